@@ -0,0 +1,8 @@
+from zenml.steps import step
+@step
+def s1() -> int:
+  return 1
+
+@step
+def s2(inp: int) -> None:
+  pass
\ No newline at end of file
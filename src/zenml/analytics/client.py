@@ -13,13 +13,17 @@
 #  permissions and limitations under the License.
 """The analytics client of ZenML."""
 
+import atexit
 import json
 import logging
+import os
+import threading
+from queue import Full, Queue
 from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
+from zenml.analytics.consumer import Consumer, QueuedMessage
 from zenml.analytics.enums import AnalyticsEvent
-from zenml.analytics.request import post
 from zenml.analytics.utils import AnalyticsEncoder
 from zenml.constants import IS_DEBUG_ENV
 
@@ -27,17 +31,44 @@ logger = logging.getLogger(__name__)
 
 
 class Client(object):
-    """The client class for ZenML analytics."""
+    """The client class for ZenML analytics.
 
-    def __init__(self, send: bool = True, timeout: int = 15) -> None:
+    Messages are put in a bounded in-memory queue and uploaded in batches by
+    a daemon consumer thread, so tracking an event never blocks on the
+    analytics server. If the queue is full, new messages are dropped. The
+    remaining messages are uploaded when the interpreter exits.
+    """
+
+    def __init__(
+        self,
+        send: bool = True,
+        timeout: int = 15,
+        max_queue_size: int = 10000,
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+    ) -> None:
         """Initialization of the client.
 
         Args:
             send: Flag to determine whether to send the message.
-            timeout: Timeout in seconds.
+            timeout: Timeout in seconds for each upload request and for
+                uploading the remaining messages at exit.
+            max_queue_size: The maximum number of queued messages.
+            upload_size: The maximum number of messages per batch.
+            upload_interval: The maximum number of seconds to wait for more
+                messages before uploading a batch.
         """
         self.send = send
         self.timeout = timeout
+        self.max_queue_size = max_queue_size
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+
+        self._queue: Optional["Queue[QueuedMessage]"] = None
+        self._consumer: Optional[Consumer] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
 
     def identify(
         self, user_id: UUID, traits: Optional[Dict[Any, Any]]
@@ -133,12 +164,73 @@ class Client(object):
         Returns:
             Tuple (success flag, the original message).
         """
+        from zenml.analytics import source_context
+
         # if send is False, return msg as if it was successfully queued
         if not self.send:
             return True, msg
 
-        post(timeout=self.timeout, batch=[msg])
+        # The source context is only available in the thread that created
+        # the message, so it needs to be queued alongside
+        queue = self._get_queue()
+        try:
+            queue.put((msg, source_context.get()), block=False)
+        except Full:
+            logger.debug("Analytics queue is full, dropping message.")
+            return False, msg
+
         return True, msg
 
+    def _get_queue(self) -> "Queue[QueuedMessage]":
+        """Gets the message queue and makes sure it is being consumed.
+
+        Returns:
+            The message queue.
+        """
+        with self._lock:
+            # Threads don't survive a fork, so child processes need their
+            # own queue and consumer
+            if self._queue is None or self._pid != os.getpid():
+                self._queue = Queue(maxsize=self.max_queue_size)
+                self._consumer = Consumer(
+                    queue=self._queue,
+                    upload_size=self.upload_size,
+                    upload_interval=self.upload_interval,
+                    timeout=self.timeout,
+                )
+                self._consumer.start()
+                self._pid = os.getpid()
+
+                if not self._atexit_registered:
+                    atexit.register(self.shutdown)
+                    self._atexit_registered = True
+
+            return self._queue
+
+    def flush(self) -> None:
+        """Blocks until all queued messages were processed."""
+        with self._lock:
+            queue = self._queue if self._pid == os.getpid() else None
+
+        if queue is not None:
+            queue.join()
+
+    def shutdown(self) -> None:
+        """Uploads the remaining messages and stops the consumer thread.
+
+        Waits at most `timeout` seconds for the remaining messages to be
+        uploaded. The client can still be used afterwards, in which case a
+        new consumer thread is started.
+        """
+        with self._lock:
+            consumer = self._consumer if self._pid == os.getpid() else None
+            self._queue = None
+            self._consumer = None
+            self._pid = None
+
+        if consumer is not None:
+            consumer.stop()
+            consumer.join(timeout=self.timeout)
+
 
 default_client = Client()
@@ -0,0 +1,139 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""The consumer thread that uploads analytics messages in batches.
+
+This module is based on the 'analytics-python' package created by Segment.
+The base functionalities are adapted to work with the ZenML analytics server.
+"""
+
+import logging
+import time
+from queue import Empty, Queue
+from threading import Thread
+from typing import Dict, List, Tuple
+
+from zenml.analytics import request
+from zenml.enums import SourceContextTypes
+
+logger = logging.getLogger(__name__)
+
+QueuedMessage = Tuple[str, SourceContextTypes]
+
+# The maximum size of a batch in bytes
+MAX_BATCH_SIZE_BYTES = 500 * 1024
+
+
+class Consumer(Thread):
+    """Daemon thread that uploads the messages of a queue in batches."""
+
+    def __init__(
+        self,
+        queue: "Queue[QueuedMessage]",
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+        timeout: int = 15,
+    ) -> None:
+        """Initialization of the consumer.
+
+        Args:
+            queue: The queue from which to consume the messages.
+            upload_size: The maximum number of messages per batch.
+            upload_interval: The maximum number of seconds to wait for more
+                messages before uploading a batch.
+            timeout: Timeout in seconds for each upload request.
+        """
+        # Daemon threads don't block the interpreter from exiting, the
+        # client flushes the remaining messages at exit instead.
+        super().__init__(daemon=True, name="zenml-analytics-consumer")
+        self.queue = queue
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+        self.timeout = timeout
+        self.running = True
+
+    def run(self) -> None:
+        """Uploads messages until the consumer is stopped.
+
+        Once stopped, the messages remaining in the queue are uploaded before
+        the thread exits.
+        """
+        while self.running or not self.queue.empty():
+            self.upload()
+
+    def stop(self) -> None:
+        """Stops the consumer after the remaining messages were uploaded."""
+        self.running = False
+
+    def upload(self) -> bool:
+        """Uploads the next batch of messages.
+
+        Returns:
+            Whether a batch was uploaded successfully.
+        """
+        batch = self.next()
+        if not batch:
+            return False
+
+        messages_by_source: Dict[SourceContextTypes, List[str]] = {}
+        for msg, source in batch:
+            messages_by_source.setdefault(source, []).append(msg)
+
+        success = True
+        try:
+            for source, messages in messages_by_source.items():
+                try:
+                    request.post(
+                        batch=messages,
+                        timeout=self.timeout,
+                        source_context_type=source,
+                    )
+                except Exception as e:
+                    logger.debug(f"Sending telemetry data failed: {e}")
+                    success = False
+        finally:
+            # Mark the messages as processed even if the upload failed, so
+            # flushing the queue never blocks on an unreachable server
+            for _ in batch:
+                self.queue.task_done()
+
+        return success
+
+    def next(self) -> List[QueuedMessage]:
+        """Collects the next batch of messages from the queue.
+
+        Returns:
+            The batch of messages. Empty if no messages were queued within
+            the upload interval.
+        """
+        batch: List[QueuedMessage] = []
+        batch_size = 0
+        start_time = time.monotonic()
+
+        while len(batch) < self.upload_size:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= self.upload_interval:
+                break
+            try:
+                item = self.queue.get(
+                    block=self.running, timeout=self.upload_interval - elapsed
+                )
+            except Empty:
+                break
+
+            batch.append(item)
+            batch_size += len(item[0])
+            if batch_size >= MAX_BATCH_SIZE_BYTES:
+                break
+
+        return batch
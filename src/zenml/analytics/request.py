@@ -18,22 +18,29 @@ The base functionalities are adapted to work with the ZenML analytics server.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 import requests
 
 from zenml.analytics.utils import AnalyticsAPIError
 from zenml.constants import ANALYTICS_SERVER_URL
+from zenml.enums import SourceContextTypes
 
 logger = logging.getLogger(__name__)
 
 
-def post(batch: List[str], timeout: int = 15) -> requests.Response:
+def post(
+    batch: List[str],
+    timeout: int = 15,
+    source_context_type: Optional[SourceContextTypes] = None,
+) -> requests.Response:
     """Post a batch of messages to the ZenML analytics server.
 
     Args:
         batch: The messages to send.
         timeout: Timeout in seconds.
+        source_context_type: The source context in which the messages were
+            created. Defaults to the current source context.
 
     Returns:
         The response.
@@ -43,10 +50,13 @@ def post(batch: List[str], timeout: int = 15) -> requests.Response:
     """
     from zenml.analytics import source_context
 
+    if source_context_type is None:
+        source_context_type = source_context.get()
+
     headers = {
         "accept": "application/json",
         "content-type": "application/json",
-        source_context.name: source_context.get().value,
+        source_context.name: source_context_type.value,
     }
     response = requests.post(
         url=ANALYTICS_SERVER_URL + "/batch",
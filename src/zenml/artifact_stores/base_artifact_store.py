@@ -40,6 +40,7 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.stack import Flavor, StackComponent, StackComponentConfig
 from zenml.utils import io_utils
+from zenml.utils.profiling_utils import count_artifact_store_io
 
 logger = get_logger(__name__)
 
@@ -440,9 +441,13 @@ class BaseArtifactStore(StackComponent):
         }
         for abc_method in inspect.getmembers(BaseArtifactStore):
             if getattr(abc_method[1], "__isabstractmethod__", False):
-                sanitized_method = _sanitize_paths(
+                sanitized_method: Callable[..., Any] = _sanitize_paths(
                     getattr(self, abc_method[0]), self.path
                 )
+                if abc_method[0] == "open":
+                    sanitized_method = count_artifact_store_io(
+                        sanitized_method
+                    )
                 # prepare overloads for filesystem methods
                 overloads[abc_method[0]] = staticmethod(sanitized_method)
 
@@ -0,0 +1,506 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Garbage collection and size accounting for artifact stores.
+
+Steps store their outputs in directories with the layout
+`<path>/<step_name>/<output_name>/<step_run_id>/<random>` and their logs in
+files with the layout `<path>/<step_name>/logs/<key>.log`. If a step fails
+before its outputs are registered or if artifact versions are only deleted
+from the database, these files are left behind. Garbage collection finds all
+files with this layout which are not referenced by an artifact version or
+logs entry anymore. Files written by other components (e.g. experiment
+trackers) or with custom URIs are never considered orphaned.
+"""
+
+import os
+import re
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from zenml.constants import (
+    ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+    GARBAGE_COLLECTION_MIN_LOG_AGE_SECONDS,
+)
+from zenml.io.fileio import convert_to_str
+from zenml.logger import get_logger
+from zenml.models import ArtifactStoreGarbageReport, ArtifactVersionUpdate
+from zenml.utils.concurrency_utils import run_concurrently
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+
+logger = get_logger(__name__)
+
+LOGS_DIRECTORY_NAME = "logs"
+LOGS_FILE_EXTENSION = ".log"
+# The random subdirectory added by `output_utils.generate_artifact_uri`
+ARTIFACT_DIRECTORY_NAME_PATTERN = re.compile(r"^[0-9a-f]{8}$")
+# Keys of the modification time in the stat info of fsspec file systems
+MODIFICATION_TIME_KEYS = ("mtime", "LastModified", "last_modified", "updated")
+
+
+class StepFile(NamedTuple):
+    """Artifact directory or log file written by a step run."""
+
+    uri: str
+    step_run_id: Optional[UUID] = None
+
+
+def _normalize(uri: str) -> str:
+    """Normalizes a URI so that it can be compared to other URIs.
+
+    Args:
+        uri: The URI to normalize.
+
+    Returns:
+        The normalized URI.
+    """
+    return uri.replace("\\", "/").rstrip("/")
+
+
+def _list_directories(
+    artifact_store: "BaseArtifactStore", paths: List[str]
+) -> List[Tuple[str, List[str], List[str]]]:
+    """Concurrently lists the contents of directories.
+
+    Args:
+        artifact_store: The artifact store which contains the directories.
+        paths: The directories to list.
+
+    Returns:
+        The path, subdirectory names and file names of each directory that
+        could be listed.
+    """
+
+    def _list(path: str) -> Tuple[str, List[str], List[str]]:
+        for _, directories, files in artifact_store.walk(path):
+            return (
+                path,
+                [convert_to_str(directory) for directory in directories],
+                [convert_to_str(file) for file in files],
+            )
+        return path, [], []
+
+    results = run_concurrently(
+        [partial(_list, path) for path in paths],
+        max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+    )
+    listings = []
+    for path, result in zip(paths, results):
+        if result.error:
+            logger.warning(
+                f"Failed to list directory '{path}': {result.error}"
+            )
+        else:
+            listings.append(result.value)
+    return listings
+
+
+def _is_step_run_id(name: str) -> bool:
+    """Checks whether a directory name is a step run ID.
+
+    Args:
+        name: The directory name.
+
+    Returns:
+        Whether the name is a step run ID in its canonical format.
+    """
+    try:
+        return str(UUID(name)) == name
+    except ValueError:
+        return False
+
+
+def find_step_files(artifact_store: "BaseArtifactStore") -> List[StepFile]:
+    """Finds all artifact directories and log files written by step runs.
+
+    The artifact store is traversed level by level, listing all directories
+    of a level concurrently.
+
+    Args:
+        artifact_store: The artifact store to search.
+
+    Returns:
+        The artifact directories and log files.
+    """
+    step_files: List[StepFile] = []
+
+    step_directories = [
+        os.path.join(artifact_store.path, directory)
+        for _, directories, _ in _list_directories(
+            artifact_store, [artifact_store.path]
+        )
+        for directory in directories
+    ]
+    output_directories = [
+        os.path.join(path, directory)
+        for path, directories, _ in _list_directories(
+            artifact_store, step_directories
+        )
+        for directory in directories
+    ]
+
+    step_run_directories: List[Tuple[str, UUID]] = []
+    for path, directories, files in _list_directories(
+        artifact_store, output_directories
+    ):
+        if os.path.basename(path) == LOGS_DIRECTORY_NAME:
+            step_files.extend(
+                StepFile(uri=os.path.join(path, file))
+                for file in files
+                if file.endswith(LOGS_FILE_EXTENSION)
+            )
+        step_run_directories.extend(
+            (os.path.join(path, directory), UUID(directory))
+            for directory in directories
+            if _is_step_run_id(directory)
+        )
+
+    step_run_ids = dict(step_run_directories)
+    for path, directories, _ in _list_directories(
+        artifact_store, list(step_run_ids)
+    ):
+        step_files.extend(
+            StepFile(
+                uri=os.path.join(path, directory),
+                step_run_id=step_run_ids[path],
+            )
+            for directory in directories
+            if ARTIFACT_DIRECTORY_NAME_PATTERN.match(directory)
+        )
+
+    return step_files
+
+
+def compute_size(artifact_store: "BaseArtifactStore", uri: str) -> int:
+    """Computes the size of a file or directory in an artifact store.
+
+    Args:
+        artifact_store: The artifact store which contains the file.
+        uri: The URI of the file or directory.
+
+    Returns:
+        The total size in bytes of all files whose size could be determined.
+    """
+    if not artifact_store.isdir(uri):
+        if not artifact_store.exists(uri):
+            return 0
+        return artifact_store.size(uri) or 0
+
+    total = 0
+    for directory, _, file_names in artifact_store.walk(uri):
+        for file_name in file_names:
+            path = os.path.join(
+                convert_to_str(directory), convert_to_str(file_name)
+            )
+            total += artifact_store.size(path) or 0
+    return total
+
+
+def _is_referenced(uri: str, references: List[str]) -> bool:
+    """Checks whether a URI or one of its parents or children is referenced.
+
+    Args:
+        uri: The normalized URI to check.
+        references: The sorted, normalized URIs of all references.
+
+    Returns:
+        Whether the URI is referenced.
+    """
+    index = bisect_left(references, uri)
+    if index < len(references) and references[index] == uri:
+        return True
+
+    index = bisect_left(references, uri + "/")
+    if index < len(references) and references[index].startswith(uri + "/"):
+        return True
+
+    parent = uri
+    while "/" in parent:
+        parent = parent.rsplit("/", 1)[0]
+        index = bisect_left(references, parent)
+        if index < len(references) and references[index] == parent:
+            return True
+    return False
+
+
+def _get_modification_time(stat: Any) -> Optional[float]:
+    """Gets the modification time from the stat info of a file.
+
+    Args:
+        stat: The stat info returned by the artifact store.
+
+    Returns:
+        The modification time as a UNIX timestamp or `None` if the stat info
+        does not contain it.
+    """
+    if hasattr(stat, "st_mtime"):
+        return float(stat.st_mtime)
+    if not isinstance(stat, dict):
+        return None
+
+    for key in MODIFICATION_TIME_KEYS:
+        value = stat.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                continue
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.timestamp()
+    return None
+
+
+def _get_old_files(
+    artifact_store: "BaseArtifactStore", uris: List[str], min_age: float
+) -> List[str]:
+    """Filters files which were last modified at least some time ago.
+
+    Args:
+        artifact_store: The artifact store which contains the files.
+        uris: The URIs of the files.
+        min_age: The minimum age in seconds.
+
+    Returns:
+        The URIs of the files which are old enough. Files whose modification
+        time can't be determined are never included.
+    """
+    results = run_concurrently(
+        [partial(artifact_store.stat, uri) for uri in uris],
+        max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+    )
+
+    now = time.time()
+    old_files = []
+    for uri, result in zip(uris, results):
+        modification_time = (
+            None if result.error else _get_modification_time(result.value)
+        )
+        if modification_time is None:
+            logger.warning(
+                f"Failed to get the modification time of '{uri}', the file "
+                "is kept."
+            )
+        elif now - modification_time >= min_age:
+            old_files.append(uri)
+    return old_files
+
+
+def _get_finished_step_run_ids(step_run_ids: List[UUID]) -> List[UUID]:
+    """Filters step runs which don't exist or are finished.
+
+    Args:
+        step_run_ids: The IDs of the step runs.
+
+    Returns:
+        The IDs of the step runs which are finished or don't exist anymore.
+    """
+    from zenml.client import Client
+
+    zen_store = Client().zen_store
+    results = run_concurrently(
+        [
+            partial(zen_store.get_run_step, step_run_id, hydrate=False)
+            for step_run_id in step_run_ids
+        ],
+        max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+    )
+
+    finished_step_run_ids = []
+    for step_run_id, result in zip(step_run_ids, results):
+        if isinstance(result.error, KeyError) or (
+            result.value and result.value.status.is_finished
+        ):
+            finished_step_run_ids.append(step_run_id)
+        elif result.error:
+            logger.warning(
+                f"Failed to get step run {step_run_id}, its files are kept: "
+                f"{result.error}"
+            )
+    return finished_step_run_ids
+
+
+def _store_artifact_version_sizes(
+    artifact_store: "BaseArtifactStore", uris: Dict[UUID, str]
+) -> int:
+    """Computes and stores the size of artifact versions.
+
+    Args:
+        artifact_store: The artifact store which contains the artifact
+            versions.
+        uris: The URIs of the artifact versions by their ID.
+
+    Returns:
+        The number of artifact versions whose size was stored.
+    """
+    from zenml.client import Client
+
+    zen_store = Client().zen_store
+
+    def _store_size(artifact_version_id: UUID, uri: str) -> None:
+        zen_store.update_artifact_version(
+            artifact_version_id=artifact_version_id,
+            artifact_version_update=ArtifactVersionUpdate(
+                size=compute_size(artifact_store, uri)
+            ),
+        )
+
+    results = run_concurrently(
+        [
+            partial(_store_size, artifact_version_id, uri)
+            for artifact_version_id, uri in uris.items()
+        ],
+        max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+    )
+    for artifact_version_id, result in zip(uris, results):
+        if result.error:
+            logger.warning(
+                "Failed to store the size of artifact version "
+                f"{artifact_version_id}: {result.error}"
+            )
+    return sum(1 for result in results if not result.error)
+
+
+def collect_garbage(
+    artifact_store: "BaseArtifactStore",
+    delete: bool = False,
+    compute_sizes: bool = True,
+) -> ArtifactStoreGarbageReport:
+    """Finds and optionally removes orphaned files of an artifact store.
+
+    The artifact store is scanned before the references are fetched, so
+    files of step runs that register their outputs in the meantime are not
+    considered orphaned. Artifact directories of step runs that are still
+    running are never considered orphaned. Log files can't be linked to their
+    step run before it is registered, so they are only considered orphaned
+    once they haven't been modified for
+    `GARBAGE_COLLECTION_MIN_LOG_AGE_SECONDS`.
+
+    Args:
+        artifact_store: The artifact store to clean up.
+        delete: Whether to remove the orphaned files. Otherwise, they are
+            only reported.
+        compute_sizes: Whether to compute the size of the orphaned files as
+            well as of all referenced artifact versions whose size is not
+            known yet. The sizes of the artifact versions are stored.
+
+    Returns:
+        The garbage collection report.
+    """
+    from zenml.client import Client
+
+    step_files = find_step_files(artifact_store)
+    references = Client().zen_store.list_artifact_store_references(
+        path=artifact_store.path
+    )
+
+    referenced_uris = sorted({_normalize(ref.uri) for ref in references})
+    unreferenced_files = [
+        step_file
+        for step_file in step_files
+        if not _is_referenced(_normalize(step_file.uri), referenced_uris)
+    ]
+    finished_step_run_ids = set(
+        _get_finished_step_run_ids(
+            list(
+                {
+                    step_file.step_run_id
+                    for step_file in unreferenced_files
+                    if step_file.step_run_id
+                }
+            )
+        )
+    )
+    old_log_files = set(
+        _get_old_files(
+            artifact_store,
+            [
+                step_file.uri
+                for step_file in unreferenced_files
+                if step_file.step_run_id is None
+            ],
+            min_age=GARBAGE_COLLECTION_MIN_LOG_AGE_SECONDS,
+        )
+    )
+    orphaned_files = [
+        step_file.uri
+        for step_file in unreferenced_files
+        if step_file.uri in old_log_files
+        or step_file.step_run_id in finished_step_run_ids
+    ]
+    logger.info(
+        f"Found {len(orphaned_files)} orphaned file(s) out of "
+        f"{len(step_files)} artifact directories and log files in artifact "
+        f"store `{artifact_store.name}`."
+    )
+
+    report = ArtifactStoreGarbageReport(
+        artifact_store_id=artifact_store.id,
+        dry_run=not delete,
+        orphaned_files=orphaned_files,
+    )
+
+    if compute_sizes:
+        results = run_concurrently(
+            [
+                partial(compute_size, artifact_store, uri)
+                for uri in orphaned_files
+            ],
+            max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+        )
+        report.orphaned_bytes = sum(result.value or 0 for result in results)
+        report.sized_artifact_versions = _store_artifact_version_sizes(
+            artifact_store,
+            {
+                ref.artifact_version_id: ref.uri
+                for ref in references
+                if ref.artifact_version_id and ref.size is None
+            },
+        )
+
+    if delete:
+
+        def _remove(uri: str) -> None:
+            if artifact_store.isdir(uri):
+                artifact_store.rmtree(uri)
+            elif artifact_store.exists(uri):
+                artifact_store.remove(uri)
+
+        results = run_concurrently(
+            [partial(_remove, uri) for uri in orphaned_files],
+            max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+        )
+        for uri, result in zip(orphaned_files, results):
+            if result.error:
+                logger.error(f"Failed to delete '{uri}': {result.error}")
+                report.failed_files.append(uri)
+        report.deleted_files = len(orphaned_files) - len(report.failed_files)
+
+    return report
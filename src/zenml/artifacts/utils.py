@@ -14,23 +14,49 @@
 """Utility functions for handling artifacts."""
 
 import base64
+import contextlib
+import io
 import os
 import tempfile
+import threading
 import time
 import zipfile
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from uuid import UUID, uuid4
 
 from zenml.client import Client
 from zenml.constants import (
+    ARTIFACT_DOWNLOAD_CHUNK_SIZE,
+    ARTIFACT_DOWNLOAD_MAX_CONCURRENT_READS,
+    ARTIFACT_STORE_CACHE_MAX_AGE_SECONDS,
+    ARTIFACT_STORE_CACHE_MAX_ENTRIES,
     MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION,
     MODEL_METADATA_YAML_FILE_NAME,
+    VISUALIZATION_CACHE_MAX_BYTES,
+    VISUALIZATION_CACHE_MAX_ENTRY_BYTES,
 )
 from zenml.enums import (
     ExecutionStatus,
     MetadataResourceTypes,
     StackComponentType,
+    StepExecutionPhase,
     VisualizationType,
 )
 from zenml.exceptions import (
@@ -45,6 +71,7 @@ from zenml.models import (
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVisualizationRequest,
+    ArtifactVisualizationResponse,
     LoadedVisualization,
     PipelineRunResponse,
     StepRunResponse,
@@ -52,7 +79,7 @@ from zenml.models import (
 )
 from zenml.new.steps.step_context import get_step_context
 from zenml.stack import StackComponent
-from zenml.utils import source_utils
+from zenml.utils import publish_queue, source_utils, tracing_utils
 from zenml.utils.yaml_utils import read_yaml, write_yaml
 
 if TYPE_CHECKING:
@@ -180,13 +207,19 @@ def save_artifact(
     # Save the artifact to the artifact store
     data_type = type(data)
     materializer_object.validate_type_compatibility(data_type)
-    materializer_object.save(data)
+    with tracing_utils.span(
+        StepExecutionPhase.OUTPUT_MATERIALIZATION, artifact_name=name
+    ):
+        materializer_object.save(data)
 
     # Save visualizations of the artifact
     visualizations: List[ArtifactVisualizationRequest] = []
     if include_visualizations:
         try:
-            vis_data = materializer_object.save_visualizations(data)
+            with tracing_utils.span(
+                StepExecutionPhase.VISUALIZATION, artifact_name=name
+            ):
+                vis_data = materializer_object.save_visualizations(data)
             for vis_uri, vis_type in vis_data.items():
                 vis_model = ArtifactVisualizationRequest(
                     type=vis_type,
@@ -203,13 +236,20 @@ def save_artifact(
     artifact_metadata: Dict[str, "MetadataType"] = {}
     if extract_metadata:
         try:
-            artifact_metadata = materializer_object.extract_full_metadata(data)
+            with tracing_utils.span(
+                StepExecutionPhase.METADATA_EXTRACTION, artifact_name=name
+            ):
+                artifact_metadata = materializer_object.extract_full_metadata(
+                    data
+                )
             artifact_metadata.update(user_metadata or {})
         except Exception as e:
             logger.warning(
                 f"Failed to extract metadata for output artifact '{name}': {e}"
             )
 
+    storage_size = artifact_metadata.get("storage_size")
+
     # Create the artifact version
     def _create_version() -> Optional[ArtifactVersionResponse]:
         artifact_version = ArtifactVersionRequest(
@@ -225,11 +265,15 @@ def save_artifact(
             artifact_store_id=artifact_store.id,
             visualizations=visualizations,
             has_custom_name=has_custom_name,
+            size=storage_size if isinstance(storage_size, int) else None,
         )
         try:
-            return client.zen_store.create_artifact_version(
-                artifact_version=artifact_version
-            )
+            with tracing_utils.span(
+                StepExecutionPhase.PUBLISHING, artifact_name=name
+            ):
+                return client.zen_store.create_artifact_version(
+                    artifact_version=artifact_version
+                )
         except EntityExistsError:
             return None
 
@@ -265,11 +309,14 @@ def save_artifact(
                 f"`{name}`. Given version already exists."
             )
     if artifact_metadata:
-        client.create_run_metadata(
-            metadata=artifact_metadata,
-            resource_id=response.id,
-            resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
-        )
+        with tracing_utils.span(
+            StepExecutionPhase.PUBLISHING, artifact_name=name
+        ):
+            publish_queue.publish_run_metadata(
+                metadata=artifact_metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+            )
 
     if manual_save:
         try:
@@ -397,6 +444,7 @@ def load_artifact_visualization(
     index: int = 0,
     zen_store: Optional["BaseZenStore"] = None,
     encode_image: bool = False,
+    use_cache: bool = False,
 ) -> LoadedVisualization:
     """Load a visualization of the given artifact.
 
@@ -406,16 +454,63 @@ def load_artifact_visualization(
         zen_store: The ZenStore to use for finding the artifact store. If not
             provided, the client's ZenStore will be used.
         encode_image: Whether to base64 encode image visualizations.
+        use_cache: Whether to use the in-memory cache of visualization
+            contents.
 
     Returns:
         The loaded visualization.
+    """
+    visualization = get_artifact_visualization(artifact=artifact, index=index)
+    value: Any = (
+        _visualization_cache.get(visualization.id) if use_cache else None
+    )
+    if value is None:
+        artifact_store = _load_artifact_store(
+            artifact_store_id=artifact.artifact_store_id,  # type: ignore[arg-type]
+            zen_store=zen_store,
+        )
+        mode = (
+            "rb"
+            if use_cache or visualization.type == VisualizationType.IMAGE
+            else "r"
+        )
+        value = _load_file_from_artifact_store(
+            uri=visualization.uri,
+            artifact_store=artifact_store,
+            mode=mode,
+        )
+        if use_cache:
+            _visualization_cache.set(visualization.id, value)
+
+    if use_cache and visualization.type != VisualizationType.IMAGE:
+        # The cache stores the raw bytes, decode them the same way as reading
+        # the file in text mode
+        value = io.TextIOWrapper(io.BytesIO(value)).read()
+
+    # Encode image visualizations if requested
+    if visualization.type == VisualizationType.IMAGE and encode_image:
+        value = base64.b64encode(bytes(value))
+
+    return LoadedVisualization(type=visualization.type, value=value)
+
+
+def get_artifact_visualization(
+    artifact: "ArtifactVersionResponse", index: int = 0
+) -> ArtifactVisualizationResponse:
+    """Get a visualization of an artifact and make sure it can be loaded.
+
+    Args:
+        artifact: The artifact.
+        index: The index of the visualization.
+
+    Returns:
+        The visualization.
 
     Raises:
         DoesNotExistException: If the artifact does not have the requested
-            visualization or if the visualization was not found in the artifact
-            store.
+            visualization or if the artifact store of the artifact was
+            deleted.
     """
-    # Get the visualization to load
     if not artifact.visualizations:
         raise DoesNotExistException(
             f"Artifact '{artifact.id}' has no visualizations."
@@ -425,29 +520,139 @@ def load_artifact_visualization(
             f"Artifact '{artifact.id}' only has {len(artifact.visualizations)} "
             f"visualizations, but index {index} was requested."
         )
-    visualization = artifact.visualizations[index]
-
-    # Load the visualization from the artifact's artifact store
     if not artifact.artifact_store_id:
         raise DoesNotExistException(
             f"Artifact '{artifact.id}' cannot be visualized because the "
             "underlying artifact store was deleted."
         )
+    return artifact.visualizations[index]
+
+
+class VisualizationStream(NamedTuple):
+    """The content of a visualization that is streamed from an artifact store.
+
+    Attributes:
+        visualization: The visualization.
+        media_type: The media type of the content.
+        chunks: Iterator over the chunks of the content.
+    """
+
+    visualization: ArtifactVisualizationResponse
+    media_type: str
+    chunks: Iterator[bytes]
+
+
+_VISUALIZATION_MEDIA_TYPES = {
+    VisualizationType.CSV: "text/csv; charset=utf-8",
+    VisualizationType.HTML: "text/html; charset=utf-8",
+    VisualizationType.MARKDOWN: "text/markdown; charset=utf-8",
+}
+
+_IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+
+
+def _get_visualization_media_type(
+    visualization_type: VisualizationType, head: bytes
+) -> str:
+    """Get the media type of a visualization.
+
+    Args:
+        visualization_type: The type of the visualization.
+        head: The first bytes of the visualization content.
+
+    Returns:
+        The media type.
+    """
+    if visualization_type != VisualizationType.IMAGE:
+        return _VISUALIZATION_MEDIA_TYPES[visualization_type]
+
+    for signature, media_type in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if b"<svg" in head[:1024]:
+        return "image/svg+xml"
+    return "application/octet-stream"
+
+
+def stream_artifact_visualization(
+    artifact: "ArtifactVersionResponse",
+    index: int = 0,
+    zen_store: Optional["BaseZenStore"] = None,
+    use_cache: bool = True,
+) -> VisualizationStream:
+    """Stream the raw content of a visualization of the given artifact.
+
+    The visualization file is opened before this function returns, so errors
+    loading it are raised immediately and not when iterating the content.
+    Small visualizations are added to the in-memory cache once they were
+    streamed completely.
+
+    Args:
+        artifact: The artifact to visualize.
+        index: The index of the visualization to load.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+        use_cache: Whether to use the in-memory cache of visualization
+            contents.
+
+    Returns:
+        The visualization content stream.
+    """
+    visualization = get_artifact_visualization(artifact=artifact, index=index)
+
+    content = _visualization_cache.get(visualization.id) if use_cache else None
+    if content is not None:
+        return VisualizationStream(
+            visualization=visualization,
+            media_type=_get_visualization_media_type(
+                visualization.type, content[:1024]
+            ),
+            chunks=iter([content]),
+        )
+
     artifact_store = _load_artifact_store(
-        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+        artifact_store_id=artifact.artifact_store_id,  # type: ignore[arg-type]
+        zen_store=zen_store,
     )
-    mode = "rb" if visualization.type == VisualizationType.IMAGE else "r"
-    value = _load_file_from_artifact_store(
-        uri=visualization.uri,
-        artifact_store=artifact_store,
-        mode=mode,
+    head, file = _open_file_from_artifact_store(
+        uri=visualization.uri, artifact_store=artifact_store
     )
 
-    # Encode image visualizations if requested
-    if visualization.type == VisualizationType.IMAGE and encode_image:
-        value = base64.b64encode(bytes(value))
-
-    return LoadedVisualization(type=visualization.type, value=value)
+    def _iter_chunks() -> Iterator[bytes]:
+        """Streams the visualization content and caches it if possible.
+
+        Yields:
+            The chunks of the visualization content.
+        """
+        chunks: Optional[List[bytes]] = [] if use_cache else None
+        size = 0
+        with file:
+            chunk = head
+            while chunk:
+                yield chunk
+                size += len(chunk)
+                if chunks is not None:
+                    if size <= VISUALIZATION_CACHE_MAX_ENTRY_BYTES:
+                        chunks.append(chunk)
+                    else:
+                        chunks = None
+                chunk = file.read(ARTIFACT_DOWNLOAD_CHUNK_SIZE)
+
+        if chunks is not None:
+            _visualization_cache.set(visualization.id, b"".join(chunks))
+
+    return VisualizationStream(
+        visualization=visualization,
+        media_type=_get_visualization_media_type(visualization.type, head),
+        chunks=_iter_chunks(),
+    )
 
 
 def load_artifact_from_response(artifact: "ArtifactVersionResponse") -> Any:
@@ -475,6 +680,7 @@ def download_artifact_files_from_response(
     artifact: "ArtifactVersionResponse",
     path: str,
     overwrite: bool = False,
+    compression_level: Optional[int] = None,
 ) -> None:
     """Download the given artifact into a file.
 
@@ -482,6 +688,8 @@ def download_artifact_files_from_response(
         artifact: The artifact to download.
         path: The path to which to download the artifact.
         overwrite: Whether to overwrite the file if it already exists.
+        compression_level: The compression level between 0 (no compression)
+            and 9. If not given, the default level of zlib is used.
 
     Raises:
         FileExistsError: If the file already exists and `overwrite` is `False`.
@@ -496,35 +704,226 @@ def download_artifact_files_from_response(
         artifact=artifact
     )
 
-    if filepaths := artifact_store.listdir(artifact.uri):
-        # save a zipfile to 'path' containing all the files
-        # in 'filepaths' with compression
+    try:
+        with open(path, "wb") as f:
+            for chunk in stream_artifact_files_as_zip(
+                artifact_store=artifact_store,
+                uri=artifact.uri,
+                compression_level=compression_level,
+            ):
+                f.write(chunk)
+    except Exception as e:
+        logger.error(
+            f"Failed to save artifact '{artifact.id}' to zip file "
+            f" '{path}': {e}"
+        )
+        raise
+
+
+def stream_artifact_version_files(
+    artifact: "ArtifactVersionResponse",
+    zen_store: Optional["BaseZenStore"] = None,
+    compression_level: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Stream the files of an artifact as a zip archive.
+
+    The artifact store is loaded before this function returns, so errors
+    loading it are raised immediately and not when iterating the stream.
+
+    Args:
+        artifact: The artifact to download.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+        compression_level: The compression level between 0 (no compression)
+            and 9. If not given, the default level of zlib is used.
+
+    Returns:
+        Iterator over the chunks of the zip archive.
+
+    Raises:
+        DoesNotExistException: If the artifact store of the artifact was
+            deleted.
+    """
+    if not artifact.artifact_store_id:
+        raise DoesNotExistException(
+            f"Artifact '{artifact.id}' cannot be downloaded because the "
+            "underlying artifact store was deleted."
+        )
+    artifact_store = _load_artifact_store(
+        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+    )
+    return stream_artifact_files_as_zip(
+        artifact_store=artifact_store,
+        uri=artifact.uri,
+        compression_level=compression_level,
+    )
+
+
+class _ZipStreamBuffer:
+    """Unseekable file-like object that buffers the output of a zip file."""
+
+    def __init__(self) -> None:
+        """Initializes the buffer."""
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        """Buffers data.
+
+        Args:
+            data: The data to buffer.
+
+        Returns:
+            The number of buffered bytes.
+        """
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        """Flushes the buffer. This is a no-op."""
+
+    def drain(self) -> bytes:
+        """Removes and returns all buffered data.
+
+        Returns:
+            The buffered data.
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _walk_artifact_files(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> Iterator[Tuple[str, str]]:
+    """Walks all files in an artifact directory, including subdirectories.
+
+    Args:
+        artifact_store: The artifact store in which the files are stored.
+        uri: The artifact directory.
+
+    Yields:
+        Tuples of the path of a file and its path relative to the artifact
+        directory using forward slashes.
+    """
+    for directory, _, files in artifact_store.walk(uri):
+        directory_str = (
+            directory.decode() if isinstance(directory, bytes) else directory
+        )
+        for file in files:
+            file_str = file.decode() if isinstance(file, bytes) else file
+            path = os.path.join(directory_str, file_str)
+            relative_path = os.path.relpath(path, uri).replace(os.sep, "/")
+            yield path, relative_path
+
+
+def _open_artifact_file(
+    artifact_store: "BaseArtifactStore", path: str
+) -> Tuple[bytes, IO[bytes]]:
+    """Opens a file in an artifact store and reads its first chunk.
+
+    Args:
+        artifact_store: The artifact store in which the file is stored.
+        path: The path of the file.
+
+    Returns:
+        The first chunk of the file and the open file to read the remaining
+        chunks from.
+    """
+    file = artifact_store.open(path, mode="rb")
+    try:
+        return file.read(ARTIFACT_DOWNLOAD_CHUNK_SIZE), file
+    except BaseException:
+        file.close()
+        raise
+
+
+def stream_artifact_files_as_zip(
+    artifact_store: "BaseArtifactStore",
+    uri: str,
+    compression_level: Optional[int] = None,
+    max_concurrent_reads: int = ARTIFACT_DOWNLOAD_MAX_CONCURRENT_READS,
+) -> Iterator[bytes]:
+    """Stream all files of an artifact directory as a zip archive.
+
+    Each file of the directory tree is written to a single zip entry. The
+    next files are opened and their first chunk is read concurrently while
+    the current file is being compressed, which hides the latency of remote
+    artifact stores. At most `max_concurrent_reads` chunks are buffered, the
+    remaining content of a file is read sequentially.
+
+    Args:
+        artifact_store: The artifact store in which the files are stored.
+        uri: The artifact directory.
+        compression_level: The compression level between 0 (no compression)
+            and 9. If not given, the default level of zlib is used.
+        max_concurrent_reads: The maximum number of files read concurrently.
+
+    Yields:
+        The chunks of the zip archive.
+
+    Raises:
+        ValueError: If the compression level is invalid.
+    """
+    if compression_level is not None and not 0 <= compression_level <= 9:
+        raise ValueError(
+            f"Invalid compression level {compression_level}, the compression "
+            "level needs to be between 0 and 9."
+        )
+
+    buffer = _ZipStreamBuffer()
+    files = _walk_artifact_files(artifact_store=artifact_store, uri=uri)
+    pending: Deque[Tuple[str, "Future[Tuple[bytes, IO[bytes]]]"]] = deque()
+
+    compression = (
+        zipfile.ZIP_STORED if compression_level == 0 else zipfile.ZIP_DEFLATED
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_concurrent_reads)
+    ) as pool, zipfile.ZipFile(
+        cast(IO[bytes], buffer),
+        mode="w",
+        compression=compression,
+        compresslevel=compression_level or None,
+    ) as zipf:
+
+        def _read_ahead() -> None:
+            """Starts reading the next file in the background."""
+            for path, relative_path in files:
+                future = pool.submit(_open_artifact_file, artifact_store, path)
+                pending.append((relative_path, future))
+                return
+
+        for _ in range(max(1, max_concurrent_reads)):
+            _read_ahead()
+
         try:
-            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for file in filepaths:
-                    # Ensure 'file' is a string for path operations
-                    # and ZIP entry naming
-                    file_str = (
-                        file.decode() if isinstance(file, bytes) else file
-                    )
-                    file_path = str(Path(artifact.uri) / file_str)
-                    with artifact_store.open(
-                        name=file_path, mode="rb"
-                    ) as store_file:
-                        # Use a loop to read and write chunks of the file
-                        # instead of reading the entire file into memory
-                        CHUNK_SIZE = 8192
-                        while True:
-                            if file_content := store_file.read(CHUNK_SIZE):
-                                zipf.writestr(file_str, file_content)
-                            else:
-                                break
-        except Exception as e:
-            logger.error(
-                f"Failed to save artifact '{artifact.id}' to zip file "
-                f" '{path}': {e}"
-            )
-            raise
+            while pending:
+                relative_path, future = pending.popleft()
+                _read_ahead()
+                chunk, file = future.result()
+                with file, zipf.open(
+                    relative_path, mode="w", force_zip64=True
+                ) as entry:
+                    while chunk:
+                        entry.write(chunk)
+                        if data := buffer.drain():
+                            yield data
+                        chunk = file.read(ARTIFACT_DOWNLOAD_CHUNK_SIZE)
+                if data := buffer.drain():
+                    yield data
+        finally:
+            # Close the files that were opened in advance if the stream was
+            # closed early or failed
+            for _, future in pending:
+                if not future.cancel():
+                    try:
+                        future.result()[1].close()
+                    except Exception:
+                        pass
+
+    if data := buffer.drain():
+        yield data
 
 
 def get_producer_step_of_artifact(
@@ -641,6 +1040,178 @@ def _load_artifact_from_uri(
     return artifact
 
 
+# When an artifact store component and its service connector were last updated
+_ArtifactStoreVersion = Tuple[datetime, Optional[datetime]]
+_ArtifactStoreCacheEntry = Tuple[
+    _ArtifactStoreVersion, float, "BaseArtifactStore"
+]
+
+
+class _ArtifactStoreCache:
+    """Cache of artifact store instances.
+
+    Instantiating an artifact store might be expensive, e.g. if it needs to
+    authenticate using a service connector. Cached instances are invalidated
+    whenever the artifact store component or its service connector are
+    updated and expire after a while, as they might hold short-lived
+    credentials.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = ARTIFACT_STORE_CACHE_MAX_ENTRIES,
+        max_age: float = ARTIFACT_STORE_CACHE_MAX_AGE_SECONDS,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached artifact stores.
+            max_age: The number of seconds after which cached artifact stores
+                expire.
+        """
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._entries: "OrderedDict[UUID, _ArtifactStoreCacheEntry]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self, artifact_store_id: UUID, version: _ArtifactStoreVersion
+    ) -> Optional["BaseArtifactStore"]:
+        """Gets a cached artifact store.
+
+        Args:
+            artifact_store_id: The ID of the artifact store.
+            version: When the artifact store component and its service
+                connector were last updated.
+
+        Returns:
+            The cached artifact store or None if no valid instance is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(artifact_store_id)
+            if entry is None:
+                return None
+
+            cached_version, expires_at, artifact_store = entry
+            if cached_version != version or expires_at <= time.monotonic():
+                del self._entries[artifact_store_id]
+                return None
+
+            self._entries.move_to_end(artifact_store_id)
+            return artifact_store
+
+    def set(
+        self,
+        artifact_store_id: UUID,
+        artifact_store: "BaseArtifactStore",
+        version: _ArtifactStoreVersion,
+    ) -> None:
+        """Caches an artifact store.
+
+        Args:
+            artifact_store_id: The ID of the artifact store.
+            artifact_store: The artifact store instance.
+            version: When the artifact store component and its service
+                connector were last updated.
+        """
+        if self._max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[artifact_store_id] = (
+                version,
+                time.monotonic() + self._max_age,
+                artifact_store,
+            )
+            self._entries.move_to_end(artifact_store_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clears the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _VisualizationCache:
+    """LRU cache of visualization contents bounded by their total size."""
+
+    def __init__(
+        self,
+        max_bytes: int = VISUALIZATION_CACHE_MAX_BYTES,
+        max_entry_bytes: int = VISUALIZATION_CACHE_MAX_ENTRY_BYTES,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_bytes: The maximum total size of the cached contents.
+            max_entry_bytes: The maximum size of a single cached content.
+                Larger contents are not cached.
+        """
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self._entries: "OrderedDict[UUID, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached contents.
+
+        Returns:
+            The total size in bytes.
+        """
+        return self._size
+
+    def get(self, visualization_id: UUID) -> Optional[bytes]:
+        """Gets the cached content of a visualization.
+
+        Args:
+            visualization_id: The ID of the visualization.
+
+        Returns:
+            The cached content or None if the content is not cached.
+        """
+        with self._lock:
+            content = self._entries.get(visualization_id)
+            if content is not None:
+                self._entries.move_to_end(visualization_id)
+            return content
+
+    def set(self, visualization_id: UUID, content: bytes) -> None:
+        """Caches the content of a visualization.
+
+        Args:
+            visualization_id: The ID of the visualization.
+            content: The content of the visualization.
+        """
+        if len(content) > self._max_entry_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(visualization_id, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[visualization_id] = content
+            self._size += len(content)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Clears the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_artifact_store_cache = _ArtifactStoreCache()
+_visualization_cache = _VisualizationCache()
+
+
 def _load_artifact_store(
     artifact_store_id: Union[str, "UUID"],
     zen_store: Optional["BaseZenStore"] = None,
@@ -678,6 +1249,17 @@ def _load_artifact_store(
             f"Stack component '{artifact_store_id}' is not an artifact store."
         )
 
+    connector = artifact_store_model.connector
+    version = (
+        artifact_store_model.updated,
+        connector.updated if connector else None,
+    )
+    artifact_store = _artifact_store_cache.get(
+        artifact_store_model.id, version=version
+    )
+    if artifact_store:
+        return artifact_store
+
     try:
         artifact_store = cast(
             "BaseArtifactStore",
@@ -691,6 +1273,11 @@ def _load_artifact_store(
             f"dependencies are not installed. For more information, see {link}."
         )
 
+    _artifact_store_cache.set(
+        artifact_store_model.id,
+        artifact_store,
+        version=version,
+    )
     return artifact_store
 
 
@@ -755,6 +1342,41 @@ def _load_file_from_artifact_store(
 
     Returns:
         The loaded file.
+    """
+    with _handle_artifact_store_file_errors(uri, artifact_store):
+        with artifact_store.open(uri, mode) as text_file:
+            return text_file.read()
+
+
+def _open_file_from_artifact_store(
+    uri: str, artifact_store: "BaseArtifactStore"
+) -> Tuple[bytes, IO[bytes]]:
+    """Open the given uri in the given artifact store and read its first chunk.
+
+    Args:
+        uri: The uri of the file to open.
+        artifact_store: The artifact store in which to open the file.
+
+    Returns:
+        The first chunk of the file and the open file to read the remaining
+        chunks from.
+    """
+    with _handle_artifact_store_file_errors(uri, artifact_store):
+        return _open_artifact_file(artifact_store=artifact_store, path=uri)
+
+
+@contextlib.contextmanager
+def _handle_artifact_store_file_errors(
+    uri: str, artifact_store: "BaseArtifactStore"
+) -> Iterator[None]:
+    """Converts errors when accessing a file in an artifact store.
+
+    Args:
+        uri: The uri of the file.
+        artifact_store: The artifact store in which the file is stored.
+
+    Yields:
+        Nothing.
 
     Raises:
         DoesNotExistException: If the file does not exist in the artifact store.
@@ -762,8 +1384,7 @@ def _load_file_from_artifact_store(
         IOError: If the artifact store rejects the request.
     """
     try:
-        with artifact_store.open(uri, mode) as text_file:
-            return text_file.read()
+        yield
     except FileNotFoundError:
         raise DoesNotExistException(
             f"File '{uri}' does not exist in artifact store "
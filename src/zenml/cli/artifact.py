@@ -21,12 +21,14 @@ import click
 from zenml.cli import utils as cli_utils
 from zenml.cli.cli import TagGroup, cli
 from zenml.client import Client
-from zenml.enums import CliCategories
+from zenml.console import console
+from zenml.enums import CliCategories, StorageUsageGroup
 from zenml.logger import get_logger
 from zenml.models import ArtifactFilter, ArtifactVersionFilter
 from zenml.models.v2.core.artifact import ArtifactResponse
 from zenml.models.v2.core.artifact_version import ArtifactVersionResponse
 from zenml.utils.pagination_utils import depaginate
+from zenml.utils.string_utils import get_human_readable_filesize
 
 logger = get_logger(__name__)
 
@@ -279,6 +281,151 @@ def prune_artifacts(
     cli_utils.declare("All unused artifacts and artifact versions deleted.")
 
 
+@artifact.command(
+    "gc",
+    help=(
+        "Find artifact and log files of step runs in an artifact store that "
+        "are no longer referenced by any artifact version or step run."
+    ),
+)
+@click.option(
+    "--artifact-store",
+    "-s",
+    "artifact_store",
+    type=str,
+    required=False,
+    help=(
+        "Name or ID of the artifact store to scan. Defaults to the artifact "
+        "store of the active stack."
+    ),
+)
+@click.option(
+    "--delete",
+    "-d",
+    is_flag=True,
+    help="Delete the orphaned files instead of only listing them.",
+)
+@click.option(
+    "--skip-sizes",
+    is_flag=True,
+    help=(
+        "Don't compute the size of the orphaned files and of the artifact "
+        "versions whose size is not known yet."
+    ),
+)
+@click.option(
+    "--yes",
+    "-y",
+    is_flag=True,
+    help="Don't ask for confirmation.",
+)
+def garbage_collect_artifact_store(
+    artifact_store: Optional[str] = None,
+    delete: bool = False,
+    skip_sizes: bool = False,
+    yes: bool = False,
+) -> None:
+    """Find and optionally delete orphaned files in an artifact store.
+
+    Args:
+        artifact_store: Name or ID of the artifact store to scan.
+        delete: Delete the orphaned files instead of only listing them.
+        skip_sizes: Don't compute the size of the orphaned files and of the
+            artifact versions whose size is not known yet.
+        yes: If set, don't ask for confirmation.
+    """
+    if delete and not yes:
+        confirmation = cli_utils.confirmation(
+            "Are you sure you want to delete all orphaned files in the "
+            "artifact store? Run this command without `--delete` to see "
+            "which files would be deleted."
+        )
+        if not confirmation:
+            cli_utils.declare("Garbage collection canceled.")
+            return
+
+    try:
+        with console.status("Scanning artifact store...\n"):
+            report = Client().garbage_collect_artifact_store(
+                name_id_or_prefix=artifact_store,
+                delete=delete,
+                compute_sizes=not skip_sizes,
+            )
+    except (KeyError, ValueError) as e:
+        cli_utils.error(str(e))
+
+    if not report.orphaned_files:
+        cli_utils.declare("No orphaned files found.")
+    elif delete:
+        cli_utils.declare(f"Deleted {report.deleted_files} orphaned file(s).")
+        if report.failed_files:
+            cli_utils.warning(
+                f"Failed to delete {len(report.failed_files)} file(s): "
+                f"{', '.join(report.failed_files)}"
+            )
+    else:
+        for uri in report.orphaned_files:
+            cli_utils.declare(uri)
+        cli_utils.declare(
+            f"Found {len(report.orphaned_files)} orphaned file(s). Run this "
+            "command with `--delete` to delete them."
+        )
+
+    if report.orphaned_bytes is not None and report.orphaned_files:
+        cli_utils.declare(
+            "Total size of the orphaned files: "
+            f"{get_human_readable_filesize(report.orphaned_bytes)}."
+        )
+    if report.sized_artifact_versions:
+        cli_utils.declare(
+            f"Stored the size of {report.sized_artifact_versions} artifact "
+            "version(s)."
+        )
+
+
+@artifact.command(
+    "usage",
+    help="Show the storage used by artifacts, pipelines or workspaces.",
+)
+@click.option(
+    "--group-by",
+    "-g",
+    type=click.Choice([group.value for group in StorageUsageGroup]),
+    default=StorageUsageGroup.ARTIFACT.value,
+    help="The entity by which to group the artifact versions.",
+)
+def artifact_storage_usage(group_by: str) -> None:
+    """Show the storage used by artifact versions.
+
+    Args:
+        group_by: The entity by which to group the artifact versions.
+    """
+    usage = Client().get_artifact_storage_usage(
+        group_by=StorageUsageGroup(group_by)
+    )
+    if not usage:
+        cli_utils.declare("No artifact versions found.")
+        return
+
+    cli_utils.print_table(
+        [
+            {
+                "id": entry.id,
+                "name": entry.name,
+                "size": get_human_readable_filesize(entry.size),
+                "artifact_versions": entry.artifact_versions,
+                "unknown_size": entry.unknown_size_artifact_versions,
+            }
+            for entry in usage
+        ]
+    )
+    if any(entry.unknown_size_artifact_versions for entry in usage):
+        cli_utils.declare(
+            "The size of some artifact versions is not known yet. Run "
+            "`zenml artifact gc` to compute it."
+        )
+
+
 def _artifact_version_to_print(
     artifact_version: ArtifactVersionResponse,
 ) -> Dict[str, Any]:
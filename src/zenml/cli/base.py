@@ -45,12 +45,10 @@ from zenml.constants import (
 from zenml.enums import AnalyticsEventSource, DatabaseBackupStrategy, StoreType
 from zenml.environment import Environment, get_environment
 from zenml.exceptions import GitNotFoundError, InitializationException
-from zenml.integrations.registry import integration_registry
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.utils.io_utils import copy_dir, get_global_config_directory
 from zenml.utils.yaml_utils import write_yaml
-from zenml.zen_server.utils import get_active_deployment
 
 logger = get_logger(__name__)
 # WT_SESSION is a Windows Terminal specific environment variable. If it
@@ -358,6 +356,8 @@ def clean(yes: bool = False, local: bool = False) -> None:
         )
 
     if yes or confirm:
+        from zenml.zen_server.utils import get_active_deployment
+
         server = get_active_deployment(local=True)
 
         if server:
@@ -603,6 +603,8 @@ def info(
         file: Flag to output to a file.
         stack: Flag to output information about active stack and components
     """
+    from zenml.integrations.registry import integration_registry
+
     gc = GlobalConfiguration()
     environment = Environment()
     client = Client()
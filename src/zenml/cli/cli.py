@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Core CLI functionality."""
 
+import importlib
 import os
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -24,7 +25,7 @@ from zenml import __version__
 from zenml.analytics import source_context
 from zenml.cli.formatter import ZenFormatter
 from zenml.client import Client
-from zenml.enums import CliCategories, SourceContextTypes
+from zenml.enums import CliCategories, SourceContextTypes, StackComponentType
 from zenml.logger import set_root_verbosity
 from zenml.utils import source_utils
 
@@ -63,11 +64,102 @@ class ZenContext(click.Context):
     formatter_class = ZenFormatter
 
 
+class _LazyCommands(Dict[str, click.Command]):
+    """Commands of a group that are registered when first accessed."""
+
+    def __init__(
+        self,
+        commands: Dict[str, click.Command],
+        lazy_subcommands: Dict[str, Sequence[str]],
+    ) -> None:
+        """Initialize the commands.
+
+        Args:
+            commands: The already registered commands.
+            lazy_subcommands: Mapping of subcommand names to the modules
+                which need to be imported to register the subcommand.
+        """
+        super().__init__(commands)
+        self.lazy_subcommands = lazy_subcommands
+
+    def __missing__(self, key: str) -> click.Command:
+        """Registers a command by importing its modules.
+
+        Args:
+            key: The name of the command.
+
+        Returns:
+            The command.
+
+        Raises:
+            KeyError: If no command with that name exists.
+        """
+        for module in self.lazy_subcommands.get(key, ()):
+            importlib.import_module(module)
+
+        if key in self:
+            return super().__getitem__(key)
+        raise KeyError(key)
+
+
 class ZenMLCLI(click.Group):
-    """Custom click Group to create a custom format command help output."""
+    """Custom click Group to create a custom format command help output.
+
+    Subcommands can be registered lazily by specifying the modules that
+    define them. These modules only get imported once the subcommand is
+    actually used, which keeps the startup time of the CLI low.
+    """
 
     context_class = ZenContext
 
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, Sequence[str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the ZenML CLI group.
+
+        Args:
+            *args: Positional arguments for the click group.
+            lazy_subcommands: Mapping of subcommand names to the modules which
+                need to be imported to register the subcommand.
+            **kwargs: Keyword arguments for the click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self.commands = _LazyCommands(self.commands, self.lazy_subcommands)
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        """Lists the names of all subcommands.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The names of all registered and lazily registered subcommands.
+        """
+        return sorted(
+            set(super().list_commands(ctx)) | set(self.lazy_subcommands)
+        )
+
+    def get_command(
+        self, ctx: Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Gets a subcommand and imports its modules if necessary.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The name of the subcommand.
+
+        Returns:
+            The subcommand or None if no subcommand with that name exists.
+        """
+        try:
+            return self.commands[cmd_name]
+        except KeyError:
+            return None
+
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
@@ -144,7 +236,59 @@ class ZenMLCLI(click.Group):
                     formatter.write_dl(rows)  # type: ignore[arg-type]
 
 
-@click.group(cls=ZenMLCLI)
+def _get_lazy_subcommands() -> Dict[str, Sequence[str]]:
+    """Gets the modules which define the ZenML CLI subcommands.
+
+    Returns:
+        Mapping of subcommand names to the modules which need to be imported
+        to register the subcommand.
+    """
+    modules_by_command: Dict[str, Sequence[str]] = {
+        "analytics": ["zenml.cli.config"],
+        "artifact": ["zenml.cli.artifact"],
+        "authorized-device": ["zenml.cli.authorized_device"],
+        "backup-database": ["zenml.cli.base"],
+        "clean": ["zenml.cli.base"],
+        "code-repository": ["zenml.cli.code_repository"],
+        "connect": ["zenml.cli.server"],
+        "deploy": ["zenml.cli.server"],
+        "destroy": ["zenml.cli.server"],
+        "disconnect": ["zenml.cli.server"],
+        "down": ["zenml.cli.server"],
+        "downgrade": ["zenml.cli.downgrade"],
+        "go": ["zenml.cli.base"],
+        "hub": ["zenml.cli.hub"],
+        "info": ["zenml.cli.base"],
+        "init": ["zenml.cli.base"],
+        "integration": ["zenml.cli.integration"],
+        "logging": ["zenml.cli.config"],
+        "logs": ["zenml.cli.server"],
+        "migrate-database": ["zenml.cli.base"],
+        "model": ["zenml.cli.model"],
+        "pipeline": ["zenml.cli.pipeline"],
+        "restore-database": ["zenml.cli.base"],
+        "secret": ["zenml.cli.secret"],
+        "service-account": ["zenml.cli.service_accounts"],
+        "service-connector": ["zenml.cli.service_connectors"],
+        "show": ["zenml.cli.server"],
+        "stack": ["zenml.cli.stack", "zenml.cli.stack_recipes"],
+        "status": ["zenml.cli.server"],
+        "tag": ["zenml.cli.tag"],
+        "up": ["zenml.cli.server"],
+        "user": ["zenml.cli.user_management"],
+        "version": ["zenml.cli.version"],
+        "workspace": ["zenml.cli.workspace"],
+    }
+    # The command groups of all stack component types are generated in the
+    # same module
+    for component_type in StackComponentType:
+        command_name = component_type.value.replace("_", "-")
+        modules_by_command[command_name] = ["zenml.cli.stack_components"]
+
+    return modules_by_command
+
+
+@click.group(cls=ZenMLCLI, lazy_subcommands=_get_lazy_subcommands())
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
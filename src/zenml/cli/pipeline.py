@@ -15,6 +15,7 @@
 
 import json
 import os
+from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Union
 
 import click
@@ -24,7 +25,8 @@ from zenml.cli.cli import TagGroup, cli
 from zenml.cli.utils import list_options
 from zenml.client import Client
 from zenml.console import console
-from zenml.enums import CliCategories
+from zenml.constants import FILTERING_DATETIME_FORMAT
+from zenml.enums import CliCategories, ExecutionStatus
 from zenml.logger import get_logger
 from zenml.models import (
     PipelineBuildBase,
@@ -35,6 +37,7 @@ from zenml.models import (
 )
 from zenml.new.pipelines.pipeline import Pipeline
 from zenml.utils import source_utils, uuid_utils
+from zenml.utils.string_utils import get_human_readable_filesize
 from zenml.utils.yaml_utils import write_yaml
 
 logger = get_logger(__name__)
@@ -507,6 +510,136 @@ def delete_pipeline_run(
         cli_utils.declare(f"Deleted pipeline run '{run_name_or_id}'.")
 
 
+@runs.command(
+    "prune",
+    help="Delete all pipeline runs matching a retention policy, e.g. "
+    "`zenml pipeline runs prune --older-than 30` to delete all runs older "
+    "than 30 days.",
+)
+@click.option(
+    "--older-than",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Only delete runs created more than this number of days ago.",
+)
+@click.option(
+    "--pipeline",
+    "pipeline_name",
+    type=str,
+    default=None,
+    help="Only delete runs of the pipeline with this name.",
+)
+@click.option(
+    "--status",
+    type=click.Choice([status.value for status in ExecutionStatus]),
+    default=None,
+    help="Only delete runs with this status.",
+)
+@click.option(
+    "--delete-artifacts",
+    is_flag=True,
+    help="Also delete the artifact versions produced by the runs that aren't "
+    "used by any other run.",
+)
+@click.option(
+    "--delete-files",
+    is_flag=True,
+    help="Also remove the artifact and log files of the deleted runs and "
+    "artifact versions from the artifact stores.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only report what would be deleted.",
+)
+@click.option(
+    "--yes",
+    "-y",
+    is_flag=True,
+    help="Don't ask for confirmation.",
+)
+def prune_pipeline_runs(
+    older_than: Optional[int] = None,
+    pipeline_name: Optional[str] = None,
+    status: Optional[str] = None,
+    delete_artifacts: bool = False,
+    delete_files: bool = False,
+    dry_run: bool = False,
+    yes: bool = False,
+) -> None:
+    """Delete all pipeline runs matching a retention policy.
+
+    Args:
+        older_than: Only delete runs created more than this number of days
+            ago.
+        pipeline_name: Only delete runs of the pipeline with this name.
+        status: Only delete runs with this status.
+        delete_artifacts: Also delete the artifact versions produced by the
+            runs that aren't used by any other run.
+        delete_files: Also remove the files of the deleted entities from the
+            artifact stores.
+        dry_run: Only report what would be deleted.
+        yes: If set, don't ask for confirmation.
+    """
+    if older_than is None and pipeline_name is None and status is None:
+        cli_utils.error(
+            "Please specify at least one of `--older-than`, `--pipeline` or "
+            "`--status` to select the runs to delete."
+        )
+
+    created = None
+    if older_than is not None:
+        cutoff = datetime.utcnow() - timedelta(days=older_than)
+        created = f"lt:{cutoff.strftime(FILTERING_DATETIME_FORMAT)}"
+
+    if not yes and not dry_run:
+        confirmation = cli_utils.confirmation(
+            "Are you sure you want to delete all pipeline runs matching this "
+            "retention policy? You can use `--dry-run` to see what would be "
+            "deleted."
+        )
+        if not confirmation:
+            cli_utils.declare("Pipeline run deletion canceled.")
+            return
+
+    try:
+        with console.status("Deleting pipeline runs...\n"):
+            summary = Client().delete_pipeline_runs(
+                created=created,
+                pipeline_name=pipeline_name,
+                status=status,
+                delete_artifacts=delete_artifacts,
+                delete_from_artifact_store=delete_files,
+                dry_run=dry_run,
+            )
+    except (KeyError, ValueError) as e:
+        cli_utils.error(str(e))
+
+    prefix = "Would delete" if dry_run else "Deleted"
+    cli_utils.declare(
+        f"{prefix} {summary.pipeline_runs} pipeline run(s), "
+        f"{summary.step_runs} step run(s) and {summary.artifact_versions} "
+        "artifact version(s)."
+    )
+    if delete_files:
+        if dry_run:
+            cli_utils.declare(
+                f"Would remove {len(summary.files)} file(s) with a total size "
+                f"of {get_human_readable_filesize(summary.file_bytes or 0)} "
+                "from the artifact stores."
+            )
+        else:
+            cli_utils.declare(
+                f"Removed {summary.deleted_files} file(s) from the artifact "
+                "stores."
+            )
+            if summary.failed_files:
+                cli_utils.warning(
+                    f"Failed to remove {len(summary.failed_files)} file(s): "
+                    f"{', '.join(summary.failed_files)}"
+                )
+
+
 @pipeline.group()
 def builds() -> None:
     """Commands for pipeline builds."""
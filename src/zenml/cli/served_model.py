@@ -28,6 +28,7 @@ from zenml.cli.utils import (
     warning,
 )
 from zenml.console import console
+from zenml.constants import MODEL_SERVER_STATUS_MAX_AGE_SECONDS
 from zenml.enums import StackComponentType
 from zenml.model_deployers import BaseModelDeployer
 
@@ -122,6 +123,12 @@ def register_model_deployer_subcommands() -> None:  # noqa: C901
         is_flag=True,
         help="Show only model servers that are currently running.",
     )
+    @click.option(
+        "--no-refresh",
+        is_flag=True,
+        help="Show the last known status of the model servers instead of "
+        "checking their current status.",
+    )
     @click.pass_obj
     def list_models(
         model_deployer: "BaseModelDeployer",
@@ -132,6 +139,7 @@ def register_model_deployer_subcommands() -> None:  # noqa: C901
         model_version: Optional[str],
         flavor: Optional[str],
         running: bool,
+        no_refresh: bool,
     ) -> None:
         """List of all served models within the model-deployer stack component.
 
@@ -148,6 +156,8 @@ def register_model_deployer_subcommands() -> None:  # noqa: C901
             model_version: Show only served model versions for the given model
                 version.
             flavor: Show only served model versions for the given model flavor.
+            no_refresh: Show the last known status of the model servers
+                instead of checking their current status.
         """
         services = model_deployer.find_model_server(
             running=running,
@@ -157,6 +167,8 @@ def register_model_deployer_subcommands() -> None:  # noqa: C901
             model_name=model,
             model_version=model_version,
             flavor=flavor,
+            refresh_status=not no_refresh,
+            status_max_age=MODEL_SERVER_STATUS_MAX_AGE_SECONDS,
         )
         if services:
             pretty_print_model_deployer(
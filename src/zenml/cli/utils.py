@@ -39,7 +39,6 @@ from typing import (
 )
 
 import click
-import pkg_resources
 import yaml
 from pydantic import BaseModel, SecretStr
 from rich import box, table
@@ -76,7 +75,6 @@ from zenml.services import BaseService, ServiceState
 from zenml.stack import StackComponent
 from zenml.stack.stack_component import StackComponentConfig
 from zenml.utils import secret_utils
-from zenml.zen_server.deploy import ServerDeployment
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -99,6 +97,7 @@ if TYPE_CHECKING:
         StackResponse,
     )
     from zenml.stack import Stack
+    from zenml.zen_server.deploy import ServerDeployment
 
 logger = get_logger(__name__)
 
@@ -1134,6 +1133,8 @@ def is_uv_installed() -> bool:
     Returns:
         True if uv is installed, False otherwise.
     """
+    import pkg_resources
+
     try:
         pkg_resources.get_distribution("uv")
         return True
@@ -2747,6 +2748,8 @@ def is_jupyter_installed() -> bool:
     Returns:
         bool: True if Jupyter notebook is installed, False otherwise.
     """
+    import pkg_resources
+
     try:
         pkg_resources.get_distribution("notebook")
         return True
@@ -28,6 +28,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -45,11 +46,13 @@ from zenml.client_lazy_loader import (
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.source import Source
 from zenml.constants import (
+    ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
     ENV_ZENML_ACTIVE_STACK_ID,
     ENV_ZENML_ACTIVE_WORKSPACE_ID,
     ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
     ENV_ZENML_REPOSITORY_PATH,
     ENV_ZENML_SERVER,
+    LINEAGE_DEPTH_DEFAULT,
     PAGE_SIZE_DEFAULT,
     PAGINATION_STARTING_PAGE,
     REPOSITORY_DIRECTORY_NAME,
@@ -58,6 +61,7 @@ from zenml.constants import (
 )
 from zenml.enums import (
     ArtifactType,
+    LineageDirection,
     LogicalOperators,
     MetadataResourceTypes,
     ModelStages,
@@ -67,6 +71,7 @@ from zenml.enums import (
     SecretScope,
     SorterOps,
     StackComponentType,
+    StorageUsageGroup,
     StoreType,
 )
 from zenml.exceptions import (
@@ -86,12 +91,17 @@ from zenml.models import (
     APIKeyRotateRequest,
     APIKeyUpdate,
     ArtifactFilter,
+    ArtifactLineagePage,
     ArtifactResponse,
+    ArtifactStorageUsage,
+    ArtifactStoreFile,
+    ArtifactStoreGarbageReport,
     ArtifactUpdate,
     ArtifactVersionFilter,
     ArtifactVersionResponse,
     ArtifactVersionUpdate,
     BaseIdentifiedResponse,
+    BulkDeletionSummary,
     CodeRepositoryFilter,
     CodeRepositoryRequest,
     CodeRepositoryResponse,
@@ -185,12 +195,14 @@ from zenml.services.service import ServiceConfig
 from zenml.services.service_status import ServiceState
 from zenml.services.service_type import ServiceType
 from zenml.utils import io_utils, source_utils
+from zenml.utils.concurrency_utils import run_concurrently
 from zenml.utils.dict_utils import dict_to_bytes
 from zenml.utils.filesync_model import FileSyncModel
 from zenml.utils.pagination_utils import depaginate
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
     from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
     from zenml.service_connectors.service_connector import ServiceConnector
     from zenml.stack import Stack
@@ -3375,6 +3387,98 @@ class Client(metaclass=ClientMetaClass):
         )
         self.zen_store.delete_run(run_id=run.id)
 
+    def delete_pipeline_runs(
+        self,
+        logical_operator: LogicalOperators = LogicalOperators.AND,
+        id: Optional[Union[UUID, str]] = None,
+        created: Optional[Union[datetime, str]] = None,
+        updated: Optional[Union[datetime, str]] = None,
+        name: Optional[str] = None,
+        workspace_id: Optional[Union[str, UUID]] = None,
+        pipeline_id: Optional[Union[str, UUID]] = None,
+        pipeline_name: Optional[str] = None,
+        user_id: Optional[Union[str, UUID]] = None,
+        stack_id: Optional[Union[str, UUID]] = None,
+        status: Optional[str] = None,
+        start_time: Optional[Union[datetime, str]] = None,
+        end_time: Optional[Union[datetime, str]] = None,
+        unlisted: Optional[bool] = None,
+        delete_artifacts: bool = False,
+        delete_from_artifact_store: bool = False,
+        dry_run: bool = False,
+    ) -> BulkDeletionSummary:
+        """Deletes all pipeline runs matching the filters.
+
+        The runs are deleted in batches by the ZenML store instead of one by
+        one. If requested, the artifact and log files of the deleted entities
+        are removed from their artifact stores concurrently afterwards.
+
+        Args:
+            logical_operator: Which logical operator to use [and, or]
+            id: The id of the runs to filter by.
+            created: Use to filter by time of creation, e.g.
+                `lt:2024-01-01 00:00:00` to delete all runs created before
+                2024.
+            updated: Use the last updated date for filtering
+            name: The name of the run to filter by.
+            workspace_id: The id of the workspace to filter by.
+            pipeline_id: The id of the pipeline to filter by.
+            pipeline_name: The name of the pipeline to filter by.
+            user_id: The id of the user to filter by.
+            stack_id: The id of the stack to filter by.
+            status: The status of the pipeline run
+            start_time: The start_time for the pipeline run
+            end_time: The end_time for the pipeline run
+            unlisted: If the runs should be unlisted or not.
+            delete_artifacts: If True, also delete the artifact versions
+                produced by the runs that aren't used by any other run.
+            delete_from_artifact_store: If True, remove the artifact and log
+                files of the deleted entities from the artifact stores.
+            dry_run: If True, nothing is deleted and the returned summary
+                contains what would be deleted, including the size of the
+                files if `delete_from_artifact_store` is set.
+
+        Returns:
+            Summary of the deleted entities and files.
+        """
+        runs_filter_model = PipelineRunFilter(
+            logical_operator=logical_operator,
+            id=id,
+            created=created,
+            updated=updated,
+            name=name,
+            workspace_id=workspace_id,
+            pipeline_id=pipeline_id,
+            pipeline_name=pipeline_name,
+            user_id=user_id,
+            stack_id=stack_id,
+            status=status,
+            start_time=start_time,
+            end_time=end_time,
+            unlisted=unlisted,
+        )
+        runs_filter_model.set_scope_workspace(self.active_workspace.id)
+        summary = self.zen_store.delete_runs(
+            runs_filter_model=runs_filter_model,
+            delete_artifacts=delete_artifacts,
+            dry_run=dry_run,
+        )
+
+        if delete_from_artifact_store:
+            if dry_run:
+                summary.file_bytes = self._get_artifact_store_files_size(
+                    summary.files
+                )
+            else:
+                summary.failed_files = self._delete_artifact_store_files(
+                    summary.files
+                )
+                summary.deleted_files = len(
+                    [file for file in summary.files if file.artifact_store_id]
+                ) - len(summary.failed_files)
+
+        return summary
+
     # -------------------------------- Step run --------------------------------
 
     def get_run_step(
@@ -3608,14 +3712,60 @@ class Client(metaclass=ClientMetaClass):
             unused_artifact_versions = depaginate(
                 partial(self.list_artifact_versions, only_unused=True)
             )
-            for unused_artifact_version in unused_artifact_versions:
-                self._delete_artifact_from_artifact_store(
-                    unused_artifact_version
-                )
+            self._delete_artifacts_from_artifact_stores(
+                unused_artifact_versions
+            )
 
         self.zen_store.prune_artifact_versions(only_versions)
         logger.info("All unused artifacts and artifact versions deleted.")
 
+    def garbage_collect_artifact_store(
+        self,
+        name_id_or_prefix: Optional[Union[str, UUID]] = None,
+        delete: bool = False,
+        compute_sizes: bool = True,
+    ) -> ArtifactStoreGarbageReport:
+        """Find and optionally delete orphaned files in an artifact store.
+
+        Artifact directories and log files of step runs are orphaned if no
+        artifact version or step run references them anymore, e.g. because
+        a step failed before registering its outputs or artifact versions
+        were deleted without their files.
+
+        Args:
+            name_id_or_prefix: The name, ID or prefix of the artifact store.
+                If not given, the artifact store of the active stack is used.
+            delete: Whether to delete the orphaned files. Otherwise, they
+                are only reported.
+            compute_sizes: Whether to compute the size of the orphaned
+                files, as well as to compute and store the size of all
+                artifact versions in the artifact store whose size is not
+                known yet.
+
+        Returns:
+            The garbage collection report.
+        """
+        from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+        from zenml.artifacts.garbage_collection import collect_garbage
+        from zenml.stack.stack_component import StackComponent
+
+        if name_id_or_prefix is None:
+            artifact_store = self.active_stack.artifact_store
+        else:
+            artifact_store_model = self.get_stack_component(
+                component_type=StackComponentType.ARTIFACT_STORE,
+                name_id_or_prefix=name_id_or_prefix,
+            )
+            component = StackComponent.from_model(artifact_store_model)
+            assert isinstance(component, BaseArtifactStore)
+            artifact_store = component
+
+        return collect_garbage(
+            artifact_store=artifact_store,
+            delete=delete,
+            compute_sizes=compute_sizes,
+        )
+
     # --------------------------- Artifact Versions ---------------------------
 
     def get_artifact_version(
@@ -3772,6 +3922,73 @@ class Client(metaclass=ClientMetaClass):
             artifact_version_update=artifact_version_update,
         )
 
+    def get_artifact_version_lineage(
+        self,
+        name_id_or_prefix: Union[str, UUID],
+        version: Optional[str] = None,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: int = LINEAGE_DEPTH_DEFAULT,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> ArtifactLineagePage:
+        """Get the step runs in the lineage of an artifact version.
+
+        The lineage spans across pipeline runs, e.g. the downstream lineage
+        of a dataset contains all step runs that consumed the dataset or any
+        artifact derived from it, together with their pipeline runs and the
+        model versions linked to these runs.
+
+        Args:
+            name_id_or_prefix: Either the ID of the artifact version or the
+                name of the artifact.
+            version: The version of the artifact. Only used if
+                `name_id_or_prefix` is the name of the artifact. If not
+                specified, the latest version is used.
+            direction: The direction in which to follow the lineage.
+            max_depth: The maximum number of step runs between the artifact
+                version and a step run in the lineage.
+            page: The page to get.
+            size: The maximum number of entries per page.
+
+        Returns:
+            A page of the step runs in the lineage, ordered by depth.
+        """
+        if isinstance(name_id_or_prefix, UUID):
+            artifact_version_id = name_id_or_prefix
+        else:
+            artifact_version_id = self.get_artifact_version(
+                name_id_or_prefix=name_id_or_prefix,
+                version=version,
+                hydrate=False,
+            ).id
+
+        return self.zen_store.get_artifact_version_lineage(
+            artifact_version_id=artifact_version_id,
+            direction=direction,
+            max_depth=max_depth,
+            page=page,
+            size=size,
+        )
+
+    def get_artifact_storage_usage(
+        self, group_by: StorageUsageGroup = StorageUsageGroup.ARTIFACT
+    ) -> List[ArtifactStorageUsage]:
+        """Get the storage used by artifact versions, grouped by an entity.
+
+        The size of an artifact version is stored when it is saved. For
+        older artifact versions or artifact versions saved without metadata,
+        it is computed by `garbage_collect_artifact_store(...)`.
+
+        Args:
+            group_by: The entity by which to group the artifact versions.
+                An artifact version counts towards every pipeline that
+                produced it.
+
+        Returns:
+            The storage usage of each entity, ordered by size.
+        """
+        return self.zen_store.get_artifact_storage_usage(group_by=group_by)
+
     def delete_artifact_version(
         self,
         name_id_or_prefix: Union[str, UUID],
@@ -3872,6 +4089,162 @@ class Client(metaclass=ClientMetaClass):
                 "store."
             )
 
+    def _delete_artifacts_from_artifact_stores(
+        self, artifact_versions: Sequence[ArtifactVersionResponse]
+    ) -> None:
+        """Concurrently delete artifact objects from their artifact stores.
+
+        Args:
+            artifact_versions: The artifact versions to delete.
+
+        Raises:
+            RuntimeError: If any of the artifacts could not be deleted.
+        """
+        failed_uris = self._delete_artifact_store_files(
+            [
+                ArtifactStoreFile(
+                    uri=artifact_version.uri,
+                    artifact_store_id=artifact_version.artifact_store_id,
+                )
+                for artifact_version in artifact_versions
+            ]
+        )
+        if failed_uris:
+            raise RuntimeError(
+                f"Failed to delete {len(failed_uris)} artifact(s) from the "
+                f"artifact store: {', '.join(failed_uris)}"
+            )
+
+    def _get_artifact_stores(
+        self, files: Sequence[ArtifactStoreFile]
+    ) -> List[Optional["BaseArtifactStore"]]:
+        """Instantiate the artifact stores which contain files.
+
+        Args:
+            files: The files.
+
+        Returns:
+            The artifact store of each file, or None if it could not be
+            instantiated.
+        """
+        from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+        from zenml.stack.stack_component import StackComponent
+
+        artifact_stores: Dict[UUID, BaseArtifactStore] = {}
+        for artifact_store_id in {
+            file.artifact_store_id for file in files if file.artifact_store_id
+        }:
+            try:
+                artifact_store_model = self.get_stack_component(
+                    component_type=StackComponentType.ARTIFACT_STORE,
+                    name_id_or_prefix=artifact_store_id,
+                )
+                artifact_store = StackComponent.from_model(
+                    artifact_store_model
+                )
+                assert isinstance(artifact_store, BaseArtifactStore)
+            except Exception as e:
+                logger.error(
+                    f"Failed to load artifact store '{artifact_store_id}'. "
+                    "This might happen if your local client does not have "
+                    "access to the artifact store or does not have the "
+                    f"required integrations installed. Full error: {e}"
+                )
+            else:
+                artifact_stores[artifact_store_id] = artifact_store
+
+        return [
+            artifact_stores.get(file.artifact_store_id)
+            if file.artifact_store_id
+            else None
+            for file in files
+        ]
+
+    def _delete_artifact_store_files(
+        self, files: Sequence[ArtifactStoreFile]
+    ) -> List[str]:
+        """Concurrently remove files and directories from artifact stores.
+
+        Args:
+            files: The files to remove.
+
+        Files without an artifact store are skipped.
+
+        Returns:
+            The URIs of the files that could not be removed.
+        """
+        failed_uris: List[str] = []
+        removable_files: List[Tuple["BaseArtifactStore", str]] = []
+        for file, artifact_store in zip(
+            files, self._get_artifact_stores(files)
+        ):
+            if not file.artifact_store_id:
+                logger.warning(
+                    f"Artifact '{file.uri}' does not have an artifact store "
+                    "associated with it. Skipping deletion from artifact "
+                    "store."
+                )
+            elif artifact_store:
+                removable_files.append((artifact_store, file.uri))
+            else:
+                failed_uris.append(file.uri)
+
+        def _remove(artifact_store: "BaseArtifactStore", uri: str) -> None:
+            if artifact_store.isdir(uri):
+                artifact_store.rmtree(uri)
+            elif artifact_store.exists(uri):
+                artifact_store.remove(uri)
+
+        results = run_concurrently(
+            [
+                partial(_remove, artifact_store, uri)
+                for artifact_store, uri in removable_files
+            ],
+            max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+        )
+        for (_, uri), result in zip(removable_files, results):
+            if result.error:
+                logger.error(
+                    f"Failed to delete '{uri}' from the artifact store: "
+                    f"{result.error}"
+                )
+                failed_uris.append(uri)
+
+        removed_files = len(removable_files) - sum(
+            1 for result in results if result.error
+        )
+        if removed_files:
+            logger.info(
+                f"Deleted {removed_files} file(s) from the artifact stores."
+            )
+        return failed_uris
+
+    def _get_artifact_store_files_size(
+        self, files: Sequence[ArtifactStoreFile]
+    ) -> int:
+        """Concurrently compute the total size of files in artifact stores.
+
+        Args:
+            files: The files and directories.
+
+        Returns:
+            The total size in bytes of all files whose size could be
+            determined.
+        """
+        from zenml.artifacts.garbage_collection import compute_size
+
+        results = run_concurrently(
+            [
+                partial(compute_size, artifact_store, file.uri)
+                for file, artifact_store in zip(
+                    files, self._get_artifact_stores(files)
+                )
+                if artifact_store
+            ],
+            max_workers=ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS,
+        )
+        return sum(result.value or 0 for result in results)
+
     # ------------------------------ Run Metadata ------------------------------
 
     def create_run_metadata(
@@ -4378,6 +4751,58 @@ class Client(metaclass=ClientMetaClass):
 
         raise KeyError(msg)
 
+    def get_secrets_by_name(
+        self,
+        names: Sequence[str],
+        scope: Optional[SecretScope] = None,
+        hydrate: bool = True,
+    ) -> Dict[str, SecretResponse]:
+        """Fetches multiple secrets by their exact names in a single call.
+
+        This resolves the names the same way as `get_secret_by_name_and_scope`
+        but lets the zen store resolve all names and fetch the values of the
+        matching secrets in a single call.
+
+        Args:
+            names: The names of the secrets to get.
+            scope: The scope of the secrets to get. If not set, secrets in
+                the user scope take precedence over secrets in the workspace
+                scope.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            A dictionary mapping the names to the secrets. Names for which no
+            secret exists are not included.
+
+        Raises:
+            NotImplementedError: If centralized secrets management is not
+                enabled.
+        """
+        requested_names = set(names)
+        if not requested_names:
+            return {}
+
+        try:
+            secrets = self.zen_store.get_secrets_by_name(
+                names=sorted(requested_names),
+                workspace_id=self.active_workspace.id,
+                user_id=self.active_user.id,
+                scope=scope,
+                hydrate=hydrate,
+            )
+        except NotImplementedError:
+            raise NotImplementedError(
+                "centralized secrets management is not supported or explicitly "
+                "disabled in the target ZenML deployment."
+            )
+
+        return {
+            secret.name: secret
+            for secret in secrets
+            if secret.name in requested_names
+        }
+
     def list_secrets_in_scope(
         self,
         scope: SecretScope,
@@ -5050,6 +5475,9 @@ class Client(metaclass=ClientMetaClass):
             AuthorizationException: If the service connector verification
                 fails due to invalid credentials or insufficient permissions.
         """
+        from zenml.service_connectors.service_connector import (
+            service_connector_cache,
+        )
         from zenml.service_connectors.service_connector_registry import (
             service_connector_registry,
         )
@@ -5184,6 +5612,7 @@ class Client(metaclass=ClientMetaClass):
             service_connector_id=connector_model.id,
             update=connector_update,
         )
+        service_connector_cache.invalidate(connector_model.id)
 
         if connector_resources:
             connector_resources.id = connector_response.id
@@ -5203,6 +5632,10 @@ class Client(metaclass=ClientMetaClass):
         Args:
             name_id_or_prefix: The ID or name of the service connector to delete.
         """
+        from zenml.service_connectors.service_connector import (
+            service_connector_cache,
+        )
+
         service_connector = self.get_service_connector(
             name_id_or_prefix=name_id_or_prefix,
             allow_name_prefix_match=False,
@@ -5211,6 +5644,7 @@ class Client(metaclass=ClientMetaClass):
         self.zen_store.delete_service_connector(
             service_connector_id=service_connector.id
         )
+        service_connector_cache.invalidate(service_connector.id)
         logger.info(
             "Removed service connector (type: %s) with name '%s'.",
             service_connector.type,
@@ -13,8 +13,21 @@
 #  permissions and limitations under the License.
 """Base class for code repositories."""
 
+import os
+import tarfile
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Type,
+)
 from uuid import UUID
 
 from zenml.config.secret_reference_mixin import SecretReferenceMixin
@@ -27,6 +40,24 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Maximum number of files downloaded concurrently if a code repository
+# downloads files individually.
+MAX_CONCURRENT_FILE_DOWNLOADS = 16
+
+
+def normalize_repository_sub_directory(sub_directory: Optional[str]) -> str:
+    """Normalizes a subdirectory of a repository.
+
+    Args:
+        sub_directory: The subdirectory relative to the repository root.
+
+    Returns:
+        The normalized subdirectory without leading or trailing slashes, or
+        an empty string for the repository root.
+    """
+    normalized = os.path.normpath(sub_directory or ".").replace(os.sep, "/")
+    return "" if normalized == "." else normalized.strip("/")
+
 
 class BaseCodeRepositoryConfig(SecretReferenceMixin, ABC):
     """Base config for code repositories."""
@@ -144,3 +175,115 @@ class BaseCodeRepository(ABC):
             The local repository context object.
         """
         pass
+
+    @staticmethod
+    def _extract_archive(
+        archive: IO[bytes],
+        directory: str,
+        repo_sub_directory: Optional[str],
+    ) -> None:
+        """Extracts a repository archive to a local directory.
+
+        Repository archives created by git hosting services contain a single
+        top-level directory which includes all files of the repository. This
+        directory is stripped when extracting the archive.
+
+        Args:
+            archive: The (optionally compressed) tar archive.
+            directory: The directory to extract the files to.
+            repo_sub_directory: The subdirectory in the repository to
+                extract files from.
+
+        Raises:
+            RuntimeError: If the archive contains files outside of the
+                target directory or the subdirectory does not exist.
+        """
+        prefix = normalize_repository_sub_directory(repo_sub_directory)
+        directory = os.path.abspath(directory)
+        os.makedirs(directory, exist_ok=True)
+        found_sub_directory = not prefix
+
+        with tarfile.open(fileobj=archive, mode="r:*") as tar:
+            for member in tar:
+                _, _, path = member.name.partition("/")
+                if prefix:
+                    if path != prefix and not path.startswith(prefix + "/"):
+                        continue
+                    found_sub_directory = True
+                    path = path[len(prefix) :].lstrip("/")
+
+                if not path or not (member.isfile() or member.isdir()):
+                    continue
+
+                local_path = os.path.abspath(os.path.join(directory, path))
+                if os.path.commonpath([directory, local_path]) != directory:
+                    raise RuntimeError(
+                        f"Invalid path `{member.name}` in repository archive."
+                    )
+
+                if member.isdir():
+                    os.makedirs(local_path, exist_ok=True)
+                    continue
+
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                file = tar.extractfile(member)
+                assert file
+                with file, open(local_path, "wb") as f:
+                    while data := file.read(1024 * 1024):
+                        f.write(data)
+                os.chmod(local_path, member.mode & 0o777)
+
+        if not found_sub_directory:
+            raise RuntimeError("Invalid repository subdirectory.")
+
+    @staticmethod
+    def _download_files_concurrently(
+        paths: List[str],
+        directory: str,
+        repo_sub_directory: Optional[str],
+        download_file: Callable[[str], bytes],
+    ) -> None:
+        """Downloads individual files of a repository concurrently.
+
+        Args:
+            paths: Paths of the files to download relative to the repository
+                root.
+            directory: The directory to download the files to.
+            repo_sub_directory: The subdirectory in the repository from which
+                the files are downloaded. The file paths inside the target
+                directory are relative to this subdirectory.
+            download_file: Function that returns the content of the file at
+                a path.
+
+        Raises:
+            RuntimeError: If any of the files failed to download.
+        """
+        prefix = normalize_repository_sub_directory(repo_sub_directory)
+        failed_paths: List[str] = []
+
+        def _download(path: str) -> None:
+            relative_path = os.path.relpath(path, prefix or ".")
+            local_path = os.path.join(directory, relative_path)
+            try:
+                content = download_file(path)
+            except Exception as e:
+                logger.error("Error processing %s: %s", path, e)
+                failed_paths.append(path)
+                return
+
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with open(local_path, "wb") as f:
+                f.write(content)
+
+        os.makedirs(directory, exist_ok=True)
+        with ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_FILE_DOWNLOADS
+        ) as pool:
+            # Consume the iterator to surface unexpected exceptions
+            list(pool.map(_download, paths))
+
+        if failed_paths:
+            raise RuntimeError(
+                f"Failed to download {len(failed_paths)} file(s) of the code "
+                f"repository: {', '.join(sorted(failed_paths)[:10])}"
+            )
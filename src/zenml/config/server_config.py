@@ -226,6 +226,9 @@ class ServerConfiguration(BaseModel):
         auto_activate: Whether to automatically activate the server and create a
             default admin user account with an empty password during the initial
             deployment.
+        metrics_enabled: Whether to collect request, database, RBAC,
+            authentication and artifact store latency metrics and expose them
+            in the Prometheus text format at the `/metrics` endpoint.
     """
 
     deployment_type: ServerDeploymentType = ServerDeploymentType.OTHER
@@ -300,6 +303,7 @@ class ServerConfiguration(BaseModel):
     display_announcements: bool = True
     display_updates: bool = True
     auto_activate: bool = False
+    metrics_enabled: bool = False
 
     _deployment_id: Optional[UUID] = None
 
@@ -139,6 +139,10 @@ ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING = (
 ENV_ZENML_DISABLE_WORKSPACE_WARNINGS = "ZENML_DISABLE_WORKSPACE_WARNINGS"
 ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT = "ZENML_SKIP_IMAGE_BUILDER_DEFAULT"
 ENV_ZENML_REQUIRES_CODE_DOWNLOAD = "ZENML_REQUIRES_CODE_DOWNLOAD"
+ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY = "ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY"
+ENV_ZENML_CODE_DOWNLOAD_CACHE_MAX_ENTRIES = (
+    "ZENML_CODE_DOWNLOAD_CACHE_MAX_ENTRIES"
+)
 ENV_ZENML_SERVER = "ZENML_SERVER"
 ENV_ZENML_LOCAL_SERVER = "ZENML_LOCAL_SERVER"
 ENV_ZENML_HUB_URL = "ZENML_HUB_URL"
@@ -149,6 +153,30 @@ ENV_ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES = (
     "ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES"
 )
 ENV_ZENML_IGNORE_FAILURE_HOOK = "ZENML_IGNORE_FAILURE_HOOK"
+ENV_ZENML_PARSED_DEPLOYMENT_CACHE_SIZE = "ZENML_PARSED_DEPLOYMENT_CACHE_SIZE"
+ENV_ZENML_RUN_GRAPH_CACHE_SIZE = "ZENML_RUN_GRAPH_CACHE_SIZE"
+ENV_ZENML_STEP_TRACING = "ZENML_STEP_TRACING"
+ENV_ZENML_STEP_TRACING_OPENTELEMETRY = "ZENML_STEP_TRACING_OPENTELEMETRY"
+ENV_ZENML_STEP_PROFILING = "ZENML_STEP_PROFILING"
+ENV_ZENML_STEP_PROFILING_INTERVAL_MS = "ZENML_STEP_PROFILING_INTERVAL_MS"
+ENV_ZENML_DISABLE_INTEGRATION_INSTALLATION_CACHE = (
+    "ZENML_DISABLE_INTEGRATION_INSTALLATION_CACHE"
+)
+ENV_ZENML_SECRETS_CACHE_TTL = "ZENML_SECRETS_CACHE_TTL"
+ENV_ZENML_VISUALIZATION_CACHE_SIZE = "ZENML_VISUALIZATION_CACHE_SIZE"
+ENV_ZENML_WRITE_BEHIND_PUBLISHING = "ZENML_WRITE_BEHIND_PUBLISHING"
+ENV_ZENML_SERVICE_CONNECTOR_VERIFICATION_TIMEOUT = (
+    "ZENML_SERVICE_CONNECTOR_VERIFICATION_TIMEOUT"
+)
+ENV_ZENML_SERVICE_CONNECTOR_VERIFICATION_WORKERS = (
+    "ZENML_SERVICE_CONNECTOR_VERIFICATION_WORKERS"
+)
+ENV_ZENML_MODEL_SERVER_STATUS_MAX_AGE = "ZENML_MODEL_SERVER_STATUS_MAX_AGE"
+ENV_ZENML_MODEL_SERVER_STATUS_TIMEOUT = "ZENML_MODEL_SERVER_STATUS_TIMEOUT"
+ENV_ZENML_MODEL_SERVER_STATUS_WORKERS = "ZENML_MODEL_SERVER_STATUS_WORKERS"
+ENV_ZENML_GARBAGE_COLLECTION_MIN_LOG_AGE = (
+    "ZENML_GARBAGE_COLLECTION_MIN_LOG_AGE"
+)
 
 # ZenML Server environment variables
 ENV_ZENML_SERVER_PREFIX = "ZENML_SERVER_"
@@ -317,6 +345,7 @@ DEACTIVATE = "/deactivate"
 DEVICES = "/devices"
 DEVICE_AUTHORIZATION = "/device_authorization"
 DEVICE_VERIFY = "/verify"
+DOWNLOAD = "/download"
 EMAIL_ANALYTICS = "/email-opt-in"
 EVENT_FLAVORS = "/event-flavors"
 EVENT_SOURCES = "/event-sources"
@@ -325,19 +354,25 @@ GET_OR_CREATE = "/get-or-create"
 GRAPH = "/graph"
 HEALTH = "/health"
 INFO = "/info"
+LINEAGE = "/lineage"
 LOGIN = "/login"
 LOGOUT = "/logout"
 LOGS = "/logs"
+METRICS = "/metrics"
 PIPELINE_BUILDS = "/pipeline_builds"
 PIPELINE_CONFIGURATION = "/pipeline-configuration"
 PIPELINE_DEPLOYMENTS = "/pipeline_deployments"
 PIPELINES = "/pipelines"
 PIPELINE_SPEC = "/pipeline-spec"
 PLUGIN_FLAVORS = "/plugin-flavors"
+RAW = "/raw"
+REFERENCES = "/references"
 RUNS = "/runs"
 RUN_METADATA = "/run-metadata"
 SCHEDULES = "/schedules"
 SECRETS = "/secrets"
+SECRETS_BATCH = "/batch"
+SECRETS_BY_NAME = "/by-name"
 SECRETS_OPERATIONS = "/secrets_operations"
 SECRETS_BACKUP = "/backup"
 SECRETS_RESTORE = "/restore"
@@ -358,6 +393,7 @@ STACKS = "/stacks"
 STACK_COMPONENTS = "/components"
 STATISTICS = "/statistics"
 STATUS = "/status"
+STORAGE_USAGE = "/storage_usage"
 STEP_CONFIGURATION = "/step-configuration"
 STEPS = "/steps"
 TAGS = "/tags"
@@ -381,6 +417,13 @@ PIPELINE_API_TOKEN_EXPIRES_MINUTES = handle_int_env_var(
 
 # Secret constants
 SECRET_VALUES = "values"
+# Caching secret values is opt-in: the cache is local to a process, so other
+# server replicas might return outdated values until their entries expire
+SECRETS_CACHE_TTL_SECONDS = handle_int_env_var(
+    ENV_ZENML_SECRETS_CACHE_TTL, default=0
+)
+SECRETS_CACHE_MAX_ENTRIES = 1000
+SECRETS_STORE_MAX_CONCURRENT_REQUESTS = 8
 
 # Pagination and filtering defaults
 PAGINATION_STARTING_PAGE: int = 1
@@ -392,6 +435,41 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
 )
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Maximum number of parsed pipeline deployment configurations cached in memory
+PARSED_DEPLOYMENT_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_PARSED_DEPLOYMENT_CACHE_SIZE, default=128
+)
+# Maximum number of lineage graphs of finished pipeline runs cached in memory
+RUN_GRAPH_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_RUN_GRAPH_CACHE_SIZE, default=32
+)
+
+# Interval at which the resource usage of a step is sampled if step
+# profiling is enabled
+STEP_PROFILING_INTERVAL_MILLISECONDS: int = handle_int_env_var(
+    ENV_ZENML_STEP_PROFILING_INTERVAL_MS, default=500
+)
+
+# Maximum number of code downloads that are kept in the local download cache
+CODE_DOWNLOAD_CACHE_MAX_ENTRIES: int = handle_int_env_var(
+    ENV_ZENML_CODE_DOWNLOAD_CACHE_MAX_ENTRIES, default=10
+)
+
+# Artifact lineage query defaults
+LINEAGE_DEPTH_DEFAULT: int = 10
+LINEAGE_DEPTH_MAXIMUM: int = 100
+
+# Number of pipeline runs that are deleted in a single transaction
+BULK_DELETION_BATCH_SIZE = 100
+# Maximum number of files that are removed from an artifact store at once
+ARTIFACT_STORE_MAX_CONCURRENT_OPERATIONS = 16
+# Log files are written before their step run is registered, so unreferenced
+# log files are only considered orphaned once they are older than this
+GARBAGE_COLLECTION_MIN_LOG_AGE_SECONDS = handle_int_env_var(
+    ENV_ZENML_GARBAGE_COLLECTION_MIN_LOG_AGE,
+    default=60 * 60 * 24,  # 1 day
+)
+
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
@@ -441,9 +519,44 @@ MEDIUMTEXT_MAX_LENGTH = 2**24 - 1
 # Model Control Plane constants
 LATEST_MODEL_VERSION_PLACEHOLDER = "__latest__"
 
+# Source utils constants
+SOURCE_CACHE_MAX_ENTRIES = 1024
+
+# Artifact download constants
+ARTIFACT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+ARTIFACT_DOWNLOAD_MAX_CONCURRENT_READS = 8
+
+# Artifact visualization constants
+ARTIFACT_STORE_CACHE_MAX_ENTRIES = 32
+ARTIFACT_STORE_CACHE_MAX_AGE_SECONDS = 60 * 5  # 5 minutes
+VISUALIZATION_CACHE_MAX_BYTES = handle_int_env_var(
+    ENV_ZENML_VISUALIZATION_CACHE_SIZE, default=64 * 1024 * 1024
+)
+VISUALIZATION_CACHE_MAX_ENTRY_BYTES = 8 * 1024 * 1024  # 8 MiB
+
 
 # Service connector constants
 SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS = 60 * 5  # 5 minutes
+SERVICE_CONNECTOR_CACHE_MAX_ENTRIES = 256
+SERVICE_CONNECTOR_CACHE_MAX_AGE_SECONDS = 60 * 15  # 15 minutes
+SERVICE_CONNECTOR_CACHE_REFRESH_MARGIN_SECONDS = 60 * 5  # 5 minutes
+SERVICE_CONNECTOR_VERIFICATION_TIMEOUT_SECONDS = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_VERIFICATION_TIMEOUT, default=60
+)
+SERVICE_CONNECTOR_VERIFICATION_MAX_WORKERS = handle_int_env_var(
+    ENV_ZENML_SERVICE_CONNECTOR_VERIFICATION_WORKERS, default=16
+)
+
+# Model server status refresh
+MODEL_SERVER_STATUS_MAX_AGE_SECONDS = handle_int_env_var(
+    ENV_ZENML_MODEL_SERVER_STATUS_MAX_AGE, default=30
+)
+MODEL_SERVER_STATUS_REFRESH_TIMEOUT_SECONDS = handle_int_env_var(
+    ENV_ZENML_MODEL_SERVER_STATUS_TIMEOUT, default=30
+)
+MODEL_SERVER_STATUS_REFRESH_MAX_WORKERS = handle_int_env_var(
+    ENV_ZENML_MODEL_SERVER_STATUS_WORKERS, default=16
+)
 
 # Versioned entities
 MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION = (
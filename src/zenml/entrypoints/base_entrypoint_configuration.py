@@ -225,7 +225,8 @@ class BaseEntrypointConfiguration(ABC):
             code_repo_root, code_reference.subdirectory
         )
         os.makedirs(download_dir)
-        repo.download_files(
+        code_repository_utils.download_code_from_repository(
+            repo=repo,
             commit=code_reference.commit,
             directory=download_dir,
             repo_sub_directory=code_reference.subdirectory,
@@ -357,6 +357,36 @@ class MetadataResourceTypes(StrEnum):
     MODEL_VERSION = "model_version"
 
 
+class LineageDirection(StrEnum):
+    """Directions in which the lineage of an artifact version can be queried."""
+
+    UPSTREAM = "upstream"
+    DOWNSTREAM = "downstream"
+
+
+class StorageUsageGroup(StrEnum):
+    """Entities by which the storage usage of artifacts can be grouped."""
+
+    ARTIFACT = "artifact"
+    PIPELINE = "pipeline"
+    WORKSPACE = "workspace"
+
+
+class StepExecutionPhase(StrEnum):
+    """All traced phases of a step execution."""
+
+    RUN_CREATION = "run_creation"
+    INPUT_RESOLUTION = "input_resolution"
+    CACHE_LOOKUP = "cache_lookup"
+    INPUT_LOADING = "input_loading"
+    USER_FUNCTION = "user_function"
+    OUTPUT_MATERIALIZATION = "output_materialization"
+    VISUALIZATION = "visualization"
+    METADATA_EXTRACTION = "metadata_extraction"
+    PUBLISHING = "publishing"
+    OTHER = "other"
+
+
 class DatabaseBackupStrategy(StrEnum):
     """All available database backup strategies."""
 
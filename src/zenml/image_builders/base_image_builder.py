@@ -13,7 +13,6 @@
 #  permissions and limitations under the License.
 """Base class for all ZenML image builders."""
 
-import hashlib
 import os
 import tempfile
 from abc import ABC, abstractmethod
@@ -103,6 +102,10 @@ class BaseImageBuilder(StackComponent, ABC):
     ) -> str:
         """Uploads a Docker image build context to a remote location.
 
+        The build context is stored under its content checksum, so the
+        archive is neither created nor uploaded if a build context with the
+        same content was uploaded before.
+
         Args:
             build_context: The build context to upload.
             parent_path_directory_name: The name of the directory to upload
@@ -117,24 +120,17 @@ class BaseImageBuilder(StackComponent, ABC):
         parent_path = f"{artifact_store.path}/{parent_path_directory_name}"
         fileio.makedirs(parent_path)
 
-        hash_ = hashlib.sha1()  # nosec
+        filename = f"{build_context.compute_checksum()}.tar.gz"
+        filepath = f"{parent_path}/{filename}"
+        if fileio.exists(filepath):
+            logger.info("Build context already exists, not uploading.")
+            return filepath
+
         with tempfile.NamedTemporaryFile(mode="w+b", delete=False) as f:
             build_context.write_archive(f, gzip=True)
 
-            while True:
-                data = f.read(64 * 1024)
-                if not data:
-                    break
-                hash_.update(data)
-
-            filename = f"{hash_.hexdigest()}.tar.gz"
-            filepath = f"{parent_path}/{filename}"
-            if not fileio.exists(filepath):
-                logger.info("Uploading build context to `%s`.", filepath)
-                fileio.copy(f.name, filepath)
-            else:
-                logger.info("Build context already exists, not uploading.")
-
+        logger.info("Uploading build context to `%s`.", filepath)
+        fileio.copy(f.name, filepath)
         os.unlink(f.name)
         return filepath
 
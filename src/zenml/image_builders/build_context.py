@@ -13,9 +13,17 @@
 #  permissions and limitations under the License.
 """Image build context."""
 
+import collections
+import gzip as gzip_module
+import hashlib
+import json
 import os
+import stat
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Set, Tuple, cast
+from typing import IO, Any, Deque, Dict, List, Optional, Set, Tuple, cast
 
 from zenml.constants import REPOSITORY_DIRECTORY_NAME
 from zenml.io import fileio
@@ -24,6 +32,171 @@ from zenml.utils import io_utils, string_utils
 
 logger = get_logger(__name__)
 
+FILE_HASH_MANIFEST_DIRECTORY = "build_context_manifests"
+# Files modified less than this many seconds before hashing them might be
+# modified again without changing their modification time, so their hashes
+# are not cached.
+FILE_HASH_MANIFEST_MIN_AGE = 2
+COMPRESSION_CHUNK_SIZE = 4 * 1024 * 1024
+COMPRESSION_LEVEL = 9
+
+
+def _hash_file(path: str) -> str:
+    """Computes the SHA-256 hash of a file.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The file hash.
+    """
+    hash_ = hashlib.sha256()
+    with open(path, "rb") as f:
+        while data := f.read(1024 * 1024):
+            hash_.update(data)
+    return hash_.hexdigest()
+
+
+def _get_max_workers() -> int:
+    """Gets the number of threads to use for hashing and compression.
+
+    Returns:
+        The number of threads.
+    """
+    return min(8, os.cpu_count() or 1)
+
+
+class _FileHashManifest:
+    """Persisted content hashes of the files in a build context root.
+
+    The hash of a file is reused as long as its size and modification time
+    don't change, so unchanged files don't need to be read again when
+    computing the build context checksum.
+    """
+
+    def __init__(self, root: str) -> None:
+        """Initializes the manifest.
+
+        Args:
+            root: The build context root directory.
+        """
+        root_hash = hashlib.md5(  # nosec
+            os.path.abspath(root).encode()
+        ).hexdigest()
+        self._path = os.path.join(
+            io_utils.get_global_config_directory(),
+            FILE_HASH_MANIFEST_DIRECTORY,
+            f"{root_hash}.json",
+        )
+        self._entries: Dict[str, List[Any]] = {}
+        self._updated_entries: Dict[str, List[Any]] = {}
+
+        try:
+            with open(self._path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def get_hashes(
+        self, files: Dict[str, Tuple[str, os.stat_result]]
+    ) -> Dict[str, str]:
+        """Gets the content hashes of files.
+
+        Args:
+            files: Mapping of the relative path of each file to its absolute
+                path and stat result.
+
+        Returns:
+            Mapping of the relative path of each file to its content hash.
+        """
+        hashes = {}
+        files_to_hash = []
+        min_modification_time = time.time_ns() - int(
+            FILE_HASH_MANIFEST_MIN_AGE * 1e9
+        )
+
+        for path, (full_path, stat_result) in files.items():
+            entry = self._entries.get(path)
+            if (
+                isinstance(entry, list)
+                and len(entry) == 3
+                and entry[0] == stat_result.st_size
+                and entry[1] == stat_result.st_mtime_ns
+            ):
+                hashes[path] = entry[2]
+                self._updated_entries[path] = entry
+            else:
+                files_to_hash.append((path, full_path, stat_result))
+
+        if files_to_hash:
+            with ThreadPoolExecutor(max_workers=_get_max_workers()) as pool:
+                new_hashes = pool.map(
+                    _hash_file,
+                    [full_path for _, full_path, _ in files_to_hash],
+                )
+                for (path, _, stat_result), hash_ in zip(
+                    files_to_hash, new_hashes
+                ):
+                    hashes[path] = hash_
+                    if stat_result.st_mtime_ns < min_modification_time:
+                        self._updated_entries[path] = [
+                            stat_result.st_size,
+                            stat_result.st_mtime_ns,
+                            hash_,
+                        ]
+
+        return hashes
+
+    def save(self) -> None:
+        """Writes the hashes of the current files to disk."""
+        if self._updated_entries == self._entries:
+            return
+
+        temporary_path = f"{self._path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(temporary_path, "w") as f:
+                json.dump(self._updated_entries, f)
+            os.replace(temporary_path, self._path)
+        except OSError as e:
+            logger.debug("Failed to write build context file hashes: %s", e)
+
+
+def _compress(source: IO[bytes], destination: IO[bytes]) -> None:
+    """Compresses a file using gzip.
+
+    The file is split into chunks which are compressed in parallel and
+    written as separate members of a multi-member gzip file, which can be
+    decompressed by any gzip implementation.
+
+    Args:
+        source: The file to compress.
+        destination: The file to write the compressed data to.
+    """
+    source.seek(0)
+    max_workers = _get_max_workers()
+    pending: Deque["Future[bytes]"] = collections.deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while chunk := source.read(COMPRESSION_CHUNK_SIZE):
+            pending.append(
+                pool.submit(
+                    gzip_module.compress,
+                    chunk,
+                    compresslevel=COMPRESSION_LEVEL,
+                    mtime=0,
+                )
+            )
+            # Limit the number of chunks kept in memory
+            if len(pending) >= 2 * max_workers:
+                destination.write(pending.popleft().result())
+
+        while pending:
+            destination.write(pending.popleft().result())
+
 
 class BuildContext:
     """Image build context.
@@ -48,6 +221,7 @@ class BuildContext:
         self._root = root
         self._dockerignore_file = dockerignore_file
         self._extra_files: Dict[str, str] = {}
+        self._files: Optional[Set[str]] = None
 
     @property
     def dockerignore_file(self) -> Optional[str]:
@@ -114,27 +288,88 @@ class BuildContext:
                 with file_source.open("r") as f:
                     self._extra_files[file_destination.as_posix()] = f.read()
 
+    def compute_checksum(self) -> str:
+        """Computes a checksum of the build context content.
+
+        The checksum only changes if files are added to or removed from the
+        build context, or if the content or permissions of a file change.
+        Content hashes of files in the build context root directory are
+        cached, so unchanged files are not read again. Subclasses that add
+        content to the archive in `write_archive(...)` must include that
+        content in the checksum.
+
+        Returns:
+            The checksum.
+        """
+        hash_ = hashlib.sha256()
+        extra_files = dict(self._get_extra_files())
+
+        if self._root:
+            files = {}
+            for path in sorted(self._get_files()):
+                if path in extra_files:
+                    # Extra files override files in the root directory
+                    continue
+
+                full_path = os.path.join(self._root, path)
+                try:
+                    stat_result = os.lstat(full_path)
+                except OSError:
+                    continue
+
+                hash_.update(f"{path}\0{stat_result.st_mode}\0".encode())
+                if stat.S_ISREG(stat_result.st_mode):
+                    files[path] = (full_path, stat_result)
+                elif stat.S_ISLNK(stat_result.st_mode):
+                    hash_.update(os.readlink(full_path).encode())
+
+            manifest = _FileHashManifest(root=self._root)
+            file_hashes = manifest.get_hashes(files)
+            manifest.save()
+            for path in sorted(file_hashes):
+                hash_.update(f"{path}\0{file_hashes[path]}\0".encode())
+
+        for destination, content in sorted(extra_files.items()):
+            hash_.update(f"{destination}\0".encode())
+            hash_.update(content.encode())
+
+        return hash_.hexdigest()
+
     def write_archive(self, output_file: IO[bytes], gzip: bool = True) -> None:
         """Writes an archive of the build context to the given file.
 
         Args:
             output_file: The file to write the archive to.
-            gzip: Whether to use `gzip` to compress the file.
+            gzip: Whether to use `gzip` to compress the file. The archive is
+                compressed in parallel chunks.
         """
         from docker.utils import build as docker_build_utils
 
         files = self._get_files()
         extra_files = self._get_extra_files()
 
-        context_archive = docker_build_utils.create_archive(
-            fileobj=output_file,
-            root=self._root,
-            files=sorted(files),
-            gzip=gzip,
-            extra_files=extra_files,
-        )
+        if gzip:
+            with tempfile.TemporaryFile(mode="w+b") as tar_file:
+                docker_build_utils.create_archive(
+                    fileobj=tar_file,
+                    root=self._root,
+                    files=sorted(files),
+                    gzip=False,
+                    extra_files=extra_files,
+                )
+                _compress(source=tar_file, destination=output_file)
+        else:
+            docker_build_utils.create_archive(
+                fileobj=output_file,
+                root=self._root,
+                files=sorted(files),
+                gzip=False,
+                extra_files=extra_files,
+            )
 
-        build_context_size = os.path.getsize(context_archive.name)
+        output_file.seek(0, os.SEEK_END)
+        build_context_size = output_file.tell()
+        output_file.seek(0)
         if (
             self._root
             and build_context_size > 50 * 1024 * 1024
@@ -154,21 +389,28 @@ class BuildContext:
     def _get_files(self) -> Set[str]:
         """Gets all non-ignored files in the build context root directory.
 
+        The files are only collected once per build context.
+
         Returns:
             All build context files.
         """
+        if self._files is not None:
+            return self._files
+
         if self._root:
             exclude_patterns = self._get_exclude_patterns()
             from docker.utils import build as docker_build_utils
 
-            return cast(
+            self._files = cast(
                 Set[str],
                 docker_build_utils.exclude_paths(
                     self._root, patterns=exclude_patterns
                 ),
             )
         else:
-            return set()
+            self._files = set()
+
+        return self._files
 
     def _get_extra_files(self) -> List[Tuple[str, str]]:
         """Gets all extra files of the build context.
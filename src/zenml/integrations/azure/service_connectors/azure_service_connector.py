@@ -458,10 +458,6 @@ class AzureServiceConnector(ServiceConnector):
     _subscription_id: Optional[str] = None
     _subscription_name: Optional[str] = None
     _tenant_id: Optional[str] = None
-    _session_cache: Dict[
-        str,
-        Tuple[TokenCredential, Optional[datetime.datetime]],
-    ] = {}
 
     @classmethod
     def _get_connector_type(cls) -> ServiceConnectorTypeModel:
@@ -590,34 +586,27 @@ class AzureServiceConnector(ServiceConnector):
             An Azure credential for the specified resource and its expiration
             timestamp, if applicable.
         """
-        # We maintain a cache of all sessions to avoid re-authenticating
+
+        # Sessions are cached process-wide to avoid re-authenticating
         # multiple times for the same resource
-        key = auth_method
-        if key in self._session_cache:
-            session, expires_at = self._session_cache[key]
-            if expires_at is None:
-                return session, None
-
-            # Refresh expired sessions
-            now = datetime.datetime.now(datetime.timezone.utc)
-            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
-
-            # check if the token expires in the near future
-            if expires_at > now + datetime.timedelta(
-                minutes=AZURE_SESSION_EXPIRATION_BUFFER
-            ):
-                return session, expires_at
+        def authenticate() -> (
+            Tuple[TokenCredential, Optional[datetime.datetime]]
+        ):
+            logger.debug(
+                f"Creating Azure credential for auth method '{auth_method}', "
+                f"resource type '{resource_type}' and resource ID "
+                f"'{resource_id}'..."
+            )
+            return self._authenticate(auth_method, resource_type, resource_id)
 
-        logger.debug(
-            f"Creating Azure credential for auth method '{auth_method}', "
-            f"resource type '{resource_type}' and resource ID "
-            f"'{resource_id}'..."
-        )
-        session, expires_at = self._authenticate(
-            auth_method, resource_type, resource_id
+        return self._get_cached_session(
+            auth_method=auth_method,
+            # Azure credentials are not specific to a resource
+            resource_type=None,
+            resource_id=None,
+            authenticate=authenticate,
+            refresh_margin=AZURE_SESSION_EXPIRATION_BUFFER * 60,
         )
-        self._session_cache[key] = (session, expires_at)
-        return session, expires_at
 
     def _authenticate(
         self,
@@ -815,14 +815,6 @@ class GCPServiceConnector(ServiceConnector):
 
     config: GCPBaseConfig
 
-    _session_cache: Dict[
-        Tuple[str, Optional[str], Optional[str]],
-        Tuple[
-            gcp_credentials.Credentials,
-            Optional[datetime.datetime],
-        ],
-    ] = {}
-
     @classmethod
     def _get_connector_type(cls) -> ServiceConnectorTypeModel:
         """Get the service connector type specification.
@@ -849,33 +841,26 @@ class GCPServiceConnector(ServiceConnector):
             GCP session with credentials for the specified resource and its
             expiration timestamp, if applicable.
         """
-        # We maintain a cache of all sessions to avoid re-authenticating
+
+        # Sessions are cached process-wide to avoid re-authenticating
         # multiple times for the same resource
-        key = (auth_method, resource_type, resource_id)
-        if key in self._session_cache:
-            session, expires_at = self._session_cache[key]
-            if expires_at is None:
-                return session, None
-
-            # Refresh expired sessions
-            now = datetime.datetime.now(datetime.timezone.utc)
-            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
-            # check if the token expires in the near future
-            if expires_at > now + datetime.timedelta(
-                minutes=GCP_SESSION_EXPIRATION_BUFFER
-            ):
-                return session, expires_at
-
-        logger.debug(
-            f"Creating GCP authentication session for auth method "
-            f"'{auth_method}', resource type '{resource_type}' and resource ID "
-            f"'{resource_id}'..."
-        )
-        session, expires_at = self._authenticate(
-            auth_method, resource_type, resource_id
+        def authenticate() -> (
+            Tuple[gcp_credentials.Credentials, Optional[datetime.datetime]]
+        ):
+            logger.debug(
+                f"Creating GCP authentication session for auth method "
+                f"'{auth_method}', resource type '{resource_type}' and resource ID "
+                f"'{resource_id}'..."
+            )
+            return self._authenticate(auth_method, resource_type, resource_id)
+
+        return self._get_cached_session(
+            auth_method=auth_method,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            authenticate=authenticate,
+            refresh_margin=GCP_SESSION_EXPIRATION_BUFFER * 60,
         )
-        self._session_cache[key] = (session, expires_at)
-        return session, expires_at
 
     @classmethod
     def _get_scopes(
@@ -13,9 +13,10 @@
 #  permissions and limitations under the License.
 """GitHub code repository."""
 
-import os
+import base64
 import re
-from typing import List, Optional
+import tempfile
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from github import Github, GithubException
@@ -27,6 +28,7 @@ from zenml.code_repositories import (
 )
 from zenml.code_repositories.base_code_repository import (
     BaseCodeRepositoryConfig,
+    normalize_repository_sub_directory,
 )
 from zenml.code_repositories.git import LocalGitRepositoryContext
 from zenml.logger import get_logger
@@ -136,6 +138,66 @@ class GitHubCodeRepository(BaseCodeRepository):
     ) -> None:
         """Downloads files from a commit to a local directory.
 
+        The files are downloaded as a single archive. If that fails, the
+        files are downloaded individually.
+
+        Args:
+            commit: The commit to download.
+            directory: The directory to download to.
+            repo_sub_directory: The sub directory to download from.
+        """
+        try:
+            self._download_archive(
+                commit=commit,
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                "Failed to download repository archive, downloading files "
+                "individually instead: %s",
+                e,
+            )
+
+        self._download_individual_files(
+            commit=commit,
+            directory=directory,
+            repo_sub_directory=repo_sub_directory,
+        )
+
+    def _download_archive(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> None:
+        """Downloads the tarball of a commit and extracts it.
+
+        Args:
+            commit: The commit to download.
+            directory: The directory to download to.
+            repo_sub_directory: The sub directory to download from.
+        """
+        archive_url = self.github_repo.get_archive_link("tarball", ref=commit)
+
+        with tempfile.TemporaryFile() as f:
+            with requests.get(
+                archive_url, stream=True, timeout=60
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+
+            f.seek(0)
+            self._extract_archive(
+                archive=f,
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+            )
+
+    def _download_individual_files(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> None:
+        """Downloads all files of a commit concurrently.
+
         Args:
             commit: The commit to download.
             directory: The directory to download to.
@@ -144,28 +206,81 @@ class GitHubCodeRepository(BaseCodeRepository):
         Raises:
             RuntimeError: If the repository sub directory is invalid.
         """
-        contents = self.github_repo.get_contents(
-            repo_sub_directory or "", ref=commit
-        )
-        if not isinstance(contents, List):
+        github_repo = self.github_repo
+        prefix = normalize_repository_sub_directory(repo_sub_directory)
+
+        blobs = {
+            path: sha
+            for path, sha in self._list_blobs(commit, prefix=prefix).items()
+            if not prefix or path.startswith(prefix + "/")
+        }
+        if prefix and not blobs:
             raise RuntimeError("Invalid repository subdirectory.")
 
-        os.makedirs(directory, exist_ok=True)
+        def _download_file(path: str) -> bytes:
+            blob = github_repo.get_git_blob(blobs[path])
+            return base64.b64decode(blob.content)
+
+        self._download_files_concurrently(
+            paths=list(blobs),
+            directory=directory,
+            repo_sub_directory=repo_sub_directory,
+            download_file=_download_file,
+        )
+
+    def _list_blobs(self, commit: str, prefix: str) -> Dict[str, str]:
+        """Lists the files of a commit.
+
+        GitHub truncates recursive tree listings of large repositories, in
+        which case the tree is listed one directory at a time instead.
 
-        for content in contents:
-            local_path = os.path.join(directory, content.name)
-            if content.type == "dir":
-                self.download_files(
-                    commit=commit,
-                    directory=local_path,
-                    repo_sub_directory=content.path,
+        Args:
+            commit: The commit for which to list the files.
+            prefix: The repository subdirectory to which to limit the
+                listing, or an empty string to list all files.
+
+        Raises:
+            RuntimeError: If a single directory contains too many entries to
+                be listed.
+
+        Returns:
+            The SHAs of all files by their path.
+        """
+        tree = self.github_repo.get_git_tree(commit, recursive=True)
+        if not tree.raw_data.get("truncated", False):
+            return {
+                element.path: element.sha
+                for element in tree.tree
+                if element.type == "blob"
+            }
+
+        logger.debug(
+            "Recursive file listing is truncated, listing each directory "
+            "individually instead."
+        )
+        blobs: Dict[str, str] = {}
+        directories: List[Tuple[str, str]] = [("", commit)]
+        while directories:
+            directory, sha = directories.pop()
+            tree = self.github_repo.get_git_tree(sha)
+            if tree.raw_data.get("truncated", False):
+                raise RuntimeError(
+                    f"Unable to list the files of directory `{directory}` "
+                    "in the repository because it contains too many entries."
                 )
-            else:
-                try:
-                    with open(local_path, "wb") as f:
-                        f.write(content.decoded_content)
-                except (GithubException, IOError) as e:
-                    logger.error("Error processing %s: %s", content.path, e)
+
+            for element in tree.tree:
+                path = f"{directory}/{element.path}".lstrip("/")
+                if element.type == "blob":
+                    blobs[path] = element.sha
+                elif element.type == "tree" and (
+                    not prefix
+                    or path == prefix
+                    or path.startswith(prefix + "/")
+                    or prefix.startswith(path + "/")
+                ):
+                    directories.append((path, element.sha))
+        return blobs
 
     def get_local_context(self, path: str) -> Optional[LocalRepositoryContext]:
         """Gets the local repository context.
@@ -13,9 +13,9 @@
 #  permissions and limitations under the License.
 """GitLab code repository."""
 
-import os
 import re
-from typing import Optional
+import tempfile
+from typing import Optional, cast
 
 from gitlab import Gitlab
 from gitlab.v4.objects import Project
@@ -26,6 +26,7 @@ from zenml.code_repositories import (
 )
 from zenml.code_repositories.base_code_repository import (
     BaseCodeRepositoryConfig,
+    normalize_repository_sub_directory,
 )
 from zenml.code_repositories.git.local_git_repository_context import (
     LocalGitRepositoryContext,
@@ -99,36 +100,93 @@ class GitLabCodeRepository(BaseCodeRepository):
     ) -> None:
         """Downloads files from a commit to a local directory.
 
+        The files are downloaded as a single archive. If that fails, the
+        files are downloaded individually.
+
+        Args:
+            commit: The commit to download.
+            directory: The directory to download to.
+            repo_sub_directory: The sub directory to download from.
+        """
+        try:
+            self._download_archive(
+                commit=commit,
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                "Failed to download repository archive, downloading files "
+                "individually instead: %s",
+                e,
+            )
+
+        self._download_individual_files(
+            commit=commit,
+            directory=directory,
+            repo_sub_directory=repo_sub_directory,
+        )
+
+    def _download_archive(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> None:
+        """Downloads the archive of a commit and extracts it.
+
         Args:
             commit: The commit to download.
             directory: The directory to download to.
             repo_sub_directory: The sub directory to download from.
         """
-        contents = self.gitlab_project.repository_tree(
-            ref=commit,
-            path=repo_sub_directory or "",
+        with tempfile.TemporaryFile() as f:
+            self.gitlab_project.repository_archive(
+                sha=commit,
+                format="tar.gz",
+                streamed=True,
+                action=f.write,
+                chunk_size=1024 * 1024,
+            )
+            f.seek(0)
+            self._extract_archive(
+                archive=f,
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+            )
+
+    def _download_individual_files(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> None:
+        """Downloads all files of a commit concurrently.
+
+        Args:
+            commit: The commit to download.
+            directory: The directory to download to.
+            repo_sub_directory: The sub directory to download from.
+        """
+        gitlab_project = self.gitlab_project
+        paths = [
+            content["path"]
+            for content in gitlab_project.repository_tree(
+                ref=commit,
+                path=normalize_repository_sub_directory(repo_sub_directory),
+                recursive=True,
+                get_all=True,
+            )
+            if content["type"] == "blob"
+        ]
+
+        def _download_file(path: str) -> bytes:
+            logger.debug(f"Processing {path}")
+            return cast(
+                bytes, gitlab_project.files.raw(file_path=path, ref=commit)
+            )
+
+        self._download_files_concurrently(
+            paths=paths,
+            directory=directory,
+            repo_sub_directory=repo_sub_directory,
+            download_file=_download_file,
         )
-        for content in contents:
-            logger.debug(f"Processing {content['path']}")
-            if content["type"] == "tree":
-                path = os.path.join(directory, content["name"])
-                os.makedirs(path, exist_ok=True)
-                self.download_files(
-                    commit=commit,
-                    directory=path,
-                    repo_sub_directory=content["path"],
-                )
-            else:
-                try:
-                    path = content["path"]
-                    file_content = self.gitlab_project.files.get(
-                        file_path=path, ref=commit
-                    ).decode()
-                    path = os.path.join(directory, content["name"])
-                    with open(path, "wb") as file:
-                        file.write(file_content)
-                except Exception as e:
-                    logger.error("Error processing %s: %s", content["path"], e)
 
     def get_local_context(self, path: str) -> Optional[LocalRepositoryContext]:
         """Gets the local repository context.
@@ -13,16 +13,23 @@
 #  permissions and limitations under the License.
 """Base and meta classes for ZenML integrations."""
 
-import re
+import sys
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
 
-import pkg_resources
-from pkg_resources import Requirement
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion
 
 from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
 from zenml.stack.flavor import Flavor
-from zenml.utils.integration_utils import parse_requirement
+from zenml.utils.integration_utils import installation_cache
+
+if sys.version_info < (3, 10):
+    from importlib_metadata import PackageNotFoundError, distribution
+else:
+    from importlib.metadata import PackageNotFoundError, distribution
 
 if TYPE_CHECKING:
     from zenml.plugins.base_plugin_flavor import BasePluginFlavor
@@ -31,6 +38,25 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _version_matches(specifier: SpecifierSet, version: str) -> bool:
+    """Checks whether a package version matches a version specifier.
+
+    Args:
+        specifier: The version specifier.
+        version: The package version.
+
+    Returns:
+        Whether the version matches the specifier.
+    """
+    if not specifier:
+        return True
+
+    try:
+        return specifier.contains(version, prereleases=True)
+    except InvalidVersion:
+        return False
+
+
 class IntegrationMeta(type):
     """Metaclass responsible for registering different Integration subclasses."""
 
@@ -65,70 +91,119 @@ class Integration(metaclass=IntegrationMeta):
     def check_installation(cls) -> bool:
         """Method to check whether the required packages are installed.
 
+        The result is cached until the packages installed in the environment
+        change.
+
         Returns:
             True if all required packages are installed, False otherwise.
         """
-        for r in cls.get_requirements():
+        requirements = cls.get_requirements()
+
+        installed = installation_cache.get(cls.NAME, requirements)
+        if installed is None:
+            installed = all(cls._check_requirement(r) for r in requirements)
+            installation_cache.set(cls.NAME, requirements, installed)
+
+        if installed:
+            logger.debug(
+                f"Integration {cls.NAME} is installed correctly with "
+                f"requirements {requirements}."
+            )
+        return installed
+
+    @classmethod
+    def _check_requirement(cls, requirement: str) -> bool:
+        """Checks whether a requirement of the integration is installed.
+
+        This checks that the required package and its direct dependencies,
+        including the dependencies of the requested extras, are installed in
+        matching versions.
+
+        Args:
+            requirement: The requirement to check.
+
+        Returns:
+            True if the requirement is installed, False otherwise.
+        """
+        try:
+            parsed_requirement = Requirement(requirement)
+        except InvalidRequirement:
+            logger.debug(
+                f"Unable to parse requirement '{requirement}' of "
+                f"integration {cls.NAME}."
+            )
+            return False
+
+        if parsed_requirement.marker and not (
+            parsed_requirement.marker.evaluate()
+        ):
+            # Requirement does not apply to the current environment
+            return True
+
+        try:
+            dist = distribution(parsed_requirement.name)
+        except PackageNotFoundError:
+            logger.debug(
+                f"Unable to find required package '{parsed_requirement}' for "
+                f"integration {cls.NAME}."
+            )
+            return False
+
+        if not _version_matches(parsed_requirement.specifier, dist.version):
+            logger.debug(
+                f"Package version '{parsed_requirement.name}=="
+                f"{dist.version}' does not match version "
+                f"'{parsed_requirement}' necessary for integration "
+                f"{cls.NAME}."
+            )
+            return False
+
+        extras = {canonicalize_name(e) for e in parsed_requirement.extras}
+        provided_extras = {
+            canonicalize_name(e)
+            for e in dist.metadata.get_all("Provides-Extra") or []
+        }
+        if unknown_extras := extras - provided_extras:
+            logger.debug(
+                f"Unknown extras {sorted(unknown_extras)} for requirement "
+                f"'{requirement}' necessary for integration {cls.NAME}."
+            )
+            return False
+
+        marker_environments = [{"extra": extra} for extra in ["", *extras]]
+        for dependency_string in dist.requires or []:
             try:
-                # First check if the base package is installed
-                dist = pkg_resources.get_distribution(r)
-
-                # Next, check if the dependencies (including extras) are
-                # installed
-                deps: List[Requirement] = []
-
-                _, extras = parse_requirement(r)
-                if extras:
-                    extra_list = extras[1:-1].split(",")
-                    for extra in extra_list:
-                        try:
-                            requirements = dist.requires(extras=[extra])  # type: ignore[arg-type]
-                        except pkg_resources.UnknownExtra as e:
-                            logger.debug(f"Unknown extra: {str(e)}")
-                            return False
-                        deps.extend(requirements)
-                else:
-                    deps = dist.requires()
-
-                for ri in deps:
-                    try:
-                        # Remove the "extra == ..." part from the requirement string
-                        cleaned_req = re.sub(
-                            r"; extra == \"\w+\"", "", str(ri)
-                        )
-                        pkg_resources.get_distribution(cleaned_req)
-                    except pkg_resources.DistributionNotFound as e:
-                        logger.debug(
-                            f"Unable to find required dependency "
-                            f"'{e.req}' for requirement '{r}' "
-                            f"necessary for integration '{cls.NAME}'."
-                        )
-                        return False
-                    except pkg_resources.VersionConflict as e:
-                        logger.debug(
-                            f"Package version '{e.dist}' does not match "
-                            f"version '{e.req}' required by '{r}' "
-                            f"necessary for integration '{cls.NAME}'."
-                        )
-                        return False
-
-            except pkg_resources.DistributionNotFound as e:
+                dependency = Requirement(dependency_string)
+            except InvalidRequirement:
+                continue
+
+            if dependency.marker and not any(
+                dependency.marker.evaluate(environment)
+                for environment in marker_environments
+            ):
+                continue
+
+            try:
+                dependency_dist = distribution(dependency.name)
+            except PackageNotFoundError:
                 logger.debug(
-                    f"Unable to find required package '{e.req}' for "
-                    f"integration {cls.NAME}."
+                    f"Unable to find required dependency '{dependency.name}' "
+                    f"for requirement '{requirement}' necessary for "
+                    f"integration '{cls.NAME}'."
                 )
                 return False
-            except pkg_resources.VersionConflict as e:
+
+            if not _version_matches(
+                dependency.specifier, dependency_dist.version
+            ):
                 logger.debug(
-                    f"Package version '{e.dist}' does not match version "
-                    f"'{e.req}' necessary for integration {cls.NAME}."
+                    f"Package version '{dependency.name}=="
+                    f"{dependency_dist.version}' does not match version "
+                    f"'{dependency.specifier}' required by '{requirement}' "
+                    f"necessary for integration '{cls.NAME}'."
                 )
                 return False
 
-        logger.debug(
-            f"Integration {cls.NAME} is installed correctly with "
-            f"requirements {cls.get_requirements()}."
-        )
         return True
 
     @classmethod
@@ -31,14 +31,15 @@ Internal interface: no backwards compatibility guarantees.
 Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils.py.
 """
 
-import datetime
 import enum
+import hashlib
 import re
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Optional, Tuple, TypeVar, cast
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
@@ -108,6 +109,25 @@ def sanitize_pod_name(pod_name: str) -> str:
     return re.sub(r"[-]+", "-", pod_name)
 
 
+def sanitize_label(label: str) -> str:
+    """Sanitize a label value so it conforms to Kubernetes label conventions.
+
+    Label values that exceed the maximum length of 63 characters are
+    shortened and suffixed with a hash so they remain unique.
+
+    Args:
+        label: Arbitrary input label value.
+
+    Returns:
+        Sanitized label value.
+    """
+    label = re.sub(r"[^a-zA-Z0-9-_.]", "-", label)
+    if len(label) > 63:
+        digest = hashlib.sha256(label.encode()).hexdigest()[:8]
+        label = f"{label[:54]}-{digest}"
+    return re.sub(r"^[-_.]+|[-_.]+$", "", label)
+
+
 def pod_is_not_pending(pod: k8s_client.V1Pod) -> bool:
     """Check if pod status is not 'Pending'.
 
@@ -168,6 +188,100 @@ def get_pod(
         raise RuntimeError from e
 
 
+# Maximum duration of a single watch request. Watches are restarted
+# afterwards, which also gives the client function a chance to refresh
+# expiring credentials.
+MAX_WATCH_DURATION_SECONDS = 300
+
+
+def _wait_for_pod_change(
+    core_api: k8s_client.CoreV1Api,
+    pod: Optional[k8s_client.V1Pod],
+    pod_name: str,
+    namespace: str,
+    timeout: float,
+) -> bool:
+    """Wait until a pod changes using a Kubernetes watch.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod: The current version of the pod.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        timeout: The maximum time to wait in seconds.
+
+    Returns:
+        False if the pod could not be watched, True otherwise.
+    """
+    if pod is None:
+        return False
+
+    watch = k8s_watch.Watch()
+    try:
+        for _ in watch.stream(
+            core_api.list_namespaced_pod,
+            namespace=namespace,
+            field_selector=f"metadata.name={pod_name}",
+            resource_version=pod.metadata.resource_version,
+            timeout_seconds=max(int(timeout), 1),
+        ):
+            break
+    except Exception as e:
+        logger.debug(f"Unable to watch pod `{namespace}:{pod_name}`: {e}")
+        return False
+    finally:
+        watch.stop()
+
+    return True
+
+
+def follow_pod_logs(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    skip_lines: int,
+    timeout: Optional[float],
+) -> Tuple[int, bool]:
+    """Stream the logs of a pod to `zenml.logger.info()` while it is running.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        skip_lines: The number of log lines that were already logged.
+        timeout: The maximum number of seconds to follow the logs.
+
+    Returns:
+        The total number of logged lines and whether the logs could be
+        streamed.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    logged_lines = 0
+    watch = k8s_watch.Watch()
+    try:
+        for line in watch.stream(
+            core_api.read_namespaced_pod_log,
+            name=pod_name,
+            namespace=namespace,
+            follow=True,
+            _request_timeout=timeout,
+        ):
+            logged_lines += 1
+            if logged_lines > skip_lines:
+                logger.info(line)
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+    except Exception as e:
+        logger.debug(
+            f"Unable to follow the logs of pod `{namespace}:{pod_name}`: {e}"
+        )
+        return max(logged_lines, skip_lines), False
+    finally:
+        watch.stop()
+
+    return max(logged_lines, skip_lines), True
+
+
 def wait_pod(
     kube_client_fn: Callable[[], k8s_client.ApiClient],
     pod_name: str,
@@ -179,6 +293,11 @@ def wait_pod(
 ) -> k8s_client.V1Pod:
     """Wait for a pod to meet an exit condition.
 
+    Instead of polling the pod in fixed intervals, this function watches the
+    pod for changes and follows its logs while it is running. If the pod or
+    its logs can't be watched, e.g. because of missing permissions, it falls
+    back to polling.
+
     Args:
         kube_client_fn: the kube client fn is a function that is called
             periodically and is used to get a `CoreV1Api` client for
@@ -188,13 +307,13 @@ def wait_pod(
         pod_name: The name of the pod.
         namespace: The namespace of the pod.
         exit_condition_lambda: A lambda
-            which will be called periodically to wait for a pod to exit. The
-            function returns True to exit.
+            which will be called whenever the pod changes to wait for a pod
+            to exit. The function returns True to exit.
         timeout_sec: Timeout in seconds to wait for pod to reach exit
             condition, or 0 to wait for an unlimited duration.
             Defaults to unlimited.
-        exponential_backoff: Whether to use exponential back off for polling.
-            Defaults to False.
+        exponential_backoff: Whether to use exponential back off when falling
+            back to polling. Defaults to False.
         stream_logs: Whether to stream the pod logs to
             `zenml.logger.info()`. Defaults to False.
 
@@ -204,7 +323,7 @@ def wait_pod(
     Returns:
         The pod object which meets the exit condition.
     """
-    start_time = datetime.datetime.utcnow()
+    start_time = time.monotonic()
 
     # Link to exponential back-off algorithm used here:
     # https://cloud.google.com/storage/docs/exponential-backoff
@@ -212,6 +331,8 @@ def wait_pod(
     maximum_backoff = 32
 
     logged_lines = 0
+    follow_logs = True
+    use_watch = True
 
     while True:
         kube_client = kube_client_fn()
@@ -219,18 +340,33 @@ def wait_pod(
 
         resp = get_pod(core_api, pod_name, namespace)
 
+        remaining: Optional[float] = None
+        if timeout_sec != 0:
+            remaining = timeout_sec - (time.monotonic() - start_time)
+
         # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
         if stream_logs and pod_is_not_pending(resp):
-            response = core_api.read_namespaced_pod_log(
-                name=pod_name,
-                namespace=namespace,
-            )
-            logs = response.splitlines()
-            if len(logs) > logged_lines:
-                for line in logs[logged_lines:]:
-                    logger.info(line)
-                logged_lines = len(logs)
+            if follow_logs:
+                # Returns once the pod's container stopped or no logs were
+                # written within the remaining time
+                logged_lines, follow_logs = follow_pod_logs(
+                    core_api,
+                    pod_name=pod_name,
+                    namespace=namespace,
+                    skip_lines=logged_lines,
+                    timeout=remaining,
+                )
+                resp = get_pod(core_api, pod_name, namespace)
+            else:
+                response = core_api.read_namespaced_pod_log(
+                    name=pod_name,
+                    namespace=namespace,
+                )
+                logs = response.splitlines()
+                if len(logs) > logged_lines:
+                    for line in logs[logged_lines:]:
+                        logger.info(line)
+                    logged_lines = len(logs)
 
         # Raise an error if the pod failed.
         if pod_failed(resp):
@@ -241,13 +377,29 @@ def wait_pod(
             return resp
 
         # Check if wait timed out.
-        elapse_time = datetime.datetime.utcnow() - start_time
-        if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
+        elapsed_time = time.monotonic() - start_time
+        if timeout_sec != 0 and elapsed_time >= timeout_sec:
             raise RuntimeError(
                 f"Waiting for pod `{namespace}:{pod_name}` timed out after "
                 f"{timeout_sec} seconds."
             )
 
+        # Wait for the pod to change. If the logs are polled, the pod needs
+        # to be polled as well.
+        if use_watch and (follow_logs or not stream_logs):
+            watch_timeout = float(MAX_WATCH_DURATION_SECONDS)
+            if timeout_sec != 0:
+                watch_timeout = min(watch_timeout, timeout_sec - elapsed_time)
+            use_watch = _wait_for_pod_change(
+                core_api,
+                pod=resp,
+                pod_name=pod_name,
+                namespace=namespace,
+                timeout=watch_timeout,
+            )
+            if use_watch:
+                continue
+
         # Wait (using exponential backoff).
         time.sleep(backoff_interval)
         if exponential_backoff and backoff_interval < maximum_backoff:
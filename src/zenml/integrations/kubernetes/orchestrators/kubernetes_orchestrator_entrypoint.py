@@ -33,12 +33,16 @@ from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator import
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_pod_manifest,
 )
+from zenml.integrations.kubernetes.orchestrators.pod_watcher import PodWatcher
 from zenml.logger import get_logger
 from zenml.orchestrators.dag_runner import ThreadedDagRunner
 from zenml.orchestrators.utils import get_config_environment_vars
 
 logger = get_logger(__name__)
 
+# Label which identifies the step pods of an orchestrator run
+ORCHESTRATOR_RUN_ID_LABEL = "zenml-orchestrator-run-id"
+
 
 def parse_args() -> argparse.Namespace:
     """Parse entrypoint arguments.
@@ -62,6 +66,12 @@ def main() -> None:
     args = parse_args()
 
     orchestrator_run_id = socket.gethostname()
+    # Label all step pods of this run so they can be watched together
+    run_id_label = {
+        ORCHESTRATOR_RUN_ID_LABEL: kube_utils.sanitize_label(
+            orchestrator_run_id
+        )
+    }
 
     deployment_config = Client().get_deployment(args.deployment_id)
 
@@ -121,6 +131,7 @@ def main() -> None:
             service_account_name=settings.step_pod_service_account_name
             or settings.service_account_name,
             mount_local_stores=mount_local_stores,
+            labels=run_id_label,
         )
 
         # Create and run pod.
@@ -131,18 +142,22 @@ def main() -> None:
 
         # Wait for pod to finish.
         logger.info(f"Waiting for pod of step `{step_name}` to start...")
-        kube_utils.wait_pod(
-            kube_client_fn=lambda: orchestrator.get_kube_client(
-                incluster=True
-            ),
+        pod_watcher.wait_for_pod(
             pod_name=pod_name,
-            namespace=args.kubernetes_namespace,
             exit_condition_lambda=kube_utils.pod_is_done,
-            stream_logs=True,
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    pod_watcher = PodWatcher(
+        kube_client_fn=lambda: orchestrator.get_kube_client(incluster=True),
+        namespace=args.kubernetes_namespace,
+        label_selector=",".join(f"{k}={v}" for k, v in run_id_label.items()),
+        stream_logs=True,
+    )
+    with pod_watcher:
+        ThreadedDagRunner(
+            dag=pipeline_dag, run_fn=run_step_on_kubernetes
+        ).run()
 
     logger.info("Orchestration pod completed.")
 
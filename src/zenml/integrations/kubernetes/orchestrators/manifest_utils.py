@@ -102,6 +102,7 @@ def build_pod_manifest(
     service_account_name: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
     mount_local_stores: bool = False,
+    labels: Optional[Dict[str, str]] = None,
 ) -> k8s_client.V1Pod:
     """Build a Kubernetes pod manifest for a ZenML run or step.
 
@@ -120,6 +121,7 @@ def build_pod_manifest(
         env: Environment variables to set.
         mount_local_stores: Whether to mount the local stores path inside the
             pod.
+        labels: Additional labels to add to the pod.
 
     Returns:
         Pod manifest.
@@ -156,6 +158,7 @@ def build_pod_manifest(
         labels={
             "run": run_name,
             "pipeline": pipeline_name,
+            **(labels or {}),
         },
     )
 
@@ -0,0 +1,552 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Shared watcher for the pods of a Kubernetes orchestrator run."""
+
+import threading
+import time
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
+
+from kubernetes import client as k8s_client
+from kubernetes import watch as k8s_watch
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Interval in which pods are listed if they can't be watched
+POD_LIST_INTERVAL_SECONDS = 1
+# Minimum and maximum time to wait between retries after failing to list the
+# pods
+MIN_RETRY_INTERVAL_SECONDS = 1
+MAX_RETRY_INTERVAL_SECONDS = 32
+# Number of consecutive authorization failures after which listing the pods is
+# given up in favor of reading them individually
+MAX_FORBIDDEN_ATTEMPTS = 3
+# Maximum time to wait for the logs of a finished pod to be streamed
+LOG_FLUSH_TIMEOUT_SECONDS = 30
+# Logs are resumed slightly before the last streamed line, lines that were
+# already logged are skipped based on their timestamp
+LOG_RESUME_OVERLAP_SECONDS = 5
+
+
+class _PodLogCursor:
+    """Position in the logs of a pod from which streaming can be resumed.
+
+    Log lines are requested with timestamps. When the logs are streamed
+    again, lines that are older than the last logged line are skipped, as
+    well as the lines with the same timestamp that were already logged.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the cursor."""
+        self._timestamp: Optional[Tuple[str, int]] = None
+        self._lines_at_timestamp = 0
+        self._last_line_time: Optional[float] = None
+        self._resume_timestamp: Optional[Tuple[str, int]] = None
+        self._lines_to_skip = 0
+
+    @property
+    def since_seconds(self) -> Optional[int]:
+        """Number of seconds of logs to request when resuming the logs.
+
+        Returns:
+            The number of seconds or None if the logs need to be streamed
+            from the start.
+        """
+        if self._last_line_time is None:
+            return None
+        return (
+            int(time.time() - self._last_line_time)
+            + LOG_RESUME_OVERLAP_SECONDS
+        )
+
+    def start(self) -> None:
+        """Starts streaming the logs again."""
+        self._resume_timestamp = self._timestamp
+        self._lines_to_skip = self._lines_at_timestamp
+
+    def advance(self, line: str) -> Optional[str]:
+        """Moves the cursor past a log line.
+
+        Args:
+            line: The log line, prefixed with its timestamp.
+
+        Returns:
+            The log line without the timestamp or None if it was already
+            logged.
+        """
+        raw_timestamp, _, message = line.partition(" ")
+        seconds, _, fraction = raw_timestamp.rstrip("Z").partition(".")
+        # RFC 3339 timestamps with a variable number of fractional digits
+        timestamp = (seconds, int(fraction.ljust(9, "0")[:9] or 0))
+
+        if self._resume_timestamp is not None:
+            if timestamp < self._resume_timestamp:
+                return None
+            if timestamp == self._resume_timestamp and self._lines_to_skip:
+                self._lines_to_skip -= 1
+                return None
+            self._resume_timestamp = None
+
+        if timestamp == self._timestamp:
+            self._lines_at_timestamp += 1
+        else:
+            self._timestamp = timestamp
+            self._lines_at_timestamp = 1
+        self._last_line_time = time.time()
+        return message
+
+
+class PodWatcher:
+    """Watches all pods of an orchestrator run using a single watch.
+
+    Instead of each step polling or watching its own pod, a single
+    namespace-scoped watch filtered by a label selector keeps track of all
+    pods of the run and notifies the threads waiting for them whenever a pod
+    changes. If the pods can't be watched, e.g. because of missing
+    permissions, they are listed periodically instead. If they can't be
+    listed either, the pods that threads are waiting for are read
+    individually.
+
+    Usage:
+        ```python
+        with PodWatcher(kube_client_fn, namespace, "run-id=abc") as watcher:
+            watcher.wait_for_pod("pod", exit_condition_lambda=pod_is_done)
+        ```
+    """
+
+    def __init__(
+        self,
+        kube_client_fn: Callable[[], k8s_client.ApiClient],
+        namespace: str,
+        label_selector: str,
+        stream_logs: bool = False,
+    ) -> None:
+        """Initializes the watcher.
+
+        Args:
+            kube_client_fn: Function that returns a client for the Kubernetes
+                API. It is called whenever the watch is restarted and should
+                cache the client but instantiate a new one if the credentials
+                of the previous one are about to expire.
+            namespace: The namespace of the pods.
+            label_selector: Label selector that matches all pods to watch.
+            stream_logs: Whether to stream the logs of the pods to
+                `zenml.logger.info()`.
+        """
+        self._kube_client_fn = kube_client_fn
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._stream_logs = stream_logs
+
+        self._pods: Dict[str, k8s_client.V1Pod] = {}
+        self._deleted_pods: Set[str] = set()
+        self._condition = threading.Condition()
+        self._log_threads: Dict[str, threading.Thread] = {}
+        self._stop_event = threading.Event()
+        self._watch: Optional[k8s_watch.Watch] = None
+        self._watch_pods = True
+        self._list_pods_allowed = True
+        self._requested_pods: Set[str] = set()
+        self._error: Optional[Exception] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PodWatcher":
+        """Starts the watcher.
+
+        Returns:
+            The watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stops the watcher.
+
+        Args:
+            exc_type: The type of the exception that was raised, if any.
+            exc_value: The exception that was raised, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """Starts watching the pods in a background thread."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="zenml-pod-watcher"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching the pods."""
+        self._stop_event.set()
+        if self._watch:
+            self._watch.stop()
+        if self._thread:
+            self._thread.join(timeout=POD_LIST_INTERVAL_SECONDS)
+            self._thread = None
+
+        # Wake up all threads that are still waiting for a pod
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait_for_pod(
+        self,
+        pod_name: str,
+        exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
+        timeout_sec: int = 0,
+    ) -> k8s_client.V1Pod:
+        """Wait for a pod to meet an exit condition.
+
+        Args:
+            pod_name: The name of the pod.
+            exit_condition_lambda: A lambda which will be called whenever the
+                pod changes. The function returns True to exit.
+            timeout_sec: Timeout in seconds to wait for the pod to reach the
+                exit condition, or 0 to wait for an unlimited duration.
+                Defaults to unlimited.
+
+        Raises:
+            RuntimeError: If the pod failed or was deleted, the timeout was
+                reached, the watcher was stopped or the pods can't be read.
+
+        Returns:
+            The pod object which meets the exit condition.
+        """
+        deadline = time.monotonic() + timeout_sec if timeout_sec else None
+
+        with self._condition:
+            self._requested_pods.add(pod_name)
+            while True:
+                if pod_name in self._deleted_pods:
+                    raise RuntimeError(
+                        f"Pod `{self._namespace}:{pod_name}` was deleted."
+                    )
+
+                pod = self._pods.get(pod_name)
+                if pod is not None and (
+                    kube_utils.pod_failed(pod) or exit_condition_lambda(pod)
+                ):
+                    break
+
+                if self._error:
+                    raise RuntimeError(
+                        f"Unable to watch pod `{self._namespace}:{pod_name}`: "
+                        f"{self._error}"
+                    )
+
+                if self._stop_event.is_set():
+                    raise RuntimeError(
+                        f"Stopped watching pod `{self._namespace}:{pod_name}`."
+                    )
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"Waiting for pod `{self._namespace}:{pod_name}` "
+                            "timed out."
+                        )
+                self._condition.wait(timeout=remaining)
+
+            log_thread = self._log_threads.get(pod_name)
+
+        # Make sure the complete logs were streamed before returning
+        if log_thread:
+            log_thread.join(timeout=LOG_FLUSH_TIMEOUT_SECONDS)
+
+        if kube_utils.pod_failed(pod):
+            raise RuntimeError(f"Pod `{self._namespace}:{pod_name}` failed.")
+
+        return pod
+
+    def _run(self) -> None:
+        """Keeps the pods in sync until the watcher is stopped."""
+        retry_interval = MIN_RETRY_INTERVAL_SECONDS
+        forbidden_attempts = 0
+        while not self._stop_event.is_set():
+            try:
+                core_api = k8s_client.CoreV1Api(self._kube_client_fn())
+                if not self._list_pods_allowed:
+                    self._read_pods(core_api)
+                    retry_interval = MIN_RETRY_INTERVAL_SECONDS
+                    forbidden_attempts = 0
+                    self._stop_event.wait(POD_LIST_INTERVAL_SECONDS)
+                    continue
+
+                resource_version = self._list_pods(core_api)
+                retry_interval = MIN_RETRY_INTERVAL_SECONDS
+                forbidden_attempts = 0
+
+                if self._watch_pods:
+                    self._watch_for_changes(core_api, resource_version)
+                else:
+                    self._stop_event.wait(POD_LIST_INTERVAL_SECONDS)
+            except Exception as e:
+                logger.debug(
+                    f"Unable to read pods `{self._namespace}:"
+                    f"{self._label_selector}`: {e}"
+                )
+                if isinstance(e, ApiException) and e.status == 403:
+                    forbidden_attempts += 1
+                    if forbidden_attempts >= MAX_FORBIDDEN_ATTEMPTS:
+                        if not self._list_pods_allowed:
+                            self._fail(e)
+                            return
+
+                        logger.debug(
+                            f"Not allowed to list pods in namespace "
+                            f"`{self._namespace}`, reading them individually "
+                            "instead."
+                        )
+                        self._list_pods_allowed = False
+                        retry_interval = MIN_RETRY_INTERVAL_SECONDS
+                        forbidden_attempts = 0
+                        continue
+
+                self._stop_event.wait(retry_interval)
+                retry_interval = min(
+                    retry_interval * 2, MAX_RETRY_INTERVAL_SECONDS
+                )
+
+    def _fail(self, error: Exception) -> None:
+        """Stops syncing the pods and fails all waiting threads.
+
+        Args:
+            error: The error that prevents the pods from being read.
+        """
+        with self._condition:
+            self._error = error
+            self._condition.notify_all()
+
+    def _list_pods(self, core_api: k8s_client.CoreV1Api) -> str:
+        """Lists all pods and updates their state.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+
+        Returns:
+            The resource version of the pod list.
+        """
+        pod_list = core_api.list_namespaced_pod(
+            namespace=self._namespace, label_selector=self._label_selector
+        )
+        pods = {pod.metadata.name: pod for pod in pod_list.items}
+        with self._condition:
+            for pod_name in self._pods.keys() - pods.keys():
+                self._deleted_pods.add(pod_name)
+            self._pods = pods
+            self._condition.notify_all()
+
+        for pod in pods.values():
+            self._start_log_thread(pod)
+
+        return pod_list.metadata.resource_version  # type: ignore[no-any-return]
+
+    def _read_pods(self, core_api: k8s_client.CoreV1Api) -> None:
+        """Reads the pods that threads are waiting for and updates their state.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+
+        Raises:
+            ApiException: If a pod can't be read.
+        """
+        finished_phases = (
+            kube_utils.PodPhase.SUCCEEDED.value,
+            kube_utils.PodPhase.FAILED.value,
+        )
+        with self._condition:
+            pod_names = [
+                pod_name
+                for pod_name in self._requested_pods
+                if pod_name not in self._deleted_pods
+                and (
+                    pod_name not in self._pods
+                    or self._pods[pod_name].status.phase not in finished_phases
+                )
+            ]
+
+        for pod_name in pod_names:
+            try:
+                pod = core_api.read_namespaced_pod(
+                    name=pod_name, namespace=self._namespace
+                )
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                with self._condition:
+                    # Pods that were not created yet don't exist either
+                    if pod_name in self._pods:
+                        del self._pods[pod_name]
+                        self._deleted_pods.add(pod_name)
+                        self._condition.notify_all()
+                continue
+
+            self._update_pod(pod, deleted=False)
+
+    def _watch_for_changes(
+        self, core_api: k8s_client.CoreV1Api, resource_version: str
+    ) -> None:
+        """Watches the pods for changes until the watch ends.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            resource_version: The resource version from which to watch.
+        """
+        self._watch = k8s_watch.Watch()
+        try:
+            for event in self._watch.stream(
+                core_api.list_namespaced_pod,
+                namespace=self._namespace,
+                label_selector=self._label_selector,
+                resource_version=resource_version,
+                timeout_seconds=kube_utils.MAX_WATCH_DURATION_SECONDS,
+            ):
+                if event["type"] == "ERROR":
+                    # The pods are listed again in the next iteration
+                    break
+                self._update_pod(
+                    event["object"], deleted=event["type"] == "DELETED"
+                )
+        except ApiException as e:
+            if e.status == 410:
+                # The resource version expired, list the pods again
+                return
+            logger.debug(
+                f"Unable to watch pods `{self._namespace}:"
+                f"{self._label_selector}`, falling back to listing them "
+                f"periodically: {e}"
+            )
+            self._watch_pods = False
+        finally:
+            self._watch.stop()
+
+    def _update_pod(self, pod: k8s_client.V1Pod, deleted: bool) -> None:
+        """Updates the state of a pod and notifies all waiting threads.
+
+        Args:
+            pod: The pod.
+            deleted: Whether the pod was deleted.
+        """
+        pod_name = pod.metadata.name
+        with self._condition:
+            if deleted:
+                self._pods.pop(pod_name, None)
+                self._deleted_pods.add(pod_name)
+            else:
+                self._pods[pod_name] = pod
+            self._condition.notify_all()
+
+        if not deleted:
+            self._start_log_thread(pod)
+
+    def _start_log_thread(self, pod: k8s_client.V1Pod) -> None:
+        """Starts streaming the logs of a pod once it is no longer pending.
+
+        Args:
+            pod: The pod.
+        """
+        if not self._stream_logs or not kube_utils.pod_is_not_pending(pod):
+            return
+
+        pod_name = pod.metadata.name
+        with self._condition:
+            if pod_name in self._log_threads:
+                return
+            thread = threading.Thread(
+                target=self._stream_pod_logs,
+                args=(pod_name,),
+                daemon=True,
+                name=f"zenml-pod-logs-{pod_name}",
+            )
+            self._log_threads[pod_name] = thread
+        thread.start()
+
+    def _pod_is_finished(self, pod_name: str) -> bool:
+        """Checks whether a pod finished running.
+
+        Args:
+            pod_name: The name of the pod.
+
+        Returns:
+            Whether the pod succeeded or failed, or was deleted or not
+            created yet.
+        """
+        with self._condition:
+            pod = self._pods.get(pod_name)
+            return pod is None or pod.status.phase in (
+                kube_utils.PodPhase.SUCCEEDED.value,
+                kube_utils.PodPhase.FAILED.value,
+            )
+
+    def _stream_pod_logs(self, pod_name: str) -> None:
+        """Streams the logs of a pod until it finished.
+
+        The logs are followed until the pod finished, even if the log stream
+        ends earlier, e.g. because the connection was closed. Streaming is
+        resumed from the last logged line.
+
+        Args:
+            pod_name: The name of the pod.
+        """
+        cursor = _PodLogCursor()
+        while not self._stop_event.is_set():
+            # Check before following the logs so the complete logs of a
+            # finished pod are still streamed once
+            finished = self._pod_is_finished(pod_name)
+            kwargs: Dict[str, Any] = {}
+            since_seconds = cursor.since_seconds
+            if since_seconds is not None:
+                kwargs["since_seconds"] = since_seconds
+
+            cursor.start()
+            watch = k8s_watch.Watch()
+            try:
+                core_api = k8s_client.CoreV1Api(self._kube_client_fn())
+                for line in watch.stream(
+                    core_api.read_namespaced_pod_log,
+                    name=pod_name,
+                    namespace=self._namespace,
+                    follow=True,
+                    timestamps=True,
+                    **kwargs,
+                ):
+                    message = cursor.advance(line)
+                    if message is not None:
+                        logger.info(message)
+            except Exception as e:
+                logger.debug(
+                    "Unable to stream the logs of pod "
+                    f"`{self._namespace}:{pod_name}`: {e}"
+                )
+            finally:
+                watch.stop()
+
+            if finished:
+                return
+            self._stop_event.wait(POD_LIST_INTERVAL_SECONDS)
@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Implementation of a registry to track ZenML integrations."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -30,6 +31,8 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry."""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._activated_integrations: Set[str] = set()
+        self._activation_lock = threading.RLock()
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -68,15 +71,43 @@ class IntegrationRegistry(object):
         """
         self._integrations[key] = type_
 
+    def activate_integration(self, name: str) -> bool:
+        """Activates a registered integration if it is installed.
+
+        Integrations are only activated once, subsequent calls return
+        immediately.
+
+        Args:
+            name: Name of the integration to activate.
+
+        Returns:
+            Whether the integration is activated.
+        """
+        if name in self._activated_integrations:
+            return True
+
+        integration = self._integrations.get(name)
+        if not integration:
+            return False
+
+        with self._activation_lock:
+            if name in self._activated_integrations:
+                return True
+
+            if not integration.check_installation():
+                logger.debug(f"Integration `{name}` could not be activated.")
+                return False
+
+            logger.debug(f"Activating integration `{name}`...")
+            integration.activate()
+            self._activated_integrations.add(name)
+            logger.debug(f"Integration `{name}` is activated.")
+            return True
+
     def activate_integrations(self) -> None:
         """Method to activate the integrations with are registered in the registry."""
-        for name, integration in self._integrations.items():
-            if integration.check_installation():
-                logger.debug(f"Activating integration `{name}`...")
-                integration.activate()
-                logger.debug(f"Integration `{name}` is activated.")
-            else:
-                logger.debug(f"Integration `{name}` could not be activated.")
+        for name in list(self._integrations):
+            self.activate_integration(name)
 
     @property
     def list_integration_names(self) -> List[str]:
@@ -21,6 +21,7 @@ from typing import Any, Dict, Generator, List, Optional
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from pydantic import BaseModel, Field, ValidationError
 
 from zenml.logger import get_logger
@@ -33,6 +34,9 @@ api = k8s_client.ApiClient()
 SELDON_DEPLOYMENT_KIND = "SeldonDeployment"
 SELDON_DEPLOYMENT_API_VERSION = "machinelearning.seldon.io/v1"
 
+# Polling interval used if deployments can't be watched for changes
+SELDON_DEPLOYMENT_POLL_INTERVAL = 5
+
 
 class SeldonDeploymentPredictorParameter(BaseModel):
     """Parameter for Seldon Deployment predictor.
@@ -76,12 +80,15 @@ class SeldonDeploymentMetadata(BaseModel):
         labels: Kubernetes labels for the Seldon Deployment.
         annotations: Kubernetes annotations for the Seldon Deployment.
         creationTimestamp: the creation timestamp of the Seldon Deployment.
+        resourceVersion: the Kubernetes resource version of the Seldon
+            Deployment.
     """
 
     name: str
     labels: Dict[str, str] = Field(default_factory=dict)
     annotations: Dict[str, str] = Field(default_factory=dict)
     creationTimestamp: Optional[str] = None
+    resourceVersion: Optional[str] = None
 
     class Config:
         """Pydantic configuration class."""
@@ -651,7 +658,9 @@ class SeldonClient:
             # are not
             deployment.mark_as_managed_by_zenml()
 
-            body_deploy = deployment.dict(exclude_none=True)
+            body_deploy = deployment.dict(
+                exclude_none=True, exclude={"metadata": {"resourceVersion"}}
+            )
             response = (
                 self._custom_objects_api.create_namespaced_custom_object(
                     group="machinelearning.seldon.io",
@@ -678,9 +687,12 @@ class SeldonClient:
 
         created_deployment = self.get_deployment(name=deployment.name)
 
+        deadline = time.monotonic() + poll_timeout
         while poll_timeout > 0 and created_deployment.is_pending():
-            time.sleep(5)
-            poll_timeout -= 5
+            if not self._wait_for_deployment_change(
+                created_deployment, deadline=deadline
+            ):
+                break
             created_deployment = self.get_deployment(name=deployment.name)
 
         return created_deployment
@@ -713,7 +725,7 @@ class SeldonClient:
             # call `get_deployment` to check that the deployment exists
             # and is managed by ZenML. It will raise
             # a SeldonDeploymentNotFoundError otherwise
-            self.get_deployment(name=name)
+            existing_deployment = self.get_deployment(name=name)
 
             response = (
                 self._custom_objects_api.delete_namespaced_custom_object(
@@ -737,13 +749,16 @@ class SeldonClient:
                 f"Exception when deleting SeldonDeployment resource {name}"
             ) from e
 
+        deadline = time.monotonic() + poll_timeout
         while poll_timeout > 0:
             try:
-                self.get_deployment(name=name)
+                existing_deployment = self.get_deployment(name=name)
             except SeldonDeploymentNotFoundError:
                 return
-            time.sleep(5)
-            poll_timeout -= 5
+            if not self._wait_for_deployment_change(
+                existing_deployment, deadline=deadline
+            ):
+                return
 
     def update_deployment(
         self,
@@ -788,7 +803,10 @@ class SeldonClient:
                 namespace=self._namespace,
                 plural="seldondeployments",
                 name=deployment.name,
-                body=deployment.dict(exclude_none=True),
+                body=deployment.dict(
+                    exclude_none=True,
+                    exclude={"metadata": {"resourceVersion"}},
+                ),
                 _request_timeout=poll_timeout or None,
             )
             logger.debug("Seldon Core API response: %s", response)
@@ -802,13 +820,60 @@ class SeldonClient:
 
         updated_deployment = self.get_deployment(name=deployment.name)
 
+        deadline = time.monotonic() + poll_timeout
         while poll_timeout > 0 and updated_deployment.is_pending():
-            time.sleep(5)
-            poll_timeout -= 5
+            if not self._wait_for_deployment_change(
+                updated_deployment, deadline=deadline
+            ):
+                break
             updated_deployment = self.get_deployment(name=deployment.name)
 
         return updated_deployment
 
+    def _wait_for_deployment_change(
+        self, deployment: SeldonDeployment, deadline: float
+    ) -> bool:
+        """Wait until a Seldon Core deployment resource changes.
+
+        The deployment resource is watched for changes. If that is not
+        possible, this method falls back to waiting for the polling interval.
+
+        Args:
+            deployment: the current version of the Seldon Core deployment
+                resource.
+            deadline: the monotonic time until which to wait at most.
+
+        Returns:
+            False if the deadline has passed, True otherwise.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        watch = k8s_watch.Watch()
+        try:
+            for _ in watch.stream(
+                self._custom_objects_api.list_namespaced_custom_object,
+                group="machinelearning.seldon.io",
+                version="v1",
+                namespace=self._namespace,
+                plural="seldondeployments",
+                field_selector=f"metadata.name={deployment.name}",
+                resource_version=deployment.metadata.resourceVersion,
+                timeout_seconds=max(int(remaining), 1),
+            ):
+                break
+        except Exception as e:
+            logger.debug(
+                f"Unable to watch SeldonDeployment resource "
+                f"{deployment.name}: {e}"
+            )
+            time.sleep(min(SELDON_DEPLOYMENT_POLL_INTERVAL, remaining))
+        finally:
+            watch.stop()
+
+        return True
+
     def get_deployment(self, name: str) -> SeldonDeployment:
         """Get a ZenML managed Seldon Core deployment resource by name.
 
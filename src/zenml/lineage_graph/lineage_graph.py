@@ -13,9 +13,21 @@
 #  permissions and limitations under the License.
 """Class for lineage graph generation."""
 
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from zenml.enums import ExecutionStatus
 from zenml.lineage_graph.edge import Edge
@@ -28,9 +40,11 @@ from zenml.lineage_graph.node import (
 from zenml.lineage_graph.node.artifact_node import ArtifactNodeStatus
 
 if TYPE_CHECKING:
+    from zenml.config.step_configurations import StepConfiguration
     from zenml.models import (
         ArtifactVersionResponse,
         PipelineRunResponse,
+        RunMetadataResponse,
         StepRunResponse,
     )
 
@@ -38,6 +52,94 @@ if TYPE_CHECKING:
 ARTIFACT_PREFIX = "artifact_"
 STEP_PREFIX = "step_"
 
+MetadataTuple = Tuple[str, str, str]  # (key, value, type)
+
+
+def _get_metadata_tuples(
+    run_metadata: Dict[str, "RunMetadataResponse"],
+) -> List[MetadataTuple]:
+    """Converts run metadata to the representation used in lineage graphs.
+
+    Args:
+        run_metadata: The run metadata.
+
+    Returns:
+        The metadata as (key, value, type) tuples.
+    """
+    return [(m.key, str(m.value), str(m.type)) for m in run_metadata.values()]
+
+
+class LineageArtifactVersion(NamedTuple):
+    """The information of an artifact version needed for a lineage graph."""
+
+    id: UUID
+    type: str
+    data_type: str
+    uri: str
+    producer_step_run_id: Optional[UUID]
+    metadata: List[MetadataTuple]
+
+    @classmethod
+    def from_model(
+        cls, artifact: "ArtifactVersionResponse"
+    ) -> "LineageArtifactVersion":
+        """Creates the lineage information from an artifact version model.
+
+        Args:
+            artifact: The artifact version.
+
+        Returns:
+            The lineage information of the artifact version.
+        """
+        return cls(
+            id=artifact.id,
+            type=artifact.type,
+            data_type=artifact.data_type.import_path,
+            uri=artifact.uri,
+            producer_step_run_id=artifact.producer_step_run_id,
+            metadata=_get_metadata_tuples(artifact.run_metadata),
+        )
+
+
+class LineageStepRun(NamedTuple):
+    """The information of a step run needed for a lineage graph."""
+
+    id: UUID
+    name: str
+    status: ExecutionStatus
+    config: "StepConfiguration"
+    inputs: Dict[str, LineageArtifactVersion]
+    outputs: Dict[str, LineageArtifactVersion]
+    parent_step_ids: List[UUID]
+    metadata: List[MetadataTuple]
+
+    @classmethod
+    def from_model(cls, step: "StepRunResponse") -> "LineageStepRun":
+        """Creates the lineage information from a step run model.
+
+        Args:
+            step: The step run.
+
+        Returns:
+            The lineage information of the step run.
+        """
+        return cls(
+            id=step.id,
+            name=step.name,
+            status=step.status,
+            config=step.config,
+            inputs={
+                name: LineageArtifactVersion.from_model(artifact)
+                for name, artifact in step.inputs.items()
+            },
+            outputs={
+                name: LineageArtifactVersion.from_model(artifact)
+                for name, artifact in step.outputs.items()
+            },
+            parent_step_ids=step.parent_step_ids,
+            metadata=_get_metadata_tuples(step.run_metadata),
+        )
+
 
 class LineageGraph(BaseModel):
     """A lineage graph representation of a PipelineRunResponseModel."""
@@ -47,22 +149,47 @@ class LineageGraph(BaseModel):
     root_step_id: Optional[str] = None
     run_metadata: List[Tuple[str, str, str]] = []
 
+    # Indexes of the node IDs and of the sources and targets of all edges
+    _node_ids: Set[str] = PrivateAttr(default_factory=set)
+    _sources: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _targets: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data: Any) -> None:
+        """Initializes the lineage graph and indexes its nodes and edges.
+
+        Args:
+            **data: The graph attributes.
+        """
+        super().__init__(**data)
+        for node in self.nodes:
+            self._node_ids.add(node.id)
+        for edge in self.edges:
+            self._index_edge(edge)
+
     def generate_run_nodes_and_edges(self, run: "PipelineRunResponse") -> None:
         """Initializes a lineage graph from a pipeline run.
 
         Args:
             run: The PipelineRunResponseModel to generate the lineage graph for.
         """
-        self.run_metadata = [
-            (m.key, str(m.value), str(m.type))
-            for m in run.run_metadata.values()
-        ]
+        self.run_metadata = _get_metadata_tuples(run.run_metadata)
+        self.generate_nodes_and_edges(
+            [LineageStepRun.from_model(step) for step in run.steps.values()]
+        )
 
-        for step in run.steps.values():
-            self.generate_step_nodes_and_edges(step)
+    def generate_nodes_and_edges(
+        self, steps: Sequence[LineageStepRun]
+    ) -> None:
+        """Generates the nodes and edges for all steps of a pipeline run.
 
-        self.add_external_artifacts(run)
-        self.add_direct_edges(run)
+        Args:
+            steps: The steps of the pipeline run.
+        """
+        for step in steps:
+            self._add_step_run(step)
+
+        self._add_external_artifact_versions(steps)
+        self._add_direct_step_edges(steps)
 
     def generate_step_nodes_and_edges(self, step: "StepRunResponse") -> None:
         """Generates the nodes and edges for a step and its artifacts.
@@ -70,6 +197,129 @@ class LineageGraph(BaseModel):
         Args:
             step: The step to generate the nodes and edges for.
         """
+        self._add_step_run(LineageStepRun.from_model(step))
+
+    def add_external_artifacts(self, run: "PipelineRunResponse") -> None:
+        """Adds all external artifacts to the lineage graph.
+
+        Args:
+            run: The pipeline run to add external artifacts for.
+        """
+        self._add_external_artifact_versions(
+            [LineageStepRun.from_model(step) for step in run.steps.values()]
+        )
+
+    def add_direct_edges(self, run: "PipelineRunResponse") -> None:
+        """Add all direct edges between nodes generated by `after=...`.
+
+        Args:
+            run: The pipeline run to add direct edges for.
+        """
+        self._add_direct_step_edges(
+            [LineageStepRun.from_model(step) for step in run.steps.values()]
+        )
+
+    def has_artifact_link(self, step_id: str, parent_step_id: str) -> bool:
+        """Checks if a step has an artifact link to a parent step.
+
+        This is the case for all parent steps that were not specified via
+        `after=...`.
+
+        Args:
+            step_id: The node ID of the step to check.
+            parent_step_id: T node ID of the parent step to check.
+
+        Returns:
+            True if the steps are linked via an artifact, False otherwise.
+        """
+        parent_outputs = self._targets.get(parent_step_id, set())
+        child_inputs = self._sources.get(step_id, set())
+        return not parent_outputs.isdisjoint(child_inputs)
+
+    def add_step_node(
+        self,
+        step: "StepRunResponse",
+        id: str,
+    ) -> None:
+        """Adds a step node to the lineage graph.
+
+        Args:
+            step: The step to add a node for.
+            id: The id of the step node.
+        """
+        self._add_step_node(LineageStepRun.from_model(step), id=id)
+
+    def add_artifact_node(
+        self,
+        artifact: "ArtifactVersionResponse",
+        id: str,
+        name: str,
+        step_id: str,
+        status: ArtifactNodeStatus,
+    ) -> None:
+        """Adds an artifact node to the lineage graph.
+
+        Args:
+            artifact: The artifact to add a node for.
+            id: The id of the artifact node.
+            name: The input or output name of the artifact.
+            step_id: The id of the step that produced the artifact.
+            status: The status of the step that produced the artifact.
+        """
+        self._add_artifact_node(
+            LineageArtifactVersion.from_model(artifact),
+            id=id,
+            name=name,
+            step_id=step_id,
+            status=status,
+        )
+
+    def add_node(self, node: Union[StepNode, ArtifactNode]) -> None:
+        """Adds a node to the lineage graph.
+
+        Args:
+            node: The node to add.
+        """
+        self.nodes.append(node)
+        self._node_ids.add(node.id)
+
+    def has_node(self, id: str) -> bool:
+        """Checks if the lineage graph contains a node.
+
+        Args:
+            id: The id of the node.
+
+        Returns:
+            True if the graph contains a node with the given id.
+        """
+        return id in self._node_ids
+
+    def add_edge(self, source: str, target: str) -> None:
+        """Adds an edge to the lineage graph.
+
+        Args:
+            source: The source node id.
+            target: The target node id.
+        """
+        edge = Edge(id=source + "_" + target, source=source, target=target)
+        self.edges.append(edge)
+        self._index_edge(edge)
+
+    def _index_edge(self, edge: Edge) -> None:
+        """Adds an edge to the indexes of the lineage graph.
+
+        Args:
+            edge: The edge to index.
+        """
+        self._targets.setdefault(edge.source, set()).add(edge.target)
+        self._sources.setdefault(edge.target, set()).add(edge.source)
+
+    def _add_step_run(self, step: LineageStepRun) -> None:
+        """Adds the nodes and edges for a step and its artifacts.
+
+        Args:
+            step: The step to add the nodes and edges for.
+        """
         step_id = STEP_PREFIX + str(step.id)
 
         # Set a root step if it doesn't exist yet
@@ -77,7 +327,7 @@ class LineageGraph(BaseModel):
             self.root_step_id = step_id
 
         # Add the step node
-        self.add_step_node(step, step_id)
+        self._add_step_node(step, step_id)
 
         # Add nodes and edges for all output artifacts
         for artifact_name, artifact_version in step.outputs.items():
@@ -88,7 +338,7 @@ class LineageGraph(BaseModel):
                 artifact_status = ArtifactNodeStatus.CREATED
             else:
                 artifact_status = ArtifactNodeStatus.UNKNOWN
-            self.add_artifact_node(
+            self._add_artifact_node(
                 artifact=artifact_version,
                 id=artifact_version_id,
                 name=artifact_name,
@@ -102,20 +352,21 @@ class LineageGraph(BaseModel):
             artifact_version_id = ARTIFACT_PREFIX + str(artifact_version.id)
             self.add_edge(artifact_version_id, step_id)
 
-    def add_external_artifacts(self, run: "PipelineRunResponse") -> None:
-        """Adds all external artifacts to the lineage graph.
+    def _add_external_artifact_versions(
+        self, steps: Sequence[LineageStepRun]
+    ) -> None:
+        """Adds the input artifacts that weren't produced by any step.
 
         Args:
-            run: The pipeline run to add external artifacts for.
+            steps: The steps of the pipeline run.
         """
-        nodes_ids = {node.id for node in self.nodes}
-        for step in run.steps.values():
+        for step in steps:
             for artifact_name, artifact_version in step.inputs.items():
                 artifact_version_id = ARTIFACT_PREFIX + str(
                     artifact_version.id
                 )
-                if artifact_version_id not in nodes_ids:
-                    self.add_artifact_node(
+                if not self.has_node(artifact_version_id):
+                    self._add_artifact_node(
                         artifact=artifact_version,
                         id=artifact_version_id,
                         name=artifact_name,
@@ -123,45 +374,20 @@ class LineageGraph(BaseModel):
                         status=ArtifactNodeStatus.EXTERNAL,
                     )
 
-    def add_direct_edges(self, run: "PipelineRunResponse") -> None:
-        """Add all direct edges between nodes generated by `after=...`.
+    def _add_direct_step_edges(self, steps: Sequence[LineageStepRun]) -> None:
+        """Adds the edges between steps that aren't linked via artifacts.
 
         Args:
-            run: The pipeline run to add direct edges for.
+            steps: The steps of the pipeline run.
         """
-        for step in run.steps.values():
+        for step in steps:
             step_id = STEP_PREFIX + str(step.id)
             for parent_step_id_uuid in step.parent_step_ids:
                 parent_step_id = STEP_PREFIX + str(parent_step_id_uuid)
                 if not self.has_artifact_link(step_id, parent_step_id):
                     self.add_edge(parent_step_id, step_id)
 
-    def has_artifact_link(self, step_id: str, parent_step_id: str) -> bool:
-        """Checks if a step has an artifact link to a parent step.
-
-        This is the case for all parent steps that were not specified via
-        `after=...`.
-
-        Args:
-            step_id: The node ID of the step to check.
-            parent_step_id: T node ID of the parent step to check.
-
-        Returns:
-            True if the steps are linked via an artifact, False otherwise.
-        """
-        parent_outputs, child_inputs = set(), set()
-        for edge in self.edges:
-            if edge.source == parent_step_id:
-                parent_outputs.add(edge.target)
-            if edge.target == step_id:
-                child_inputs.add(edge.source)
-        return bool(parent_outputs.intersection(child_inputs))
-
-    def add_step_node(
-        self,
-        step: "StepRunResponse",
-        id: str,
-    ) -> None:
+    def _add_step_node(self, step: LineageStepRun, id: str) -> None:
         """Adds a step node to the lineage graph.
 
         Args:
@@ -175,7 +401,7 @@ class LineageGraph(BaseModel):
                 for key, value in step_config.items()
                 if key not in ["inputs", "outputs", "parameters"] and value
             }
-        self.nodes.append(
+        self.add_node(
             StepNode(
                 id=id,
                 data=StepNodeDetails(
@@ -187,17 +413,14 @@ class LineageGraph(BaseModel):
                     configuration=step_config,
                     inputs={k: v.uri for k, v in step.inputs.items()},
                     outputs={k: v.uri for k, v in step.outputs.items()},
-                    metadata=[
-                        (m.key, str(m.value), str(m.type))
-                        for m in step.run_metadata.values()
-                    ],
+                    metadata=step.metadata,
                 ),
             )
         )
 
-    def add_artifact_node(
+    def _add_artifact_node(
         self,
-        artifact: "ArtifactVersionResponse",
+        artifact: LineageArtifactVersion,
         id: str,
         name: str,
         step_id: str,
@@ -212,33 +435,20 @@ class LineageGraph(BaseModel):
             step_id: The id of the step that produced the artifact.
             status: The status of the step that produced the artifact.
         """
-        node = ArtifactNode(
-            id=id,
-            data=ArtifactNodeDetails(
-                execution_id=str(artifact.id),
-                name=name,
-                status=status,
-                is_cached=status == ArtifactNodeStatus.CACHED,
-                artifact_type=artifact.type,
-                artifact_data_type=artifact.data_type.import_path,
-                parent_step_id=step_id,
-                producer_step_id=str(artifact.producer_step_run_id),
-                uri=artifact.uri,
-                metadata=[
-                    (m.key, str(m.value), str(m.type))
-                    for m in artifact.run_metadata.values()
-                ],
-            ),
-        )
-        self.nodes.append(node)
-
-    def add_edge(self, source: str, target: str) -> None:
-        """Adds an edge to the lineage graph.
-
-        Args:
-            source: The source node id.
-            target: The target node id.
-        """
-        self.edges.append(
-            Edge(id=source + "_" + target, source=source, target=target)
+        self.add_node(
+            ArtifactNode(
+                id=id,
+                data=ArtifactNodeDetails(
+                    execution_id=str(artifact.id),
+                    name=name,
+                    status=status,
+                    is_cached=status == ArtifactNodeStatus.CACHED,
+                    artifact_type=artifact.type,
+                    artifact_data_type=artifact.data_type,
+                    parent_step_id=step_id,
+                    producer_step_id=str(artifact.producer_step_run_id),
+                    uri=artifact.uri,
+                    metadata=artifact.metadata,
+                ),
+            )
         )
@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Implementation of a default materializer registry."""
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
 from zenml.logger import get_logger
 
@@ -24,12 +25,47 @@ if TYPE_CHECKING:
 
 
 class MaterializerRegistry:
-    """Matches a Python type to a default materializer."""
+    """Matches a Python type to a default materializer.
+
+    The materializer that was found for a type by walking its MRO is memoized,
+    so looking up the materializer for a type that was seen before is a single
+    dictionary access. The memoized results are invalidated whenever a
+    materializer gets registered.
+    """
 
     def __init__(self) -> None:
         """Initialize the materializer registry."""
         self.default_materializer: Optional[Type["BaseMaterializer"]] = None
         self.materializer_types: Dict[Type[Any], Type["BaseMaterializer"]] = {}
+        # Registered materializer for each looked up type, `None` if no
+        # materializer is registered for the type or any of its base classes
+        self._dispatch_table: Dict[
+            Type[Any], Optional[Type["BaseMaterializer"]]
+        ] = {}
+        self._is_registered_cache: Dict[Type[Any], bool] = {}
+        self._registered_types_state: Tuple[int, int] = (0, 0)
+        self._lock = threading.Lock()
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Invalidates the memoized materializer lookups."""
+        self._dispatch_table = {}
+        self._is_registered_cache = {}
+        self._registered_types_state = (
+            id(self.materializer_types),
+            len(self.materializer_types),
+        )
+
+    def _invalidate_if_modified(self) -> None:
+        """Invalidates the memoized lookups if the registered types changed.
+
+        This catches modifications of the `materializer_types` dictionary that
+        don't go through the registration methods.
+        """
+        state = (id(self.materializer_types), len(self.materializer_types))
+        if state != self._registered_types_state:
+            with self._lock:
+                self._invalidate()
 
     def register_materializer_type(
         self, key: Type[Any], type_: Type["BaseMaterializer"]
@@ -41,7 +77,9 @@ class MaterializerRegistry:
             type_: A BaseMaterializer subclass.
         """
         if key not in self.materializer_types:
-            self.materializer_types[key] = type_
+            with self._lock:
+                self.materializer_types[key] = type_
+                self._invalidate()
             logger.debug(f"Registered materializer {type_} for {key}")
         else:
             logger.debug(
@@ -59,7 +97,9 @@ class MaterializerRegistry:
             key: Indicates the type of object.
             type_: A BaseMaterializer subclass.
         """
-        self.materializer_types[key] = type_
+        with self._lock:
+            self.materializer_types[key] = type_
+            self._invalidate()
         logger.debug(f"Registered materializer {type_} for {key}")
 
     def __getitem__(self, key: Type[Any]) -> Type["BaseMaterializer"]:
@@ -71,11 +111,61 @@ class MaterializerRegistry:
         Returns:
             `BaseMaterializer` subclass that was registered for this key.
         """
+        return self.get_materializer(key)
+
+    def get_materializer(
+        self,
+        key: Type[Any],
+        default_materializer: Optional[Type["BaseMaterializer"]] = None,
+    ) -> Type["BaseMaterializer"]:
+        """Get the materializer for a type.
+
+        Args:
+            key: Indicates the type of object.
+            default_materializer: The materializer to use if no materializer
+                is registered for the type. If not given, the default
+                materializer of the registry will be used.
+
+        Returns:
+            `BaseMaterializer` subclass that was registered for this key or
+            the default materializer.
+        """
+        materializer = self._get_registered_materializer(key)
+        if materializer:
+            return materializer
+        return default_materializer or self.get_default_materializer()
+
+    def _get_registered_materializer(
+        self, key: Type[Any]
+    ) -> Optional[Type["BaseMaterializer"]]:
+        """Get the materializer registered for a type or its base classes.
+
+        Args:
+            key: Indicates the type of object.
+
+        Returns:
+            The registered materializer or None if no materializer is
+            registered for the type or any of its base classes.
+        """
+        self._invalidate_if_modified()
+        dispatch_table = self._dispatch_table
+        try:
+            return dispatch_table[key]
+        except KeyError:
+            pass
+
+        materializer = None
         for class_ in key.__mro__:
             materializer = self.materializer_types.get(class_, None)
             if materializer:
-                return materializer
-        return self.get_default_materializer()
+                break
+
+        with self._lock:
+            # Don't store the result if a materializer was registered in the
+            # meantime
+            if dispatch_table is self._dispatch_table:
+                dispatch_table[key] = materializer
+        return materializer
 
     def get_default_materializer(self) -> Type["BaseMaterializer"]:
         """Get the default materializer that is used if no other is found.
@@ -112,7 +202,20 @@ class MaterializerRegistry:
             True if a materializer is registered for the given type, False
             otherwise.
         """
-        return any(issubclass(key, type_) for type_ in self.materializer_types)
+        self._invalidate_if_modified()
+        is_registered_cache = self._is_registered_cache
+        try:
+            return is_registered_cache[key]
+        except KeyError:
+            pass
+
+        is_registered = any(
+            issubclass(key, type_) for type_ in self.materializer_types
+        )
+        with self._lock:
+            if is_registered_cache is self._is_registered_cache:
+                is_registered_cache[key] = is_registered
+        return is_registered
 
 
 materializer_registry = MaterializerRegistry()
@@ -421,11 +421,13 @@ class Model(BaseModel):
             artifact_responses.update(mv.model_artifacts)
             artifact_responses.update(mv.deployment_artifacts)
 
-            for artifact_ in artifact_responses.values():
-                for artifact_response_ in artifact_.values():
-                    client._delete_artifact_from_artifact_store(
-                        artifact_version=artifact_response_
-                    )
+            client._delete_artifacts_from_artifact_stores(
+                [
+                    artifact_response_
+                    for artifact_ in artifact_responses.values()
+                    for artifact_response_ in artifact_.values()
+                ]
+            )
 
         client.delete_all_model_version_artifact_links(self.id, only_link)
 
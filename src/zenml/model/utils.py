@@ -28,6 +28,7 @@ from zenml.models import (
     ServiceUpdate,
 )
 from zenml.new.steps.step_context import get_step_context
+from zenml.utils import publish_queue
 
 logger = get_logger(__name__)
 
@@ -110,7 +111,9 @@ def link_artifact_config_to_model(
             is_model_artifact=artifact_config.is_model_artifact,
             is_deployment_artifact=artifact_config.is_deployment_artifact,
         )
-        client.zen_store.create_model_version_artifact_link(request)
+        publish_queue.publish(
+            client.zen_store.create_model_version_artifact_link, request
+        )
 
 
 def log_model_version_metadata(
@@ -14,7 +14,9 @@
 """Base class for all ZenML model deployers."""
 
 import contextlib
+import functools
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from typing import (
     Any,
     ClassVar,
@@ -22,20 +24,28 @@ from typing import (
     Generator,
     List,
     Optional,
+    Tuple,
     Type,
     cast,
 )
 from uuid import UUID
 
 from zenml.client import Client
+from zenml.constants import (
+    MODEL_SERVER_STATUS_MAX_AGE_SECONDS,
+    MODEL_SERVER_STATUS_REFRESH_MAX_WORKERS,
+    MODEL_SERVER_STATUS_REFRESH_TIMEOUT_SECONDS,
+)
 from zenml.enums import StackComponentType
 from zenml.logger import get_logger
-from zenml.services import BaseService, ServiceConfig
+from zenml.models import ServiceResponse
+from zenml.services import BaseService, ServiceConfig, ServiceStatus
 from zenml.services.service import BaseDeploymentService
 from zenml.services.service_type import ServiceType
 from zenml.stack import StackComponent
 from zenml.stack.flavor import Flavor
 from zenml.stack.stack_component import StackComponentConfig
+from zenml.utils.concurrency_utils import run_concurrently
 
 logger = get_logger(__name__)
 
@@ -290,9 +300,16 @@ class BaseModelDeployer(StackComponent, ABC):
         type: Optional[str] = None,
         flavor: Optional[str] = None,
         pipeline_run_id: Optional[str] = None,
+        refresh_status: bool = True,
+        status_max_age: float = 0,
     ) -> List[BaseService]:
         """Abstract method to find one or more a model servers that match the given criteria.
 
+        The status of the model servers is refreshed concurrently, unless it
+        was already checked within the last `status_max_age` seconds. Model
+        servers for which the status check does not finish in time are
+        returned with their last known status.
+
         Args:
             running: If true, only running services will be returned.
             service_uuid: The UUID of the service that was originally used
@@ -314,6 +331,13 @@ class BaseModelDeployer(StackComponent, ABC):
                 deployer. Can include the pipeline name, the run id, the step
                 name, the model name, the model uri, the model type etc.
             service_name: The name of the service to find.
+            refresh_status: If false, the last known status of the model
+                servers is returned without checking the external services.
+            status_max_age: The maximum age in seconds of a status that is
+                returned without checking the external service. By default,
+                the status is always checked. Read-only callers that can
+                tolerate slightly outdated statuses, e.g. for listing model
+                servers, can set this to reuse recently checked statuses.
 
         Returns:
             One or more Service objects representing model servers that match
@@ -336,30 +360,111 @@ class BaseModelDeployer(StackComponent, ABC):
             flavor=flavor or service_type.flavor if service_type else None,
             hydrate=True,
         )
-        services = []
+        services: List[BaseService] = []
+        stale_services: List[Tuple[int, ServiceResponse]] = []
         for service_response in service_responses.items:
             if not service_response.service_source:
                 client.delete_service(service_response.id)
                 continue
             service = BaseDeploymentService.from_model(service_response)
-            service.update_status()
-            if service.status.dict() != service_response.status:
-                client.update_service(
-                    id=service.uuid,
-                    admin_state=service.admin_state,
-                    status=service.status.dict(),
-                    endpoint=service.endpoint.dict()
-                    if service.endpoint
-                    else None,
+            if refresh_status and not self._is_status_fresh(
+                service.status, max_age=status_max_age
+            ):
+                stale_services.append((len(services), service_response))
+            services.append(service)
+
+        # The statuses are checked on separate service instances, so checks
+        # that time out and keep running in the background can't modify the
+        # services that are returned
+        results = run_concurrently(
+            [
+                functools.partial(
+                    self._refresh_service_status, service_response
                 )
+                for _, service_response in stale_services
+            ],
+            max_workers=MODEL_SERVER_STATUS_REFRESH_MAX_WORKERS,
+            timeout=MODEL_SERVER_STATUS_REFRESH_TIMEOUT_SECONDS,
+        )
+        for (index, _), result in zip(stale_services, results):
+            service = services[index]
+            if result.timed_out:
+                logger.warning(
+                    f"Timed out after {MODEL_SERVER_STATUS_REFRESH_TIMEOUT_SECONDS} "
+                    f"seconds while checking the status of service "
+                    f"{service.uuid}, using its last known status instead."
+                )
+            elif result.error:
+                logger.warning(
+                    f"Failed to check the status of service {service.uuid}, "
+                    f"using its last known status instead: {result.error}"
+                )
+            else:
+                services[index] = result.value
+
+        running_services = []
+        for service in services:
             if running and not service.is_running:
                 logger.warning(
                     f"Service {service.uuid} is in an unexpected state. "
                     f"Expected running={running}, but found running={service.is_running}."
                 )
                 continue
-            services.append(service)
-        return services
+            running_services.append(service)
+        return running_services
+
+    @staticmethod
+    def _is_status_fresh(status: ServiceStatus, max_age: float) -> bool:
+        """Checks whether the last known status of a service is recent enough.
+
+        Args:
+            status: The status of the service.
+            max_age: The maximum age of the status in seconds.
+
+        Returns:
+            Whether the status was checked within the last `max_age` seconds.
+        """
+        last_status_update = status.last_status_update
+        if max_age <= 0 or last_status_update is None:
+            return False
+        return datetime.utcnow() - last_status_update < timedelta(
+            seconds=max_age
+        )
+
+    @staticmethod
+    def _refresh_service_status(
+        service_response: ServiceResponse,
+    ) -> BaseService:
+        """Checks the status of a service and stores it in the service record.
+
+        The service record is only updated if the status changed or if the
+        stored check time is older than `MODEL_SERVER_STATUS_MAX_AGE_SECONDS`,
+        so that the record can still be used to skip status checks.
+
+        Args:
+            service_response: The service record.
+
+        Returns:
+            The service with the refreshed status.
+        """
+        service = BaseDeploymentService.from_model(service_response)
+        previous_status = service.status.copy()
+        service.update_status()
+
+        exclude = {"last_status_update"}
+        status_changed = service.status.dict(
+            exclude=exclude
+        ) != previous_status.dict(exclude=exclude)
+        if status_changed or not BaseModelDeployer._is_status_fresh(
+            previous_status, max_age=MODEL_SERVER_STATUS_MAX_AGE_SECONDS
+        ):
+            Client().update_service(
+                id=service.uuid,
+                admin_state=service.admin_state,
+                status=service.status.dict(),
+                endpoint=service.endpoint.dict() if service.endpoint else None,
+            )
+        return service
 
     @abstractmethod
     def perform_stop_model(
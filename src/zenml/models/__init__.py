@@ -341,6 +341,19 @@ from zenml.models.v2.core.event_source import (
 from zenml.models.v2.misc.user_auth import UserAuthModel
 from zenml.models.v2.misc.build_item import BuildItem
 from zenml.models.v2.misc.loaded_visualization import LoadedVisualization
+from zenml.models.v2.misc.artifact_lineage import (
+    ArtifactLineageEntry,
+    ArtifactLineagePage,
+)
+from zenml.models.v2.misc.artifact_storage import (
+    ArtifactStoreGarbageReport,
+    ArtifactStoreReference,
+    ArtifactStorageUsage,
+)
+from zenml.models.v2.misc.bulk_deletion import (
+    ArtifactStoreFile,
+    BulkDeletionSummary,
+)
 from zenml.models.v2.misc.hub_plugin_models import (
     HubPluginRequestModel,
     HubPluginResponseModel,
@@ -820,6 +833,13 @@ __all__ = [
     "ExternalUserModel",
     "BuildItem",
     "LoadedVisualization",
+    "ArtifactLineageEntry",
+    "ArtifactLineagePage",
+    "ArtifactStoreFile",
+    "ArtifactStoreGarbageReport",
+    "ArtifactStoreReference",
+    "ArtifactStorageUsage",
+    "BulkDeletionSummary",
     "HubPluginRequestModel",
     "HubPluginResponseModel",
     "HubUserResponseModel",
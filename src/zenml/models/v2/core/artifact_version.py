@@ -97,6 +97,9 @@ class ArtifactVersionRequest(WorkspaceScopedRequest):
     visualizations: Optional[List["ArtifactVisualizationRequest"]] = Field(
         default=None, title="Visualizations of the artifact."
     )
+    size: Optional[int] = Field(
+        default=None, title="Size of the artifact in bytes."
+    )
 
     _convert_source = convert_source_validator("materializer", "data_type")
 
@@ -110,6 +113,7 @@ class ArtifactVersionUpdate(BaseModel):
     name: Optional[str] = None
     add_tags: Optional[List[str]] = None
     remove_tags: Optional[List[str]] = None
+    size: Optional[int] = None
 
 
 # ------------------ Response Model ------------------
@@ -141,6 +145,10 @@ class ArtifactVersionResponseBody(WorkspaceScopedResponseBody):
     producer_pipeline_run_id: Optional[UUID] = Field(
         title="The ID of the pipeline run that generated this artifact version."
     )
+    size: Optional[int] = Field(
+        default=None,
+        title="Size of the artifact in bytes, if it is known.",
+    )
 
     _convert_source = convert_source_validator("materializer", "data_type")
 
@@ -242,6 +250,15 @@ class ArtifactVersionResponse(
         """
         return self.get_body().producer_pipeline_run_id
 
+    @property
+    def size(self) -> Optional[int]:
+        """The `size` property.
+
+        Returns:
+            the value of the property.
+        """
+        return self.get_body().size
+
     @property
     def artifact_store_id(self) -> Optional[UUID]:
         """The `artifact_store_id` property.
@@ -340,7 +357,12 @@ class ArtifactVersionResponse(
 
         return load_artifact_from_response(self)
 
-    def download_files(self, path: str, overwrite: bool = False) -> None:
+    def download_files(
+        self,
+        path: str,
+        overwrite: bool = False,
+        compression_level: Optional[int] = None,
+    ) -> None:
         """Downloads data for an artifact with no materializing.
 
         Any artifacts will be saved as a zip file to the given path.
@@ -348,6 +370,9 @@ class ArtifactVersionResponse(
         Args:
             path: The path to save the binary data to.
             overwrite: Whether to overwrite the file if it already exists.
+            compression_level: The compression level between 0 (no
+                compression) and 9. If not given, the default level of zlib
+                is used.
 
         Raises:
             ValueError: If the path does not end with '.zip'.
@@ -364,6 +389,7 @@ class ArtifactVersionResponse(
             self,
             path=path,
             overwrite=overwrite,
+            compression_level=compression_level,
         )
 
     def read(self) -> Any:
@@ -0,0 +1,68 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Models representing the lineage of artifact versions across runs."""
+
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from zenml.enums import LineageDirection
+
+
+class ArtifactLineageEntry(BaseModel):
+    """A step run in the lineage of an artifact version."""
+
+    step_run_id: UUID = Field(title="The ID of the step run.")
+    step_run_name: str = Field(title="The name of the step run.")
+    pipeline_run_id: UUID = Field(
+        title="The ID of the pipeline run of the step run."
+    )
+    pipeline_run_name: str = Field(
+        title="The name of the pipeline run of the step run."
+    )
+    artifact_version_id: UUID = Field(
+        title="The ID of the artifact version which links the step run to "
+        "the lineage. For downstream lineage, this is an input of the step "
+        "run, for upstream lineage an output. If the step run is linked "
+        "through several artifact versions, this is one of the artifact "
+        "versions on the shortest path."
+    )
+    depth: int = Field(
+        title="The number of step runs between the queried artifact version "
+        "and this step run, including this step run."
+    )
+    model_version_ids: List[UUID] = Field(
+        default=[],
+        title="The IDs of the model versions linked to the pipeline run.",
+    )
+
+
+class ArtifactLineagePage(BaseModel):
+    """Page of the lineage of an artifact version."""
+
+    artifact_version_id: UUID = Field(
+        title="The ID of the artifact version whose lineage was queried."
+    )
+    direction: LineageDirection = Field(
+        title="The direction in which the lineage was queried."
+    )
+    max_depth: int = Field(title="The maximum depth of the lineage.")
+    index: int = Field(title="The index of the page.")
+    max_size: int = Field(title="The maximum size of the page.")
+    total_pages: int = Field(title="The total number of pages.")
+    total: int = Field(title="The total number of entries.")
+    items: List[ArtifactLineageEntry] = Field(
+        title="The entries of the page, ordered by depth."
+    )
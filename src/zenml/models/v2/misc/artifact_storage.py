@@ -0,0 +1,83 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Models representing the usage and garbage collection of artifact stores."""
+
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ArtifactStoreReference(BaseModel):
+    """A URI in an artifact store which is referenced by an entity."""
+
+    uri: str = Field(title="The referenced URI.")
+    artifact_version_id: Optional[UUID] = Field(
+        default=None,
+        title="The ID of the artifact version stored at the URI, or None "
+        "if the URI belongs to a log file.",
+    )
+    size: Optional[int] = Field(
+        default=None,
+        title="The size of the artifact version in bytes, if it is known.",
+    )
+
+
+class ArtifactStorageUsage(BaseModel):
+    """Storage used by the artifact versions of an entity."""
+
+    id: UUID = Field(title="The ID of the entity.")
+    name: str = Field(title="The name of the entity.")
+    size: int = Field(
+        title="The total size in bytes of all artifact versions with a "
+        "known size."
+    )
+    artifact_versions: int = Field(title="The number of artifact versions.")
+    unknown_size_artifact_versions: int = Field(
+        title="The number of artifact versions whose size is not known yet."
+    )
+
+
+class ArtifactStoreGarbageReport(BaseModel):
+    """Result of a garbage collection run on an artifact store."""
+
+    artifact_store_id: UUID = Field(
+        title="The ID of the artifact store that was scanned."
+    )
+    dry_run: bool = Field(
+        title="Whether orphaned files were only reported without removing "
+        "them."
+    )
+    orphaned_files: List[str] = Field(
+        default=[],
+        title="The URIs of artifact directories and log files which are not "
+        "referenced by any artifact version or step run.",
+    )
+    orphaned_bytes: Optional[int] = Field(
+        default=None,
+        title="The total size of the orphaned files in bytes, if it was "
+        "computed.",
+    )
+    deleted_files: int = Field(
+        default=0, title="The number of orphaned files that were removed."
+    )
+    failed_files: List[str] = Field(
+        default=[],
+        title="The URIs of the orphaned files that could not be removed.",
+    )
+    sized_artifact_versions: int = Field(
+        default=0,
+        title="The number of artifact versions whose size was computed and "
+        "stored.",
+    )
@@ -0,0 +1,59 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Models representing the result of bulk deletions."""
+
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ArtifactStoreFile(BaseModel):
+    """A file or directory in an artifact store."""
+
+    uri: str = Field(title="The URI of the file or directory.")
+    artifact_store_id: Optional[UUID] = Field(
+        title="The ID of the artifact store which contains the file."
+    )
+
+
+class BulkDeletionSummary(BaseModel):
+    """Summary of the entities and files removed by a bulk deletion."""
+
+    dry_run: bool = Field(
+        title="Whether the deletion was only simulated without removing "
+        "anything."
+    )
+    pipeline_runs: int = Field(
+        default=0, title="The number of deleted pipeline runs."
+    )
+    step_runs: int = Field(default=0, title="The number of deleted step runs.")
+    artifact_versions: int = Field(
+        default=0, title="The number of deleted artifact versions."
+    )
+    files: List[ArtifactStoreFile] = Field(
+        default=[],
+        title="The artifact and log files of the deleted entities.",
+    )
+    file_bytes: Optional[int] = Field(
+        default=None,
+        title="The total size of the files in bytes, if it was computed.",
+    )
+    deleted_files: int = Field(
+        default=0, title="The number of files removed from artifact stores."
+    )
+    failed_files: List[str] = Field(
+        default=[],
+        title="The URIs of the files that could not be removed.",
+    )
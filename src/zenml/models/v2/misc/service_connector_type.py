@@ -801,7 +801,11 @@ class ServiceConnectorResourcesModel(BaseModel):
             connector_type=connector_model.type,
         )
 
-        resource_types = resource_type or connector_model.resource_types
+        resource_types = (
+            [resource_type]
+            if resource_type
+            else connector_model.resource_types
+        )
         for resource_type in resource_types:
             resources.resources.append(
                 ServiceConnectorTypedResourcesModel(
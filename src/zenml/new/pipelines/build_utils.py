@@ -138,12 +138,7 @@ def reuse_or_create_pipeline_build(
         The build response.
     """
     if not build:
-        if (
-            allow_build_reuse
-            and code_repository
-            and not deployment.requires_included_files
-            and build_required(deployment=deployment)
-        ):
+        if allow_build_reuse and build_required(deployment=deployment):
             existing_build = find_existing_build(
                 deployment=deployment, code_repository=code_repository
             )
@@ -165,8 +160,9 @@ def reuse_or_create_pipeline_build(
                     "  * The stack contains a container registry\n"
                     "  * The Docker settings of the pipeline and all its steps "
                     "are the same as for the existing build\n"
-                    "  * The build does not include code. This will only be "
-                    "the case if the existing build was created with a clean "
+                    "  * The build does not include code, or the code it "
+                    "includes is exactly the same as your local code. A build "
+                    "does not include code if it was created with a clean "
                     "code repository."
                 )
 
@@ -199,10 +195,13 @@ def reuse_or_create_pipeline_build(
 
 def find_existing_build(
     deployment: "PipelineDeploymentBase",
-    code_repository: "BaseCodeRepository",
+    code_repository: Optional["BaseCodeRepository"] = None,
 ) -> Optional["PipelineBuildResponse"]:
     """Find an existing build for a deployment.
 
+    Builds that include code are only reused if the checksum of the included
+    code matches the checksum of the local code.
+
     Args:
         deployment: The deployment for which to find an existing build.
         code_repository: The code repository that will be used to download
@@ -223,6 +222,10 @@ def find_existing_build(
     build_checksum = compute_build_checksum(
         required_builds, stack=stack, code_repository=code_repository
     )
+    includes_code = any(
+        build_config.should_include_files(code_repository=code_repository)
+        for build_config in required_builds
+    )
 
     matches = client.list_builds(
         sort_by="desc:created",
@@ -233,9 +236,11 @@ def find_existing_build(
         # TODO: Should we support this by storing the unique Docker ID for
         #   the image and checking if an image with that ID exists locally?
         is_local=False,
-        # The build contains some code which might be different from the
-        # local code the user is expecting to run
-        contains_code=False,
+        # If the build contains code, the checksum includes the content of
+        # the code. Otherwise we make sure to not reuse a build that contains
+        # code which might be different from the local code the user is
+        # expecting to run
+        contains_code=None if includes_code else False,
         zenml_version=zenml.__version__,
         # Match all patch versions of the same Python major + minor
         python_version=f"startswith:{python_version_prefix}",
@@ -403,6 +408,7 @@ def compute_build_checksum(
         The build checksum.
     """
     hash_ = hashlib.md5()  # nosec
+    source_files_checksums: Dict[Optional[str], str] = {}
 
     for item in items:
         key = PipelineBuildBase.get_image_key(
@@ -417,9 +423,42 @@ def compute_build_checksum(
         hash_.update(key.encode())
         hash_.update(settings_checksum.encode())
 
+        if item.should_include_files(code_repository=code_repository):
+            # The image includes the files of the source root, so it can only
+            # be reused if those files didn't change
+            dockerignore = item.settings.dockerignore
+            if dockerignore not in source_files_checksums:
+                source_files_checksums[
+                    dockerignore
+                ] = compute_source_files_checksum(
+                    dockerignore_file=dockerignore
+                )
+            hash_.update(source_files_checksums[dockerignore].encode())
+
     return hash_.hexdigest()
 
 
+def compute_source_files_checksum(
+    dockerignore_file: Optional[str] = None,
+) -> str:
+    """Compute a checksum of the files that will be included in an image.
+
+    Args:
+        dockerignore_file: Optional dockerignore file that defines which files
+            of the source root are included.
+
+    Returns:
+        The checksum of the source files.
+    """
+    from zenml.image_builders import BuildContext
+
+    build_context = BuildContext(
+        root=source_utils.get_source_root(),
+        dockerignore_file=dockerignore_file,
+    )
+    return build_context.compute_checksum()
+
+
 def verify_local_repository_context(
     deployment: "PipelineDeploymentBase",
     local_repo_context: Optional["LocalRepositoryContext"],
@@ -542,11 +581,11 @@ def verify_custom_build(
         )
         if build_checksum != build.checksum:
             logger.warning(
-                "The Docker settings used for the build `%s` are "
-                "not the same as currently specified for your pipeline. "
+                "The Docker settings or included code used for the build `%s` "
+                "are not the same as currently specified for your pipeline. "
                 "This means that the build you specified to run this "
                 "pipeline might be outdated and most likely contains "
-                "outdated requirements.",
+                "outdated code or requirements.",
                 build.id,
             )
     else:
@@ -24,6 +24,7 @@ from zenml.models import (
     StepRunResponse,
     StepRunUpdate,
 )
+from zenml.utils import publish_queue
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -36,6 +37,8 @@ def publish_successful_step_run(
 ) -> "StepRunResponse":
     """Publishes a successful step run.
 
+    All queued writes are stored before the step run is marked as completed.
+
     Args:
         step_run_id: The ID of the step run to update.
         output_artifact_ids: The output artifact IDs for the step run.
@@ -43,6 +46,7 @@ def publish_successful_step_run(
     Returns:
         The updated step run.
     """
+    publish_queue.flush()
     return Client().zen_store.update_run_step(
         step_run_id=step_run_id,
         step_run_update=StepRunUpdate(
@@ -62,6 +66,7 @@ def publish_failed_step_run(step_run_id: "UUID") -> "StepRunResponse":
     Returns:
         The updated step run.
     """
+    publish_queue.flush(raise_on_error=False)
     return Client().zen_store.update_run_step(
         step_run_id=step_run_id,
         step_run_update=StepRunUpdate(
@@ -82,6 +87,7 @@ def publish_failed_pipeline_run(
     Returns:
         The updated pipeline run.
     """
+    publish_queue.flush(raise_on_error=False)
     return Client().zen_store.update_run(
         run_id=pipeline_run_id,
         run_update=PipelineRunUpdate(
@@ -125,9 +131,8 @@ def publish_pipeline_run_metadata(
         pipeline_run_metadata: A dictionary mapping stack component IDs to the
             metadata they created.
     """
-    client = Client()
     for stack_component_id, metadata in pipeline_run_metadata.items():
-        client.create_run_metadata(
+        publish_queue.publish_run_metadata(
             metadata=metadata,
             resource_id=pipeline_run_id,
             resource_type=MetadataResourceTypes.PIPELINE_RUN,
@@ -146,9 +151,8 @@ def publish_step_run_metadata(
         step_run_metadata: A dictionary mapping stack component IDs to the
             metadata they created.
     """
-    client = Client()
     for stack_component_id, metadata in step_run_metadata.items():
-        client.create_run_metadata(
+        publish_queue.publish_run_metadata(
             metadata=metadata,
             resource_id=step_run_id,
             resource_type=MetadataResourceTypes.STEP_RUN,
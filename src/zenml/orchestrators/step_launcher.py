@@ -29,7 +29,7 @@ from zenml.constants import (
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
 )
-from zenml.enums import ExecutionStatus
+from zenml.enums import ExecutionStatus, StepExecutionPhase
 from zenml.environment import get_run_environment_dict
 from zenml.logger import get_logger
 from zenml.logging import step_logging
@@ -51,7 +51,7 @@ from zenml.orchestrators import (
 from zenml.orchestrators import utils as orchestrator_utils
 from zenml.orchestrators.step_runner import StepRunner
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import publish_queue, string_utils, tracing_utils
 
 if TYPE_CHECKING:
     from zenml.step_operators import BaseStepOperator
@@ -139,12 +139,23 @@ class StepLauncher:
         self._step_name = step.spec.pipeline_parameter_name
 
     def launch(self) -> None:
+        """Launches the step."""
+        with tracing_utils.trace_step(self._step_name) as trace:
+            self._launch(trace=trace)
+
+    def _launch(self, trace: Optional[tracing_utils.StepTrace]) -> None:
         """Launches the step.
 
+        Args:
+            trace: The trace of the step execution.
+
         Raises:
             BaseException: If the step failed to launch, run, or publish.
         """
-        pipeline_run, run_was_created = self._create_or_reuse_run()
+        with tracing_utils.span(
+            StepExecutionPhase.RUN_CREATION, name="pipeline_run_creation"
+        ):
+            pipeline_run, run_was_created = self._create_or_reuse_run()
 
         # Enable or disable step logs storage
         if handle_bool_env_var(ENV_ZENML_DISABLE_STEP_LOGS_STORAGE, False):
@@ -182,10 +193,11 @@ class StepLauncher:
                             run_id=pipeline_run.id
                         )
                     )
-                    publish_utils.publish_pipeline_run_metadata(
-                        pipeline_run_id=pipeline_run.id,
-                        pipeline_run_metadata=pipeline_run_metadata,
-                    )
+                    with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                        publish_utils.publish_pipeline_run_metadata(
+                            pipeline_run_id=pipeline_run.id,
+                            pipeline_run_metadata=pipeline_run_metadata,
+                        )
                 client = Client()
                 (
                     docstring,
@@ -220,9 +232,21 @@ class StepLauncher:
                     step_run.end_time = datetime.utcnow()
                     raise
                 finally:
-                    step_run_response = Client().zen_store.create_run_step(
-                        step_run
-                    )
+                    with tracing_utils.span(
+                        StepExecutionPhase.RUN_CREATION,
+                        name="step_run_creation",
+                    ):
+                        step_run_response = Client().zen_store.create_run_step(
+                            step_run
+                        )
+                    if trace:
+                        trace.step_run_id = step_run_response.id
+
+                if not execution_needed:
+                    # Cached step runs are published when they're created, so
+                    # the queued writes of the step need to be stored now
+                    with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                        publish_queue.flush()
 
                 logger.info(f"Step `{self._step_name}` has started.")
                 if execution_needed:
@@ -272,14 +296,18 @@ class StepLauncher:
                                 logger.error(
                                     f"Failed to run step `{self._step_name}` after {max_retries} retries. Exiting."
                                 )
-                                publish_utils.publish_failed_step_run(
-                                    step_run_response.id
-                                )
+                                with tracing_utils.span(
+                                    StepExecutionPhase.PUBLISHING
+                                ):
+                                    publish_utils.publish_failed_step_run(
+                                        step_run_response.id
+                                    )
                                 raise
 
         except:  # noqa: E722
             logger.error(f"Pipeline run `{pipeline_run.name}` failed.")
-            publish_utils.publish_failed_pipeline_run(pipeline_run.id)
+            with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                publish_utils.publish_failed_pipeline_run(pipeline_run.id)
             raise
 
     def _get_step_docstring_and_source_code(self) -> Tuple[Optional[str], str]:
@@ -350,21 +378,25 @@ class StepLauncher:
             self._deployment.step_configurations[step_run.name].config.model
             or self._deployment.pipeline_configuration.model
         )
-        input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
-            step=self._step,
-            run_id=step_run.pipeline_run_id,
-        )
+        with tracing_utils.span(StepExecutionPhase.INPUT_RESOLUTION):
+            input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
+                step=self._step,
+                run_id=step_run.pipeline_run_id,
+            )
         input_artifact_ids = {
             input_name: artifact.id
             for input_name, artifact in input_artifacts.items()
         }
 
-        cache_key = cache_utils.generate_cache_key(
-            step=self._step,
-            input_artifact_ids=input_artifact_ids,
-            artifact_store=self._stack.artifact_store,
-            workspace_id=Client().active_workspace.id,
-        )
+        with tracing_utils.span(
+            StepExecutionPhase.CACHE_LOOKUP, name="cache_key_generation"
+        ):
+            cache_key = cache_utils.generate_cache_key(
+                step=self._step,
+                input_artifact_ids=input_artifact_ids,
+                artifact_store=self._stack.artifact_store,
+                workspace_id=Client().active_workspace.id,
+            )
 
         step_run.inputs = input_artifact_ids
         step_run.parent_step_ids = parent_step_ids
@@ -384,9 +416,10 @@ class StepLauncher:
 
         execution_needed = True
         if cache_enabled:
-            cached_step_run = cache_utils.get_cached_step_run(
-                cache_key=cache_key
-            )
+            with tracing_utils.span(StepExecutionPhase.CACHE_LOOKUP):
+                cached_step_run = cache_utils.get_cached_step_run(
+                    cache_key=cache_key
+                )
             if cached_step_run:
                 logger.info(f"Using cached version of `{self._step_name}`.")
                 execution_needed = False
@@ -396,16 +429,17 @@ class StepLauncher:
                     output_name: artifact.id
                     for output_name, artifact in cached_outputs.items()
                 }
-                orchestrator_utils._link_cached_artifacts_to_model(
-                    model_from_context=model,
-                    step_run=step_run,
-                    step_source=self._step.spec.source,
-                )
-                if self._step.config.model:
-                    orchestrator_utils._link_pipeline_run_to_model_from_context(
-                        pipeline_run_id=step_run.pipeline_run_id,
-                        model=self._step.config.model,
+                with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                    orchestrator_utils._link_cached_artifacts_to_model(
+                        model_from_context=model,
+                        step_run=step_run,
+                        step_source=self._step.spec.source,
                     )
+                    if self._step.config.model:
+                        orchestrator_utils._link_pipeline_run_to_model_from_context(
+                            pipeline_run_id=step_run.pipeline_run_id,
+                            model=self._step.config.model,
+                        )
                 step_run.status = ExecutionStatus.CACHED
                 step_run.end_time = step_run.start_time
 
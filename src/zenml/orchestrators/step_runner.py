@@ -39,6 +39,7 @@ from zenml.constants import (
     ENV_ZENML_IGNORE_FAILURE_HOOK,
     handle_bool_env_var,
 )
+from zenml.enums import StepExecutionPhase
 from zenml.exceptions import StepContextError, StepInterfaceError
 from zenml.logger import get_logger
 from zenml.logging.step_logging import StepLogsStorageContext, redirected
@@ -62,7 +63,12 @@ from zenml.steps.utils import (
     parse_return_type_annotations,
     resolve_type_annotation,
 )
-from zenml.utils import materializer_utils, source_utils
+from zenml.utils import (
+    materializer_utils,
+    profiling_utils,
+    source_utils,
+    tracing_utils,
+)
 
 if TYPE_CHECKING:
     from zenml.config.source import Source
@@ -144,7 +150,15 @@ class StepRunner:
                     "step logging storage is disabled."
                 )
 
-        with logs_context:
+        # If the step is not run by a step launcher in the same process (e.g.
+        # when using a step operator), this starts a separate trace.
+        with logs_context, tracing_utils.trace_step(
+            step_run.name,
+            metadata_key=tracing_utils.STEP_OPERATOR_PHASE_DURATIONS_METADATA_KEY,
+        ) as trace:
+            if trace:
+                trace.step_run_id = step_run.id
+
             step_instance = self._load_step()
             output_materializers = self._load_output_materializers()
             spec = inspect.getfullargspec(
@@ -165,6 +179,8 @@ class StepRunner:
             with StepEnvironment(
                 step_run_info=step_run_info,
                 cache_enabled=cache_enabled,
+            ), profiling_utils.profile_step(
+                step_name=step_run.name, step_run_id=step_run.id
             ):
                 self._stack.prepare_step_run(info=step_run_info)
 
@@ -198,9 +214,10 @@ class StepRunner:
 
                 step_failed = False
                 try:
-                    return_values = step_instance.call_entrypoint(
-                        **function_params
-                    )
+                    with tracing_utils.span(StepExecutionPhase.USER_FUNCTION):
+                        return_values = step_instance.call_entrypoint(
+                            **function_params
+                        )
                 except BaseException as step_exception:  # noqa: E722
                     step_failed = True
                     if not handle_bool_env_var(
@@ -211,19 +228,24 @@ class StepRunner:
                             := self.configuration.failure_hook_source
                         ):
                             logger.info("Detected failure hook. Running...")
-                            self.load_and_run_hook(
-                                failure_hook_source,
-                                step_exception=step_exception,
-                            )
+                            with tracing_utils.span(
+                                StepExecutionPhase.USER_FUNCTION,
+                                name="failure_hook",
+                            ):
+                                self.load_and_run_hook(
+                                    failure_hook_source,
+                                    step_exception=step_exception,
+                                )
                     raise
                 finally:
-                    step_run_metadata = self._stack.get_step_run_metadata(
-                        info=step_run_info,
-                    )
-                    publish_step_run_metadata(
-                        step_run_id=step_run_info.step_run_id,
-                        step_run_metadata=step_run_metadata,
-                    )
+                    with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                        step_run_metadata = self._stack.get_step_run_metadata(
+                            info=step_run_info,
+                        )
+                        publish_step_run_metadata(
+                            step_run_id=step_run_info.step_run_id,
+                            step_run_metadata=step_run_metadata,
+                        )
                     self._stack.cleanup_step_run(
                         info=step_run_info, step_failed=step_failed
                     )
@@ -233,10 +255,14 @@ class StepRunner:
                             := self.configuration.success_hook_source
                         ):
                             logger.info("Detected success hook. Running...")
-                            self.load_and_run_hook(
-                                success_hook_source,
-                                step_exception=None,
-                            )
+                            with tracing_utils.span(
+                                StepExecutionPhase.USER_FUNCTION,
+                                name="success_hook",
+                            ):
+                                self.load_and_run_hook(
+                                    success_hook_source,
+                                    step_exception=None,
+                                )
 
                         # Store and publish the output artifacts of the step function.
                         output_data = self._validate_outputs(
@@ -258,23 +284,27 @@ class StepRunner:
                             artifact_metadata_enabled=artifact_metadata_enabled,
                             artifact_visualization_enabled=artifact_visualization_enabled,
                         )
-                        link_step_artifacts_to_model(
-                            artifact_version_ids=output_artifact_ids
-                        )
-                        _link_pipeline_run_to_model_from_artifacts(
-                            pipeline_run_id=pipeline_run.id,
-                            artifact_names=list(output_artifact_ids.keys()),
-                            external_artifacts=list(
-                                step_run.config.external_input_artifacts.values()
-                            ),
-                        )
+                        with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                            link_step_artifacts_to_model(
+                                artifact_version_ids=output_artifact_ids
+                            )
+                            _link_pipeline_run_to_model_from_artifacts(
+                                pipeline_run_id=pipeline_run.id,
+                                artifact_names=list(
+                                    output_artifact_ids.keys()
+                                ),
+                                external_artifacts=list(
+                                    step_run.config.external_input_artifacts.values()
+                                ),
+                            )
                     StepContext._clear()  # Remove the step context singleton
 
             # Update the status and output artifacts of the step run.
-            publish_successful_step_run(
-                step_run_id=step_run_info.step_run_id,
-                output_artifact_ids=output_artifact_ids,
-            )
+            with tracing_utils.span(StepExecutionPhase.PUBLISHING):
+                publish_successful_step_run(
+                    step_run_id=step_run_info.step_run_id,
+                    output_artifact_ids=output_artifact_ids,
+                )
 
     def _load_step(self) -> "BaseStep":
         """Load the step instance.
@@ -352,9 +382,12 @@ class StepRunner:
                 )
                 function_params[arg] = get_step_context()
             elif arg in input_artifacts:
-                function_params[arg] = self._load_input_artifact(
-                    input_artifacts[arg], arg_type
-                )
+                with tracing_utils.span(
+                    StepExecutionPhase.INPUT_LOADING, input_name=arg
+                ):
+                    function_params[arg] = self._load_input_artifact(
+                        input_artifacts[arg], arg_type
+                    )
             elif arg in self.configuration.parameters:
                 function_params[arg] = self.configuration.parameters[arg]
             else:
@@ -585,18 +618,21 @@ class StepRunner:
                     output_name
                 ].default_materializer_source
 
+                default_materializer_class: Optional[
+                    Type[BaseMaterializer]
+                ] = None
                 if default_materializer_source:
-                    default_materializer_class: Type[BaseMaterializer] = (
+                    default_materializer_class = (
                         source_utils.load_and_validate_class(
                             default_materializer_source,
                             expected_class=BaseMaterializer,
                         )
                     )
-                    materializer_registry.default_materializer = (
-                        default_materializer_class
-                    )
 
-                materializer_class = materializer_registry[data_type]
+                materializer_class = materializer_registry.get_materializer(
+                    data_type,
+                    default_materializer=default_materializer_class,
+                )
 
             uri = output_artifact_uris[output_name]
             artifact_config = output_annotations[output_name].artifact_config
@@ -34,6 +34,7 @@ from zenml.exceptions import StepContextError
 from zenml.model.utils import link_artifact_config_to_model
 from zenml.models.v2.core.step_run import StepRunRequest
 from zenml.new.steps.step_context import get_step_context
+from zenml.utils import publish_queue
 
 if TYPE_CHECKING:
     from zenml.artifacts.external_artifact_config import (
@@ -176,14 +177,15 @@ def _link_pipeline_run_to_model_from_context(
         model_id, model_version_id = model.model_id, model.id
 
     if model_id and model_version_id:
-        Client().zen_store.create_model_version_pipeline_run_link(
+        publish_queue.publish(
+            Client().zen_store.create_model_version_pipeline_run_link,
             ModelVersionPipelineRunRequest(
                 user=Client().active_user.id,
                 workspace=Client().active_workspace.id,
                 pipeline_run=pipeline_run_id,
                 model=model_id,
                 model_version=model_version_id,
-            )
+            ),
         )
 
 
@@ -266,14 +268,15 @@ def _link_pipeline_run_to_model_from_artifacts(
             )
 
     for model in models:
-        client.zen_store.create_model_version_pipeline_run_link(
+        publish_queue.publish(
+            client.zen_store.create_model_version_pipeline_run_link,
             ModelVersionPipelineRunRequest(
                 user=client.active_user.id,
                 workspace=client.active_workspace.id,
                 pipeline_run=pipeline_run_id,
                 model=model[0],
                 model_version=model[1],
-            )
+            ),
         )
 
 
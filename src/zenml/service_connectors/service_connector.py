@@ -13,17 +13,27 @@
 #  permissions and limitations under the License.
 """Base ZenML Service Connector class."""
 
+import functools
+import hashlib
+import json
 import logging
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
+    Hashable,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -39,7 +49,12 @@ from pydantic.main import ModelMetaclass
 from zenml.client import Client
 from zenml.constants import (
     ENV_ZENML_ENABLE_IMPLICIT_AUTH_METHODS,
+    SERVICE_CONNECTOR_CACHE_MAX_AGE_SECONDS,
+    SERVICE_CONNECTOR_CACHE_MAX_ENTRIES,
+    SERVICE_CONNECTOR_CACHE_REFRESH_MARGIN_SECONDS,
     SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS,
+    SERVICE_CONNECTOR_VERIFICATION_MAX_WORKERS,
+    SERVICE_CONNECTOR_VERIFICATION_TIMEOUT_SECONDS,
     handle_bool_env_var,
 )
 from zenml.exceptions import AuthorizationException
@@ -55,9 +70,12 @@ from zenml.models import (
     UserResponse,
     WorkspaceResponse,
 )
+from zenml.utils.concurrency_utils import run_concurrently
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class AuthenticationConfig(BaseModel):
     """Base authentication configuration."""
@@ -98,6 +116,253 @@ class AuthenticationConfig(BaseModel):
         return self.dict(exclude_none=True)
 
 
+_CacheKey = Tuple[Optional[UUID], Hashable]
+
+
+class ServiceConnectorCacheStats(BaseModel):
+    """Statistics of the service connector cache."""
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    failed_refreshes: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class _ServiceConnectorCacheEntry(NamedTuple):
+    """An entry of the service connector cache."""
+
+    value: Any
+    expires_at: Optional[datetime]
+    valid_until: Optional[datetime]
+    refresh_at: datetime
+
+
+class ServiceConnectorCache:
+    """Process-wide cache of authenticated service connector clients.
+
+    The cache stores connector clients as well as the sessions and
+    credentials that connector implementations use to authenticate to their
+    resources, so that all stack components running in the same process
+    reuse them instead of authenticating again. Entries are keyed on the
+    connector ID and arbitrary additional key parts, usually the
+    authentication method and the resource type and ID.
+
+    Entries are discarded once their credentials expire. An entry is
+    refreshed proactively when it gets close to its expiration time: a
+    single thread re-creates the value while all others keep using the
+    still valid cached value. Entries without an expiration time are
+    refreshed periodically to pick up connector configuration changes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SERVICE_CONNECTOR_CACHE_MAX_ENTRIES,
+        max_age_seconds: int = SERVICE_CONNECTOR_CACHE_MAX_AGE_SECONDS,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached entries. The least
+                recently used entries are evicted first.
+            max_age_seconds: The time after which entries without an
+                expiration time are refreshed.
+        """
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._entries: "OrderedDict[_CacheKey, _ServiceConnectorCacheEntry]" = OrderedDict()
+        self._key_locks: Dict[_CacheKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = ServiceConnectorCacheStats()
+
+    def get_or_create(
+        self,
+        connector_id: Optional[UUID],
+        key: Hashable,
+        factory: Callable[[], Tuple[T, Optional[datetime]]],
+        skew_tolerance: int = 0,
+        refresh_margin: int = SERVICE_CONNECTOR_CACHE_REFRESH_MARGIN_SECONDS,
+    ) -> Tuple[T, Optional[datetime]]:
+        """Gets a cached value or creates it.
+
+        Args:
+            connector_id: The ID of the connector that the value belongs to.
+            key: Additional parts of the cache key.
+            factory: Function that creates the value and returns it together
+                with its expiration time, if applicable.
+            skew_tolerance: Number of seconds before the expiration time at
+                which the value is considered expired.
+            refresh_margin: Number of seconds before the value is considered
+                expired at which it is refreshed proactively.
+
+        Returns:
+            The cached or created value and its expiration time.
+        """
+        cache_key = (connector_id, key)
+        now = datetime.now(timezone.utc)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and self._is_expired(entry, now):
+                del self._entries[cache_key]
+                self._stats.expirations += 1
+                entry = None
+
+            if entry is not None and now < entry.refresh_at:
+                self._entries.move_to_end(cache_key)
+                self._stats.hits += 1
+                return entry.value, entry.expires_at
+
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        if entry is not None:
+            # The entry is still valid but about to expire. Only one thread
+            # refreshes it while the others keep using the cached value.
+            if not key_lock.acquire(blocking=False):
+                with self._lock:
+                    self._stats.hits += 1
+                return entry.value, entry.expires_at
+
+            try:
+                with self._lock:
+                    self._stats.refreshes += 1
+                try:
+                    return self._create(
+                        cache_key, factory, skew_tolerance, refresh_margin
+                    )
+                except Exception as e:
+                    logger.debug(
+                        "Failed to refresh cached service connector value "
+                        "%s, using the cached value until it expires: %s",
+                        key,
+                        e,
+                    )
+                    with self._lock:
+                        self._stats.failed_refreshes += 1
+                    return entry.value, entry.expires_at
+            finally:
+                key_lock.release()
+
+        with key_lock:
+            # Another thread might have created the value while we were
+            # waiting for the lock
+            with self._lock:
+                entry = self._entries.get(cache_key)
+                if entry is not None and not self._is_expired(
+                    entry, datetime.now(timezone.utc)
+                ):
+                    self._stats.hits += 1
+                    return entry.value, entry.expires_at
+                self._stats.misses += 1
+
+            return self._create(
+                cache_key, factory, skew_tolerance, refresh_margin
+            )
+
+    def invalidate(self, connector_id: Optional[UUID] = None) -> None:
+        """Removes cached values.
+
+        Args:
+            connector_id: Only remove the values of the connector with this
+                ID. If not given, all values are removed.
+        """
+        with self._lock:
+            for cache_key in list(self._entries):
+                if connector_id is None or cache_key[0] == connector_id:
+                    del self._entries[cache_key]
+                    self._key_locks.pop(cache_key, None)
+
+    def stats(self) -> ServiceConnectorCacheStats:
+        """Gets the cache statistics.
+
+        Returns:
+            A snapshot of the cache statistics.
+        """
+        with self._lock:
+            return self._stats.copy(update={"size": len(self._entries)})
+
+    @staticmethod
+    def _is_expired(entry: _ServiceConnectorCacheEntry, now: datetime) -> bool:
+        """Checks whether a cache entry has expired.
+
+        Args:
+            entry: The cache entry.
+            now: The current time.
+
+        Returns:
+            Whether the entry has expired.
+        """
+        return entry.valid_until is not None and now >= entry.valid_until
+
+    def _create(
+        self,
+        cache_key: _CacheKey,
+        factory: Callable[[], Tuple[T, Optional[datetime]]],
+        skew_tolerance: int,
+        refresh_margin: int,
+    ) -> Tuple[T, Optional[datetime]]:
+        """Creates a value and stores it in the cache.
+
+        Args:
+            cache_key: The cache key.
+            factory: Function that creates the value.
+            skew_tolerance: Number of seconds before the expiration time at
+                which the value is considered expired.
+            refresh_margin: Number of seconds before the value is considered
+                expired at which it is refreshed.
+
+        Returns:
+            The created value and its expiration time.
+        """
+        value, expires_at = factory()
+        now = datetime.now(timezone.utc)
+
+        if expires_at is None:
+            valid_until = None
+            refresh_at = now + timedelta(seconds=self.max_age_seconds)
+        else:
+            if expires_at.tzinfo is None:
+                # Naive timestamps are always in UTC
+                valid_until = expires_at.replace(tzinfo=timezone.utc)
+            else:
+                valid_until = expires_at
+            valid_until -= timedelta(seconds=skew_tolerance)
+            # Values with a short lifetime are used for at least half of it
+            refresh_at = max(
+                valid_until - timedelta(seconds=refresh_margin),
+                now + (valid_until - now) / 2,
+            )
+
+        with self._lock:
+            self._entries[cache_key] = _ServiceConnectorCacheEntry(
+                value=value,
+                expires_at=expires_at,
+                valid_until=valid_until,
+                refresh_at=refresh_at,
+            )
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._key_locks.pop(evicted_key, None)
+                self._stats.evictions += 1
+
+        return value, expires_at
+
+
+service_connector_cache = ServiceConnectorCache()
+
+
+class _ResourceTypeVerification(NamedTuple):
+    """The result of verifying a single resource type of a connector."""
+
+    resource_type: Optional[str]
+    resource_id: Optional[str]
+    resource_ids: Optional[List[str]] = None
+    error: Optional[str] = None
+
+
 class ServiceConnectorMeta(ModelMetaclass):
     """Metaclass responsible for automatically registering ServiceConnector classes."""
 
@@ -825,6 +1090,25 @@ class ServiceConnector(BaseModel, metaclass=ServiceConnectorMeta):
 
         return model
 
+    @property
+    def valid_until(self) -> Optional[datetime]:
+        """The time until which the connector credentials can be used.
+
+        Returns:
+            The expiration time of the connector credentials minus the skew
+            tolerance, or None if the credentials don't expire.
+        """
+        if not self.expires_at:
+            return None
+
+        expires_at = self.expires_at.replace(tzinfo=timezone.utc)
+        # Subtract some time to account for clock skew or other delays.
+        return expires_at - timedelta(
+            seconds=self.expires_skew_tolerance
+            if self.expires_skew_tolerance is not None
+            else SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS
+        )
+
     def has_expired(self) -> bool:
         """Check if the connector authentication credentials have expired.
 
@@ -835,16 +1119,10 @@ class ServiceConnector(BaseModel, metaclass=ServiceConnectorMeta):
         Returns:
             True if the connector has expired, False otherwise.
         """
-        if not self.expires_at:
+        expires_at = self.valid_until
+        if not expires_at:
             return False
 
-        expires_at = self.expires_at.replace(tzinfo=timezone.utc)
-        # Subtract some time to account for clock skew or other delays.
-        expires_at = expires_at - timedelta(
-            seconds=self.expires_skew_tolerance
-            if self.expires_skew_tolerance is not None
-            else SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS
-        )
         delta = expires_at - datetime.now(timezone.utc)
         result = delta < timedelta(seconds=0)
 
@@ -859,6 +1137,65 @@ class ServiceConnector(BaseModel, metaclass=ServiceConnectorMeta):
 
         return result
 
+    def _get_cached_session(
+        self,
+        auth_method: str,
+        resource_type: Optional[str],
+        resource_id: Optional[str],
+        authenticate: Callable[[], Tuple[T, Optional[datetime]]],
+        refresh_margin: int = SERVICE_CONNECTOR_CACHE_REFRESH_MARGIN_SECONDS,
+    ) -> Tuple[T, Optional[datetime]]:
+        """Get an authenticated session from the process-wide cache.
+
+        Sessions are shared between all connector instances in the process
+        that use the same connector type, configuration and credentials, so
+        that stack components don't need to re-authenticate.
+
+        Args:
+            auth_method: The authentication method of the session.
+            resource_type: The resource type of the session.
+            resource_id: The resource ID of the session.
+            authenticate: Function that authenticates and returns a new
+                session together with its expiration time, if applicable.
+            refresh_margin: Number of seconds before the session expires at
+                which it is refreshed.
+
+        Returns:
+            The session and its expiration time, if applicable.
+        """
+        return service_connector_cache.get_or_create(
+            connector_id=self.id,
+            key=(
+                "session",
+                self.get_type().connector_type,
+                self._get_credentials_fingerprint(),
+                auth_method,
+                resource_type,
+                resource_id,
+            ),
+            factory=authenticate,
+            refresh_margin=refresh_margin,
+        )
+
+    def _get_credentials_fingerprint(self) -> str:
+        """Get a fingerprint of the connector configuration and credentials.
+
+        Returns:
+            A hash of all configuration values, including secret values.
+        """
+        values = {
+            key: value.get_secret_value()
+            if isinstance(value, SecretStr)
+            else value
+            for key, value in self.config.all_values.items()
+        }
+        serialized = json.dumps(
+            [self.auth_method, self.expires_at, values],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
     def validate_runtime_args(
         self,
         resource_type: Optional[str],
@@ -1237,100 +1574,162 @@ class ServiceConnector(BaseModel, metaclass=ServiceConnectorMeta):
             if len(verify_resource_types) == 1:
                 verify_resource_id = resource_id
 
-        # Here we go through each resource type and attempt to verify and list
-        # the resources that the connector can access for that resource type.
-        # This list may start with a `None` resource type, which indicates that
-        # the connector should verify that it can authenticate globally.
-        for resource_type in verify_resource_types:
-            try:
-                resource_type, resource_id = self.validate_runtime_args(
+        # The list of resource types may start with a `None` resource type,
+        # which indicates that the connector should verify that it can
+        # authenticate globally. We stop on a global failure, otherwise the
+        # individual resource types are verified concurrently because each
+        # verification usually involves API calls to the remote service.
+        if verify_resource_types and verify_resource_types[0] is None:
+            result = self._verify_resource_type(
+                resource_type=verify_resource_types.pop(0),
+                resource_id=verify_resource_id,
+            )
+            self._record_verification_result(resources, result)
+            if result.error:
+                return resources
+
+        task_results = run_concurrently(
+            [
+                functools.partial(
+                    self._verify_resource_type,
                     resource_type=resource_type,
                     resource_id=verify_resource_id,
-                    require_resource_type=False,
-                    require_resource_id=False,
                 )
+                for resource_type in verify_resource_types
+            ],
+            max_workers=SERVICE_CONNECTOR_VERIFICATION_MAX_WORKERS,
+        )
+        for task_result in task_results:
+            if task_result.error:
+                raise task_result.error
+            self._record_verification_result(resources, task_result.value)
 
-                resource_ids = self._verify(
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                )
-            except ValueError as exc:
-                raise ValueError(
-                    f"The connector configuration is incomplete or invalid: "
-                    f"{exc}",
-                )
-            except AuthorizationException as exc:
-                error = f"connector{name_msg} authorization failure: {exc}"
-                # Log an exception if debug logging is enabled
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception(error)
-                else:
-                    logger.warning(error)
+        return resources
 
-                # Log the error in the resources object
-                resources.set_error(error, resource_type=resource_type)
-                if resource_type:
-                    continue
-                else:
-                    # We stop on a global failure
-                    break
-            except Exception as exc:
-                error = (
-                    f"connector{name_msg} verification failed with "
-                    f"unexpected error: {exc}"
-                )
-                # Log an exception if debug logging is enabled
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception(error)
-                else:
-                    logger.warning(error)
-                error = (
-                    "an unexpected error occurred while verifying the "
-                    "connector."
-                )
-                # Log the error in the resources object
-                resources.set_error(error, resource_type=resource_type)
-                if resource_type:
-                    continue
-                else:
-                    # We stop on a global failure
-                    break
+    def _verify_resource_type(
+        self,
+        resource_type: Optional[str],
+        resource_id: Optional[str],
+    ) -> "_ResourceTypeVerification":
+        """Verify and list the resources of a single resource type.
 
-            if not resource_type:
-                # If a resource type is not provided as argument, we don't
-                # expect any resources to be listed
-                continue
+        Args:
+            resource_type: The type of the resources to verify. If not
+                provided, the connector verifies that it can authenticate
+                globally.
+            resource_id: The ID of a particular resource instance to verify.
 
-            resource_type_spec = spec.resource_type_dict[resource_type]
+        Returns:
+            The verification result.
 
-            if resource_id:
-                # A single resource was requested, so we expect a single
-                # resource to be listed
-                if [resource_id] != resource_ids:
-                    logger.error(
-                        f"a different resource ID '{resource_ids}' was "
-                        f"returned than the one requested: {resource_ids}. "
-                        f"This is likely a bug in the {self.__class__} "
-                        "connector implementation."
-                    )
-                resources.set_resource_ids(resource_type, [resource_id])
-            elif not resource_ids:
-                # If no resources were listed, signal this as an error that the
-                # connector cannot access any resources.
-                error = (
-                    f"connector{name_msg} didn't list any "
-                    f"{resource_type_spec.name} resources. This is likely "
-                    "caused by the connector credentials not being valid or "
-                    "not having sufficient permissions to list or access "
-                    "resources of this type. Please check the connector "
-                    "configuration and its credentials and try again."
-                )
-                logger.debug(error)
-                resources.set_error(error, resource_type=resource_type)
+        Raises:
+            ValueError: If the connector configuration is incomplete or
+                invalid.
+        """
+        name_msg = f" '{self.name}'" if self.name else ""
+        try:
+            resource_type, resource_id = self.validate_runtime_args(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                require_resource_type=False,
+                require_resource_id=False,
+            )
+
+            resource_ids = self._verify(
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
+        except ValueError as exc:
+            raise ValueError(
+                f"The connector configuration is incomplete or invalid: {exc}",
+            )
+        except AuthorizationException as exc:
+            error = f"connector{name_msg} authorization failure: {exc}"
+            # Log an exception if debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception(error)
             else:
-                resources.set_resource_ids(resource_type, resource_ids)
+                logger.warning(error)
+        except Exception as exc:
+            error = (
+                f"connector{name_msg} verification failed with "
+                f"unexpected error: {exc}"
+            )
+            # Log an exception if debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception(error)
+            else:
+                logger.warning(error)
+            error = (
+                "an unexpected error occurred while verifying the connector."
+            )
+        else:
+            return _ResourceTypeVerification(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                resource_ids=resource_ids,
+            )
 
-        return resources
+        return _ResourceTypeVerification(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            error=error,
+        )
+
+    def _record_verification_result(
+        self,
+        resources: ServiceConnectorResourcesModel,
+        result: "_ResourceTypeVerification",
+    ) -> None:
+        """Record the verification result of a resource type.
+
+        Args:
+            resources: The resources model to record the result in.
+            result: The verification result.
+        """
+        resource_type = result.resource_type
+        resource_id = result.resource_id
+        resource_ids = result.resource_ids
+
+        if result.error:
+            # Log the error in the resources object
+            resources.set_error(result.error, resource_type=resource_type)
+            return
+
+        if not resource_type:
+            # If a resource type is not provided as argument, we don't
+            # expect any resources to be listed
+            return
+
+        name_msg = f" '{self.name}'" if self.name else ""
+        resource_type_spec = self.get_type().resource_type_dict[resource_type]
+
+        if resource_id:
+            # A single resource was requested, so we expect a single
+            # resource to be listed
+            if [resource_id] != resource_ids:
+                logger.error(
+                    f"a different resource ID '{resource_ids}' was "
+                    f"returned than the one requested: {resource_ids}. "
+                    f"This is likely a bug in the {self.__class__} "
+                    "connector implementation."
+                )
+            resources.set_resource_ids(resource_type, [resource_id])
+        elif not resource_ids:
+            # If no resources were listed, signal this as an error that the
+            # connector cannot access any resources.
+            error = (
+                f"connector{name_msg} didn't list any "
+                f"{resource_type_spec.name} resources. This is likely "
+                "caused by the connector credentials not being valid or "
+                "not having sufficient permissions to list or access "
+                "resources of this type. Please check the connector "
+                "configuration and its credentials and try again."
+            )
+            logger.debug(error)
+            resources.set_error(error, resource_type=resource_type)
+        else:
+            resources.set_resource_ids(resource_type, resource_ids)
 
     def get_connector_client(
         self,
@@ -1408,3 +1807,136 @@ class ServiceConnector(BaseModel, metaclass=ServiceConnectorMeta):
         # all attributes with leading underscore are private and therefore
         # are mutable and not included in serialization
         underscore_attrs_are_private = True
+
+
+def verify_service_connectors(
+    connectors: Sequence[ServiceConnectorResponse],
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    timeout: Optional[float] = SERVICE_CONNECTOR_VERIFICATION_TIMEOUT_SECONDS,
+    max_workers: int = SERVICE_CONNECTOR_VERIFICATION_MAX_WORKERS,
+) -> List[ServiceConnectorResourcesModel]:
+    """Concurrently list the resources that service connectors can access.
+
+    Args:
+        connectors: The connectors to verify.
+        resource_type: The type of resources to list.
+        resource_id: The ID of a particular resource instance to verify.
+        timeout: Maximum number of seconds that the verification of a single
+            connector may take. Connectors that time out are included in the
+            result with an error.
+        max_workers: The maximum number of connectors to verify at the same
+            time.
+
+    Returns:
+        The resources that the connectors have access to, in the same order
+        as the connectors. Connectors that are not configured correctly or
+        that fail to authenticate are not included.
+
+    Raises:
+        Exception: If the verification of a connector fails with an
+            unexpected error.
+    """
+    tasks = [
+        functools.partial(
+            _list_connector_resources,
+            connector=connector,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
+        for connector in connectors
+    ]
+    task_results = run_concurrently(
+        tasks, max_workers=max_workers, timeout=timeout
+    )
+
+    resource_list: List[ServiceConnectorResourcesModel] = []
+    for connector, task_result in zip(connectors, task_results):
+        if task_result.timed_out:
+            logger.error(
+                f"Timed out fetching {resource_type or 'available'} resources "
+                f"from service connector {connector.name}/{connector.id}."
+            )
+            resources = ServiceConnectorResourcesModel.from_connector_model(
+                connector,
+                resource_type=resource_type,
+            )
+            resources.set_error(
+                f"the connector verification timed out after {timeout} "
+                "seconds."
+            )
+            resource_list.append(resources)
+        elif isinstance(
+            task_result.error, (ValueError, AuthorizationException)
+        ):
+            error = (
+                f'Failed to fetch {resource_type or "available"} '
+                f"resources from service connector {connector.name}/"
+                f"{connector.id}: {task_result.error}"
+            )
+            # Log an exception if debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.error(error, exc_info=task_result.error)
+            else:
+                logger.error(error)
+        elif task_result.error:
+            raise task_result.error
+        elif task_result.value is not None:
+            resource_list.append(task_result.value)
+
+    return resource_list
+
+
+def _list_connector_resources(
+    connector: ServiceConnectorResponse,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+) -> Optional[ServiceConnectorResourcesModel]:
+    """List the resources that a service connector can access.
+
+    For connectors that we can instantiate, i.e. those that have a connector
+    type available locally, we return complete information about the
+    resources that they have access to. For those that are not locally
+    available, we only return rudimentary information extracted from the
+    connector model without actively trying to discover the resources that
+    they have access to.
+
+    Args:
+        connector: The connector model.
+        resource_type: The type of resources to list.
+        resource_id: The ID of a particular resource instance to verify.
+
+    Returns:
+        The resources that the connector has access to or None if the
+        connector is not configured with the requested resource ID.
+    """
+    from zenml.service_connectors.service_connector_registry import (
+        service_connector_registry,
+    )
+
+    if service_connector_registry.is_registered(connector.type):
+        connector_instance = service_connector_registry.instantiate_connector(
+            model=connector
+        )
+        return connector_instance.verify(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            list_resources=True,
+        )
+
+    if resource_id and connector.resource_id != resource_id:
+        # If an explicit resource ID is required, the connector has to be
+        # configured with it.
+        return None
+
+    resources = ServiceConnectorResourcesModel.from_connector_model(
+        connector,
+        resource_type=resource_type,
+    )
+    for r in resources.resources:
+        if not r.resource_ids:
+            r.error = (
+                f"The service '{connector.type}' connector type is not "
+                "available."
+            )
+    return resources
@@ -16,16 +16,9 @@
 A service is a process or set of processes that outlive a pipeline run.
 """
 
-from zenml.services.container.container_service import (
-    ContainerService,
-    ContainerServiceConfig,
-    ContainerServiceStatus,
-)
-from zenml.services.container.container_service_endpoint import (
-    ContainerServiceEndpoint,
-    ContainerServiceEndpointConfig,
-    ContainerServiceEndpointStatus,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from zenml.services.local.local_service import (
     LocalDaemonService,
     LocalDaemonServiceConfig,
@@ -54,6 +47,54 @@ from zenml.services.service_monitor import (
 from zenml.services.service_status import ServiceState, ServiceStatus
 from zenml.services.service_type import ServiceType
 
+if TYPE_CHECKING:
+    from zenml.services.container.container_service import (
+        ContainerService,
+        ContainerServiceConfig,
+        ContainerServiceStatus,
+    )
+    from zenml.services.container.container_service_endpoint import (
+        ContainerServiceEndpoint,
+        ContainerServiceEndpointConfig,
+        ContainerServiceEndpointStatus,
+    )
+
+# The container services depend on the Docker client, which is slow to import
+# and only required when actually using container services.
+_LAZY_IMPORTS = {
+    "ContainerService": "zenml.services.container.container_service",
+    "ContainerServiceConfig": "zenml.services.container.container_service",
+    "ContainerServiceStatus": "zenml.services.container.container_service",
+    "ContainerServiceEndpoint": (
+        "zenml.services.container.container_service_endpoint"
+    ),
+    "ContainerServiceEndpointConfig": (
+        "zenml.services.container.container_service_endpoint"
+    ),
+    "ContainerServiceEndpointStatus": (
+        "zenml.services.container.container_service_endpoint"
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the container service classes on first access.
+
+    Args:
+        name: Name of the attribute.
+
+    Returns:
+        The attribute.
+
+    Raises:
+        AttributeError: If the module has no attribute with the given name.
+    """
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ServiceState",
@@ -16,6 +16,7 @@
 import json
 import time
 from abc import abstractmethod
+from datetime import datetime
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
@@ -49,6 +50,12 @@ if TYPE_CHECKING:
 
 ZENM_ENDPOINT_PREFIX = "zenml-"
 
+# Intervals between status checks while waiting for a service. The interval
+# starts small, so services that become ready quickly are detected quickly,
+# and grows so that slow services are not checked unnecessarily often.
+SERVICE_POLL_INITIAL_INTERVAL_SECONDS = 0.1
+SERVICE_POLL_MAX_INTERVAL_SECONDS = 2.0
+
 
 def update_service_status(
     pre_status: Optional[ServiceState] = None,
@@ -295,6 +302,8 @@ class BaseService(BaseTypedModel):
                 exc_info=True,
             )
             self.status.update_state(ServiceState.ERROR, str(e))
+        finally:
+            self.status.last_status_update = datetime.utcnow()
 
     def get_service_status_message(self) -> str:
         """Get a service status message.
@@ -314,7 +323,8 @@ class BaseService(BaseTypedModel):
 
         It does this until the service operational state matches the
         administrative state, the service enters a failed state, or the timeout
-        is reached.
+        is reached. The interval between two status checks starts small and
+        grows exponentially.
 
         Args:
             timeout: maximum time to wait for the service operational state
@@ -324,7 +334,8 @@ class BaseService(BaseTypedModel):
             True if the service operational state matches the administrative
             state, False otherwise.
         """
-        time_remaining = timeout
+        deadline = time.monotonic() + timeout
+        interval = SERVICE_POLL_INITIAL_INTERVAL_SECONDS
         while True:
             if self.admin_state == ServiceState.ACTIVE and self.is_running:
                 return True
@@ -332,10 +343,11 @@ class BaseService(BaseTypedModel):
                 return True
             if self.is_failed:
                 return False
+            time_remaining = deadline - time.monotonic()
             if time_remaining <= 0:
                 break
-            time.sleep(1)
-            time_remaining -= 1
+            time.sleep(min(interval, time_remaining))
+            interval = min(interval * 2, SERVICE_POLL_MAX_INTERVAL_SECONDS)
 
         if timeout > 0:
             logger.error(
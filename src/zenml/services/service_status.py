@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the ServiceStatus class."""
 
+from datetime import datetime
 from typing import Optional
 
 from zenml.logger import get_logger
@@ -47,11 +48,14 @@ class ServiceStatus(BaseTypedModel):
         state: the current operational state
         last_state: the operational state prior to the last status update
         last_error: the error encountered during the last status update
+        last_status_update: the UTC time at which the status was last
+            checked against the external service
     """
 
     state: ServiceState = ServiceState.INACTIVE
     last_state: ServiceState = ServiceState.INACTIVE
     last_error: str = ""
+    last_status_update: Optional[datetime] = None
 
     def update_state(
         self,
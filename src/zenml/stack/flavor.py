@@ -131,6 +131,18 @@ class Flavor:
         Returns:
             The loaded flavor.
         """
+        if (
+            flavor_model.integration
+            and flavor_model.integration != "built-in"
+            and not flavor_model.is_custom
+        ):
+            from zenml.integrations.registry import integration_registry
+
+            # Integrations are activated lazily when one of their flavors is
+            # used, so their materializers and service connectors are
+            # available without activating all integrations.
+            integration_registry.activate_integration(flavor_model.integration)
+
         flavor = source_utils.load(flavor_model.source)()
         return cast(Flavor, flavor)
 
@@ -645,10 +645,21 @@ class Stack:
 
             client = Client()
 
+            # Resolve all secrets referenced by exact name in one pass
+            try:
+                secrets = client.get_secrets_by_name(
+                    [secret_ref.name for secret_ref in required_secrets]
+                )
+            except NotImplementedError:
+                secrets = {}
+
             # Attempt to resolve secrets through the secrets store
             for secret_ref in required_secrets.copy():
                 try:
-                    secret = client.get_secret(secret_ref.name)
+                    secret = secrets.get(secret_ref.name)
+                    if secret is None:
+                        secret = client.get_secret(secret_ref.name)
+                        secrets[secret_ref.name] = secret
                     if (
                         secret_validation_level
                         == SecretValidationLevel.SECRET_AND_KEY_EXISTS
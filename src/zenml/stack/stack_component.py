@@ -18,7 +18,17 @@ from abc import ABC
 from collections.abc import Mapping, Sequence
 from datetime import datetime
 from inspect import isclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from pydantic import BaseModel, Extra, root_validator
@@ -511,8 +521,12 @@ class StackComponent:
                 compatible or not found.
         """
         from zenml.client import Client
+        from zenml.service_connectors.service_connector import (
+            service_connector_cache,
+        )
 
-        if self.connector is None:
+        connector_id = self.connector
+        if connector_id is None:
             return None
 
         if self._connector_instance is not None:
@@ -540,13 +554,37 @@ class StackComponent:
             # Otherwise, use the resource ID configured in the component
             resource_id = self.connector_resource_id
 
-        client = Client()
-        try:
-            self._connector_instance = client.get_service_connector_client(
-                name_id_or_prefix=self.connector,
-                resource_type=self.connector_requirements.resource_type,
+        resource_type = self.connector_requirements.resource_type
+
+        def get_connector_client() -> (
+            Tuple["ServiceConnector", Optional[datetime]]
+        ):
+            connector_client = Client().get_service_connector_client(
+                name_id_or_prefix=connector_id,
+                resource_type=resource_type,
                 resource_id=resource_id,
             )
+            return connector_client, connector_client.valid_until
+
+        try:
+            # Connector clients are shared between all stack components in
+            # the process that use the same connector and resource. The key
+            # includes the time of the last connector update, so changes
+            # made by other processes or through the server (e.g. rotated
+            # credentials) are picked up immediately.
+            connector_updated = (
+                Client()
+                .zen_store.get_service_connector(connector_id, hydrate=False)
+                .updated
+            )
+            (
+                self._connector_instance,
+                _,
+            ) = service_connector_cache.get_or_create(
+                connector_id=connector_id,
+                key=("client", connector_updated, resource_type, resource_id),
+                factory=get_connector_client,
+            )
         except KeyError:
             raise RuntimeError(
                 f"The connector with ID {self.connector} linked "
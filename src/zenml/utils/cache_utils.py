@@ -0,0 +1,117 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for in-memory caching."""
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe, bounded cache that evicts the least recently used items.
+
+    ```python
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # 1
+    cache.set("c", 3)  # evicts "b"
+    cache.get("b")  # None
+    ```
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of items to keep in the cache. A value
+                of 0 or less disables the cache.
+        """
+        self.maxsize = maxsize
+        self._items: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Gets an item from the cache.
+
+        Args:
+            key: The key of the item.
+
+        Returns:
+            The cached item or None if no item for the key is cached.
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Adds an item to the cache.
+
+        Args:
+            key: The key of the item.
+            value: The item to cache.
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Removes an item from the cache.
+
+        Args:
+            key: The key of the item.
+
+        Returns:
+            The removed item or None if no item for the key was cached.
+        """
+        with self._lock:
+            return self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all items from the cache."""
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key: K) -> bool:
+        """Checks whether an item for a key is cached.
+
+        Args:
+            key: The key of the item.
+
+        Returns:
+            Whether an item for the key is cached.
+        """
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        """The number of cached items.
+
+        Returns:
+            The number of cached items.
+        """
+        with self._lock:
+            return len(self._items)
@@ -13,9 +13,15 @@
 #  permissions and limitations under the License.
 """Utilities for code repositories."""
 
+import hashlib
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from typing import (
     Dict,
+    Iterator,
+    List,
     Optional,
 )
 
@@ -23,6 +29,10 @@ from zenml.code_repositories import (
     BaseCodeRepository,
     LocalRepositoryContext,
 )
+from zenml.constants import (
+    CODE_DOWNLOAD_CACHE_MAX_ENTRIES,
+    ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY,
+)
 from zenml.logger import get_logger
 from zenml.utils import source_utils
 from zenml.utils.pagination_utils import depaginate
@@ -121,3 +131,189 @@ def find_active_code_repository(
 
     _CODE_REPOSITORY_CACHE[path] = local_context
     return local_context
+
+
+def get_code_download_cache_directory() -> str:
+    """Gets the directory in which downloaded code is cached.
+
+    The directory can be configured using the
+    `ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY` environment variable. Pointing it to
+    a directory that is shared between all containers on a node (e.g. a
+    Kubernetes `hostPath` volume) allows the steps of a pipeline run on that
+    node to share a single download.
+
+    Returns:
+        The code download cache directory.
+    """
+    return os.getenv(ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY) or os.path.join(
+        tempfile.gettempdir(), "zenml-code-downloads"
+    )
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Context manager that holds an exclusive lock on a file.
+
+    The lock is held across processes. On platforms that don't support file
+    locking, no lock is acquired. The lock file may be removed while holding
+    the lock, processes waiting for it then lock the newly created file
+    instead.
+
+    Args:
+        path: Path of the lock file.
+
+    Yields:
+        Nothing.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    while True:
+        with open(path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    removed = (
+                        os.stat(path).st_ino
+                        != os.fstat(lock_file.fileno()).st_ino
+                    )
+                except FileNotFoundError:
+                    removed = True
+                if not removed:
+                    yield
+                    return
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _remove_lock_file(path: str) -> None:
+    """Removes a lock file if it exists.
+
+    Args:
+        path: Path of the lock file.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _evict_code_downloads(max_entries: int) -> None:
+    """Removes the least recently used code downloads from the cache.
+
+    Args:
+        max_entries: The maximum number of code downloads to keep.
+    """
+    cache_root = get_code_download_cache_directory()
+    entries: List[str] = []
+    lock_files: List[str] = []
+    for root, directories, files in os.walk(cache_root):
+        depth = os.path.relpath(root, cache_root).count(os.sep)
+        if root != cache_root and depth == 1:
+            # `<cache>/<code_repository_id>/<commit>/<sub_directory_hash>`
+            entries.extend(
+                os.path.join(root, directory)
+                for directory in directories
+                if not directory.startswith("tmp")
+            )
+            lock_files.extend(
+                os.path.join(root, file)
+                for file in files
+                if file.endswith(".lock")
+            )
+            directories.clear()
+
+    entries.sort(key=os.path.getmtime, reverse=True)
+    evicted_entries = entries[max_entries:]
+    for entry in evicted_entries:
+        with _file_lock(f"{entry}.lock"):
+            shutil.rmtree(entry, ignore_errors=True)
+            _remove_lock_file(f"{entry}.lock")
+        logger.debug("Removed cached code download `%s`.", entry)
+
+    # Lock files of failed downloads don't belong to any entry
+    for lock_file in set(lock_files) - {
+        f"{entry}.lock" for entry in evicted_entries
+    }:
+        entry = lock_file[: -len(".lock")]
+        if os.path.exists(entry):
+            continue
+        with _file_lock(lock_file):
+            if not os.path.exists(entry):
+                _remove_lock_file(lock_file)
+
+
+def download_code_from_repository(
+    repo: "BaseCodeRepository",
+    commit: str,
+    directory: str,
+    repo_sub_directory: Optional[str] = None,
+) -> None:
+    """Downloads files of a code repository commit using a local cache.
+
+    Downloads are cached per code repository, commit and subdirectory. If
+    multiple processes download the same files at the same time, only one of
+    them downloads the files while the others wait for the download to finish.
+    Only the `ZENML_CODE_DOWNLOAD_CACHE_MAX_ENTRIES` most recently used
+    downloads are kept in the cache, setting it to 0 disables the cache.
+
+    Args:
+        repo: The code repository from which to download the files.
+        commit: The commit to download.
+        directory: The directory to download the files to.
+        repo_sub_directory: The subdirectory in the repository to download
+            files from.
+    """
+    sub_directory_hash = hashlib.md5(  # nosec
+        (repo_sub_directory or "").encode()
+    ).hexdigest()
+    cache_directory = os.path.join(
+        get_code_download_cache_directory(), str(repo.id), commit
+    )
+    cache_path = os.path.join(cache_directory, sub_directory_hash)
+
+    cache_enabled = CODE_DOWNLOAD_CACHE_MAX_ENTRIES > 0
+    if cache_enabled:
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+        except OSError as e:
+            logger.debug("Unable to create code download cache: %s", e)
+            cache_enabled = False
+
+    if not cache_enabled:
+        repo.download_files(
+            commit=commit,
+            directory=directory,
+            repo_sub_directory=repo_sub_directory,
+        )
+        return
+
+    with _file_lock(f"{cache_path}.lock"):
+        if os.path.isdir(cache_path):
+            logger.info("Using cached code download.")
+            # Marks the download as recently used
+            os.utime(cache_path)
+        else:
+            temporary_path = tempfile.mkdtemp(dir=cache_directory)
+            try:
+                # Raises if any file failed to download, so only complete
+                # downloads end up in the cache
+                repo.download_files(
+                    commit=commit,
+                    directory=temporary_path,
+                    repo_sub_directory=repo_sub_directory,
+                )
+                os.rename(temporary_path, cache_path)
+            finally:
+                shutil.rmtree(temporary_path, ignore_errors=True)
+
+        # Copy while holding the lock so the download can't be evicted
+        shutil.copytree(cache_path, directory, dirs_exist_ok=True)
+
+    try:
+        _evict_code_downloads(max_entries=CODE_DOWNLOAD_CACHE_MAX_ENTRIES)
+    except OSError as e:
+        logger.debug("Failed to clean up the code download cache: %s", e)
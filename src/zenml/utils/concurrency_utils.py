@@ -0,0 +1,142 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for running tasks concurrently."""
+
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    cast,
+)
+
+
+class TaskResult(NamedTuple):
+    """The result of a task run by `run_concurrently`."""
+
+    value: Any = None
+    error: Optional[Exception] = None
+    timed_out: bool = False
+
+
+def run_concurrently(
+    tasks: Sequence[Callable[[], Any]],
+    max_workers: int,
+    timeout: Optional[float] = None,
+) -> List[TaskResult]:
+    """Run tasks concurrently in a pool of daemon threads.
+
+    Tasks that don't finish within the timeout are abandoned and reported as
+    timed out, their worker is replaced so that the remaining tasks are not
+    delayed. Python threads can't be cancelled, so abandoned tasks keep
+    running in the background until they finish. They don't prevent the
+    interpreter from exiting, and their threads exit when they finish instead
+    of picking up other tasks, so at most `max_workers` tasks that have not
+    timed out run at the same time. Workers are only replaced while at most
+    `max_workers` abandoned tasks are still running, which bounds the number
+    of threads to twice `max_workers`. Once that limit is exceeded and no
+    workers are left, the tasks that were not started yet are reported as
+    timed out as well.
+
+    Args:
+        tasks: The tasks to run.
+        max_workers: The maximum number of tasks to run at the same time.
+        timeout: Maximum number of seconds that a single task may run. The
+            time that a task spends waiting for a free worker is not counted.
+
+    Returns:
+        The results of the tasks, in the same order as the tasks.
+    """
+    max_workers = max(max_workers, 1)
+    results: List[Optional[TaskResult]] = [None] * len(tasks)
+    start_times: Dict[int, float] = {}
+    condition = threading.Condition()
+    # All of the following state is guarded by the condition
+    next_index = 0
+    active_workers = 0
+    abandoned_tasks = 0
+
+    def _worker() -> None:
+        nonlocal next_index, active_workers, abandoned_tasks
+        while True:
+            with condition:
+                if next_index >= len(tasks):
+                    active_workers -= 1
+                    condition.notify_all()
+                    return
+                index = next_index
+                next_index += 1
+                start_times[index] = time.monotonic()
+                # Wake up the main thread to enforce the timeout of the task
+                condition.notify_all()
+
+            try:
+                result = TaskResult(value=tasks[index]())
+            except Exception as e:
+                result = TaskResult(error=e)
+
+            with condition:
+                condition.notify_all()
+                if results[index] is None:
+                    results[index] = result
+                else:
+                    # The task timed out and this worker was already
+                    # replaced
+                    abandoned_tasks -= 1
+                    return
+
+    def _start_workers() -> None:
+        nonlocal active_workers
+        while (
+            active_workers < min(max_workers, len(tasks) - next_index)
+            and abandoned_tasks <= max_workers
+        ):
+            active_workers += 1
+            threading.Thread(target=_worker, daemon=True).start()
+
+    with condition:
+        while True:
+            _start_workers()
+            if active_workers == 0 and next_index < len(tasks):
+                # All workers are blocked by abandoned tasks
+                for index in range(next_index, len(tasks)):
+                    results[index] = TaskResult(timed_out=True)
+                next_index = len(tasks)
+
+            wait_time: Optional[float] = None
+            timed_out = False
+            if timeout is not None:
+                now = time.monotonic()
+                for index, start_time in start_times.items():
+                    if results[index] is not None:
+                        continue
+                    remaining = start_time + timeout - now
+                    if remaining <= 0:
+                        results[index] = TaskResult(timed_out=True)
+                        active_workers -= 1
+                        abandoned_tasks += 1
+                        timed_out = True
+                    elif wait_time is None or remaining < wait_time:
+                        wait_time = remaining
+            if all(result is not None for result in results):
+                break
+            if not timed_out:
+                condition.wait(wait_time)
+
+    return cast(List[TaskResult], results)
@@ -13,8 +13,25 @@
 #  permissions and limitations under the License.
 """Util functions for integration."""
 
+import atexit
+import hashlib
+import json
+import os
 import re
-from typing import Optional, Tuple
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from zenml.constants import (
+    ENV_ZENML_DISABLE_INTEGRATION_INSTALLATION_CACHE,
+    handle_bool_env_var,
+)
+from zenml.logger import get_logger
+from zenml.utils.io_utils import get_global_config_directory
+
+logger = get_logger(__name__)
+
+INTEGRATION_INSTALLATION_CACHE_FILENAME = "integration_installation_cache.json"
 
 
 def parse_requirement(requirement: str) -> Tuple[Optional[str], Optional[str]]:
@@ -32,3 +49,216 @@ def parse_requirement(requirement: str) -> Tuple[Optional[str], Optional[str]]:
         name, extras = match.groups()
         return (None, None) if " " in requirement else (name, extras)
     return None, None
+
+
+def get_site_packages_fingerprint() -> str:
+    """Computes a fingerprint of the installed packages of the environment.
+
+    Installing, upgrading or removing a package adds or removes a metadata
+    directory in the site-packages directory it is installed in, which
+    changes the modification time of that directory. Hashing the
+    modification times of all site-packages directories on the Python path is
+    therefore a cheap way to detect changes to the installed packages without
+    reading the metadata of any package.
+
+    Returns:
+        The fingerprint.
+    """
+    hash_ = hashlib.md5()  # nosec
+    hash_.update(sys.version.encode())
+
+    for path in sorted(set(sys.path)):
+        if os.path.basename(os.path.normpath(path)) not in (
+            "site-packages",
+            "dist-packages",
+        ):
+            continue
+        try:
+            modification_time = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        hash_.update(f"{path}:{modification_time}".encode())
+
+    return hash_.hexdigest()
+
+
+class IntegrationInstallationCache:
+    """Persisted cache of integration installation check results.
+
+    The results are stored in the global config directory, separately for
+    each Python environment, and are discarded as soon as the packages
+    installed in the environment change.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            path: Path of the cache file. Defaults to a file in the global
+                config directory.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._save_registered = False
+
+    @property
+    def path(self) -> str:
+        """Path of the cache file.
+
+        Returns:
+            Path of the cache file.
+        """
+        return self._path or os.path.join(
+            get_global_config_directory(),
+            INTEGRATION_INSTALLATION_CACHE_FILENAME,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            Whether the cache is enabled.
+        """
+        return not handle_bool_env_var(
+            ENV_ZENML_DISABLE_INTEGRATION_INSTALLATION_CACHE, False
+        )
+
+    @staticmethod
+    def _environment_key() -> str:
+        """Key of the current Python environment in the cache file.
+
+        Returns:
+            The environment key.
+        """
+        return sys.prefix
+
+    def _read_file(self) -> Dict[str, Any]:
+        """Reads the cache file.
+
+        Returns:
+            The content of the cache file, keyed by environment.
+        """
+        try:
+            with open(self.path, "r") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return content if isinstance(content, dict) else {}
+
+    def _load(self) -> Dict[str, Any]:
+        """Loads the entries of the current environment.
+
+        Returns:
+            The cache entries of the current environment.
+        """
+        if self._entries is None:
+            self._fingerprint = get_site_packages_fingerprint()
+            environment = self._read_file().get(self._environment_key(), {})
+            if (
+                isinstance(environment, dict)
+                and environment.get("fingerprint") == self._fingerprint
+                and isinstance(environment.get("integrations"), dict)
+            ):
+                self._entries = environment["integrations"]
+            else:
+                self._entries = {}
+        return self._entries
+
+    def get(self, name: str, requirements: List[str]) -> Optional[bool]:
+        """Gets the cached installation status of an integration.
+
+        Args:
+            name: Name of the integration.
+            requirements: The requirements of the integration.
+
+        Returns:
+            Whether the integration is installed, or None if the installation
+            status is not cached.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._load().get(name)
+
+        if (
+            isinstance(entry, dict)
+            and entry.get("requirements") == list(requirements)
+            and isinstance(entry.get("installed"), bool)
+        ):
+            return bool(entry["installed"])
+        return None
+
+    def set(self, name: str, requirements: List[str], installed: bool) -> None:
+        """Caches the installation status of an integration.
+
+        The cache file is written when the process exits.
+
+        Args:
+            name: Name of the integration.
+            requirements: The requirements of the integration.
+            installed: Whether the integration is installed.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._load()[name] = {
+                "requirements": list(requirements),
+                "installed": installed,
+            }
+            self._dirty = True
+            if not self._save_registered:
+                atexit.register(self.save)
+                self._save_registered = True
+
+    def clear(self) -> None:
+        """Clears the in-memory cache entries."""
+        with self._lock:
+            self._entries = None
+            self._fingerprint = None
+            self._dirty = False
+
+    def save(self) -> None:
+        """Writes the cache entries of the current environment to disk.
+
+        If the installed packages changed since the entries were loaded, some
+        of them might be outdated and nothing is written.
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            self._dirty = False
+
+            if get_site_packages_fingerprint() != self._fingerprint:
+                logger.debug(
+                    "Installed packages changed, not persisting integration "
+                    "installation cache."
+                )
+                return
+
+            content = self._read_file()
+            content[self._environment_key()] = {
+                "fingerprint": self._fingerprint,
+                "integrations": self._entries,
+            }
+
+            path = self.path
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(temporary_path, "w") as f:
+                    json.dump(content, f)
+                os.replace(temporary_path, path)
+            except OSError as e:
+                logger.debug(
+                    "Failed to write integration installation cache: %s", e
+                )
+
+
+installation_cache = IntegrationInstallationCache()
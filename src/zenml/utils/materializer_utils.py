@@ -13,11 +13,21 @@
 #  permissions and limitations under the License.
 """Util functions for materializers."""
 
-from typing import TYPE_CHECKING, Any, Optional, Sequence, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple, Type
 
 if TYPE_CHECKING:
     from zenml.materializers.base_materializer import BaseMaterializer
 
+_SELECTION_CACHE_MAX_ENTRIES = 1024
+
+# The selection only depends on class attributes of the data type and
+# materializer classes, so the results (including data types for which no
+# materializer was found) are memoized.
+_selection_cache: Dict[
+    Tuple[Type[Any], Tuple[Type["BaseMaterializer"], ...]],
+    Optional[Type["BaseMaterializer"]],
+] = {}
+
 
 def select_materializer(
     data_type: Type[Any],
@@ -35,6 +45,35 @@ def select_materializer(
     Returns:
         The first materializer that can handle the given data type.
     """
+    cache_key = (data_type, tuple(materializer_classes))
+    try:
+        materializer_class = _selection_cache[cache_key]
+    except KeyError:
+        materializer_class = _select_materializer(*cache_key)
+        if len(_selection_cache) >= _SELECTION_CACHE_MAX_ENTRIES:
+            _selection_cache.clear()
+        _selection_cache[cache_key] = materializer_class
+
+    if materializer_class:
+        return materializer_class
+
+    raise RuntimeError(f"No materializer found for type {data_type}.")
+
+
+def _select_materializer(
+    data_type: Type[Any],
+    materializer_classes: Tuple[Type["BaseMaterializer"], ...],
+) -> Optional[Type["BaseMaterializer"]]:
+    """Select a materializer for a given data type.
+
+    Args:
+        data_type: The data type for which to select the materializer.
+        materializer_classes: Available materializer classes.
+
+    Returns:
+        The first materializer that can handle the given data type or None if
+        no materializer can handle it.
+    """
     fallback: Optional[Type["BaseMaterializer"]] = None
 
     for class_ in data_type.__mro__:
@@ -44,7 +83,4 @@ def select_materializer(
             elif not fallback and materializer_class.can_handle_type(class_):
                 fallback = materializer_class
 
-    if fallback:
-        return fallback
-
-    raise RuntimeError(f"No materializer found for type {data_type}.")
+    return fallback
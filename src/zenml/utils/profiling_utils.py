@@ -0,0 +1,617 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for profiling the resource usage of step executions.
+
+If the `ZENML_STEP_PROFILING` environment variable is set, the step runner
+samples the resource usage of its process in a background thread while a step
+is executing and stores it as metadata of the step run. Once the pipeline run
+is finished, the resource usage of all its steps is aggregated and stored as
+metadata of the pipeline run.
+
+All values describe the process executing the step. This includes other
+threads of the process and, for orchestrators that execute multiple steps in
+the same process, memory that was already allocated before the step started.
+Memory and disk I/O are read from `/proc` and the `resource` module, so some
+values are not available on all platforms. Artifact store I/O is counted for
+file objects opened with the `open` method of an artifact store, which remote
+artifact stores also use for files opened with `fileio`.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from zenml.constants import (
+    ENV_ZENML_STEP_PROFILING,
+    STEP_PROFILING_INTERVAL_MILLISECONDS,
+    handle_bool_env_var,
+)
+from zenml.logger import get_logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+logger = get_logger(__name__)
+
+RESOURCE_USAGE_METADATA_KEY = "resource_usage"
+
+# Values that are summed up or maximized when aggregating the resource usage
+# of multiple steps
+_SUMMED_VALUES = [
+    "duration_seconds",
+    "cpu_seconds",
+    "artifact_store_bytes_read",
+    "artifact_store_bytes_written",
+    "disk_bytes_read",
+    "disk_bytes_written",
+]
+_MAXIMIZED_VALUES = ["peak_memory_bytes", "peak_cpu_utilization"]
+
+
+class _ByteCounter:
+    """Counts the bytes transferred through artifact store file objects."""
+
+    def __init__(self) -> None:
+        """Initializes the counter."""
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.active_profilers = 0
+        self.lock = threading.Lock()
+
+    def add(self, read: int = 0, written: int = 0) -> None:
+        """Adds transferred bytes.
+
+        Args:
+            read: The number of bytes read.
+            written: The number of bytes written.
+        """
+        with self.lock:
+            self.bytes_read += read
+            self.bytes_written += written
+
+    def get(self) -> Tuple[int, int]:
+        """Gets the number of bytes read and written so far.
+
+        Returns:
+            The number of bytes read and written.
+        """
+        with self.lock:
+            return self.bytes_read, self.bytes_written
+
+
+_artifact_store_io = _ByteCounter()
+
+
+def _get_size(data: Any) -> int:
+    """Gets the size of data read from or written to a file.
+
+    Args:
+        data: The data.
+
+    Returns:
+        The size in bytes, or 0 if the size is unknown.
+    """
+    if isinstance(data, str):
+        return len(data.encode("utf-8", errors="replace"))
+    if isinstance(data, memoryview):
+        return data.nbytes
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return 0
+
+
+class _CountingFile:
+    """File object wrapper that counts the bytes read and written."""
+
+    def __init__(self, file: Any) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            file: The wrapped file object.
+        """
+        self._file = file
+
+    def __getattr__(self, name: str) -> Any:
+        """Forwards attribute access to the wrapped file object.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            The attribute of the wrapped file object.
+        """
+        return getattr(self._file, name)
+
+    def __enter__(self) -> "_CountingFile":
+        """Enters the context of the wrapped file object.
+
+        Returns:
+            The wrapper.
+        """
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> Any:
+        """Exits the context of the wrapped file object.
+
+        Args:
+            *args: The exception information.
+
+        Returns:
+            The return value of the wrapped file object.
+        """
+        return self._file.__exit__(*args)
+
+    def __iter__(self) -> "_CountingFile":
+        """Iterates over the lines of the file.
+
+        Returns:
+            The wrapper.
+        """
+        return self
+
+    def __next__(self) -> Any:
+        """Reads the next line.
+
+        Returns:
+            The next line.
+        """
+        line = next(self._file)
+        _artifact_store_io.add(read=_get_size(line))
+        return line
+
+    def read(self, *args: Any, **kwargs: Any) -> Any:
+        """Reads from the file.
+
+        Args:
+            *args: Positional arguments of the wrapped method.
+            **kwargs: Keyword arguments of the wrapped method.
+
+        Returns:
+            The data that was read.
+        """
+        data = self._file.read(*args, **kwargs)
+        _artifact_store_io.add(read=_get_size(data))
+        return data
+
+    def readline(self, *args: Any, **kwargs: Any) -> Any:
+        """Reads a line from the file.
+
+        Args:
+            *args: Positional arguments of the wrapped method.
+            **kwargs: Keyword arguments of the wrapped method.
+
+        Returns:
+            The line that was read.
+        """
+        line = self._file.readline(*args, **kwargs)
+        _artifact_store_io.add(read=_get_size(line))
+        return line
+
+    def readlines(self, *args: Any, **kwargs: Any) -> Any:
+        """Reads all lines from the file.
+
+        Args:
+            *args: Positional arguments of the wrapped method.
+            **kwargs: Keyword arguments of the wrapped method.
+
+        Returns:
+            The lines that were read.
+        """
+        lines = self._file.readlines(*args, **kwargs)
+        _artifact_store_io.add(read=sum(_get_size(line) for line in lines))
+        return lines
+
+    def readinto(self, buffer: Any) -> Any:
+        """Reads from the file into a buffer.
+
+        Args:
+            buffer: The buffer to read into.
+
+        Returns:
+            The number of bytes read.
+        """
+        size = self._file.readinto(buffer)
+        _artifact_store_io.add(read=size or 0)
+        return size
+
+    def write(self, data: Any) -> Any:
+        """Writes to the file.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The return value of the wrapped method.
+        """
+        result = self._file.write(data)
+        _artifact_store_io.add(written=_get_size(data))
+        return result
+
+    def writelines(self, lines: Any) -> None:
+        """Writes lines to the file.
+
+        Args:
+            lines: The lines to write.
+        """
+        lines = list(lines)
+        self._file.writelines(lines)
+        _artifact_store_io.add(written=sum(_get_size(line) for line in lines))
+
+
+class count_artifact_store_io:
+    """Counts the bytes transferred through file objects of an artifact store.
+
+    The bytes are only counted while a step is profiled, otherwise the file
+    objects are returned unchanged. This is a class instead of a closure so
+    that artifact stores with a wrapped `open` method can still be pickled.
+    """
+
+    def __init__(self, open_function: Callable[..., Any]) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            open_function: The `open` method of the artifact store.
+        """
+        self.open_function = open_function
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Opens a file and counts the bytes transferred through it.
+
+        Args:
+            *args: Positional arguments of the wrapped method.
+            **kwargs: Keyword arguments of the wrapped method.
+
+        Returns:
+            The opened file object.
+        """
+        file = self.open_function(*args, **kwargs)
+        if _artifact_store_io.active_profilers:
+            return _CountingFile(file)
+        return file
+
+
+def _get_cpu_time() -> float:
+    """Gets the CPU time used by the process.
+
+    Returns:
+        The user and system CPU time of the process and its terminated child
+        processes in seconds.
+    """
+    if resource is None:
+        return time.process_time()
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (
+        usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+    )
+
+
+def _get_memory_usage() -> Optional[int]:
+    """Gets the resident set size of the process.
+
+    Returns:
+        The resident set size in bytes, or None if it is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _get_peak_memory_usage() -> Optional[int]:
+    """Gets the peak resident set size of the process since it started.
+
+    Returns:
+        The peak resident set size in bytes, or None if it is not available.
+    """
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak is reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _get_disk_io() -> Optional[Tuple[int, int]]:
+    """Gets the bytes the process read from and wrote to storage devices.
+
+    Returns:
+        The number of bytes read and written, or None if they are not
+        available.
+    """
+    try:
+        with open("/proc/self/io") as f:
+            values = dict(
+                line.split(":", 1) for line in f.read().splitlines() if line
+            )
+        return int(values["read_bytes"]), int(values["write_bytes"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class _Sample(NamedTuple):
+    """Resource usage of the process at a point in time."""
+
+    time: float
+    cpu_time: float
+
+
+class StepProfiler:
+    """Samples the resource usage of the process executing a step."""
+
+    def __init__(
+        self,
+        step_name: str,
+        step_run_id: Optional[UUID] = None,
+        interval: float = STEP_PROFILING_INTERVAL_MILLISECONDS / 1000,
+    ) -> None:
+        """Initializes the profiler.
+
+        Args:
+            step_name: Name of the profiled step.
+            step_run_id: ID of the step run for which to store the resource
+                usage as metadata.
+            interval: The interval at which to sample the resource usage in
+                seconds.
+        """
+        self.step_name = step_name
+        self.step_run_id = step_run_id
+        self.interval = max(interval, 0.01)
+
+        self.duration = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory: Optional[int] = None
+        self.peak_cpu_utilization = 0.0
+        self.artifact_store_io = (0, 0)
+        self.disk_io: Optional[Tuple[int, int]] = None
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._first_sample: Optional[_Sample] = None
+        self._last_sample: Optional[_Sample] = None
+        self._start_peak_memory: Optional[int] = None
+        self._start_artifact_store_io = (0, 0)
+        self._start_disk_io: Optional[Tuple[int, int]] = None
+
+    def _sample(self) -> None:
+        """Samples the current resource usage of the process."""
+        sample = _Sample(time=time.perf_counter(), cpu_time=_get_cpu_time())
+        memory = _get_memory_usage()
+
+        with self._lock:
+            if memory is not None:
+                self.peak_memory = max(self.peak_memory or 0, memory)
+
+            last_sample = self._last_sample
+            if last_sample:
+                elapsed = sample.time - last_sample.time
+                # Very short intervals, e.g. between the last periodic sample
+                # and the final one, would only yield noise
+                if elapsed >= self.interval / 2:
+                    self.peak_cpu_utilization = max(
+                        self.peak_cpu_utilization,
+                        (sample.cpu_time - last_sample.cpu_time) / elapsed,
+                    )
+            else:
+                self._first_sample = sample
+            self._last_sample = sample
+
+    def _run(self) -> None:
+        """Samples the resource usage until the profiler is stopped."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as e:
+                logger.debug("Failed to sample the resource usage: %s", e)
+                return
+
+    def start(self) -> None:
+        """Starts sampling the resource usage in a background thread."""
+        with _artifact_store_io.lock:
+            _artifact_store_io.active_profilers += 1
+        self._start_artifact_store_io = _artifact_store_io.get()
+        self._start_peak_memory = _get_peak_memory_usage()
+        self._start_disk_io = _get_disk_io()
+        self._sample()
+
+        self._thread = threading.Thread(
+            target=self._run, name="zenml-step-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and computes the resource usage of the step."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        self._sample()
+
+        with _artifact_store_io.lock:
+            _artifact_store_io.active_profilers -= 1
+        read, written = _artifact_store_io.get()
+        self.artifact_store_io = (
+            read - self._start_artifact_store_io[0],
+            written - self._start_artifact_store_io[1],
+        )
+
+        # If the peak of the process increased, it was reached during the
+        # step, which is more accurate than the periodic samples
+        peak_memory = _get_peak_memory_usage()
+        if (
+            peak_memory is not None
+            and self._start_peak_memory is not None
+            and peak_memory > self._start_peak_memory
+        ):
+            self.peak_memory = max(self.peak_memory or 0, peak_memory)
+
+        disk_io = _get_disk_io()
+        if disk_io and self._start_disk_io:
+            self.disk_io = (
+                disk_io[0] - self._start_disk_io[0],
+                disk_io[1] - self._start_disk_io[1],
+            )
+
+        assert self._first_sample and self._last_sample
+        self.duration = self._last_sample.time - self._first_sample.time
+        self.cpu_time = (
+            self._last_sample.cpu_time - self._first_sample.cpu_time
+        )
+
+    def get_metadata(self) -> Dict[str, "MetadataType"]:
+        """Gets the resource usage as step run metadata.
+
+        CPU utilization is the CPU time divided by the elapsed time, so a
+        value of 1.0 corresponds to one fully used CPU core.
+
+        Returns:
+            The step run metadata.
+        """
+        usage: Dict[str, Any] = {
+            "duration_seconds": round(self.duration, 3),
+            "cpu_seconds": round(self.cpu_time, 3),
+            "cpu_utilization": round(
+                self.cpu_time / self.duration if self.duration else 0.0, 3
+            ),
+            "peak_cpu_utilization": round(self.peak_cpu_utilization, 3),
+            "artifact_store_bytes_read": self.artifact_store_io[0],
+            "artifact_store_bytes_written": self.artifact_store_io[1],
+        }
+        if self.peak_memory is not None:
+            usage["peak_memory_bytes"] = self.peak_memory
+        if self.disk_io is not None:
+            usage["disk_bytes_read"] = self.disk_io[0]
+            usage["disk_bytes_written"] = self.disk_io[1]
+        return {RESOURCE_USAGE_METADATA_KEY: usage}
+
+
+def aggregate_resource_usage(
+    usages: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Aggregates the resource usage of multiple steps.
+
+    Durations, CPU times and transferred bytes are summed up while peak values
+    are maximized. The aggregated CPU utilization is the total CPU time
+    divided by the total duration of all steps.
+
+    Args:
+        usages: The resource usage of each step as stored in the step run
+            metadata.
+
+    Returns:
+        The aggregated resource usage.
+    """
+    aggregate: Dict[str, Any] = {"steps": len(usages)}
+    for usage in usages:
+        for key, value in usage.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            if key in _SUMMED_VALUES:
+                aggregate[key] = aggregate.get(key, 0) + value
+            elif key in _MAXIMIZED_VALUES:
+                aggregate[key] = max(aggregate.get(key, value), value)
+
+    for key, value in aggregate.items():
+        if isinstance(value, float):
+            aggregate[key] = round(value, 3)
+    if aggregate.get("duration_seconds"):
+        aggregate["cpu_utilization"] = round(
+            aggregate.get("cpu_seconds", 0) / aggregate["duration_seconds"], 3
+        )
+    return aggregate
+
+
+def step_profiling_enabled() -> bool:
+    """Checks whether the resource usage of steps is profiled.
+
+    Returns:
+        Whether step profiling is enabled.
+    """
+    return handle_bool_env_var(ENV_ZENML_STEP_PROFILING, False)
+
+
+@contextmanager
+def profile_step(
+    step_name: str, step_run_id: UUID
+) -> Iterator[Optional[StepProfiler]]:
+    """Profiles the resource usage of a step execution.
+
+    If step profiling is enabled, the resource usage is stored as step run
+    metadata once the step execution finishes.
+
+    Args:
+        step_name: Name of the step.
+        step_run_id: ID of the step run.
+
+    Yields:
+        The step profiler, or None if step profiling is disabled.
+    """
+    if not step_profiling_enabled():
+        yield None
+        return
+
+    profiler = StepProfiler(step_name=step_name, step_run_id=step_run_id)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _publish_step_profile(profiler)
+
+
+def _publish_step_profile(profiler: StepProfiler) -> None:
+    """Stores the resource usage of a step as step run metadata.
+
+    Args:
+        profiler: The stopped step profiler.
+    """
+    from zenml.enums import MetadataResourceTypes
+    from zenml.utils import publish_queue
+
+    assert profiler.step_run_id
+    try:
+        publish_queue.publish_run_metadata(
+            metadata=profiler.get_metadata(),
+            resource_id=profiler.step_run_id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to store the resource usage of step `%s`: %s",
+            profiler.step_name,
+            e,
+        )
@@ -0,0 +1,422 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Write-behind queue for non-critical writes of step runs.
+
+Writes like run metadata or model links don't influence the execution of a
+step, but each of them requires a round trip to the ZenML server. If
+enabled via the `ZENML_WRITE_BEHIND_PUBLISHING` environment variable, these
+writes are queued and sent in batches by a background thread instead. The
+queue is flushed before a step run is published and when the process exits,
+so all writes are stored once a step run is marked as finished.
+
+Writes are tracked per producer thread: flushing only waits for the writes
+queued by the calling thread and only raises their errors, so steps that run
+concurrently in the same process don't wait for or fail because of each
+other's writes.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import defaultdict
+from functools import partial
+from queue import Empty, Queue
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+from zenml.constants import (
+    ENV_ZENML_WRITE_BEHIND_PUBLISHING,
+    handle_bool_env_var,
+)
+from zenml.enums import MetadataResourceTypes
+from zenml.logger import get_logger
+from zenml.utils.concurrency_utils import run_concurrently
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+logger = get_logger(__name__)
+
+
+class _Write(NamedTuple):
+    """A queued write."""
+
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    producer: int
+
+
+class _RunMetadataWrite(NamedTuple):
+    """Queued run metadata of a resource."""
+
+    resource_id: UUID
+    resource_type: MetadataResourceTypes
+    stack_component_id: Optional[UUID]
+    metadata: Dict[str, "MetadataType"]
+    producer: int
+
+
+_QueuedWrite = Union[_Write, _RunMetadataWrite]
+
+
+class PublishQueue:
+    """Queue which sends writes in batches from a background thread."""
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        batch_interval: float = 0.1,
+        max_workers: int = 8,
+    ) -> None:
+        """Initializes the queue.
+
+        Args:
+            batch_size: The maximum number of writes per batch.
+            batch_interval: The maximum number of seconds to wait for more
+                writes before sending a batch.
+            max_workers: The maximum number of writes of a batch that are
+                sent at the same time.
+        """
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._writes_done = threading.Condition(self._lock)
+        self._queue: "Queue[_QueuedWrite]" = Queue()
+        # Number of writes that are not done yet and errors of failed writes
+        # by the ID of the thread which queued them
+        self._pending: Dict[int, int] = defaultdict(int)
+        self._errors: Dict[int, List[Exception]] = defaultdict(list)
+        self._worker: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Queues a write.
+
+        Args:
+            fn: The function which performs the write.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        """
+        self._put(
+            _Write(
+                fn=fn,
+                args=args,
+                kwargs=kwargs,
+                producer=threading.get_ident(),
+            )
+        )
+
+    def submit_run_metadata(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        resource_id: UUID,
+        resource_type: MetadataResourceTypes,
+        stack_component_id: Optional[UUID] = None,
+    ) -> None:
+        """Queues run metadata.
+
+        Metadata of the same resource and stack component that is sent in
+        the same batch is merged into a single request.
+
+        Args:
+            metadata: The metadata to create as a dictionary of key-value
+                pairs.
+            resource_id: The ID of the resource for which the metadata was
+                produced.
+            resource_type: The type of the resource for which the metadata
+                was produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+        """
+        self._put(
+            _RunMetadataWrite(
+                resource_id=resource_id,
+                resource_type=resource_type,
+                stack_component_id=stack_component_id,
+                metadata=dict(metadata),
+                producer=threading.get_ident(),
+            )
+        )
+
+    def flush(
+        self, raise_on_error: bool = True, all_producers: bool = False
+    ) -> None:
+        """Waits until the queued writes were sent.
+
+        Args:
+            raise_on_error: Whether to raise the first error of the writes
+                that failed since the last flush. Otherwise, the errors are
+                only logged.
+            all_producers: Whether to wait for the writes of all threads.
+                Otherwise, only the writes queued by the calling thread are
+                waited for.
+
+        Raises:
+            Exception: The first error of the failed writes.
+        """
+        producer = threading.get_ident()
+        errors: List[Exception] = []
+        with self._writes_done:
+            if self._pid != os.getpid():
+                # Nothing was queued by this process
+                return
+
+            if all_producers:
+                self._writes_done.wait_for(lambda: not self._pending)
+                for producer_errors in self._errors.values():
+                    errors.extend(producer_errors)
+                self._errors.clear()
+            else:
+                self._writes_done.wait_for(
+                    lambda: producer not in self._pending
+                )
+                errors = self._errors.pop(producer, [])
+
+        if errors and raise_on_error:
+            raise errors[0]
+        for error in errors:
+            logger.warning(f"Failed to publish queued write: {error}")
+
+    def _put(self, write: _QueuedWrite) -> None:
+        """Queues a write and makes sure the worker is running.
+
+        Args:
+            write: The write to queue.
+        """
+        with self._lock:
+            # Threads don't survive a fork, so a forked process needs its
+            # own queue and worker
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = Queue()
+                self._pending.clear()
+                self._errors.clear()
+                self._worker = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    daemon=True,
+                    name="zenml-publish-queue",
+                )
+                self._worker.start()
+            self._pending[write.producer] += 1
+            self._queue.put(write)
+
+    def _run(self, queue: "Queue[_QueuedWrite]") -> None:
+        """Sends the queued writes in batches.
+
+        Args:
+            queue: The queue from which to send the writes.
+        """
+        while True:
+            batch = self._next_batch(queue)
+            try:
+                self._publish(batch)
+            except Exception as e:
+                self._add_error(
+                    e, producers={write.producer for write in batch}
+                )
+            finally:
+                with self._writes_done:
+                    for write in batch:
+                        self._pending[write.producer] -= 1
+                        if not self._pending[write.producer]:
+                            del self._pending[write.producer]
+                    self._writes_done.notify_all()
+
+    def _add_error(self, error: Exception, producers: Set[int]) -> None:
+        """Stores the error of a failed write.
+
+        Args:
+            error: The error.
+            producers: The IDs of the threads which queued the write.
+        """
+        with self._lock:
+            for producer in producers:
+                self._errors[producer].append(error)
+
+    def _next_batch(self, queue: "Queue[_QueuedWrite]") -> List[_QueuedWrite]:
+        """Collects the next batch of writes from the queue.
+
+        Blocks until at least one write was queued.
+
+        Args:
+            queue: The queue from which to collect the writes.
+
+        Returns:
+            The batch of writes.
+        """
+        batch = [queue.get()]
+        deadline = time.monotonic() + self.batch_interval
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(queue.get(timeout=remaining))
+            except Empty:
+                break
+
+        return batch
+
+    def _publish(self, batch: List[_QueuedWrite]) -> None:
+        """Sends a batch of writes.
+
+        Args:
+            batch: The writes to send.
+        """
+        from zenml.client import Client
+
+        client = Client()
+        tasks: List[Callable[[], Any]] = []
+        task_producers: List[Set[int]] = []
+        merged_metadata: Dict[
+            Tuple[UUID, MetadataResourceTypes, Optional[UUID]],
+            Tuple[Dict[str, "MetadataType"], Set[int]],
+        ] = {}
+
+        for write in batch:
+            if isinstance(write, _RunMetadataWrite):
+                key = (
+                    write.resource_id,
+                    write.resource_type,
+                    write.stack_component_id,
+                )
+                if key not in merged_metadata:
+                    merged_metadata[key] = ({}, set())
+                    metadata, producers = merged_metadata[key]
+                    tasks.append(
+                        partial(
+                            client.create_run_metadata,
+                            metadata=metadata,
+                            resource_id=write.resource_id,
+                            resource_type=write.resource_type,
+                            stack_component_id=write.stack_component_id,
+                        )
+                    )
+                    task_producers.append(producers)
+                metadata, producers = merged_metadata[key]
+                metadata.update(write.metadata)
+                producers.add(write.producer)
+            else:
+                tasks.append(partial(write.fn, *write.args, **write.kwargs))
+                task_producers.append({write.producer})
+
+        results = run_concurrently(tasks, max_workers=self.max_workers)
+        for result, producers in zip(results, task_producers):
+            if result.error:
+                self._add_error(result.error, producers=producers)
+
+
+_publish_queue: Optional[PublishQueue] = None
+_publish_queue_lock = threading.Lock()
+
+
+def get_publish_queue() -> Optional[PublishQueue]:
+    """Gets the publish queue if write-behind publishing is enabled.
+
+    Returns:
+        The publish queue or None if write-behind publishing is disabled.
+    """
+    global _publish_queue
+
+    if not handle_bool_env_var(ENV_ZENML_WRITE_BEHIND_PUBLISHING, False):
+        return None
+
+    with _publish_queue_lock:
+        if _publish_queue is None:
+            _publish_queue = PublishQueue()
+            # Make sure all writes are stored before the process exits
+            atexit.register(
+                _publish_queue.flush, raise_on_error=False, all_producers=True
+            )
+        return _publish_queue
+
+
+def publish(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Performs or queues a non-critical write.
+
+    Args:
+        fn: The function which performs the write.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+    """
+    if queue := get_publish_queue():
+        queue.submit(fn, *args, **kwargs)
+    else:
+        fn(*args, **kwargs)
+
+
+def publish_run_metadata(
+    metadata: Dict[str, "MetadataType"],
+    resource_id: UUID,
+    resource_type: MetadataResourceTypes,
+    stack_component_id: Optional[UUID] = None,
+) -> None:
+    """Creates or queues run metadata.
+
+    Args:
+        metadata: The metadata to create as a dictionary of key-value pairs.
+        resource_id: The ID of the resource for which the metadata was
+            produced.
+        resource_type: The type of the resource for which the metadata was
+            produced.
+        stack_component_id: The ID of the stack component that produced the
+            metadata.
+    """
+    if queue := get_publish_queue():
+        queue.submit_run_metadata(
+            metadata=metadata,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            stack_component_id=stack_component_id,
+        )
+    else:
+        from zenml.client import Client
+
+        Client().create_run_metadata(
+            metadata=metadata,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            stack_component_id=stack_component_id,
+        )
+
+
+def flush(raise_on_error: bool = True) -> None:
+    """Waits until all queued writes were sent.
+
+    Args:
+        raise_on_error: Whether to raise the first error of the writes that
+            failed since the last flush. Otherwise, the errors are only
+            logged.
+    """
+    if _publish_queue is not None:
+        _publish_queue.flush(raise_on_error=raise_on_error)
@@ -14,20 +14,28 @@
 """Utilities for loading/resolving objects."""
 
 import contextlib
+import functools
 import importlib
 import inspect
 import os
 import site
 import sys
-from distutils.sysconfig import get_python_lib
+import sysconfig
+import threading
+from collections import OrderedDict
 from pathlib import Path, PurePath
 from types import BuiltinFunctionType, FunctionType, ModuleType
 from typing import (
     Any,
     Callable,
+    Generic,
     Iterator,
+    List,
+    Mapping,
     Optional,
+    Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -38,6 +46,7 @@ from zenml.config.source import (
     Source,
     SourceType,
 )
+from zenml.constants import SOURCE_CACHE_MAX_ENTRIES
 from zenml.environment import Environment
 from zenml.logger import get_logger
 
@@ -59,6 +68,82 @@ BuiltinFunctionTypeSource = Source(
 
 _CUSTOM_SOURCE_ROOT: Optional[str] = None
 
+# Source types which don't depend on the source root or the state of a local
+# code repository and can therefore be cached per object
+_ROOT_INDEPENDENT_SOURCE_TYPES = {
+    SourceType.BUILTIN,
+    SourceType.INTERNAL,
+    SourceType.DISTRIBUTION_PACKAGE,
+}
+
+V = TypeVar("V")
+
+
+class _BoundedCache(Generic[V]):
+    """Thread-safe cache that evicts the least recently used entries."""
+
+    def __init__(self, max_entries: int = SOURCE_CACHE_MAX_ENTRIES) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached entries.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Any, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[V]:
+        """Gets a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value or None if no value is cached for the key.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: V) -> None:
+        """Caches a value.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries.
+
+        Returns:
+            The number of cached entries.
+        """
+        return len(self._entries)
+
+
+# Sources of objects whose source type doesn't depend on the source root
+_resolved_source_cache: _BoundedCache[Source] = _BoundedCache()
+# Source type, resolved module name and root dependency per module and
+# source root
+_resolved_module_cache: _BoundedCache[
+    Tuple[SourceType, str, bool]
+] = _BoundedCache()
+# Modules imported for a source type, import path and import root
+_loaded_module_cache: _BoundedCache[ModuleType] = _BoundedCache()
+
 
 def load(source: Union[Source, str]) -> Any:
     """Load a source or import path.
@@ -82,10 +167,43 @@ def load(source: Union[Source, str]) -> Any:
         return BuiltinFunctionType
 
     import_root = None
+    if source.type in {
+        SourceType.CODE_REPOSITORY,
+        SourceType.USER,
+        SourceType.UNKNOWN,
+    }:
+        import_root = get_source_root()
+
+    cache_key = (source.type, source.module, import_root)
+    module = _loaded_module_cache.get(cache_key)
+    # Make sure the module was not reloaded or removed in the meantime
+    if module is None or sys.modules.get(source.module) is not module:
+        module = _load_source_module(source=source, import_root=import_root)
+        _loaded_module_cache.set(cache_key, module)
+
+    if source.attribute:
+        obj = getattr(module, source.attribute)
+    else:
+        obj = module
+
+    return obj
+
+
+def _load_source_module(
+    source: Source, import_root: Optional[str]
+) -> ModuleType:
+    """Loads the module of a source.
+
+    Args:
+        source: The source for which to load the module.
+        import_root: The import root to use for loading the module.
+
+    Returns:
+        The loaded module.
+    """
     if source.type == SourceType.CODE_REPOSITORY:
         source = CodeRepositorySource.parse_obj(source)
         _warn_about_potential_source_loading_issues(source=source)
-        import_root = get_source_root()
     elif source.type == SourceType.DISTRIBUTION_PACKAGE:
         source = DistributionPackageSource.parse_obj(source)
         if source.version:
@@ -102,19 +220,10 @@ def load(source: Union[Source, str]) -> Any:
                     source.version,
                     source.import_path,
                 )
-    elif source.type in {SourceType.USER, SourceType.UNKNOWN}:
-        # Unknown source might also refer to a user file, include source
-        # root in python path just to be sure
-        import_root = get_source_root()
 
-    module = _load_module(module_name=source.module, import_root=import_root)
-
-    if source.attribute:
-        obj = getattr(module, source.attribute)
-    else:
-        obj = module
-
-    return obj
+    # Unknown sources might also refer to a user file, in which case the
+    # source root is included in the python path just to be sure
+    return _load_module(module_name=source.module, import_root=import_root)
 
 
 def resolve(
@@ -170,11 +279,15 @@ def resolve(
             "holds the object you want to resolve."
         )
 
-    module_name = module.__name__
-    if module_name == "__main__":
-        module_name = _resolve_module(module)
+    try:
+        cached_source = _resolved_source_cache.get(obj)
+    except TypeError:
+        # Unhashable object
+        cached_source = None
+    if cached_source is not None:
+        return cached_source.copy()
 
-    source_type = get_source_type(module=module)
+    source_type, module_name, root_dependent = _resolve_module_info(module)
 
     if source_type == SourceType.USER:
         from zenml.utils import code_repository_utils
@@ -184,8 +297,6 @@ def resolve(
         )
 
         if local_repo_context and not local_repo_context.has_local_changes:
-            module_name = _resolve_module(module)
-
             source_root = get_source_root()
             subdir = PurePath(source_root).relative_to(local_repo_context.root)
 
@@ -198,25 +309,76 @@ def resolve(
                 type=SourceType.CODE_REPOSITORY,
             )
 
-        module_name = _resolve_module(module)
-    elif source_type == SourceType.DISTRIBUTION_PACKAGE:
-        package_name = _get_package_for_module(module_name=module_name)
-        if package_name:
-            package_version = _get_package_version(package_name=package_name)
-            return DistributionPackageSource(
-                module=module_name,
-                attribute=attribute_name,
-                package_name=package_name,
-                version=package_version,
-                type=source_type,
-            )
-        else:
+    source: Source
+    if source_type == SourceType.DISTRIBUTION_PACKAGE and (
+        package_name := _get_package_for_module(module_name=module_name)
+    ):
+        package_version = _get_package_version(package_name=package_name)
+        source = DistributionPackageSource(
+            module=module_name,
+            attribute=attribute_name,
+            package_name=package_name,
+            version=package_version,
+            type=source_type,
+        )
+    else:
+        if source_type == SourceType.DISTRIBUTION_PACKAGE:
             # Fallback to an unknown source if we can't find the package
             source_type = SourceType.UNKNOWN
 
-    return Source(
-        module=module_name, attribute=attribute_name, type=source_type
+        source = Source(
+            module=module_name, attribute=attribute_name, type=source_type
+        )
+
+    if not root_dependent and source.type in _ROOT_INDEPENDENT_SOURCE_TYPES:
+        try:
+            _resolved_source_cache.set(obj, source.copy())
+        except TypeError:
+            # Unhashable object
+            pass
+
+    return source
+
+
+def _resolve_module_info(module: ModuleType) -> Tuple[SourceType, str, bool]:
+    """Resolves the source type and import path of a module.
+
+    The results are cached per module, and additionally per source root for
+    modules whose source type or import path depends on the source root.
+
+    Args:
+        module: The module to resolve.
+
+    Returns:
+        The source type and import path of the module, and whether they
+        depend on the source root.
+    """
+    module_info = _resolved_module_cache.get(module)
+    if module_info is not None:
+        if not module_info[2]:
+            return module_info
+
+        rooted_module_info = _resolved_module_cache.get(
+            (module, get_source_root())
+        )
+        if rooted_module_info is not None:
+            return rooted_module_info
+
+    source_type = get_source_type(module=module)
+    module_name = module.__name__
+    if module_name == "__main__" or source_type == SourceType.USER:
+        module_name = _resolve_module(module)
+
+    root_dependent = (
+        module.__name__ == "__main__"
+        or source_type not in _ROOT_INDEPENDENT_SOURCE_TYPES
     )
+    module_info = (source_type, module_name, root_dependent)
+    _resolved_module_cache.set(module, module_info)
+    if root_dependent:
+        _resolved_module_cache.set((module, get_source_root()), module_info)
+
+    return module_info
 
 
 def get_source_root() -> str:
@@ -279,6 +441,22 @@ def set_custom_source_root(source_root: Optional[str]) -> None:
     logger.debug("Setting custom source root: %s", source_root)
     global _CUSTOM_SOURCE_ROOT
     _CUSTOM_SOURCE_ROOT = source_root
+    clear_caches()
+
+
+def clear_caches() -> None:
+    """Clears all cached resolved sources, modules and package lookups.
+
+    This needs to be called if the source root changes or packages get
+    installed or removed while the process is running.
+    """
+    _resolved_source_cache.clear()
+    _resolved_module_cache.clear()
+    _loaded_module_cache.clear()
+    _get_site_packages_dirs.cache_clear()
+    _get_stdlib_dir.cache_clear()
+    _get_packages_distributions.cache_clear()
+    _get_package_version.cache_clear()
 
 
 def is_internal_module(module_name: str) -> bool:
@@ -316,9 +494,32 @@ def is_standard_lib_file(file_path: str) -> bool:
         True if the file belongs to the Python standard library, False
         otherwise.
     """
-    stdlib_root = get_python_lib(standard_lib=True)
+    return _get_stdlib_dir() in Path(file_path).resolve().parents
+
+
+@functools.lru_cache(maxsize=1)
+def _get_stdlib_dir() -> Path:
+    """Gets the resolved directory of the Python standard library.
+
+    Returns:
+        The resolved standard library directory.
+    """
+    stdlib_root = sysconfig.get_path("stdlib")
     logger.debug("Standard library root: %s", stdlib_root)
-    return Path(stdlib_root).resolve() in Path(file_path).resolve().parents
+    return Path(stdlib_root).resolve()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_site_packages_dirs() -> List[Path]:
+    """Gets the resolved site packages directories.
+
+    Returns:
+        The resolved site packages directories.
+    """
+    return [
+        Path(path).resolve()
+        for path in site.getsitepackages() + [site.getusersitepackages()]
+    ]
 
 
 def is_distribution_package_file(file_path: str, module_name: str) -> bool:
@@ -334,9 +535,9 @@ def is_distribution_package_file(file_path: str, module_name: str) -> bool:
     """
     absolute_file_path = Path(file_path).resolve()
 
-    for path in site.getsitepackages() + [site.getusersitepackages()]:
-        if Path(path).resolve() in absolute_file_path.parents:
-            return True
+    parents = set(absolute_file_path.parents)
+    if any(path in parents for path in _get_site_packages_dirs()):
+        return True
 
     # TODO: The previous check does not detect editable installs because
     # the site packages dir only contains a reference to the source files,
@@ -535,13 +736,8 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     Returns:
         The package name or None if no package was found.
     """
-    if sys.version_info < (3, 10):
-        from importlib_metadata import packages_distributions
-    else:
-        from importlib.metadata import packages_distributions
-
     top_level_module = module_name.split(".", maxsplit=1)[0]
-    package_names = packages_distributions().get(top_level_module, [])
+    package_names = _get_packages_distributions().get(top_level_module, [])
 
     if len(package_names) == 1:
         return package_names[0]
@@ -550,6 +746,25 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _get_packages_distributions() -> Mapping[str, List[str]]:
+    """Gets the distribution packages that provide each top-level module.
+
+    Computing this mapping requires reading the metadata of all installed
+    distributions, so it is only done once.
+
+    Returns:
+        Mapping of top-level module names to distribution package names.
+    """
+    if sys.version_info < (3, 10):
+        from importlib_metadata import packages_distributions
+    else:
+        from importlib.metadata import packages_distributions
+
+    return packages_distributions()
+
+
+@functools.lru_cache(maxsize=SOURCE_CACHE_MAX_ENTRIES)
 def _get_package_version(package_name: str) -> Optional[str]:
     """Gets the version of a package.
 
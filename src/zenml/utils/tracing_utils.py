@@ -0,0 +1,420 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for tracing the phases of a step execution.
+
+The step launcher and runner wrap each phase of a step execution in a span.
+Spans are forwarded to all registered tracing hooks and their durations are
+aggregated per phase in the active step trace:
+
+```python
+from zenml.utils import tracing_utils
+
+
+class PrintingHook(tracing_utils.BaseTracingHook):
+    def on_span_end(self, span: tracing_utils.Span) -> None:
+        print(span.name, span.duration)
+
+
+tracing_utils.register_tracing_hook(PrintingHook())
+```
+
+If the `ZENML_STEP_TRACING` environment variable is set, the time spent in
+each phase is stored as metadata of the step run. Setting the
+`ZENML_STEP_TRACING_OPENTELEMETRY` environment variable additionally exports
+all spans using the OpenTelemetry tracer provider configured in the process.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from zenml.constants import (
+    ENV_ZENML_STEP_TRACING,
+    ENV_ZENML_STEP_TRACING_OPENTELEMETRY,
+    handle_bool_env_var,
+)
+from zenml.enums import StepExecutionPhase
+from zenml.logger import get_logger
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+logger = get_logger(__name__)
+
+PHASE_DURATIONS_METADATA_KEY = "step_phase_durations"
+STEP_OPERATOR_PHASE_DURATIONS_METADATA_KEY = "step_operator_phase_durations"
+
+
+class Span(BaseModel):
+    """A timed section of a step execution."""
+
+    id: UUID = Field(default_factory=uuid4)
+    parent_id: Optional[UUID] = None
+    name: str
+    phase: StepExecutionPhase
+    attributes: Dict[str, Any] = {}
+    start_time: float
+    end_time: Optional[float] = None
+    failed: bool = False
+
+    _child_duration: float = PrivateAttr(default=0.0)
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds.
+
+        Returns:
+            The duration of the span or 0 if the span has not ended yet.
+        """
+        if self.end_time is None:
+            return 0.0
+        return self.end_time - self.start_time
+
+
+class BaseTracingHook:
+    """Base class for hooks that receive the spans of step executions.
+
+    Hooks are called synchronously in the thread executing the step, so they
+    should not perform any expensive operations.
+    """
+
+    def on_span_start(self, span: Span) -> None:
+        """Called when a span starts.
+
+        Args:
+            span: The span that started.
+        """
+
+    def on_span_end(self, span: Span) -> None:
+        """Called when a span ends.
+
+        Args:
+            span: The span that ended.
+        """
+
+
+class OpenTelemetryTracingHook(BaseTracingHook):
+    """Tracing hook that exports spans using OpenTelemetry.
+
+    The spans are created with the tracer provider that is configured
+    globally in the process, which also defines where they are exported to.
+    """
+
+    def __init__(self, tracer_name: str = "zenml") -> None:
+        """Initializes the hook.
+
+        Args:
+            tracer_name: Name of the OpenTelemetry tracer.
+        """
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer(tracer_name)
+        self._spans: Dict[UUID, Any] = {}
+        # The hook is shared by all steps and threads of the process
+        self._lock = threading.Lock()
+
+    def on_span_start(self, span: Span) -> None:
+        """Starts an OpenTelemetry span.
+
+        Args:
+            span: The span that started.
+        """
+        from opentelemetry import trace
+
+        with self._lock:
+            parent = (
+                self._spans.get(span.parent_id) if span.parent_id else None
+            )
+        context = trace.set_span_in_context(parent) if parent else None
+
+        attributes = {"zenml.phase": span.phase.value}
+        for key, value in span.attributes.items():
+            attributes[f"zenml.{key}"] = str(value)
+
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes=attributes,
+            start_time=int(span.start_time * 1e9),
+        )
+        with self._lock:
+            self._spans[span.id] = otel_span
+
+    def on_span_end(self, span: Span) -> None:
+        """Ends the OpenTelemetry span.
+
+        Args:
+            span: The span that ended.
+        """
+        from opentelemetry import trace
+
+        with self._lock:
+            otel_span = self._spans.pop(span.id, None)
+        if not otel_span:
+            return
+
+        if span.failed:
+            otel_span.set_status(trace.Status(trace.StatusCode.ERROR))
+        end_time = span.end_time or time.time()
+        otel_span.end(end_time=int(end_time * 1e9))
+
+
+class StepTrace:
+    """Aggregates the time spent in each phase of a step execution."""
+
+    def __init__(self, step_name: str, metadata_key: str) -> None:
+        """Initializes the trace.
+
+        Args:
+            step_name: Name of the traced step.
+            metadata_key: The key under which to store the phase durations
+                in the step run metadata.
+        """
+        self.step_name = step_name
+        self.metadata_key = metadata_key
+        self.step_run_id: Optional[UUID] = None
+        self.phase_durations: Dict[StepExecutionPhase, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, phase: StepExecutionPhase, duration: float) -> None:
+        """Records time spent in a phase.
+
+        Args:
+            phase: The phase.
+            duration: The time spent in the phase in seconds.
+        """
+        with self._lock:
+            self.phase_durations[phase] = (
+                self.phase_durations.get(phase, 0.0) + duration
+            )
+
+    def get_metadata(self) -> Dict[str, "MetadataType"]:
+        """Gets the phase durations as step run metadata.
+
+        Returns:
+            The step run metadata.
+        """
+        with self._lock:
+            durations = {
+                phase.value: round(duration, 6)
+                for phase, duration in self.phase_durations.items()
+            }
+        return {self.metadata_key: durations}
+
+
+_hooks: List[BaseTracingHook] = []
+_hooks_lock = threading.Lock()
+_default_hooks_registered = False
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "_current_span", default=None
+)
+_active_trace: ContextVar[Optional[StepTrace]] = ContextVar(
+    "_active_trace", default=None
+)
+
+
+def register_tracing_hook(hook: BaseTracingHook) -> None:
+    """Registers a hook that receives the spans of step executions.
+
+    Args:
+        hook: The hook to register.
+    """
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks.append(hook)
+
+
+def unregister_tracing_hook(hook: BaseTracingHook) -> None:
+    """Unregisters a tracing hook.
+
+    Args:
+        hook: The hook to unregister.
+    """
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def _register_default_hooks() -> None:
+    """Registers the hooks configured using environment variables."""
+    global _default_hooks_registered
+
+    if _default_hooks_registered:
+        return
+    _default_hooks_registered = True
+
+    if handle_bool_env_var(ENV_ZENML_STEP_TRACING_OPENTELEMETRY, False):
+        try:
+            register_tracing_hook(OpenTelemetryTracingHook())
+        except ImportError:
+            logger.warning(
+                "Unable to export step traces because the "
+                "`opentelemetry-api` package is not installed."
+            )
+
+
+def _call_hooks(method: str, span: Span) -> None:
+    """Calls a method of all registered tracing hooks.
+
+    Exceptions raised by the hooks are logged but never interrupt the step
+    execution.
+
+    Args:
+        method: The hook method to call.
+        span: The span to pass to the hooks.
+    """
+    with _hooks_lock:
+        hooks = list(_hooks)
+
+    for hook in hooks:
+        try:
+            getattr(hook, method)(span)
+        except Exception as e:
+            logger.debug("Tracing hook %s failed: %s", hook, e)
+
+
+def get_active_trace() -> Optional[StepTrace]:
+    """Gets the trace of the step that is currently executing.
+
+    Returns:
+        The active step trace, if any.
+    """
+    return _active_trace.get()
+
+
+@contextmanager
+def span(
+    phase: StepExecutionPhase, name: Optional[str] = None, **attributes: Any
+) -> Iterator[None]:
+    """Traces a section of a step execution.
+
+    The time spent in nested spans is not counted towards the phase of the
+    outer span, so the phase durations of a trace add up to its total
+    duration.
+
+    Args:
+        phase: The phase to which the section belongs.
+        name: Name of the span. Defaults to the phase name.
+        **attributes: Additional attributes of the span.
+
+    Yields:
+        Nothing.
+    """
+    trace = _active_trace.get()
+    if trace is None and not _hooks:
+        yield
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        name=name or phase.value,
+        phase=phase,
+        parent_id=parent.id if parent else None,
+        attributes=attributes,
+        start_time=time.time(),
+    )
+    _call_hooks("on_span_start", current)
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        current.failed = True
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _current_span.reset(token)
+        current.end_time = current.start_time + duration
+        if parent:
+            parent._child_duration += duration
+        if trace:
+            trace.record(phase, duration - current._child_duration)
+        _call_hooks("on_span_end", current)
+
+
+@contextmanager
+def trace_step(
+    step_name: str, metadata_key: str = PHASE_DURATIONS_METADATA_KEY
+) -> Iterator[Optional[StepTrace]]:
+    """Traces the execution of a step.
+
+    If step tracing is enabled and the `step_run_id` of the trace was set,
+    the phase durations are stored as step run metadata once the step
+    execution finishes.
+
+    Args:
+        step_name: Name of the step.
+        metadata_key: The key under which to store the phase durations in the
+            step run metadata.
+
+    Yields:
+        The step trace, or None if step tracing is disabled and no tracing
+        hooks are registered or if a step trace is already active in which
+        case the outer trace records all spans.
+    """
+    if _active_trace.get() is not None:
+        yield None
+        return
+
+    _register_default_hooks()
+    if not _hooks and not step_tracing_enabled():
+        yield None
+        return
+
+    trace = StepTrace(step_name=step_name, metadata_key=metadata_key)
+    token = _active_trace.set(trace)
+    try:
+        with span(StepExecutionPhase.OTHER, name="step", step_name=step_name):
+            yield trace
+    finally:
+        _active_trace.reset(token)
+        if trace.step_run_id and step_tracing_enabled():
+            _publish_step_trace(trace)
+
+
+def step_tracing_enabled() -> bool:
+    """Checks whether phase durations are stored as step run metadata.
+
+    Returns:
+        Whether step tracing is enabled.
+    """
+    return handle_bool_env_var(ENV_ZENML_STEP_TRACING, False)
+
+
+def _publish_step_trace(trace: StepTrace) -> None:
+    """Stores the phase durations of a step trace as step run metadata.
+
+    Args:
+        trace: The step trace.
+    """
+    from zenml.client import Client
+    from zenml.enums import MetadataResourceTypes
+
+    assert trace.step_run_id
+    try:
+        Client().create_run_metadata(
+            metadata=trace.get_metadata(),
+            resource_id=trace.step_run_id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to store the trace of step `%s`: %s", trace.step_name, e
+        )
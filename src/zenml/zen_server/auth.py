@@ -53,6 +53,7 @@ from zenml.models import (
     UserUpdate,
 )
 from zenml.zen_server.jwt import JWTToken
+from zenml.zen_server.metrics import AUTH_DURATION, timed
 from zenml.zen_server.utils import server_config, zen_store
 
 logger = get_logger(__name__)
@@ -160,6 +161,7 @@ def _fetch_and_verify_api_key(
     return api_key
 
 
+@timed(AUTH_DURATION, method="credentials")
 def authenticate_credentials(
     user_name_or_id: Optional[Union[str, UUID]] = None,
     password: Optional[str] = None,
@@ -350,6 +352,7 @@ def authenticate_credentials(
     return auth_context
 
 
+@timed(AUTH_DURATION, method="device")
 def authenticate_device(client_id: UUID, device_code: str) -> AuthContext:
     """Verify if device authorization credentials are valid.
 
@@ -487,6 +490,7 @@ def authenticate_device(client_id: UUID, device_code: str) -> AuthContext:
     return AuthContext(user=device_model.user, device=device_model)
 
 
+@timed(AUTH_DURATION, method="external_user")
 def authenticate_external_user(external_access_token: str) -> AuthContext:
     """Implement external authentication.
 
@@ -621,6 +625,7 @@ def authenticate_external_user(external_access_token: str) -> AuthContext:
     return AuthContext(user=user)
 
 
+@timed(AUTH_DURATION, method="api_key")
 def authenticate_api_key(
     api_key: str,
 ) -> AuthContext:
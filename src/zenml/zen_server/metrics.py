@@ -0,0 +1,597 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Prometheus metrics for the ZenML Server.
+
+The metrics are collected in-process and exposed in the Prometheus text
+exposition format, so no additional dependency or external service is
+required. Collecting metrics is opt-in and controlled by the
+`metrics_enabled` server configuration option.
+"""
+
+import inspect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from zenml.logger import get_logger
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+    from zenml.zen_server.rbac.rbac_interface import RBACInterface
+    from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Formats metric labels in the Prometheus text format.
+
+    Args:
+        names: The label names.
+        values: The label values.
+
+    Returns:
+        The formatted labels.
+    """
+    if not names:
+        return ""
+
+    def _escape(value: str) -> str:
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\n", "\\n")
+            .replace('"', '\\"')
+        )
+
+    labels = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + labels + "}"
+
+
+def _format_value(value: float) -> str:
+    """Formats a metric value in the Prometheus text format.
+
+    Args:
+        value: The value to format.
+
+    Returns:
+        The formatted value.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Metric:
+    """Base class for metrics."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+    ) -> None:
+        """Initializes the metric.
+
+        Args:
+            name: The metric name.
+            documentation: The metric description.
+            label_names: The names of the labels of the metric.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        """Gets the label values in the order of the label names.
+
+        Args:
+            labels: The labels.
+
+        Returns:
+            The label values.
+
+        Raises:
+            ValueError: If the labels don't match the label names.
+        """
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"Invalid labels {sorted(labels)} for metric {self.name}, "
+                f"expected {sorted(self.label_names)}."
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        """Gets the samples of the metric.
+
+        Returns:
+            A list of (suffix, label values, value) tuples.
+        """
+        return []
+
+    def render(self) -> List[str]:
+        """Renders the metric in the Prometheus text format.
+
+        Returns:
+            The lines of the rendered metric.
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, label_values, value in self.samples():
+            label_names = self.label_names
+            if len(label_values) > len(label_names):
+                label_names = label_names + ("le",)
+            lines.append(
+                f"{self.name}{suffix}"
+                f"{_format_labels(label_names, label_values)} "
+                f"{_format_value(value)}"
+            )
+        return lines
+
+
+class Gauge(Metric):
+    """Metric whose value is read from a callback when collected."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the gauge.
+
+        Args:
+            *args: Positional arguments for the base metric.
+            **kwargs: Keyword arguments for the base metric.
+        """
+        super().__init__(*args, **kwargs)
+        self._callbacks: Dict[LabelValues, Callable[[], float]] = {}
+
+    def set_function(
+        self, callback: Callable[[], float], **labels: str
+    ) -> None:
+        """Sets the callback which returns the gauge value.
+
+        Args:
+            callback: The callback.
+            **labels: The metric labels.
+        """
+        with self._lock:
+            self._callbacks[self._label_values(labels)] = callback
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        """Gets the samples of the metric.
+
+        Returns:
+            A list of (suffix, label values, value) tuples.
+        """
+        with self._lock:
+            callbacks = list(self._callbacks.items())
+
+        samples = []
+        for key, callback in callbacks:
+            try:
+                samples.append(("", key, float(callback())))
+            except Exception as e:
+                logger.debug("Failed to collect gauge %s: %s", self.name, e)
+        return samples
+
+
+class Histogram(Metric):
+    """Metric which counts observations in configurable buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        *args: Any,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        **kwargs: Any,
+    ) -> None:
+        """Initializes the histogram.
+
+        Args:
+            *args: Positional arguments for the base metric.
+            buckets: The upper bounds of the histogram buckets.
+            **kwargs: Keyword arguments for the base metric.
+        """
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Records an observation.
+
+        Args:
+            value: The observed value.
+            **labels: The metric labels.
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def get_count(self, **labels: str) -> int:
+        """Gets the number of observations.
+
+        Args:
+            **labels: The metric labels.
+
+        Returns:
+            The number of observations.
+        """
+        with self._lock:
+            return sum(self._counts.get(self._label_values(labels), []))
+
+    @contextmanager
+    def time(self, **labels: str) -> Generator[None, None, None]:
+        """Context manager that observes the duration of its body.
+
+        Nothing is recorded if metrics are disabled.
+
+        Args:
+            **labels: The metric labels.
+
+        Yields:
+            Nothing.
+        """
+        if not metrics_enabled():
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        """Gets the samples of the metric.
+
+        Returns:
+            A list of (suffix, label values, value) tuples.
+        """
+        samples: List[Tuple[str, LabelValues, float]] = []
+        with self._lock:
+            for key, counts in self._counts.items():
+                cumulative = 0
+                for upper_bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    le = (
+                        "+Inf" if math.isinf(upper_bound) else str(upper_bound)
+                    )
+                    samples.append(("_bucket", key + (le,), cumulative))
+                samples.append(("_count", key, cumulative))
+                samples.append(("_sum", key, self._sums[key]))
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metrics that can be rendered together."""
+
+    def __init__(self) -> None:
+        """Initializes the registry."""
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Registers a metric.
+
+        Args:
+            metric: The metric to register.
+
+        Returns:
+            The registered metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Renders all metrics in the Prometheus text format.
+
+        Returns:
+            The rendered metrics.
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = cast(
+    Histogram,
+    REGISTRY.register(
+        Histogram(
+            "zenml_http_request_duration_seconds",
+            "Duration of HTTP requests handled by the server.",
+            ["router", "method", "status_code"],
+        )
+    ),
+)
+STORE_CALL_DURATION = cast(
+    Histogram,
+    REGISTRY.register(
+        Histogram(
+            "zenml_store_call_duration_seconds",
+            "Duration of SQL zen store method calls.",
+            ["method"],
+        )
+    ),
+)
+SQL_QUERY_DURATION = cast(
+    Histogram,
+    REGISTRY.register(
+        Histogram(
+            "zenml_sql_query_duration_seconds",
+            "Duration of SQL queries grouped by the calling store method.",
+            ["store_method"],
+        )
+    ),
+)
+DB_POOL_CONNECTIONS = cast(
+    Gauge,
+    REGISTRY.register(
+        Gauge(
+            "zenml_db_pool_connections",
+            "Connections of the SQL database connection pool.",
+            ["state"],
+        )
+    ),
+)
+RBAC_CALL_DURATION = cast(
+    Histogram,
+    REGISTRY.register(
+        Histogram(
+            "zenml_rbac_call_duration_seconds",
+            "Duration of RBAC calls.",
+            ["operation"],
+        )
+    ),
+)
+AUTH_DURATION = cast(
+    Histogram,
+    REGISTRY.register(
+        Histogram(
+            "zenml_auth_duration_seconds",
+            "Duration of request authentication.",
+            ["method"],
+        )
+    ),
+)
+ARTIFACT_STORE_READ_DURATION = cast(
+    Histogram,
+    REGISTRY.register(
+        Histogram(
+            "zenml_artifact_store_read_duration_seconds",
+            "Duration of artifact store reads performed by the server.",
+            ["kind"],
+        )
+    ),
+)
+
+_current_store_method: ContextVar[Optional[str]] = ContextVar(
+    "_current_store_method", default=None
+)
+
+
+def metrics_enabled() -> bool:
+    """Checks whether the server collects metrics.
+
+    Returns:
+        Whether the server collects metrics.
+    """
+    from zenml.zen_server.utils import server_config
+
+    return server_config().metrics_enabled
+
+
+def timed(histogram: Histogram, **labels: str) -> Callable[[F], F]:
+    """Decorator that observes the duration of a function.
+
+    Args:
+        histogram: The histogram in which to record the duration.
+        **labels: The metric labels.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with histogram.time(**labels):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def _instrument_store_method(name: str, method: Callable[..., Any]) -> Any:
+    """Wraps a store method to record its duration.
+
+    Args:
+        name: The method name.
+        method: The store method.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _current_store_method.set(name)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            STORE_CALL_DURATION.observe(
+                time.perf_counter() - start, method=name
+            )
+            _current_store_method.reset(token)
+
+    setattr(wrapper, "__zenml_instrumented__", True)
+    return wrapper
+
+
+def _instrument_engine(engine: "Engine") -> None:
+    """Records SQL query durations and connection pool usage of an engine.
+
+    Args:
+        engine: The SQLAlchemy engine.
+    """
+    from sqlalchemy import event
+
+    if getattr(engine, "__zenml_instrumented__", False):
+        return
+    setattr(engine, "__zenml_instrumented__", True)
+
+    def _before_cursor_execute(
+        conn: Any, cursor: Any, statement: Any, *args: Any
+    ) -> None:
+        conn.info.setdefault("zenml_query_start", []).append(
+            time.perf_counter()
+        )
+
+    def _after_cursor_execute(
+        conn: Any, cursor: Any, statement: Any, *args: Any
+    ) -> None:
+        start = conn.info["zenml_query_start"].pop()
+        SQL_QUERY_DURATION.observe(
+            time.perf_counter() - start,
+            store_method=_current_store_method.get() or "other",
+        )
+
+    def _handle_error(context: Any) -> None:
+        # Failed queries never reach `after_cursor_execute`, so their start
+        # time needs to be removed here to keep the stack aligned
+        connection = context.connection
+        if connection is None or context.statement is None:
+            return
+        starts = connection.info.get("zenml_query_start")
+        if starts:
+            starts.pop()
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+    pool = engine.pool
+    for state, attribute in [
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ]:
+        callback = getattr(pool, attribute, None)
+        if callable(callback):
+            DB_POOL_CONNECTIONS.set_function(callback, state=state)
+
+
+def instrument_zen_store(store: "SqlZenStore") -> None:
+    """Records call durations and SQL queries of a SQL zen store.
+
+    The store methods are instrumented on the class, as the store is a
+    pydantic model that doesn't allow overriding methods on the instance. This
+    is fine because the server only ever uses a single store.
+
+    Args:
+        store: The store to instrument.
+    """
+    from zenml.zen_stores.zen_store_interface import ZenStoreInterface
+
+    store_class = type(store)
+    for name, _ in inspect.getmembers(
+        ZenStoreInterface, predicate=inspect.isfunction
+    ):
+        if name.startswith("_"):
+            continue
+        method = getattr(store_class, name, None)
+        if callable(method) and not getattr(
+            method, "__zenml_instrumented__", False
+        ):
+            setattr(store_class, name, _instrument_store_method(name, method))
+
+    _instrument_engine(store.engine)
+
+
+def instrument_rbac(rbac: "RBACInterface") -> None:
+    """Records call durations of an RBAC component.
+
+    Args:
+        rbac: The RBAC component to instrument.
+    """
+    for operation in [
+        "check_permissions",
+        "list_allowed_resource_ids",
+        "update_resource_membership",
+    ]:
+        method = getattr(rbac, operation)
+        setattr(
+            rbac,
+            operation,
+            timed(RBAC_CALL_DURATION, operation=operation)(method),
+        )
@@ -48,6 +48,7 @@ AnyRequest = TypeVar("AnyRequest", bound=BaseRequest)
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
 AnyFilter = TypeVar("AnyFilter", bound=BaseFilter)
 AnyUpdate = TypeVar("AnyUpdate", bound=BaseModel)
+AnyResult = TypeVar("AnyResult")
 UUIDOrStr = TypeVar("UUIDOrStr", UUID, Union[UUID, str])
 
 
@@ -203,3 +204,36 @@ def verify_permissions_and_prune_entities(
     """
     verify_permission(resource_type=resource_type, action=Action.PRUNE)
     prune_method(**kwargs)
+
+
+def verify_permissions_and_bulk_delete_entities(
+    filter_model: AnyFilter,
+    resource_type: ResourceType,
+    delete_method: Callable[..., AnyResult],
+    **kwargs: Any,
+) -> AnyResult:
+    """Verify permissions and delete all entities matching a filter.
+
+    Only the entities which the user is allowed to delete are matched by the
+    filter.
+
+    Args:
+        filter_model: The filter model to select the entities.
+        resource_type: The resource type of the entities to delete.
+        delete_method: The method to delete the entities.
+        kwargs: Keyword arguments to pass to the delete method.
+
+    Returns:
+        The result of the delete method.
+    """
+    auth_context = get_auth_context()
+    assert auth_context
+
+    verify_permission(resource_type=resource_type, action=Action.PRUNE)
+    allowed_ids = get_allowed_resource_ids(
+        resource_type=resource_type, action=Action.DELETE
+    )
+    filter_model.configure_rbac(
+        authenticated_user_id=auth_context.user.id, id=allowed_ids
+    )
+    return delete_method(filter_model, **kwargs)
@@ -13,13 +13,41 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for artifact versions."""
 
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Header, Query, Security
+from fastapi.responses import Response, StreamingResponse
 
-from zenml.artifacts.utils import load_artifact_visualization
-from zenml.constants import API, ARTIFACT_VERSIONS, VERSION_1, VISUALIZE
+from zenml.artifacts.utils import (
+    get_artifact_visualization as get_visualization_of_artifact,
+)
+from zenml.artifacts.utils import (
+    load_artifact_visualization,
+    stream_artifact_version_files,
+    stream_artifact_visualization,
+)
+from zenml.constants import (
+    API,
+    ARTIFACT_VERSIONS,
+    DOWNLOAD,
+    LINEAGE,
+    LINEAGE_DEPTH_DEFAULT,
+    LINEAGE_DEPTH_MAXIMUM,
+    PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAXIMUM,
+    PAGINATION_STARTING_PAGE,
+    RAW,
+    REFERENCES,
+    STORAGE_USAGE,
+    VERSION_1,
+    VISUALIZE,
+)
+from zenml.enums import LineageDirection, StorageUsageGroup
 from zenml.models import (
+    ArtifactLineagePage,
+    ArtifactStorageUsage,
+    ArtifactStoreReference,
     ArtifactVersionFilter,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
@@ -29,6 +57,7 @@ from zenml.models import (
 )
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
+from zenml.zen_server.metrics import ARTIFACT_STORE_READ_DURATION
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_create_entity,
     verify_permissions_and_delete_entity,
@@ -36,10 +65,11 @@ from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_prune_entities,
     verify_permissions_and_update_entity,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
     dehydrate_page,
     get_allowed_resource_ids,
+    verify_permission,
 )
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -118,6 +148,67 @@ def create_artifact_version(
     )
 
 
+@artifact_version_router.get(
+    REFERENCES,
+    response_model=List[ArtifactStoreReference],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def list_artifact_store_references(
+    path: str,
+    _: AuthContext = Security(authorize),
+) -> List[ArtifactStoreReference]:
+    """Lists all referenced URIs inside an artifact store path.
+
+    Args:
+        path: The root path of the artifact store.
+
+    Returns:
+        The URIs of all artifact versions and logs inside the path.
+    """
+    # The references are used to delete unreferenced files, so they are only
+    # listed for users which are allowed to prune artifact versions
+    verify_permission(
+        resource_type=ResourceType.ARTIFACT_VERSION, action=Action.PRUNE
+    )
+    return zen_store().list_artifact_store_references(path=path)
+
+
+@artifact_version_router.get(
+    STORAGE_USAGE,
+    response_model=List[ArtifactStorageUsage],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_artifact_storage_usage(
+    group_by: StorageUsageGroup = StorageUsageGroup.ARTIFACT,
+    _: AuthContext = Security(authorize),
+) -> List[ArtifactStorageUsage]:
+    """Gets the storage used by artifact versions, grouped by an entity.
+
+    Args:
+        group_by: The entity by which to group the artifact versions.
+
+    Returns:
+        The storage usage of each entity the user is allowed to read, ordered
+        by size.
+    """
+    verify_permission(
+        resource_type=ResourceType.ARTIFACT_VERSION, action=Action.READ
+    )
+    usages = zen_store().get_artifact_storage_usage(group_by=group_by)
+
+    resource_type = {
+        StorageUsageGroup.ARTIFACT: ResourceType.ARTIFACT,
+        StorageUsageGroup.PIPELINE: ResourceType.PIPELINE,
+        StorageUsageGroup.WORKSPACE: ResourceType.WORKSPACE,
+    }[group_by]
+    allowed_ids = get_allowed_resource_ids(resource_type=resource_type)
+    if allowed_ids is None:
+        return usages
+    return [usage for usage in usages if usage.id in allowed_ids]
+
+
 @artifact_version_router.get(
     "/{artifact_version_id}",
     response_model=ArtifactVersionResponse,
@@ -146,6 +237,69 @@ def get_artifact_version(
     )
 
 
+@artifact_version_router.get(
+    "/{artifact_version_id}" + LINEAGE,
+    response_model=ArtifactLineagePage,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_artifact_version_lineage(
+    artifact_version_id: UUID,
+    direction: LineageDirection = LineageDirection.DOWNSTREAM,
+    max_depth: int = Query(
+        LINEAGE_DEPTH_DEFAULT, ge=1, le=LINEAGE_DEPTH_MAXIMUM
+    ),
+    page: int = Query(PAGINATION_STARTING_PAGE, ge=1),
+    size: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAXIMUM),
+    _: AuthContext = Security(authorize),
+) -> ArtifactLineagePage:
+    """Get the step runs in the lineage of an artifact version.
+
+    Args:
+        artifact_version_id: The ID of the artifact version.
+        direction: The direction in which to follow the lineage.
+        max_depth: The maximum number of step runs between the artifact
+            version and a step run in the lineage.
+        page: The page to get.
+        size: The maximum number of entries per page.
+
+    Returns:
+        A page of the step runs in the lineage, ordered by depth. Step runs
+        of pipeline runs that the user is not allowed to read are excluded,
+        as well as model versions that the user is not allowed to read.
+    """
+    verify_permissions_and_get_entity(
+        id=artifact_version_id,
+        get_method=zen_store().get_artifact_version,
+        hydrate=False,
+    )
+    # The lineage crosses pipeline runs and model versions which the user
+    # might not be allowed to read. Step runs of other pipeline runs are
+    # excluded before paginating, so the total doesn't include them either.
+    lineage = zen_store().get_artifact_version_lineage(
+        artifact_version_id=artifact_version_id,
+        direction=direction,
+        max_depth=max_depth,
+        page=page,
+        size=size,
+        allowed_pipeline_run_ids=get_allowed_resource_ids(
+            resource_type=ResourceType.PIPELINE_RUN
+        ),
+    )
+
+    allowed_model_version_ids = get_allowed_resource_ids(
+        resource_type=ResourceType.MODEL_VERSION
+    )
+    if allowed_model_version_ids is not None:
+        for entry in lineage.items:
+            entry.model_version_ids = [
+                model_version_id
+                for model_version_id in entry.model_version_ids
+                if model_version_id in allowed_model_version_ids
+            ]
+    return lineage
+
+
 @artifact_version_router.put(
     "/{artifact_version_id}",
     response_model=ArtifactVersionResponse,
@@ -240,6 +394,125 @@ def get_artifact_visualization(
     artifact = verify_permissions_and_get_entity(
         id=artifact_version_id, get_method=store.get_artifact_version
     )
-    return load_artifact_visualization(
-        artifact=artifact, index=index, zen_store=store, encode_image=True
+    with ARTIFACT_STORE_READ_DURATION.time(kind="visualization"):
+        return load_artifact_visualization(
+            artifact=artifact,
+            index=index,
+            zen_store=store,
+            encode_image=True,
+            use_cache=True,
+        )
+
+
+@artifact_version_router.get(
+    "/{artifact_version_id}" + VISUALIZE + RAW,
+    response_class=StreamingResponse,
+    responses={
+        304: {"description": "The visualization was not modified."},
+        401: error_response,
+        404: error_response,
+        422: error_response,
+    },
+)
+@handle_exceptions
+def get_raw_artifact_visualization(
+    artifact_version_id: UUID,
+    index: int = 0,
+    if_none_match: Optional[str] = Header(None),
+    _: AuthContext = Security(authorize),
+) -> Response:
+    """Get the raw content of a visualization of an artifact.
+
+    The content is streamed with its actual media type instead of being
+    embedded in a JSON response. As visualizations never change once they
+    were created, clients can use the `ETag` header to revalidate them.
+
+    Args:
+        artifact_version_id: ID of the artifact version for which to get the
+            visualization.
+        index: Index of the visualization to get (if there are multiple).
+        if_none_match: ETags of visualization contents the client already has.
+
+    Returns:
+        The streamed visualization content.
+    """
+    store = zen_store()
+    artifact = verify_permissions_and_get_entity(
+        id=artifact_version_id, get_method=store.get_artifact_version
+    )
+    visualization = get_visualization_of_artifact(
+        artifact=artifact, index=index
+    )
+    etag = f'"{visualization.id}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+    }
+    if if_none_match:
+        client_etags = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in client_etags or etag in client_etags:
+            return Response(status_code=304, headers=headers)
+
+    with ARTIFACT_STORE_READ_DURATION.time(kind="visualization"):
+        stream = stream_artifact_visualization(
+            artifact=artifact, index=index, zen_store=store
+        )
+    # Visualizations can contain arbitrary user provided HTML, which must
+    # never be able to run scripts in the context of the server
+    headers.update(
+        {
+            "X-Content-Type-Options": "nosniff",
+            "Content-Security-Policy": "sandbox",
+        }
+    )
+    return StreamingResponse(
+        stream.chunks, media_type=stream.media_type, headers=headers
+    )
+
+
+@artifact_version_router.get(
+    "/{artifact_version_id}" + DOWNLOAD,
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/zip": {}}},
+        401: error_response,
+        404: error_response,
+        422: error_response,
+    },
+)
+@handle_exceptions
+def download_artifact_version_files(
+    artifact_version_id: UUID,
+    compression_level: Optional[int] = Query(None, ge=0, le=9),
+    _: AuthContext = Security(authorize),
+) -> StreamingResponse:
+    """Download the files of an artifact version as a zip archive.
+
+    The archive is streamed while it is being created, so large artifacts
+    are never buffered in the server.
+
+    Args:
+        artifact_version_id: ID of the artifact version to download.
+        compression_level: The compression level between 0 (no compression)
+            and 9. If not given, the default level of zlib is used.
+
+    Returns:
+        The streamed zip archive.
+    """
+    store = zen_store()
+    artifact = verify_permissions_and_get_entity(
+        id=artifact_version_id, get_method=store.get_artifact_version
+    )
+    return StreamingResponse(
+        stream_artifact_version_files(
+            artifact=artifact,
+            zen_store=store,
+            compression_level=compression_level,
+        ),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{artifact_version_id}.zip"'
+            )
+        },
     )
@@ -30,6 +30,7 @@ from zenml.constants import (
 from zenml.enums import ExecutionStatus
 from zenml.lineage_graph.lineage_graph import LineageGraph
 from zenml.models import (
+    BulkDeletionSummary,
     Page,
     PipelineRunFilter,
     PipelineRunResponse,
@@ -40,12 +41,14 @@ from zenml.models import (
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
+    verify_permissions_and_bulk_delete_entities,
     verify_permissions_and_delete_entity,
     verify_permissions_and_get_entity,
     verify_permissions_and_list_entities,
     verify_permissions_and_update_entity,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, ResourceType
+from zenml.zen_server.rbac.utils import verify_permission
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
@@ -90,6 +93,45 @@ def list_runs(
     )
 
 
+@router.delete(
+    "",
+    response_model=BulkDeletionSummary,
+    responses={401: error_response, 422: error_response},
+)
+@handle_exceptions
+def delete_runs(
+    runs_filter_model: PipelineRunFilter = Depends(
+        make_dependable(PipelineRunFilter)
+    ),
+    delete_artifacts: bool = False,
+    dry_run: bool = False,
+    _: AuthContext = Security(authorize),
+) -> BulkDeletionSummary:
+    """Deletes all pipeline runs matching query filters.
+
+    Args:
+        runs_filter_model: Filter model used to select the runs.
+        delete_artifacts: Whether to also delete the artifact versions
+            produced by the runs that aren't used by any other run.
+        dry_run: If True, nothing is deleted and the summary contains what
+            would be deleted.
+
+    Returns:
+        Summary of the deleted entities and their files.
+    """
+    if delete_artifacts:
+        verify_permission(
+            resource_type=ResourceType.ARTIFACT_VERSION, action=Action.PRUNE
+        )
+    return verify_permissions_and_bulk_delete_entities(
+        filter_model=runs_filter_model,
+        resource_type=ResourceType.PIPELINE_RUN,
+        delete_method=zen_store().delete_runs,
+        delete_artifacts=delete_artifacts,
+        dry_run=dry_run,
+    )
+
+
 @router.get(
     "/{run_id}",
     response_model=PipelineRunResponse,
@@ -183,12 +225,10 @@ def get_run_dag(
     Returns:
         The DAG for a given pipeline run.
     """
-    run = verify_permissions_and_get_entity(
-        id=run_id, get_method=zen_store().get_run, hydrate=True
+    verify_permissions_and_get_entity(
+        id=run_id, get_method=zen_store().get_run, hydrate=False
     )
-    graph = LineageGraph()
-    graph.generate_run_nodes_and_edges(run)
-    return graph
+    return zen_store().get_run_graph(run_id)
 
 
 @router.get(
@@ -13,19 +13,22 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline run secrets."""
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Security
 
 from zenml.constants import (
     API,
     SECRETS,
     SECRETS_BACKUP,
+    SECRETS_BATCH,
+    SECRETS_BY_NAME,
     SECRETS_OPERATIONS,
     SECRETS_RESTORE,
     VERSION_1,
 )
+from zenml.enums import SecretScope
 from zenml.models import (
     Page,
     SecretFilter,
@@ -42,6 +45,8 @@ from zenml.zen_server.rbac.endpoint_utils import (
 )
 from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
+    batch_verify_permissions_for_models,
+    dehydrate_response_model,
     get_allowed_resource_ids,
     has_permissions_for_model,
     is_owned_by_authenticated_user,
@@ -114,6 +119,89 @@ def list_secrets(
     return secrets
 
 
+@router.get(
+    SECRETS_BATCH,
+    response_model=List[SecretResponse],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_secrets(
+    secret_ids: List[UUID] = Query(...),
+    hydrate: bool = True,
+    _: AuthContext = Security(authorize),
+) -> List[SecretResponse]:
+    """Gets multiple secrets using their unique ids.
+
+    Args:
+        secret_ids: IDs of the secrets to get.
+        hydrate: Flag deciding whether to hydrate the output model(s)
+            by including metadata fields in the response.
+
+    Returns:
+        The secrets. Secrets that don't exist are not included.
+    """
+    secrets = zen_store().get_secrets(secret_ids=secret_ids, hydrate=hydrate)
+    batch_verify_permissions_for_models(secrets, action=Action.READ)
+
+    for secret in secrets:
+        if not has_permissions_for_model(
+            secret, action=Action.READ_SECRET_VALUE
+        ):
+            secret.remove_secrets()
+
+    return [dehydrate_response_model(secret) for secret in secrets]
+
+
+@router.get(
+    SECRETS_BY_NAME,
+    response_model=List[SecretResponse],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_secrets_by_name(
+    workspace_id: UUID,
+    names: List[str] = Query(...),
+    scope: Optional[SecretScope] = None,
+    hydrate: bool = True,
+    auth_context: AuthContext = Security(authorize),
+) -> List[SecretResponse]:
+    """Gets multiple secrets using their exact names.
+
+    Args:
+        workspace_id: ID of the workspace of the secrets.
+        names: Names of the secrets to get.
+        scope: Scope of the secrets to get. If not set, a user-scoped secret
+            takes precedence over a workspace-scoped secret with the same
+            name.
+        hydrate: Flag deciding whether to hydrate the output model(s)
+            by including metadata fields in the response.
+        auth_context: Authentication context.
+
+    Returns:
+        The secrets which the user is allowed to read. Names for which no
+        secret exists are not included.
+    """
+    secrets = zen_store().get_secrets_by_name(
+        names=names,
+        workspace_id=workspace_id,
+        user_id=auth_context.user.id,
+        scope=scope,
+        hydrate=hydrate,
+    )
+
+    allowed_secrets = []
+    for secret in secrets:
+        if not has_permissions_for_model(secret, action=Action.READ):
+            continue
+        if not has_permissions_for_model(
+            secret, action=Action.READ_SECRET_VALUE
+        ):
+            secret.remove_secrets()
+        allowed_secrets.append(dehydrate_response_model(secret))
+
+    return allowed_secrets
+
+
 @router.get(
     "/{secret_id}",
     response_model=SecretResponse,
@@ -70,6 +70,32 @@ types_router = APIRouter(
 )
 
 
+def _expand_secrets(connectors: List[ServiceConnectorResponse]) -> None:
+    """Updates the configuration of service connectors with their secrets.
+
+    The secrets of all connectors are fetched with a single call.
+
+    Args:
+        connectors: The service connectors to update.
+    """
+    secret_ids = {
+        connector.secret_id for connector in connectors if connector.secret_id
+    }
+    if not secret_ids:
+        return
+
+    secrets = {
+        secret.id: secret
+        for secret in zen_store().get_secrets(secret_ids=list(secret_ids))
+    }
+    for connector in connectors:
+        if connector.secret_id and connector.secret_id in secrets:
+            # Update the connector configuration with the secret.
+            connector.configuration.update(
+                secrets[connector.secret_id].secret_values
+            )
+
+
 @router.get(
     "",
     response_model=Page[ServiceConnectorResponse],
@@ -111,6 +137,7 @@ def list_service_connectors(
             action=Action.READ_SECRET_VALUE,
         )
 
+        expandable_connectors: List[ServiceConnectorResponse] = []
         for connector in connectors.items:
             if not connector.secret_id:
                 continue
@@ -127,10 +154,9 @@ def list_service_connectors(
                 # the secret values
                 continue
 
-            secret = zen_store().get_secret(secret_id=connector.secret_id)
+            expandable_connectors.append(connector)
 
-            # Update the connector configuration with the secret.
-            connector.configuration.update(secret.secret_values)
+        _expand_secrets(expandable_connectors)
 
     return connectors
 
@@ -170,10 +196,7 @@ def get_service_connector(
             connector, action=Action.READ_SECRET_VALUE
         )
     ):
-        secret = zen_store().get_secret(secret_id=connector.secret_id)
-
-        # Update the connector configuration with the secret.
-        connector.configuration.update(secret.secret_values)
+        _expand_secrets([connector])
 
     return dehydrate_response_model(connector)
 
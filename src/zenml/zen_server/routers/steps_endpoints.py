@@ -40,6 +40,7 @@ from zenml.models import (
 )
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
+from zenml.zen_server.metrics import ARTIFACT_STORE_READ_DURATION
 from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
     dehydrate_page,
@@ -262,9 +263,10 @@ def get_step_logs(
         raise HTTPException(
             status_code=404, detail="No logs available for this step"
         )
-    artifact_store = _load_artifact_store(logs.artifact_store_id, store)
-    return str(
-        _load_file_from_artifact_store(
-            logs.uri, artifact_store=artifact_store, mode="r"
+    with ARTIFACT_STORE_READ_DURATION.time(kind="logs"):
+        artifact_store = _load_artifact_store(logs.artifact_store_id, store)
+        return str(
+            _load_file_from_artifact_store(
+                logs.uri, artifact_store=artifact_store, mode="r"
+            )
         )
-    )
@@ -14,22 +14,25 @@
 """Zen Server API."""
 
 import os
+import time
 from asyncio.log import logger
 from genericpath import isfile
 from typing import Any, List
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Security
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, Response
 
 import zenml
 from zenml.analytics import source_context
-from zenml.constants import API, HEALTH
+from zenml.constants import API, HEALTH, METRICS
 from zenml.enums import AuthScheme, SourceContextTypes
+from zenml.zen_server import metrics
+from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_detail
 from zenml.zen_server.routers import (
     artifact_endpoint,
@@ -69,8 +72,10 @@ from zenml.zen_server.utils import (
     initialize_secure_headers,
     initialize_workload_manager,
     initialize_zen_store,
+    rbac,
     secure_headers,
     server_config,
+    zen_store,
 )
 
 if server_config().use_legacy_dashboard:
@@ -180,6 +185,41 @@ async def infer_source_context(request: Request, call_next: Any) -> Any:
     return await call_next(request)
 
 
+if server_config().metrics_enabled:
+
+    @app.middleware("http")
+    async def track_request_metrics(request: Request, call_next: Any) -> Any:
+        """Middleware to record the duration of requests.
+
+        Args:
+            request: The incoming request.
+            call_next: The next function to be called.
+
+        Returns:
+            The response to the request.
+        """
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            # The router sets the endpoint on the shared request scope, which
+            # allows grouping the requests by the router module.
+            endpoint = request.scope.get("endpoint")
+            router = (
+                getattr(endpoint, "__module__", "").rsplit(".", 1)[-1]
+                or "other"
+            )
+            metrics.HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                router=router,
+                method=request.method,
+                status_code=str(status_code),
+            )
+
+
 @app.on_event("startup")
 def initialize() -> None:
     """Initialize the ZenML server."""
@@ -191,6 +231,10 @@ def initialize() -> None:
     initialize_workload_manager()
     initialize_plugins()
     initialize_secure_headers()
+    if server_config().metrics_enabled:
+        metrics.instrument_zen_store(zen_store())
+        if server_config().rbac_enabled:
+            metrics.instrument_rbac(rbac())
 
 
 if server_config().use_legacy_dashboard:
@@ -227,6 +271,27 @@ def health() -> str:
     return "OK"
 
 
+@app.get(METRICS, include_in_schema=False)
+def get_metrics(_: AuthContext = Security(authorize)) -> Response:
+    """Get the server metrics in the Prometheus text format.
+
+    Scrapers need to authenticate like any other API client, e.g. with the
+    bearer token of a service account.
+
+    Returns:
+        The server metrics.
+
+    Raises:
+        HTTPException: If metrics are disabled.
+    """
+    if not server_config().metrics_enabled:
+        raise HTTPException(status_code=404)
+    return Response(
+        content=metrics.REGISTRY.render(),
+        media_type=metrics.METRICS_CONTENT_TYPE,
+    )
+
+
 templates = Jinja2Templates(directory=relative_path(DASHBOARD_DIRECTORY))
 
 
@@ -59,20 +59,27 @@ from zenml.constants import (
     FLAVORS,
     GET_OR_CREATE,
     INFO,
+    LINEAGE,
+    LINEAGE_DEPTH_DEFAULT,
     LOGIN,
     LOGS,
     MODEL_VERSION_ARTIFACTS,
     MODEL_VERSION_PIPELINE_RUNS,
     MODEL_VERSIONS,
     MODELS,
+    PAGE_SIZE_DEFAULT,
+    PAGINATION_STARTING_PAGE,
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
     PIPELINES,
+    REFERENCES,
     RUN_METADATA,
     RUNS,
     SCHEDULES,
     SECRETS,
     SECRETS_BACKUP,
+    SECRETS_BATCH,
+    SECRETS_BY_NAME,
     SECRETS_OPERATIONS,
     SECRETS_RESTORE,
     SERVER_SETTINGS,
@@ -86,6 +93,7 @@ from zenml.constants import (
     STACK_COMPONENTS,
     STACKS,
     STEPS,
+    STORAGE_USAGE,
     TAGS,
     TRIGGER_EXECUTIONS,
     TRIGGERS,
@@ -94,7 +102,10 @@ from zenml.constants import (
     WORKSPACES,
 )
 from zenml.enums import (
+    LineageDirection,
     OAuthGrantTypes,
+    SecretScope,
+    StorageUsageGroup,
     StoreType,
 )
 from zenml.exceptions import (
@@ -109,8 +120,11 @@ from zenml.models import (
     APIKeyRotateRequest,
     APIKeyUpdate,
     ArtifactFilter,
+    ArtifactLineagePage,
     ArtifactRequest,
     ArtifactResponse,
+    ArtifactStorageUsage,
+    ArtifactStoreReference,
     ArtifactUpdate,
     ArtifactVersionFilter,
     ArtifactVersionRequest,
@@ -120,6 +134,7 @@ from zenml.models import (
     BaseFilter,
     BaseIdentifiedResponse,
     BaseRequest,
+    BulkDeletionSummary,
     CodeReferenceResponse,
     CodeRepositoryFilter,
     CodeRepositoryRequest,
@@ -910,6 +925,85 @@ class RestZenStore(BaseZenStore):
             path=ARTIFACT_VERSIONS, params={"only_versions": only_versions}
         )
 
+    def get_artifact_version_lineage(
+        self,
+        artifact_version_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: int = LINEAGE_DEPTH_DEFAULT,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> ArtifactLineagePage:
+        """Gets the step runs in the lineage of an artifact version.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+            direction: The direction in which to follow the lineage.
+            max_depth: The maximum number of step runs between the artifact
+                version and a step run in the lineage.
+            page: The page to get.
+            size: The maximum number of entries per page.
+
+        Returns:
+            A page of the step runs in the lineage, ordered by depth.
+        """
+        body = self.get(
+            f"{ARTIFACT_VERSIONS}/{str(artifact_version_id)}{LINEAGE}",
+            params={
+                "direction": direction.value,
+                "max_depth": max_depth,
+                "page": page,
+                "size": size,
+            },
+        )
+        return ArtifactLineagePage.parse_obj(body)
+
+    def list_artifact_store_references(
+        self, path: str
+    ) -> List[ArtifactStoreReference]:
+        """Lists all referenced URIs inside an artifact store path.
+
+        Args:
+            path: The root path of the artifact store.
+
+        Returns:
+            The URIs of all artifact versions and logs inside the path.
+
+        Raises:
+            ValueError: If the value returned by the server is not a list.
+        """
+        body = self.get(ARTIFACT_VERSIONS + REFERENCES, params={"path": path})
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [ArtifactStoreReference.parse_obj(entry) for entry in body]
+
+    def get_artifact_storage_usage(
+        self, group_by: StorageUsageGroup = StorageUsageGroup.ARTIFACT
+    ) -> List[ArtifactStorageUsage]:
+        """Gets the storage used by artifact versions, grouped by an entity.
+
+        Args:
+            group_by: The entity by which to group the artifact versions. An
+                artifact version counts towards every pipeline that produced
+                it.
+
+        Returns:
+            The storage usage of each entity, ordered by size.
+
+        Raises:
+            ValueError: If the value returned by the server is not a list.
+        """
+        body = self.get(
+            ARTIFACT_VERSIONS + STORAGE_USAGE,
+            params={"group_by": group_by.value},
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [ArtifactStorageUsage.parse_obj(entry) for entry in body]
+
     # ------------------------ Artifact Visualizations ------------------------
 
     def get_artifact_visualization(
@@ -1682,6 +1776,31 @@ class RestZenStore(BaseZenStore):
             route=RUNS,
         )
 
+    def delete_runs(
+        self,
+        runs_filter_model: PipelineRunFilter,
+        delete_artifacts: bool = False,
+        dry_run: bool = False,
+    ) -> BulkDeletionSummary:
+        """Deletes all pipeline runs matching a filter.
+
+        Args:
+            runs_filter_model: Filter model used to select the runs.
+            delete_artifacts: Whether to also delete the artifact versions
+                produced by the runs that aren't used by any other run.
+            dry_run: If True, nothing is deleted and the summary contains
+                what would be deleted.
+
+        Returns:
+            Summary of the deleted entities and their files.
+        """
+        params: Dict[str, Any] = runs_filter_model.dict(exclude_none=True)
+        params.update(
+            {"delete_artifacts": delete_artifacts, "dry_run": dry_run}
+        )
+        body = self.delete(RUNS, params=params)
+        return BulkDeletionSummary.parse_obj(body)
+
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequest
     ) -> Tuple[PipelineRunResponse, bool]:
@@ -1904,6 +2023,84 @@ class RestZenStore(BaseZenStore):
             params={"hydrate": hydrate},
         )
 
+    def get_secrets(
+        self, secret_ids: List[UUID], hydrate: bool = True
+    ) -> List[SecretResponse]:
+        """Get multiple secrets, including their values.
+
+        Args:
+            secret_ids: IDs of the secrets.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets. Secrets that don't exist or have no values are not
+            included.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        if not secret_ids:
+            return []
+
+        body = self.get(
+            SECRETS + SECRETS_BATCH,
+            params={
+                "secret_ids": [str(secret_id) for secret_id in secret_ids],
+                "hydrate": hydrate,
+            },
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [SecretResponse.parse_obj(secret) for secret in body]
+
+    def get_secrets_by_name(
+        self,
+        names: List[str],
+        workspace_id: UUID,
+        user_id: UUID,
+        scope: Optional[SecretScope] = None,
+        hydrate: bool = True,
+    ) -> List[SecretResponse]:
+        """Get multiple secrets by their exact names, including their values.
+
+        Args:
+            names: The names of the secrets.
+            workspace_id: The ID of the workspace of the secrets.
+            user_id: The ID of the user whose user-scoped secrets to get. The
+                server always uses the authenticated user instead.
+            scope: The scope of the secrets. If not set, secrets in both
+                scopes are searched and a user-scoped secret takes precedence
+                over a workspace-scoped secret with the same name.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets. Names for which no secret with values exists are not
+            included.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        if not names:
+            return []
+
+        params: Dict[str, Any] = {
+            "names": list(names),
+            "workspace_id": str(workspace_id),
+            "hydrate": hydrate,
+        }
+        if scope is not None:
+            params["scope"] = scope.value
+        body = self.get(SECRETS + SECRETS_BY_NAME, params=params)
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [SecretResponse.parse_obj(secret) for secret in body]
+
     def list_secrets(
         self, secret_filter_model: SecretFilter, hydrate: bool = False
     ) -> Page[SecretResponse]:
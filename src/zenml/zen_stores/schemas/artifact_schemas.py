@@ -14,11 +14,12 @@
 """SQLModel implementation of artifact table."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, BigInteger, Column
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Field, Relationship
 
 from zenml.config.source import Source
@@ -42,7 +43,10 @@ from zenml.models import (
 from zenml.models.v2.core.artifact import ArtifactRequest
 from zenml.zen_stores.schemas.base_schemas import BaseSchema, NamedSchema
 from zenml.zen_stores.schemas.component_schemas import StackComponentSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.step_run_schemas import (
     StepRunInputArtifactSchema,
     StepRunOutputArtifactSchema,
@@ -51,6 +55,8 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.artifact_visualization_schemas import (
         ArtifactVisualizationSchema,
     )
@@ -99,6 +105,32 @@ class ArtifactSchema(NamedSchema, table=True):
             has_custom_name=artifact_request.has_custom_name,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the loader options to apply when querying this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        return [
+            selectinload(jl_arg(ArtifactSchema.versions)),
+            selectinload(jl_arg(ArtifactSchema.tags)).joinedload(
+                jl_arg(TagResourceSchema.tag)
+            ),
+        ]
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -175,6 +207,7 @@ class ArtifactVersionSchema(BaseSchema, table=True):
     uri: str = Field(sa_column=Column(TEXT, nullable=False))
     materializer: str = Field(sa_column=Column(TEXT, nullable=False))
     data_type: str = Field(sa_column=Column(TEXT, nullable=False))
+    size: Optional[int] = Field(sa_column=Column(BigInteger, nullable=True))
     tags: List["TagResourceSchema"] = Relationship(
         back_populates="artifact_version",
         sa_relationship_kwargs=dict(
@@ -281,8 +314,55 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             uri=artifact_version_request.uri,
             materializer=artifact_version_request.materializer.json(),
             data_type=artifact_version_request.data_type.json(),
+            size=artifact_version_request.size,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the loader options to apply when querying this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        options: List["ExecutableOption"] = [
+            joinedload(jl_arg(ArtifactVersionSchema.artifact)).options(
+                *ArtifactSchema.get_query_options()
+            ),
+            joinedload(jl_arg(ArtifactVersionSchema.user)),
+            selectinload(jl_arg(ArtifactVersionSchema.tags)).joinedload(
+                jl_arg(TagResourceSchema.tag)
+            ),
+            selectinload(
+                jl_arg(ArtifactVersionSchema.output_of_step_runs)
+            ).joinedload(jl_arg(StepRunOutputArtifactSchema.step_run)),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(ArtifactVersionSchema.workspace)),
+                    selectinload(jl_arg(ArtifactVersionSchema.visualizations)),
+                    selectinload(
+                        jl_arg(ArtifactVersionSchema.run_metadata)
+                    ).joinedload(jl_arg(RunMetadataSchema.user)),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -337,6 +417,7 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             type=self.type,
             materializer=materializer,
             data_type=data_type,
+            size=self.size,
             created=self.created,
             updated=self.updated,
             tags=[t.tag.to_model() for t in self.tags],
@@ -374,5 +455,7 @@ class ArtifactVersionSchema(BaseSchema, table=True):
         Returns:
             The updated `ArtifactVersionSchema`.
         """
+        if artifact_version_update.size is not None:
+            self.size = artifact_version_update.size
         self.updated = datetime.utcnow()
         return self
@@ -14,12 +14,14 @@
 """Base classes for SQLModel schemas."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Sequence, TypeVar
 from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.models.v2.base.base import BaseResponse
 
     B = TypeVar("B", bound=BaseResponse)  # type: ignore[type-arg]
@@ -32,6 +34,30 @@ class BaseSchema(SQLModel):
     created: datetime = Field(default_factory=datetime.utcnow)
     updated: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the loader options to apply when querying this schema.
+
+        The options returned by this method are used to eagerly load all the
+        relationships that are accessed when converting the schema to a
+        model with the same arguments. This avoids lazy-loading each
+        relationship in a separate query (N+1 query problem).
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        return []
+
     def to_model(
         self,
         include_metadata: bool = False,
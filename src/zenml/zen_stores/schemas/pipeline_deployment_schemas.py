@@ -14,23 +14,28 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
 from sqlalchemy import TEXT, Column, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import joinedload
 from sqlmodel import Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
-from zenml.constants import MEDIUMTEXT_MAX_LENGTH
+from zenml.constants import (
+    MEDIUMTEXT_MAX_LENGTH,
+    PARSED_DEPLOYMENT_CACHE_SIZE,
+)
 from zenml.models import (
     PipelineDeploymentRequest,
     PipelineDeploymentResponse,
     PipelineDeploymentResponseBody,
     PipelineDeploymentResponseMetadata,
 )
+from zenml.utils.cache_utils import LRUCache
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
 from zenml.zen_stores.schemas.code_repository_schemas import (
     CodeReferenceSchema,
@@ -38,15 +43,27 @@ from zenml.zen_stores.schemas.code_repository_schemas import (
 from zenml.zen_stores.schemas.pipeline_build_schemas import PipelineBuildSchema
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
 from zenml.zen_stores.schemas.schedule_schema import ScheduleSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
+# Deployments are immutable, which means we can safely cache their parsed
+# configurations by ID instead of parsing the JSON columns each time they're
+# converted to a model.
+_parsed_configurations_cache: LRUCache[
+    UUID, Tuple[PipelineConfiguration, Dict[str, Step]]
+] = LRUCache(maxsize=PARSED_DEPLOYMENT_CACHE_SIZE)
+
 
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
@@ -189,6 +206,112 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             server_version=request.server_version,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the loader options to apply when querying this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        options: List["ExecutableOption"] = [
+            joinedload(jl_arg(PipelineDeploymentSchema.user)),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineDeploymentSchema.workspace)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.pipeline)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.stack)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.build)),
+                    joinedload(jl_arg(PipelineDeploymentSchema.schedule)),
+                    joinedload(
+                        jl_arg(PipelineDeploymentSchema.code_reference)
+                    ),
+                ]
+            )
+        return options
+
+    def _get_parsed_configurations(
+        self,
+    ) -> Tuple[PipelineConfiguration, Dict[str, Step]]:
+        """Gets the parsed pipeline and step configurations.
+
+        Returns:
+            The cached or freshly parsed pipeline and step configurations.
+        """
+        cached = _parsed_configurations_cache.get(self.id)
+        if cached is not None:
+            return cached
+
+        pipeline_configuration = PipelineConfiguration.parse_raw(
+            self.pipeline_configuration
+        )
+        step_configurations = {
+            name: Step.parse_obj(config)
+            for name, config in json.loads(self.step_configurations).items()
+        }
+        parsed = (pipeline_configuration, step_configurations)
+        _parsed_configurations_cache.set(self.id, parsed)
+        return parsed
+
+    def get_pipeline_configuration(self) -> PipelineConfiguration:
+        """Gets the pipeline configuration of the deployment.
+
+        Returns:
+            A copy of the parsed pipeline configuration.
+        """
+        pipeline_configuration, _ = self._get_parsed_configurations()
+        return pipeline_configuration.copy(deep=True)
+
+    def get_step_configurations(self) -> Dict[str, Step]:
+        """Gets the step configurations of the deployment.
+
+        Returns:
+            Copies of the parsed step configurations.
+        """
+        _, step_configurations = self._get_parsed_configurations()
+        return {
+            name: step.copy(deep=True)
+            for name, step in step_configurations.items()
+        }
+
+    def get_step_configuration(self, step_name: str) -> Step:
+        """Gets the configuration of a single step of the deployment.
+
+        Args:
+            step_name: The name of the step.
+
+        Returns:
+            A copy of the parsed step configuration.
+        """
+        _, step_configurations = self._get_parsed_configurations()
+        return step_configurations[step_name].copy(deep=True)
+
+    def get_step_count(self) -> int:
+        """Gets the number of steps in the deployment.
+
+        This only parses the step configurations if they're not cached
+        already.
+
+        Returns:
+            The number of steps in the deployment.
+        """
+        cached = _parsed_configurations_cache.get(self.id)
+        if cached is not None:
+            return len(cached[1])
+
+        return len(json.loads(self.step_configurations))
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -206,13 +329,6 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         Returns:
             The created `PipelineDeploymentResponse`.
         """
-        pipeline_configuration = PipelineConfiguration.parse_raw(
-            self.pipeline_configuration
-        )
-        step_configurations = json.loads(self.step_configurations)
-        for s, c in step_configurations.items():
-            step_configurations[s] = Step.parse_obj(c)
-
         body = PipelineDeploymentResponseBody(
             user=self.user.to_model() if self.user else None,
             created=self.created,
@@ -223,8 +339,8 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             metadata = PipelineDeploymentResponseMetadata(
                 workspace=self.workspace.to_model(),
                 run_name_template=self.run_name_template,
-                pipeline_configuration=pipeline_configuration,
-                step_configurations=step_configurations,
+                pipeline_configuration=self.get_pipeline_configuration(),
+                step_configurations=self.get_step_configurations(),
                 client_environment=json.loads(self.client_environment),
                 client_version=self.client_version,
                 server_version=self.server_version,
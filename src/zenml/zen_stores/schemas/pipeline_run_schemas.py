@@ -15,10 +15,11 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import TEXT, Column, Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -38,13 +39,18 @@ from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
 )
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
 from zenml.zen_stores.schemas.schedule_schema import ScheduleSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.trigger_schemas import TriggerExecutionSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.model_schemas import (
         ModelVersionPipelineRunSchema,
@@ -215,6 +221,55 @@ class PipelineRunSchema(NamedSchema, table=True):
             trigger_execution_id=request.trigger_execution_id,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the loader options to apply when querying this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+        from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
+
+        options: List["ExecutableOption"] = [
+            joinedload(jl_arg(PipelineRunSchema.deployment)).options(
+                *PipelineDeploymentSchema.get_query_options(
+                    include_metadata=True
+                )
+            ),
+            joinedload(jl_arg(PipelineRunSchema.user)),
+            joinedload(jl_arg(PipelineRunSchema.stack)),
+            joinedload(jl_arg(PipelineRunSchema.pipeline)),
+            joinedload(jl_arg(PipelineRunSchema.build)),
+            joinedload(jl_arg(PipelineRunSchema.schedule)),
+            joinedload(jl_arg(PipelineRunSchema.trigger_execution)),
+            selectinload(jl_arg(PipelineRunSchema.run_metadata)).joinedload(
+                jl_arg(RunMetadataSchema.user)
+            ),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineRunSchema.workspace)),
+                    selectinload(jl_arg(PipelineRunSchema.step_runs)).options(
+                        *StepRunSchema.get_query_options()
+                    ),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -247,7 +302,9 @@ class PipelineRunSchema(NamedSchema, table=True):
         }
 
         if self.deployment is not None:
-            deployment = self.deployment.to_model()
+            # The deployment metadata is required to fill the run response,
+            # so we include it right away instead of hydrating it later on.
+            deployment = self.deployment.to_model(include_metadata=True)
 
             config = deployment.pipeline_configuration
             client_environment = deployment.client_environment
@@ -13,9 +13,10 @@
 #  permissions and limitations under the License.
 """Utility functions for SQLModel schemas."""
 
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy import Column, ForeignKey
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import Field
 
 
@@ -84,3 +85,18 @@ def build_foreign_key_field(
             **sa_column_kwargs,
         ),
     )
+
+
+def jl_arg(column: Any) -> InstrumentedAttribute:
+    """Cast a SQLModel relationship to a loader option argument.
+
+    SQLModel relationships are typed as the related schema, which loader
+    options like `joinedload` or `selectinload` don't accept.
+
+    Args:
+        column: The SQLModel relationship.
+
+    Returns:
+        The relationship cast to an instrumented attribute.
+    """
+    return cast(InstrumentedAttribute, column)
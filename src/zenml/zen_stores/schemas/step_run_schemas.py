@@ -13,13 +13,13 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
-import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.step_configurations import Step
@@ -43,11 +43,16 @@ from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
     PipelineDeploymentSchema,
 )
 from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.artifact_schemas import ArtifactVersionSchema
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
@@ -176,6 +181,56 @@ class StepRunSchema(NamedSchema, table=True):
             source_code=request.source_code,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the loader options to apply when querying this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.artifact_schemas import (
+            ArtifactVersionSchema,
+        )
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+
+        artifact_version_options = ArtifactVersionSchema.get_query_options()
+        options: List["ExecutableOption"] = [
+            joinedload(jl_arg(StepRunSchema.user)),
+            # Step runs of the same run share their deployment, so we load it
+            # in a separate query instead of joining it for each step.
+            selectinload(jl_arg(StepRunSchema.deployment)),
+            selectinload(jl_arg(StepRunSchema.run_metadata)).joinedload(
+                jl_arg(RunMetadataSchema.user)
+            ),
+            selectinload(jl_arg(StepRunSchema.input_artifacts))
+            .joinedload(jl_arg(StepRunInputArtifactSchema.artifact_version))
+            .options(*artifact_version_options),
+            selectinload(jl_arg(StepRunSchema.output_artifacts))
+            .joinedload(jl_arg(StepRunOutputArtifactSchema.artifact_version))
+            .options(*artifact_version_options),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(StepRunSchema.workspace)),
+                    joinedload(jl_arg(StepRunSchema.logs)),
+                    selectinload(jl_arg(StepRunSchema.parents)),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -215,8 +270,8 @@ class StepRunSchema(NamedSchema, table=True):
         }
 
         if self.deployment is not None:
-            full_step_config = Step.parse_obj(
-                json.loads(self.deployment.step_configurations)[self.name]
+            full_step_config = self.deployment.get_step_configuration(
+                self.name
             )
         elif self.step_configuration is not None:
             full_step_config = Step.parse_raw(self.step_configuration)
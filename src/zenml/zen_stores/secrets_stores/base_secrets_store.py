@@ -13,13 +13,21 @@
 #  permissions and limitations under the License.
 """Base Secrets Store implementation."""
 
+import json
+import secrets
+import threading
+import time
 from abc import ABC
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
+    List,
     Optional,
+    Tuple,
     Type,
 )
 from uuid import UUID
@@ -27,6 +35,10 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from zenml.config.secrets_store_config import SecretsStoreConfiguration
+from zenml.constants import (
+    SECRETS_CACHE_MAX_ENTRIES,
+    SECRETS_STORE_MAX_CONCURRENT_REQUESTS,
+)
 from zenml.enums import SecretsStoreType
 from zenml.logger import get_logger
 from zenml.utils import source_utils
@@ -44,6 +56,117 @@ ZENML_SECRET_ID_LABEL = "zenml_secret_id"
 ZENML_SECRET_NAME_LABEL = "zenml_secret_name"
 
 
+class SecretValuesCache:
+    """Short-lived in-memory cache of secret values.
+
+    The cached values are encrypted with a random key that is generated when
+    the cache is created and never leaves the memory of the current process.
+    If encryption is not available, nothing is cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = SECRETS_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl_seconds: The number of seconds for which values are cached.
+                Caching is disabled if this is not positive.
+            max_entries: The maximum number of cached secrets.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._encryption_engine: Any = None
+
+        if ttl_seconds > 0:
+            try:
+                from sqlalchemy_utils.types.encrypted.encrypted_type import (
+                    AesGcmEngine,
+                )
+
+                engine = AesGcmEngine()
+                engine._update_key(secrets.token_hex(32))
+                # Make sure that the encryption backend is available
+                engine.encrypt("")
+            except Exception as e:
+                logger.debug("Not caching secret values: %s", e)
+            else:
+                self._encryption_engine = engine
+
+    @property
+    def enabled(self) -> bool:
+        """Whether secret values are cached.
+
+        Returns:
+            Whether secret values are cached.
+        """
+        return self._encryption_engine is not None
+
+    def get(self, secret_id: UUID) -> Optional[Dict[str, str]]:
+        """Gets the cached values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+
+        Returns:
+            The cached secret values or None if the values are not cached or
+            have expired.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(secret_id)
+            if entry is None:
+                return None
+            expires_at, encrypted_values = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[secret_id]
+                return None
+
+        values: Dict[str, str] = json.loads(
+            self._encryption_engine.decrypt(encrypted_values)
+        )
+        return values
+
+    def set(self, secret_id: UUID, values: Dict[str, str]) -> None:
+        """Caches the values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+            values: The secret values.
+        """
+        if not self.enabled:
+            return
+
+        encrypted_values = self._encryption_engine.encrypt(json.dumps(values))
+        with self._lock:
+            self._entries[secret_id] = (
+                time.monotonic() + self.ttl_seconds,
+                encrypted_values,
+            )
+            self._entries.move_to_end(secret_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, secret_id: Optional[UUID] = None) -> None:
+        """Removes cached secret values.
+
+        Args:
+            secret_id: The ID of the secret to remove. If not given, all
+                cached values are removed.
+        """
+        with self._lock:
+            if secret_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(secret_id, None)
+
+
 class BaseSecretsStore(BaseModel, SecretsStoreInterface, ABC):
     """Base class for accessing and persisting ZenML secret values.
 
@@ -225,6 +348,48 @@ class BaseSecretsStore(BaseModel, SecretsStoreInterface, ABC):
     # Helpers for Secrets Store back-ends that use tags/labels
     # --------------------------------------------------------
 
+    def get_secrets_values(
+        self, secret_ids: List[UUID]
+    ) -> Dict[UUID, Dict[str, str]]:
+        """Get the secret values for multiple existing secrets.
+
+        This implementation fetches the values of the individual secrets
+        concurrently. Secrets stores that support fetching multiple secrets
+        with a single request should override it.
+
+        Args:
+            secret_ids: IDs of the secrets.
+
+        Returns:
+            The secret values, indexed by secret ID. Secrets for which no
+            values are stored in the secrets store are not included.
+        """
+
+        def _get_secret_values(secret_id: UUID) -> Optional[Dict[str, str]]:
+            try:
+                return self.get_secret_values(secret_id=secret_id)
+            except KeyError:
+                return None
+
+        unique_ids = list(dict.fromkeys(secret_ids))
+        if len(unique_ids) <= 1:
+            results = [
+                _get_secret_values(secret_id) for secret_id in unique_ids
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    len(unique_ids), SECRETS_STORE_MAX_CONCURRENT_REQUESTS
+                )
+            ) as executor:
+                results = list(executor.map(_get_secret_values, unique_ids))
+
+        return {
+            secret_id: values
+            for secret_id, values in zip(unique_ids, results)
+            if values is not None
+        }
+
     def _get_secret_metadata(
         self,
         secret_id: Optional[UUID] = None,
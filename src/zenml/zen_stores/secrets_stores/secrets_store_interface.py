@@ -14,7 +14,7 @@
 """ZenML secrets store interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List
 from uuid import UUID
 
 
@@ -68,6 +68,20 @@ class SecretsStoreInterface(ABC):
                 secrets store.
         """
 
+    @abstractmethod
+    def get_secrets_values(
+        self, secret_ids: List[UUID]
+    ) -> Dict[UUID, Dict[str, str]]:
+        """Get the secret values for multiple existing secrets.
+
+        Args:
+            secret_ids: IDs of the secrets.
+
+        Returns:
+            The secret values, indexed by secret ID. Secrets for which no
+            values are stored in the secrets store are not included.
+        """
+
     @abstractmethod
     def update_secret_values(
         self,
@@ -18,6 +18,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    List,
     Optional,
     Type,
 )
@@ -26,7 +27,7 @@ from uuid import UUID
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy_utils.types.encrypted.encrypted_type import AesGcmEngine
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from zenml.config.secrets_store_config import SecretsStoreConfiguration
 from zenml.enums import (
@@ -230,6 +231,45 @@ class SqlSecretsStore(BaseSecretsStore):
                     "reconfigured without proper secrets migration."
                 )
 
+    def get_secrets_values(
+        self, secret_ids: List[UUID]
+    ) -> Dict[UUID, Dict[str, str]]:
+        """Get the secret values for multiple existing secrets.
+
+        Args:
+            secret_ids: IDs of the secrets.
+
+        Returns:
+            The secret values, indexed by secret ID. Secrets for which no
+            values are stored in the secrets store are not included.
+        """
+        secrets_values: Dict[UUID, Dict[str, str]] = {}
+        if not secret_ids:
+            return secrets_values
+
+        with Session(self.engine) as session:
+            secrets_in_db = session.exec(
+                select(SecretSchema).where(
+                    col(SecretSchema.id).in_(secret_ids)
+                )
+            ).all()
+            for secret_in_db in secrets_in_db:
+                try:
+                    secrets_values[secret_in_db.id] = (
+                        secret_in_db.get_secret_values(
+                            encryption_engine=self._encryption_engine,
+                        )
+                    )
+                except SecretDecodeError:
+                    logger.error(
+                        f"Secret values for secret {secret_in_db.id} could "
+                        "not be decoded. This can happen if encryption has "
+                        "been enabled/disabled or if the encryption key has "
+                        "been reconfigured without proper secrets migration."
+                    )
+
+        return secrets_values
+
     def update_secret_values(
         self,
         secret_id: UUID,
@@ -29,8 +29,11 @@ from typing import (
     ClassVar,
     Dict,
     ForwardRef,
+    Iterator,
     List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -40,16 +43,23 @@ from typing import (
 from uuid import UUID
 
 from packaging import version
-from pydantic import Field, SecretStr, root_validator, validator
+from pydantic import (
+    Field,
+    SecretStr,
+    ValidationError,
+    root_validator,
+    validator,
+)
 from pydantic.json import pydantic_encoder
-from sqlalchemy import asc, desc, func
+from sqlalchemy import asc, desc, func, literal
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
     IntegrityError,
     NoResultFound,
 )
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import aliased, noload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import (
     Session,
     SQLModel,
@@ -59,6 +69,7 @@ from sqlmodel import (
     delete,
     or_,
     select,
+    update,
 )
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
@@ -73,8 +84,11 @@ from zenml.analytics.utils import (
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.secrets_store_config import SecretsStoreConfiguration
 from zenml.config.server_config import ServerConfiguration
+from zenml.config.source import Source
+from zenml.config.step_configurations import Step
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
+    BULK_DELETION_BATCH_SIZE,
     DEFAULT_PASSWORD,
     DEFAULT_STACK_AND_COMPONENT_NAME,
     DEFAULT_USERNAME,
@@ -84,6 +98,13 @@ from zenml.constants import (
     ENV_ZENML_LOCAL_SERVER,
     ENV_ZENML_SERVER,
     FINISHED_ONBOARDING_SURVEY_KEY,
+    LINEAGE_DEPTH_DEFAULT,
+    LINEAGE_DEPTH_MAXIMUM,
+    PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAXIMUM,
+    PAGINATION_STARTING_PAGE,
+    RUN_GRAPH_CACHE_SIZE,
+    SECRETS_CACHE_TTL_SECONDS,
     SQL_STORE_BACKUP_DIRECTORY_NAME,
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
@@ -92,7 +113,9 @@ from zenml.enums import (
     AuthScheme,
     DatabaseBackupStrategy,
     ExecutionStatus,
+    LineageDirection,
     LoggingLevels,
+    MetadataResourceTypes,
     ModelStages,
     SecretScope,
     SecretsStoreType,
@@ -100,11 +123,11 @@ from zenml.enums import (
     StackComponentType,
     StepRunInputArtifactType,
     StepRunOutputArtifactType,
+    StorageUsageGroup,
     StoreType,
     TaggableResourceTypes,
 )
 from zenml.exceptions import (
-    AuthorizationException,
     BackupSecretsStoreNotConfiguredError,
     EntityExistsError,
     EventSourceExistsError,
@@ -115,7 +138,14 @@ from zenml.exceptions import (
     TriggerExistsError,
 )
 from zenml.io import fileio
+from zenml.lineage_graph.lineage_graph import (
+    LineageArtifactVersion,
+    LineageGraph,
+    LineageStepRun,
+    MetadataTuple,
+)
 from zenml.logger import get_console_handler, get_logger, get_logging_level
+from zenml.metadata.metadata_types import MetadataTypeEnum
 from zenml.models import (
     APIKeyFilter,
     APIKeyInternalResponse,
@@ -125,8 +155,13 @@ from zenml.models import (
     APIKeyRotateRequest,
     APIKeyUpdate,
     ArtifactFilter,
+    ArtifactLineageEntry,
+    ArtifactLineagePage,
     ArtifactRequest,
     ArtifactResponse,
+    ArtifactStorageUsage,
+    ArtifactStoreFile,
+    ArtifactStoreReference,
     ArtifactUpdate,
     ArtifactVersionFilter,
     ArtifactVersionRequest,
@@ -136,6 +171,7 @@ from zenml.models import (
     BaseFilter,
     BaseIdentifiedResponse,
     BaseResponse,
+    BulkDeletionSummary,
     CodeReferenceRequest,
     CodeReferenceResponse,
     CodeRepositoryFilter,
@@ -257,11 +293,15 @@ from zenml.models import (
 )
 from zenml.models.v2.core.component import InternalComponentRequest
 from zenml.models.v2.core.stack import InternalStackRequest
+from zenml.service_connectors.service_connector import (
+    verify_service_connectors,
+)
 from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
 )
 from zenml.stack.flavor_registry import FlavorRegistry
 from zenml.utils import uuid_utils
+from zenml.utils.cache_utils import LRUCache
 from zenml.utils.enum_utils import StrEnum
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
@@ -316,7 +356,10 @@ from zenml.zen_stores.schemas.artifact_visualization_schemas import (
 from zenml.zen_stores.schemas.logs_schemas import LogsSchema
 from zenml.zen_stores.schemas.service_schemas import ServiceSchema
 from zenml.zen_stores.schemas.trigger_schemas import TriggerSchema
-from zenml.zen_stores.secrets_stores.base_secrets_store import BaseSecretsStore
+from zenml.zen_stores.secrets_stores.base_secrets_store import (
+    BaseSecretsStore,
+    SecretValuesCache,
+)
 from zenml.zen_stores.secrets_stores.sql_secrets_store import (
     SqlSecretsStoreConfiguration,
 )
@@ -340,6 +383,28 @@ logger = get_logger(__name__)
 
 ZENML_SQLITE_DB_FILENAME = "zenml.db"
 
+# The structure of the lineage graph of a finished run doesn't change anymore,
+# so it is cached per run and last update of the run.
+_run_graph_cache: LRUCache[Tuple[UUID, datetime], LineageGraph] = LRUCache(
+    maxsize=RUN_GRAPH_CACHE_SIZE
+)
+
+
+def _batches(
+    ids: Sequence[UUID], batch_size: int = BULK_DELETION_BATCH_SIZE
+) -> Iterator[List[UUID]]:
+    """Splits IDs into batches to keep transactions and queries small.
+
+    Args:
+        ids: The IDs to split.
+        batch_size: The maximum number of IDs per batch.
+
+    Yields:
+        The batches of IDs.
+    """
+    for i in range(0, len(ids), batch_size):
+        yield list(ids[i : i + batch_size])
+
 
 class SQLDatabaseDriver(StrEnum):
     """SQL database drivers supported by the SQL ZenML store."""
@@ -754,6 +819,7 @@ class SqlZenStore(BaseZenStore):
     _alembic: Optional[Alembic] = None
     _secrets_store: Optional[BaseSecretsStore] = None
     _backup_secrets_store: Optional[BaseSecretsStore] = None
+    _secret_values_cache: Optional[SecretValuesCache] = None
     _should_send_user_enriched_events: bool = False
 
     @property
@@ -783,6 +849,19 @@ class SqlZenStore(BaseZenStore):
         """
         return self._backup_secrets_store
 
+    @property
+    def secret_values_cache(self) -> SecretValuesCache:
+        """The cache for the secret values fetched from the secrets stores.
+
+        Returns:
+            The secret values cache.
+        """
+        if self._secret_values_cache is None:
+            self._secret_values_cache = SecretValuesCache(
+                ttl_seconds=SECRETS_CACHE_TTL_SECONDS
+            )
+        return self._secret_values_cache
+
     @property
     def engine(self) -> Engine:
         """The SQLAlchemy engine.
@@ -951,6 +1030,15 @@ class SqlZenStore(BaseZenStore):
         # the same items.
         query = query.order_by(sort_clause, asc(table.id))
 
+        # Eagerly load all relationships that are accessed when converting the
+        # schemas to models, so they don't get lazy-loaded one by one.
+        if not custom_schema_to_model_conversion:
+            query = query.options(
+                *table.get_query_options(
+                    include_metadata=hydrate, include_resources=True
+                )
+            )
+
         # Get the total amount of pages in the database for a given query
         if total == 0:
             total_pages = 1
@@ -2452,8 +2540,12 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             artifact_version = session.exec(
-                select(ArtifactVersionSchema).where(
-                    ArtifactVersionSchema.id == artifact_version_id
+                select(ArtifactVersionSchema)
+                .where(ArtifactVersionSchema.id == artifact_version_id)
+                .options(
+                    *ArtifactVersionSchema.get_query_options(
+                        include_metadata=hydrate, include_resources=hydrate
+                    )
                 )
             ).first()
             if artifact_version is None:
@@ -2618,6 +2710,386 @@ class SqlZenStore(BaseZenStore):
                 )
             session.commit()
 
+    def get_artifact_version_lineage(
+        self,
+        artifact_version_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: int = LINEAGE_DEPTH_DEFAULT,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+        allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+    ) -> ArtifactLineagePage:
+        """Gets the step runs in the lineage of an artifact version.
+
+        The lineage is computed by the database in a single recursive query,
+        so its cost doesn't depend on the number of pipeline runs involved.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+            direction: The direction in which to follow the lineage.
+            max_depth: The maximum number of step runs between the artifact
+                version and a step run in the lineage.
+            page: The page to get.
+            size: The maximum number of entries per page.
+            allowed_pipeline_run_ids: If set, only step runs of these
+                pipeline runs are included in the page and its total. The
+                lineage is still followed through other pipeline runs.
+
+        Returns:
+            A page of the step runs in the lineage, ordered by depth.
+
+        Raises:
+            KeyError: if the artifact version doesn't exist.
+            ValueError: if the depth or pagination parameters are invalid.
+        """
+        if not 1 <= max_depth <= LINEAGE_DEPTH_MAXIMUM:
+            raise ValueError(
+                f"Invalid lineage depth {max_depth}. The depth must be "
+                f"between 1 and {LINEAGE_DEPTH_MAXIMUM}."
+            )
+        if page < 1 or not 1 <= size <= PAGE_SIZE_MAXIMUM:
+            raise ValueError(
+                f"Invalid page {page} of size {size}. The page must be at "
+                f"least 1 and the size between 1 and {PAGE_SIZE_MAXIMUM}."
+            )
+
+        # Downstream, the lineage leads from the step runs that consumed an
+        # artifact version to the consumers of their outputs. Upstream, it
+        # leads from the step runs that produced an artifact version to the
+        # producers of their inputs.
+        link_schema: Type[SQLModel]
+        step_link_schema: Type[SQLModel]
+        if direction == LineageDirection.DOWNSTREAM:
+            link_schema = StepRunInputArtifactSchema
+            step_link_schema = StepRunOutputArtifactSchema
+        else:
+            link_schema = StepRunOutputArtifactSchema
+            step_link_schema = StepRunInputArtifactSchema
+
+        with Session(self.engine) as session:
+            if (
+                session.exec(
+                    select(ArtifactVersionSchema.id).where(
+                        ArtifactVersionSchema.id == artifact_version_id
+                    )
+                ).first()
+                is None
+            ):
+                raise KeyError(
+                    f"Unable to get lineage of artifact version with ID "
+                    f"{artifact_version_id}: No artifact version with this ID "
+                    "found."
+                )
+
+            link = aliased(link_schema)
+            lineage = (
+                select(  # type: ignore[call-overload]
+                    link.step_id, link.artifact_id, literal(1).label("depth")
+                )
+                .where(link.artifact_id == artifact_version_id)
+                .cte(name="lineage", recursive=True)
+            )
+            step_link = aliased(step_link_schema)
+            next_link = aliased(link_schema)
+            lineage = lineage.union(
+                select(
+                    next_link.step_id,
+                    next_link.artifact_id,
+                    lineage.c.depth + 1,
+                )
+                .select_from(lineage)
+                .join(step_link, step_link.step_id == lineage.c.step_id)
+                .join(
+                    next_link, next_link.artifact_id == step_link.artifact_id
+                )
+                .where(lineage.c.depth < max_depth)
+            )
+            # A step run can be reached on paths of different lengths and
+            # through different artifact versions. We only keep the shortest
+            # path and, if there are several, the lowest artifact version ID.
+            depths = (
+                select(  # type: ignore[call-overload]
+                    lineage.c.step_id,
+                    func.min(lineage.c.depth).label("depth"),
+                )
+                .group_by(lineage.c.step_id)
+                .subquery()
+            )
+            entries = (
+                select(  # type: ignore[call-overload]
+                    depths.c.step_id,
+                    func.min(lineage.c.artifact_id).label("artifact_id"),
+                    depths.c.depth,
+                )
+                .select_from(depths)
+                .join(
+                    lineage,
+                    and_(
+                        lineage.c.step_id == depths.c.step_id,
+                        lineage.c.depth == depths.c.depth,
+                    ),
+                )
+                .group_by(depths.c.step_id, depths.c.depth)
+            )
+            if allowed_pipeline_run_ids is not None:
+                entries = entries.join(
+                    StepRunSchema, StepRunSchema.id == depths.c.step_id
+                ).where(
+                    col(StepRunSchema.pipeline_run_id).in_(
+                        allowed_pipeline_run_ids
+                    )
+                )
+            entries = entries.subquery()
+
+            total = session.scalar(
+                select([func.count("*")]).select_from(entries)
+            )
+            total_pages = math.ceil(total / size) if total else 1
+            if page > total_pages:
+                raise ValueError(
+                    f"Invalid page {page}. The requested page size is {size} "
+                    f"and there are a total of {total} items for this query. "
+                    f"The maximum page value therefore is {total_pages}."
+                )
+
+            rows = session.execute(
+                select(  # type: ignore[call-overload]
+                    entries.c.step_id,
+                    StepRunSchema.name,
+                    StepRunSchema.pipeline_run_id,
+                    PipelineRunSchema.name,
+                    entries.c.artifact_id,
+                    entries.c.depth,
+                )
+                .select_from(entries)
+                .join(StepRunSchema, StepRunSchema.id == entries.c.step_id)
+                .join(
+                    PipelineRunSchema,
+                    PipelineRunSchema.id == StepRunSchema.pipeline_run_id,
+                )
+                .order_by(
+                    asc(entries.c.depth),
+                    asc(StepRunSchema.created),
+                    asc(StepRunSchema.id),
+                )
+                .limit(size)
+                .offset((page - 1) * size)
+            ).all()
+
+            model_version_ids: Dict[UUID, List[UUID]] = {}
+            for run_id, model_version_id in session.exec(
+                select(
+                    ModelVersionPipelineRunSchema.pipeline_run_id,
+                    ModelVersionPipelineRunSchema.model_version_id,
+                ).where(
+                    col(ModelVersionPipelineRunSchema.pipeline_run_id).in_(
+                        {row[2] for row in rows}
+                    )
+                )
+            ):
+                model_version_ids.setdefault(run_id, []).append(
+                    model_version_id
+                )
+
+            return ArtifactLineagePage(
+                artifact_version_id=artifact_version_id,
+                direction=direction,
+                max_depth=max_depth,
+                index=page,
+                max_size=size,
+                total_pages=total_pages,
+                total=total,
+                items=[
+                    ArtifactLineageEntry(
+                        step_run_id=step_run_id,
+                        step_run_name=step_run_name,
+                        pipeline_run_id=pipeline_run_id,
+                        pipeline_run_name=pipeline_run_name,
+                        artifact_version_id=artifact_id,
+                        depth=depth,
+                        model_version_ids=model_version_ids.get(
+                            pipeline_run_id, []
+                        ),
+                    )
+                    for (
+                        step_run_id,
+                        step_run_name,
+                        pipeline_run_id,
+                        pipeline_run_name,
+                        artifact_id,
+                        depth,
+                    ) in rows
+                ],
+            )
+
+    def list_artifact_store_references(
+        self, path: str
+    ) -> List[ArtifactStoreReference]:
+        """Lists all referenced URIs inside an artifact store path.
+
+        Args:
+            path: The root path of the artifact store.
+
+        Returns:
+            The URIs of all artifact versions and logs inside the path.
+        """
+        prefix = path.rstrip("/") + "/"
+        with Session(self.engine) as session:
+            artifact_versions = session.exec(
+                select(
+                    ArtifactVersionSchema.uri,
+                    ArtifactVersionSchema.id,
+                    ArtifactVersionSchema.size,
+                ).where(
+                    col(ArtifactVersionSchema.uri).startswith(
+                        prefix, autoescape=True
+                    )
+                )
+            ).all()
+            logs = session.exec(
+                select(LogsSchema.uri).where(
+                    col(LogsSchema.uri).startswith(prefix, autoescape=True)
+                )
+            ).all()
+
+        return [
+            ArtifactStoreReference(
+                uri=uri, artifact_version_id=artifact_version_id, size=size
+            )
+            for uri, artifact_version_id, size in artifact_versions
+        ] + [ArtifactStoreReference(uri=uri) for uri in logs]
+
+    def get_artifact_storage_usage(
+        self, group_by: StorageUsageGroup = StorageUsageGroup.ARTIFACT
+    ) -> List[ArtifactStorageUsage]:
+        """Gets the storage used by artifact versions, grouped by an entity.
+
+        Args:
+            group_by: The entity by which to group the artifact versions. An
+                artifact version counts towards every pipeline that produced
+                it.
+
+        Returns:
+            The storage usage of each entity, ordered by size.
+        """
+        entity_schema: Type[NamedSchema]
+        if group_by == StorageUsageGroup.PIPELINE:
+            # Cached step runs link to the same artifact versions as the
+            # original step run, so each version is only counted once per
+            # pipeline
+            versions = (
+                select(  # type: ignore[call-overload]
+                    col(PipelineRunSchema.pipeline_id).label("entity_id"),
+                    col(StepRunOutputArtifactSchema.artifact_id).label(
+                        "artifact_version_id"
+                    ),
+                )
+                .join(
+                    StepRunSchema,
+                    StepRunSchema.pipeline_run_id == PipelineRunSchema.id,
+                )
+                .join(
+                    StepRunOutputArtifactSchema,
+                    StepRunOutputArtifactSchema.step_id == StepRunSchema.id,
+                )
+                .distinct()
+                .subquery()
+            )
+            entity_schema = PipelineSchema
+        else:
+            if group_by == StorageUsageGroup.ARTIFACT:
+                entity_column = col(ArtifactVersionSchema.artifact_id)
+                entity_schema = ArtifactSchema
+            else:
+                entity_column = col(ArtifactVersionSchema.workspace_id)
+                entity_schema = WorkspaceSchema
+            versions = select(  # type: ignore[call-overload]
+                entity_column.label("entity_id"),
+                col(ArtifactVersionSchema.id).label("artifact_version_id"),
+            ).subquery()
+
+        total_size = func.coalesce(func.sum(ArtifactVersionSchema.size), 0)
+        with Session(self.engine) as session:
+            rows = session.execute(
+                select(  # type: ignore[call-overload]
+                    entity_schema.id,
+                    entity_schema.name,
+                    total_size,
+                    func.count(ArtifactVersionSchema.id),
+                    func.count(ArtifactVersionSchema.size),
+                )
+                .select_from(versions)
+                .join(entity_schema, entity_schema.id == versions.c.entity_id)
+                .join(
+                    ArtifactVersionSchema,
+                    ArtifactVersionSchema.id == versions.c.artifact_version_id,
+                )
+                .group_by(entity_schema.id, entity_schema.name)
+                .order_by(desc(total_size), asc(entity_schema.name))
+            ).all()
+
+        return [
+            ArtifactStorageUsage(
+                id=entity_id,
+                name=name,
+                size=size,
+                artifact_versions=artifact_versions,
+                unknown_size_artifact_versions=artifact_versions
+                - sized_artifact_versions,
+            )
+            for (
+                entity_id,
+                name,
+                size,
+                artifact_versions,
+                sized_artifact_versions,
+            ) in rows
+        ]
+
+    @staticmethod
+    def _delete_artifact_version_batch(
+        artifact_version_ids: List[UUID], session: Session
+    ) -> None:
+        """Deletes artifact versions and all entities that depend on them.
+
+        Args:
+            artifact_version_ids: The IDs of the artifact versions to delete.
+            session: The database session to use.
+        """
+        session.execute(
+            delete(RunMetadataSchema).where(
+                RunMetadataSchema.resource_type
+                == MetadataResourceTypes.ARTIFACT_VERSION.value,
+                col(RunMetadataSchema.resource_id).in_(artifact_version_ids),
+            )
+        )
+        session.execute(
+            delete(TagResourceSchema).where(
+                TagResourceSchema.resource_type
+                == TaggableResourceTypes.ARTIFACT_VERSION.value,
+                col(TagResourceSchema.resource_id).in_(artifact_version_ids),
+            )
+        )
+        session.execute(
+            delete(ArtifactVisualizationSchema).where(
+                col(ArtifactVisualizationSchema.artifact_version_id).in_(
+                    artifact_version_ids
+                )
+            )
+        )
+        session.execute(
+            delete(ModelVersionArtifactSchema).where(
+                col(ModelVersionArtifactSchema.artifact_version_id).in_(
+                    artifact_version_ids
+                )
+            )
+        )
+        session.execute(
+            delete(ArtifactVersionSchema).where(
+                col(ArtifactVersionSchema.id).in_(artifact_version_ids)
+            )
+        )
+
     # ------------------------ Artifact Visualizations ------------------------
 
     def get_artifact_visualization(
@@ -4033,8 +4505,12 @@ class SqlZenStore(BaseZenStore):
         with Session(self.engine) as session:
             # Check if deployment with the given ID exists
             deployment = session.exec(
-                select(PipelineDeploymentSchema).where(
-                    PipelineDeploymentSchema.id == deployment_id
+                select(PipelineDeploymentSchema)
+                .where(PipelineDeploymentSchema.id == deployment_id)
+                .options(
+                    *PipelineDeploymentSchema.get_query_options(
+                        include_metadata=hydrate
+                    )
                 )
             ).first()
             if deployment is None:
@@ -4337,9 +4813,328 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             return self._get_run_schema(
-                run_name_or_id, session=session
+                run_name_or_id,
+                session=session,
+                query_options=PipelineRunSchema.get_query_options(
+                    include_metadata=hydrate, include_resources=hydrate
+                ),
             ).to_model(include_metadata=hydrate, include_resources=hydrate)
 
+    def get_run_graph(self, run_id: UUID) -> LineageGraph:
+        """Gets the lineage graph of a pipeline run.
+
+        Instead of loading the hydrated models of all steps and artifacts,
+        the graph is built from a few queries which only select the columns
+        needed for the graph. The structure of the graphs of finished runs
+        is cached, only their metadata is fetched on each call as it might
+        still be added after a run finished.
+
+        Args:
+            run_id: The ID of the pipeline run.
+
+        Returns:
+            The lineage graph of the pipeline run.
+        """
+        with Session(self.engine) as session:
+            run = self._get_run_schema(run_id, session=session)
+            cache_key = (run.id, run.updated)
+            is_finished = ExecutionStatus(run.status).is_finished
+
+            cached_graph = (
+                _run_graph_cache.get(cache_key) if is_finished else None
+            )
+            if cached_graph is not None:
+                graph = cached_graph.copy(deep=True)
+            else:
+                graph = LineageGraph()
+                graph.generate_nodes_and_edges(
+                    self._get_lineage_step_runs(run.id, session=session)
+                )
+                if is_finished:
+                    _run_graph_cache.set(cache_key, graph.copy(deep=True))
+
+            metadata = self._get_lineage_metadata(run.id, session=session)
+
+        graph.run_metadata = metadata.get(run.id, [])
+        for node in graph.nodes:
+            node.data.metadata = metadata.get(UUID(node.data.execution_id), [])
+        return graph
+
+    def _get_lineage_step_runs(
+        self, run_id: UUID, session: Session
+    ) -> List[LineageStepRun]:
+        """Gets the lineage information of all steps of a pipeline run.
+
+        The metadata of the steps and artifacts is not included.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            session: The database session to use.
+
+        Returns:
+            The lineage information of the steps, in the order in which they
+            were created.
+
+        Raises:
+            RuntimeError: If the configuration of a step can't be loaded.
+        """
+        step_ids = select(StepRunSchema.id).where(
+            StepRunSchema.pipeline_run_id == run_id
+        )
+        steps = session.exec(
+            select(
+                StepRunSchema.id,
+                StepRunSchema.name,
+                StepRunSchema.status,
+                StepRunSchema.deployment_id,
+            )
+            .where(StepRunSchema.pipeline_run_id == run_id)
+            .order_by(asc(StepRunSchema.created))
+        ).all()
+
+        input_rows = session.exec(
+            select(
+                StepRunInputArtifactSchema.step_id,
+                StepRunInputArtifactSchema.name,
+                StepRunInputArtifactSchema.artifact_id,
+            ).where(col(StepRunInputArtifactSchema.step_id).in_(step_ids))
+        ).all()
+        output_rows = session.exec(
+            select(
+                StepRunOutputArtifactSchema.step_id,
+                StepRunOutputArtifactSchema.name,
+                StepRunOutputArtifactSchema.artifact_id,
+            ).where(col(StepRunOutputArtifactSchema.step_id).in_(step_ids))
+        ).all()
+        parent_rows = session.exec(
+            select(
+                StepRunParentsSchema.child_id, StepRunParentsSchema.parent_id
+            ).where(col(StepRunParentsSchema.child_id).in_(step_ids))
+        ).all()
+
+        artifact_ids = {row[2] for row in input_rows + output_rows}
+        artifacts = self._get_lineage_artifact_versions(
+            artifact_ids, session=session
+        )
+
+        step_configurations: Dict[UUID, Dict[str, Step]] = {}
+        inputs: Dict[UUID, Dict[str, LineageArtifactVersion]] = {}
+        outputs: Dict[UUID, Dict[str, LineageArtifactVersion]] = {}
+        parent_step_ids: Dict[UUID, List[UUID]] = {}
+        for step_id, name, artifact_id in input_rows:
+            inputs.setdefault(step_id, {})[name] = artifacts[artifact_id]
+        for step_id, name, artifact_id in output_rows:
+            outputs.setdefault(step_id, {})[name] = artifacts[artifact_id]
+        for child_id, parent_id in parent_rows:
+            parent_step_ids.setdefault(child_id, []).append(parent_id)
+
+        lineage_steps = []
+        for step_id, name, status, deployment_id in steps:
+            # Steps of old runs store their configuration themselves
+            step_configuration = None
+            if deployment_id is None:
+                step_configuration = session.exec(
+                    select(StepRunSchema.step_configuration).where(
+                        StepRunSchema.id == step_id
+                    )
+                ).one()
+
+            if deployment_id is not None:
+                if deployment_id not in step_configurations:
+                    deployment = session.exec(
+                        select(PipelineDeploymentSchema).where(
+                            PipelineDeploymentSchema.id == deployment_id
+                        )
+                    ).one()
+                    step_configurations[deployment_id] = (
+                        deployment.get_step_configurations()
+                    )
+                step = step_configurations[deployment_id][name]
+            elif step_configuration is not None:
+                step = Step.parse_raw(step_configuration)
+            else:
+                raise RuntimeError(
+                    f"Unable to load the configuration of step run {step_id}."
+                )
+
+            lineage_steps.append(
+                LineageStepRun(
+                    id=step_id,
+                    name=name,
+                    status=ExecutionStatus(status),
+                    config=step.config,
+                    inputs=inputs.get(step_id, {}),
+                    outputs=outputs.get(step_id, {}),
+                    parent_step_ids=parent_step_ids.get(step_id, []),
+                    metadata=[],
+                )
+            )
+        return lineage_steps
+
+    def _get_lineage_artifact_versions(
+        self, artifact_ids: Set[UUID], session: Session
+    ) -> Dict[UUID, LineageArtifactVersion]:
+        """Gets the lineage information of artifact versions.
+
+        The metadata of the artifact versions is not included.
+
+        Args:
+            artifact_ids: The IDs of the artifact versions.
+            session: The database session to use.
+
+        Returns:
+            The lineage information of the artifact versions by their ID.
+        """
+        if not artifact_ids:
+            return {}
+
+        rows = session.exec(
+            select(
+                ArtifactVersionSchema.id,
+                ArtifactVersionSchema.type,
+                ArtifactVersionSchema.data_type,
+                ArtifactVersionSchema.uri,
+            ).where(col(ArtifactVersionSchema.id).in_(artifact_ids))
+        ).all()
+
+        # All step runs which output the artifact versions, the producer is
+        # determined the same way as for artifact version responses
+        producer_rows = session.exec(
+            select(
+                StepRunOutputArtifactSchema.artifact_id,
+                StepRunSchema.id,
+                StepRunSchema.status,
+                StepRunSchema.original_step_run_id,
+            )
+            .join(
+                StepRunSchema,
+                col(StepRunSchema.id) == StepRunOutputArtifactSchema.step_id,
+            )
+            .where(
+                col(StepRunOutputArtifactSchema.artifact_id).in_(artifact_ids)
+            )
+            .order_by(asc(StepRunSchema.created))
+        ).all()
+        output_of_step_runs: Dict[
+            UUID, List[Tuple[UUID, ExecutionStatus, Optional[UUID]]]
+        ] = {}
+        for (
+            artifact_id,
+            step_id,
+            status,
+            original_step_run_id,
+        ) in producer_rows:
+            output_of_step_runs.setdefault(artifact_id, []).append(
+                (step_id, ExecutionStatus(status), original_step_run_id)
+            )
+
+        artifacts = {}
+        for artifact_id, type_, data_type, uri in rows:
+            producer_step_run_id = None
+            step_runs = output_of_step_runs.get(artifact_id)
+            if step_runs:
+                original_step_runs = [
+                    step_run
+                    for step_run in step_runs
+                    if step_run[1] == ExecutionStatus.COMPLETED
+                ]
+                if len(original_step_runs) == 1:
+                    producer_step_run_id = original_step_runs[0][0]
+                else:
+                    producer_step_run_id = step_runs[0][2]
+
+            try:
+                data_type_source = Source.parse_raw(data_type)
+            except ValidationError:
+                # This is an old source which was an importable source path
+                data_type_source = Source.from_import_path(data_type)
+
+            artifacts[artifact_id] = LineageArtifactVersion(
+                id=artifact_id,
+                type=type_,
+                data_type=data_type_source.import_path,
+                uri=uri,
+                producer_step_run_id=producer_step_run_id,
+                metadata=[],
+            )
+        return artifacts
+
+    def _get_lineage_metadata(
+        self, run_id: UUID, session: Session
+    ) -> Dict[UUID, List[MetadataTuple]]:
+        """Gets the metadata of a run and all its steps and artifact versions.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            session: The database session to use.
+
+        Returns:
+            The metadata as (key, value, type) tuples by resource ID.
+        """
+        step_ids = select(StepRunSchema.id).where(
+            StepRunSchema.pipeline_run_id == run_id
+        )
+        rows = session.exec(
+            select(
+                RunMetadataSchema.resource_id,
+                RunMetadataSchema.key,
+                RunMetadataSchema.value,
+                RunMetadataSchema.type,
+            )
+            .where(
+                or_(
+                    and_(
+                        RunMetadataSchema.resource_type
+                        == MetadataResourceTypes.PIPELINE_RUN.value,
+                        RunMetadataSchema.resource_id == run_id,
+                    ),
+                    and_(
+                        RunMetadataSchema.resource_type
+                        == MetadataResourceTypes.STEP_RUN.value,
+                        col(RunMetadataSchema.resource_id).in_(step_ids),
+                    ),
+                    and_(
+                        RunMetadataSchema.resource_type
+                        == MetadataResourceTypes.ARTIFACT_VERSION.value,
+                        or_(
+                            col(RunMetadataSchema.resource_id).in_(
+                                select(
+                                    StepRunInputArtifactSchema.artifact_id
+                                ).where(
+                                    col(
+                                        StepRunInputArtifactSchema.step_id
+                                    ).in_(step_ids)
+                                )
+                            ),
+                            col(RunMetadataSchema.resource_id).in_(
+                                select(
+                                    StepRunOutputArtifactSchema.artifact_id
+                                ).where(
+                                    col(
+                                        StepRunOutputArtifactSchema.step_id
+                                    ).in_(step_ids)
+                                )
+                            ),
+                        ),
+                    ),
+                )
+            )
+            .order_by(asc(RunMetadataSchema.created))
+        ).all()
+
+        # Later values of a key replace earlier ones, like in the models
+        metadata: Dict[UUID, Dict[str, MetadataTuple]] = {}
+        for resource_id, key, value, type_ in rows:
+            metadata.setdefault(resource_id, {})[key] = (
+                key,
+                str(json.loads(value)),
+                str(type_),
+            )
+        return {
+            resource_id: list(values.values())
+            for resource_id, values in metadata.items()
+        }
+
     def _replace_placeholder_run(
         self,
         pipeline_run: PipelineRunRequest,
@@ -4617,6 +5412,242 @@ class SqlZenStore(BaseZenStore):
             session.delete(existing_run)
             session.commit()
 
+    def delete_runs(
+        self,
+        runs_filter_model: PipelineRunFilter,
+        delete_artifacts: bool = False,
+        dry_run: bool = False,
+    ) -> BulkDeletionSummary:
+        """Deletes all pipeline runs matching a filter.
+
+        The runs are deleted in batches, each in a separate transaction,
+        together with their step runs, logs, metadata and model version
+        links. The files of the deleted entities are not removed from the
+        artifact stores but returned, so the caller can remove them.
+
+        Args:
+            runs_filter_model: Filter model used to select the runs.
+            delete_artifacts: Whether to also delete the artifact versions
+                produced by the runs that aren't used by any other run.
+            dry_run: If True, nothing is deleted and the summary contains
+                what would be deleted.
+
+        Returns:
+            Summary of the deleted entities and their files.
+        """
+        matching_runs = runs_filter_model.apply_filter(
+            query=select(PipelineRunSchema.id), table=PipelineRunSchema
+        )
+        with Session(self.engine) as session:
+            run_ids = list(set(session.exec(matching_runs).all()))
+
+        summary = BulkDeletionSummary(dry_run=dry_run)
+        produced_artifact_version_ids: Set[UUID] = set()
+
+        for run_id_batch in _batches(run_ids):
+            with Session(self.engine) as session:
+                step_ids = session.exec(
+                    select(StepRunSchema.id).where(
+                        col(StepRunSchema.pipeline_run_id).in_(run_id_batch)
+                    )
+                ).all()
+                summary.pipeline_runs += len(run_id_batch)
+                summary.step_runs += len(step_ids)
+
+                logs = list(
+                    session.exec(
+                        select(
+                            LogsSchema.uri, LogsSchema.artifact_store_id
+                        ).where(
+                            col(LogsSchema.pipeline_run_id).in_(run_id_batch)
+                        )
+                    ).all()
+                )
+                for step_id_batch in _batches(step_ids):
+                    logs += session.exec(
+                        select(
+                            LogsSchema.uri, LogsSchema.artifact_store_id
+                        ).where(col(LogsSchema.step_run_id).in_(step_id_batch))
+                    ).all()
+                    if delete_artifacts:
+                        produced_artifact_version_ids.update(
+                            session.exec(
+                                select(
+                                    StepRunOutputArtifactSchema.artifact_id
+                                ).where(
+                                    col(
+                                        StepRunOutputArtifactSchema.step_id
+                                    ).in_(step_id_batch)
+                                )
+                            ).all()
+                        )
+                summary.files += [
+                    ArtifactStoreFile(uri=uri, artifact_store_id=store_id)
+                    for uri, store_id in logs
+                ]
+
+                if not dry_run:
+                    self._delete_run_batch(
+                        run_ids=run_id_batch,
+                        step_ids=step_ids,
+                        session=session,
+                    )
+                    session.commit()
+
+        if not produced_artifact_version_ids:
+            return summary
+
+        # Artifact versions are only deleted once all runs are deleted, as an
+        # artifact version produced by one run might be used by another one
+        # that is deleted in a later batch
+        deleted_steps = select(StepRunSchema.id).where(
+            col(StepRunSchema.pipeline_run_id).in_(matching_runs)
+        )
+        for artifact_version_batch in _batches(
+            list(produced_artifact_version_ids)
+        ):
+            with Session(self.engine) as session:
+                used_by_inputs = select(
+                    StepRunInputArtifactSchema.artifact_id
+                ).where(
+                    col(StepRunInputArtifactSchema.artifact_id).in_(
+                        artifact_version_batch
+                    )
+                )
+                used_by_outputs = select(
+                    StepRunOutputArtifactSchema.artifact_id
+                ).where(
+                    col(StepRunOutputArtifactSchema.artifact_id).in_(
+                        artifact_version_batch
+                    )
+                )
+                if dry_run:
+                    # The links of the runs haven't actually been deleted
+                    used_by_inputs = used_by_inputs.where(
+                        col(StepRunInputArtifactSchema.step_id).notin_(
+                            deleted_steps
+                        )
+                    )
+                    used_by_outputs = used_by_outputs.where(
+                        col(StepRunOutputArtifactSchema.step_id).notin_(
+                            deleted_steps
+                        )
+                    )
+                used_ids = set(session.exec(used_by_inputs).all())
+                used_ids.update(session.exec(used_by_outputs).all())
+
+                unused_ids = [
+                    artifact_version_id
+                    for artifact_version_id in artifact_version_batch
+                    if artifact_version_id not in used_ids
+                ]
+                summary.artifact_versions += len(unused_ids)
+                summary.files += [
+                    ArtifactStoreFile(uri=uri, artifact_store_id=store_id)
+                    for uri, store_id in session.exec(
+                        select(
+                            ArtifactVersionSchema.uri,
+                            ArtifactVersionSchema.artifact_store_id,
+                        ).where(col(ArtifactVersionSchema.id).in_(unused_ids))
+                    ).all()
+                ]
+
+                if not dry_run:
+                    self._delete_artifact_version_batch(
+                        artifact_version_ids=unused_ids, session=session
+                    )
+                    session.commit()
+
+        return summary
+
+    @staticmethod
+    def _delete_run_batch(
+        run_ids: List[UUID], step_ids: Sequence[UUID], session: Session
+    ) -> None:
+        """Deletes pipeline runs and all entities that depend on them.
+
+        The dependent entities are deleted explicitly instead of relying on
+        ORM or database cascades, so a batch of runs only requires a few
+        statements and works even if foreign keys aren't enforced.
+
+        Args:
+            run_ids: The IDs of the pipeline runs to delete.
+            step_ids: The IDs of all step runs of the pipeline runs.
+            session: The database session to use.
+        """
+        for step_id_batch in _batches(step_ids):
+            session.execute(
+                delete(RunMetadataSchema).where(
+                    RunMetadataSchema.resource_type
+                    == MetadataResourceTypes.STEP_RUN.value,
+                    col(RunMetadataSchema.resource_id).in_(step_id_batch),
+                )
+            )
+            session.execute(
+                delete(LogsSchema).where(
+                    col(LogsSchema.step_run_id).in_(step_id_batch)
+                )
+            )
+            session.execute(
+                delete(StepRunParentsSchema).where(
+                    or_(
+                        col(StepRunParentsSchema.child_id).in_(step_id_batch),
+                        col(StepRunParentsSchema.parent_id).in_(step_id_batch),
+                    )
+                )
+            )
+            session.execute(
+                delete(StepRunInputArtifactSchema).where(
+                    col(StepRunInputArtifactSchema.step_id).in_(step_id_batch)
+                )
+            )
+            session.execute(
+                delete(StepRunOutputArtifactSchema).where(
+                    col(StepRunOutputArtifactSchema.step_id).in_(step_id_batch)
+                )
+            )
+            # Cached step runs of other runs might reference these step runs
+            session.execute(
+                update(StepRunSchema)
+                .where(
+                    col(StepRunSchema.original_step_run_id).in_(step_id_batch)
+                )
+                .values(original_step_run_id=None)
+            )
+            session.execute(
+                delete(StepRunSchema).where(
+                    col(StepRunSchema.id).in_(step_id_batch)
+                )
+            )
+
+        session.execute(
+            delete(RunMetadataSchema).where(
+                RunMetadataSchema.resource_type
+                == MetadataResourceTypes.PIPELINE_RUN.value,
+                col(RunMetadataSchema.resource_id).in_(run_ids),
+            )
+        )
+        session.execute(
+            delete(LogsSchema).where(
+                col(LogsSchema.pipeline_run_id).in_(run_ids)
+            )
+        )
+        session.execute(
+            delete(ModelVersionPipelineRunSchema).where(
+                col(ModelVersionPipelineRunSchema.pipeline_run_id).in_(run_ids)
+            )
+        )
+        session.execute(
+            update(ServiceSchema)
+            .where(col(ServiceSchema.pipeline_run_id).in_(run_ids))
+            .values(pipeline_run_id=None)
+        )
+        session.execute(
+            delete(PipelineRunSchema).where(
+                col(PipelineRunSchema.id).in_(run_ids)
+            )
+        )
+
     def count_runs(self, filter_model: Optional[PipelineRunFilter]) -> int:
         """Count all pipeline runs.
 
@@ -4643,6 +5674,8 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The created run metadata.
         """
+        from zenml.utils.profiling_utils import RESOURCE_USAGE_METADATA_KEY
+
         return_value: List[RunMetadataResponse] = []
         with Session(self.engine) as session:
             for key, value in run_metadata.values.items():
@@ -4662,6 +5695,15 @@ class SqlZenStore(BaseZenStore):
                 return_value.append(
                     run_metadata_schema.to_model(include_metadata=True)
                 )
+
+            if (
+                run_metadata.resource_type == MetadataResourceTypes.STEP_RUN
+                and RESOURCE_USAGE_METADATA_KEY in run_metadata.values
+            ):
+                self._update_pipeline_run_resource_usage(
+                    step_run_id=run_metadata.resource_id, session=session
+                )
+                session.commit()
         return return_value
 
     def get_run_metadata(
@@ -4960,6 +6002,9 @@ class SqlZenStore(BaseZenStore):
                 return False
             return True
 
+        # Invalidate the cached values before and after the write, so that
+        # values which are read while the write is in progress are not cached
+        self.secret_values_cache.invalidate(secret_id)
         try:
             self.secrets_store.store_secret_values(
                 secret_id=secret_id, secret_values=values
@@ -4973,6 +6018,8 @@ class SqlZenStore(BaseZenStore):
                 raise
         else:
             do_backup()
+        finally:
+            self.secret_values_cache.invalidate(secret_id)
 
     def _backup_secret_values(
         self, secret_id: UUID, values: Dict[str, str]
@@ -5002,7 +6049,10 @@ class SqlZenStore(BaseZenStore):
                 )
 
     def _get_secret_values(
-        self, secret_id: UUID, use_backup: bool = True
+        self,
+        secret_id: UUID,
+        use_backup: bool = True,
+        use_cache: bool = False,
     ) -> Dict[str, str]:
         """Gets the values of a secret from the configured secrets store.
 
@@ -5011,14 +6061,22 @@ class SqlZenStore(BaseZenStore):
             use_backup: Whether to use the backup secrets store if the primary
                 secrets store fails to retrieve the values and if a backup
                 secrets store is configured.
+            use_cache: Whether to return recently fetched values from the
+                secret values cache. Values that are read to be modified
+                should never be taken from the cache.
 
         Returns:
             The values of the secret.
 
         # noqa: DAR401
         """
+        if use_cache:
+            cached_values = self.secret_values_cache.get(secret_id)
+            if cached_values is not None:
+                return cached_values
+
         try:
-            return self.secrets_store.get_secret_values(
+            values = self.secrets_store.get_secret_values(
                 secret_id=secret_id,
             )
         except Exception as e:
@@ -5048,6 +6106,8 @@ class SqlZenStore(BaseZenStore):
                                 f"with ID {secret_id} in the primary secrets "
                                 "store. "
                             )
+                    if use_cache:
+                        self.secret_values_cache.set(secret_id, backup_values)
                     return backup_values
                 except Exception:
                     logger.exception(
@@ -5056,6 +6116,65 @@ class SqlZenStore(BaseZenStore):
                     )
             raise
 
+        if use_cache:
+            self.secret_values_cache.set(secret_id, values)
+        return values
+
+    def _get_secrets_values(
+        self, secret_ids: List[UUID]
+    ) -> Dict[UUID, Dict[str, str]]:
+        """Gets the values of multiple secrets from the configured secrets store.
+
+        Recently fetched values are taken from the secret values cache. The
+        values of all other secrets are fetched from the primary secrets store
+        in bulk, falling back to the backup secrets store for secrets that
+        can't be fetched from the primary secrets store.
+
+        Args:
+            secret_ids: The IDs of the secrets to get the values of.
+
+        Returns:
+            The values of the secrets, indexed by secret ID. Secrets without
+            values are not included.
+        """
+        secrets_values: Dict[UUID, Dict[str, str]] = {}
+        missing_ids: List[UUID] = []
+        for secret_id in dict.fromkeys(secret_ids):
+            cached_values = self.secret_values_cache.get(secret_id)
+            if cached_values is None:
+                missing_ids.append(secret_id)
+            else:
+                secrets_values[secret_id] = cached_values
+
+        if not missing_ids:
+            return secrets_values
+
+        try:
+            fetched_values = self.secrets_store.get_secrets_values(
+                secret_ids=missing_ids
+            )
+        except Exception:
+            logger.exception(
+                "Failed to get the secret values of multiple secrets from the "
+                "primary secrets store. Fetching them individually instead."
+            )
+            fetched_values = {}
+
+        for secret_id in missing_ids:
+            if secret_id in fetched_values:
+                values = fetched_values[secret_id]
+                self.secret_values_cache.set(secret_id, values)
+            else:
+                try:
+                    values = self._get_secret_values(
+                        secret_id=secret_id, use_cache=True
+                    )
+                except KeyError:
+                    continue
+            secrets_values[secret_id] = values
+
+        return secrets_values
+
     def _get_backup_secret_values(self, secret_id: UUID) -> Dict[str, str]:
         """Gets the backup values of a secret from the configured backup secrets store.
 
@@ -5162,6 +6281,9 @@ class SqlZenStore(BaseZenStore):
                 return False
             return True
 
+        # Invalidate the cached values before and after the write, so that
+        # values which are read while the write is in progress are not cached
+        self.secret_values_cache.invalidate(secret_id)
         try:
             self.secrets_store.update_secret_values(
                 secret_id=secret_id, secret_values=existing_values
@@ -5175,6 +6297,8 @@ class SqlZenStore(BaseZenStore):
                 raise
         else:
             do_backup()
+        finally:
+            self.secret_values_cache.invalidate(secret_id)
 
         return existing_values
 
@@ -5220,6 +6344,9 @@ class SqlZenStore(BaseZenStore):
 
             return True
 
+        # Invalidate the cached values before and after the write, so that
+        # values which are read while the write is in progress are not cached
+        self.secret_values_cache.invalidate(secret_id)
         try:
             self.secrets_store.delete_secret_values(secret_id=secret_id)
         except KeyError:
@@ -5235,6 +6362,8 @@ class SqlZenStore(BaseZenStore):
                 raise
         else:
             do_delete_backup()
+        finally:
+            self.secret_values_cache.invalidate(secret_id)
 
     def _delete_backup_secret_values(
         self,
@@ -5331,10 +6460,122 @@ class SqlZenStore(BaseZenStore):
                 raise KeyError(f"Secret with ID {secret_id} not found.")
             secret_model = secret_in_db.to_model(include_metadata=hydrate)
 
-        secret_model.set_secrets(self._get_secret_values(secret_id=secret_id))
+        secret_model.set_secrets(
+            self._get_secret_values(secret_id=secret_id, use_cache=True)
+        )
 
         return secret_model
 
+    def get_secrets(
+        self, secret_ids: List[UUID], hydrate: bool = True
+    ) -> List[SecretResponse]:
+        """Get multiple secrets, including their values.
+
+        The secret values are fetched from the secrets store in bulk.
+
+        Args:
+            secret_ids: IDs of the secrets.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets. Secrets that don't exist or have no values are not
+            included.
+        """
+        if not secret_ids:
+            return []
+
+        with Session(self.engine) as session:
+            secrets_in_db = session.exec(
+                select(SecretSchema).where(
+                    col(SecretSchema.id).in_(secret_ids)
+                )
+            ).all()
+            secret_models = [
+                secret_in_db.to_model(include_metadata=hydrate)
+                for secret_in_db in secrets_in_db
+            ]
+
+        secrets_values = self._get_secrets_values(
+            [secret.id for secret in secret_models]
+        )
+
+        secrets: List[SecretResponse] = []
+        for secret in secret_models:
+            if secret.id not in secrets_values:
+                continue
+            secret.set_secrets(secrets_values[secret.id])
+            secrets.append(secret)
+        return secrets
+
+    def get_secrets_by_name(
+        self,
+        names: List[str],
+        workspace_id: UUID,
+        user_id: UUID,
+        scope: Optional[SecretScope] = None,
+        hydrate: bool = True,
+    ) -> List[SecretResponse]:
+        """Get multiple secrets by their exact names, including their values.
+
+        All names are resolved with a single query and the secret values are
+        fetched from the secrets store in bulk. If no scope is given, a
+        user-scoped secret takes precedence over a workspace-scoped secret
+        with the same name.
+
+        Args:
+            names: The names of the secrets.
+            workspace_id: The ID of the workspace of the secrets.
+            user_id: The ID of the user whose user-scoped secrets to get.
+            scope: The scope of the secrets. If not set, secrets in both
+                scopes are searched.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets. Names for which no secret with values exists are not
+            included.
+        """
+        if not names:
+            return []
+
+        # Scopes to search in order of priority
+        search_scopes = (
+            [SecretScope.USER, SecretScope.WORKSPACE]
+            if scope is None
+            else [scope]
+        )
+
+        with Session(self.engine) as session:
+            candidates = session.exec(
+                select(SecretSchema)
+                .where(col(SecretSchema.name).in_(set(names)))
+                .where(
+                    col(SecretSchema.scope).in_(
+                        [search_scope.value for search_scope in search_scopes]
+                    )
+                )
+                .where(SecretSchema.workspace_id == workspace_id)
+                .where(
+                    or_(
+                        SecretSchema.scope != SecretScope.USER.value,
+                        SecretSchema.user_id == user_id,
+                    )
+                )
+                .order_by(asc(SecretSchema.created))
+            ).all()
+
+        secret_ids: Dict[str, UUID] = {}
+        for search_scope in reversed(search_scopes):
+            for candidate in reversed(candidates):
+                if candidate.scope == search_scope:
+                    # Earlier secrets and higher priority scopes win
+                    secret_ids[candidate.name] = candidate.id
+
+        return self.get_secrets(
+            secret_ids=list(secret_ids.values()), hydrate=hydrate
+        )
+
     def list_secrets(
         self, secret_filter_model: SecretFilter, hydrate: bool = False
     ) -> Page[SecretResponse]:
@@ -5442,7 +6683,9 @@ class SqlZenStore(BaseZenStore):
             )
             secret_model.set_secrets(updated_values)
         else:
-            secret_model.set_secrets(self._get_secret_values(secret_id))
+            secret_model.set_secrets(
+                self._get_secret_values(secret_id, use_cache=True)
+            )
 
         return secret_model
 
@@ -6496,66 +7739,13 @@ class SqlZenStore(BaseZenStore):
             filter_model=filter_model
         ).items
 
-        resource_list: List[ServiceConnectorResourcesModel] = []
-
-        for connector in service_connectors:
-            if not service_connector_registry.is_registered(connector.type):
-                # For connectors that we can instantiate, i.e. those that have a
-                # connector type available locally, we return complete
-                # information about the resources that they have access to.
-                #
-                # For those that are not locally available, we only return
-                # rudimentary information extracted from the connector model
-                # without actively trying to discover the resources that they
-                # have access to.
-
-                if resource_id and connector.resource_id != resource_id:
-                    # If an explicit resource ID is required, the connector
-                    # has to be configured with it.
-                    continue
-
-                resources = (
-                    ServiceConnectorResourcesModel.from_connector_model(
-                        connector,
-                        resource_type=resource_type,
-                    )
-                )
-                for r in resources.resources:
-                    if not r.resource_ids:
-                        r.error = (
-                            f"The service '{connector.type}' connector type is "
-                            "not available."
-                        )
-
-            else:
-                try:
-                    connector_instance = (
-                        service_connector_registry.instantiate_connector(
-                            model=connector
-                        )
-                    )
-
-                    resources = connector_instance.verify(
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        list_resources=True,
-                    )
-                except (ValueError, AuthorizationException) as e:
-                    error = (
-                        f'Failed to fetch {resource_type or "available"} '
-                        f"resources from service connector {connector.name}/"
-                        f"{connector.id}: {e}"
-                    )
-                    # Log an exception if debug logging is enabled
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception(error)
-                    else:
-                        logger.error(error)
-                    continue
-
-            resource_list.append(resources)
-
-        return resource_list
+        # Connectors are verified concurrently, because each verification
+        # usually involves API calls to the remote service
+        return verify_service_connectors(
+            service_connectors,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
 
     def list_service_connector_types(
         self,
@@ -7027,7 +8217,13 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             step_run = session.exec(
-                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+                select(StepRunSchema)
+                .where(StepRunSchema.id == step_run_id)
+                .options(
+                    *StepRunSchema.get_query_options(
+                        include_metadata=hydrate, include_resources=hydrate
+                    )
+                )
             ).first()
             if step_run is None:
                 raise KeyError(
@@ -7343,7 +8539,7 @@ class SqlZenStore(BaseZenStore):
 
         # Deployment always exists for pipeline runs of newer versions
         assert pipeline_run.deployment
-        num_steps = len(pipeline_run.deployment.to_model().step_configurations)
+        num_steps = pipeline_run.deployment.get_step_count()
         new_status = get_pipeline_run_status(
             step_statuses=[step_run.status for step_run in step_runs],
             num_steps=num_steps,
@@ -7393,6 +8589,122 @@ class SqlZenStore(BaseZenStore):
             pipeline_run.update(run_update)
             session.add(pipeline_run)
 
+            if new_status.is_finished:
+                self._aggregate_step_resource_usage(
+                    pipeline_run=pipeline_run,
+                    step_run_ids=[step_run.id for step_run in step_runs],
+                    session=session,
+                )
+
+    def _update_pipeline_run_resource_usage(
+        self, step_run_id: UUID, session: Session
+    ) -> None:
+        """Updates the resource usage of a finished pipeline run.
+
+        Args:
+            step_run_id: The ID of the step run whose resource usage was
+                stored.
+            session: The database session to use.
+        """
+        step_run = session.exec(
+            select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+        ).first()
+        if step_run is None:
+            return
+
+        pipeline_run = session.exec(
+            select(PipelineRunSchema).where(
+                PipelineRunSchema.id == step_run.pipeline_run_id
+            )
+        ).one()
+        if not ExecutionStatus(pipeline_run.status).is_finished:
+            # The resource usage is aggregated once the run finishes
+            return
+
+        step_run_ids = session.exec(
+            select(StepRunSchema.id).where(
+                StepRunSchema.pipeline_run_id == pipeline_run.id
+            )
+        ).all()
+        self._aggregate_step_resource_usage(
+            pipeline_run=pipeline_run,
+            step_run_ids=list(step_run_ids),
+            session=session,
+        )
+
+    @staticmethod
+    def _aggregate_step_resource_usage(
+        pipeline_run: PipelineRunSchema,
+        step_run_ids: List[UUID],
+        session: Session,
+    ) -> None:
+        """Aggregates the profiled resource usage of steps of a pipeline run.
+
+        The aggregated resource usage is stored as metadata of the pipeline
+        run once it finishes. It is recomputed whenever the resource usage of
+        a step of a finished pipeline run is stored, so steps which finish
+        after a pipeline run failed are included as well.
+
+        Args:
+            pipeline_run: The finished pipeline run.
+            step_run_ids: The IDs of all step runs of the pipeline run.
+            session: The database session to use.
+        """
+        from zenml.utils.profiling_utils import (
+            RESOURCE_USAGE_METADATA_KEY,
+            aggregate_resource_usage,
+        )
+
+        step_metadata = session.exec(
+            select(RunMetadataSchema)
+            .where(
+                RunMetadataSchema.resource_type
+                == MetadataResourceTypes.STEP_RUN.value
+            )
+            .where(col(RunMetadataSchema.resource_id).in_(step_run_ids))
+            .where(RunMetadataSchema.key == RESOURCE_USAGE_METADATA_KEY)
+            .order_by(asc(RunMetadataSchema.created))
+        ).all()
+        if not step_metadata:
+            return
+
+        # Only the latest resource usage of each step run is aggregated
+        usages = {
+            metadata.resource_id: json.loads(metadata.value)
+            for metadata in step_metadata
+        }
+        value = json.dumps(
+            aggregate_resource_usage(
+                [usage for usage in usages.values() if isinstance(usage, dict)]
+            )
+        )
+
+        existing_metadata = session.exec(
+            select(RunMetadataSchema)
+            .where(
+                RunMetadataSchema.resource_type
+                == MetadataResourceTypes.PIPELINE_RUN.value
+            )
+            .where(RunMetadataSchema.resource_id == pipeline_run.id)
+            .where(RunMetadataSchema.key == RESOURCE_USAGE_METADATA_KEY)
+        ).all()
+        if [metadata.value for metadata in existing_metadata] == [value]:
+            return
+        for metadata in existing_metadata:
+            session.delete(metadata)
+
+        session.add(
+            RunMetadataSchema(
+                workspace_id=pipeline_run.workspace_id,
+                user_id=pipeline_run.user_id,
+                resource_id=pipeline_run.id,
+                resource_type=MetadataResourceTypes.PIPELINE_RUN.value,
+                key=RESOURCE_USAGE_METADATA_KEY,
+                value=value,
+                type=MetadataTypeEnum.DICT,
+            )
+        )
+
     # --------------------------- Triggers ---------------------------
 
     @track_decorator(AnalyticsEvent.CREATED_TRIGGER)
@@ -8489,6 +9801,7 @@ class SqlZenStore(BaseZenStore):
         schema_class: Type[AnyNamedSchema],
         schema_name: str,
         session: Session,
+        query_options: Sequence[ExecutableOption] = (),
     ) -> AnyNamedSchema:
         """Query a schema by its 'name' or 'id' field.
 
@@ -8498,6 +9811,7 @@ class SqlZenStore(BaseZenStore):
             schema_name: The name of the schema used for error messages.
                 E.g., "workspace".
             session: The database session to use.
+            query_options: Loader options to apply to the query.
 
         Returns:
             The schema object.
@@ -8526,7 +9840,7 @@ class SqlZenStore(BaseZenStore):
             )
 
         schema = session.exec(
-            select(schema_class).where(filter_params)
+            select(schema_class).where(filter_params).options(*query_options)
         ).first()
 
         if schema is None:
@@ -8622,6 +9936,7 @@ class SqlZenStore(BaseZenStore):
         self,
         run_name_or_id: Union[str, UUID],
         session: Session,
+        query_options: Sequence[ExecutableOption] = (),
     ) -> PipelineRunSchema:
         """Gets a run schema by name or ID.
 
@@ -8631,6 +9946,7 @@ class SqlZenStore(BaseZenStore):
         Args:
             run_name_or_id: The name or ID of the run to get.
             session: The database session to use.
+            query_options: Loader options to apply to the query.
 
         Returns:
             The run schema.
@@ -8640,6 +9956,7 @@ class SqlZenStore(BaseZenStore):
             schema_class=PipelineRunSchema,
             schema_name="run",
             session=session,
+            query_options=query_options,
         )
 
     def _get_model_schema(
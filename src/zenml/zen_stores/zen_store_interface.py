@@ -17,6 +17,12 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
+from zenml.constants import (
+    LINEAGE_DEPTH_DEFAULT,
+    PAGE_SIZE_DEFAULT,
+    PAGINATION_STARTING_PAGE,
+)
+from zenml.enums import LineageDirection, SecretScope, StorageUsageGroup
 from zenml.models import (
     APIKeyFilter,
     APIKeyRequest,
@@ -24,14 +30,18 @@ from zenml.models import (
     APIKeyRotateRequest,
     APIKeyUpdate,
     ArtifactFilter,
+    ArtifactLineagePage,
     ArtifactRequest,
     ArtifactResponse,
+    ArtifactStorageUsage,
+    ArtifactStoreReference,
     ArtifactUpdate,
     ArtifactVersionFilter,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVersionUpdate,
     ArtifactVisualizationResponse,
+    BulkDeletionSummary,
     CodeReferenceResponse,
     CodeRepositoryFilter,
     CodeRepositoryRequest,
@@ -646,6 +656,69 @@ class ZenStoreInterface(ABC):
             only_versions: Only delete artifact versions, keeping artifacts
         """
 
+    @abstractmethod
+    def get_artifact_version_lineage(
+        self,
+        artifact_version_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: int = LINEAGE_DEPTH_DEFAULT,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> ArtifactLineagePage:
+        """Gets the step runs in the lineage of an artifact version.
+
+        The lineage spans across pipeline runs: Downstream, it contains all
+        step runs that consumed the artifact version or any artifact version
+        produced from it. Upstream, it contains all step runs that produced
+        the artifact version or any artifact version it was produced from.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+            direction: The direction in which to follow the lineage.
+            max_depth: The maximum number of step runs between the artifact
+                version and a step run in the lineage.
+            page: The page to get.
+            size: The maximum number of entries per page.
+
+        Returns:
+            A page of the step runs in the lineage, ordered by depth.
+
+        Raises:
+            KeyError: if the artifact version doesn't exist.
+        """
+
+    @abstractmethod
+    def list_artifact_store_references(
+        self, path: str
+    ) -> List[ArtifactStoreReference]:
+        """Lists all referenced URIs inside an artifact store path.
+
+        URIs are matched by their path instead of the ID of their artifact
+        store, so URIs of all artifact stores that share the path are
+        included.
+
+        Args:
+            path: The root path of the artifact store.
+
+        Returns:
+            The URIs of all artifact versions and logs inside the path.
+        """
+
+    @abstractmethod
+    def get_artifact_storage_usage(
+        self, group_by: StorageUsageGroup = StorageUsageGroup.ARTIFACT
+    ) -> List[ArtifactStorageUsage]:
+        """Gets the storage used by artifact versions, grouped by an entity.
+
+        Args:
+            group_by: The entity by which to group the artifact versions. An
+                artifact version counts towards every pipeline that produced
+                it.
+
+        Returns:
+            The storage usage of each entity, ordered by size.
+        """
+
     # -------------------- Artifact Visualization --------------------
 
     @abstractmethod
@@ -1404,6 +1477,29 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def delete_runs(
+        self,
+        runs_filter_model: PipelineRunFilter,
+        delete_artifacts: bool = False,
+        dry_run: bool = False,
+    ) -> BulkDeletionSummary:
+        """Deletes all pipeline runs matching a filter.
+
+        The files of the deleted entities are not removed from the artifact
+        stores but returned, so the caller can remove them.
+
+        Args:
+            runs_filter_model: Filter model used to select the runs.
+            delete_artifacts: Whether to also delete the artifact versions
+                produced by the runs that aren't used by any other run.
+            dry_run: If True, nothing is deleted and the summary contains
+                what would be deleted.
+
+        Returns:
+            Summary of the deleted entities and their files.
+        """
+
     @abstractmethod
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequest
@@ -1598,6 +1694,50 @@ class ZenStoreInterface(ABC):
             KeyError: if the secret does not exist.
         """
 
+    @abstractmethod
+    def get_secrets(
+        self, secret_ids: List[UUID], hydrate: bool = True
+    ) -> List[SecretResponse]:
+        """Get multiple secrets, including their values.
+
+        Args:
+            secret_ids: IDs of the secrets.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets. Secrets that don't exist or have no values are not
+            included.
+        """
+
+    @abstractmethod
+    def get_secrets_by_name(
+        self,
+        names: List[str],
+        workspace_id: UUID,
+        user_id: UUID,
+        scope: Optional[SecretScope] = None,
+        hydrate: bool = True,
+    ) -> List[SecretResponse]:
+        """Get multiple secrets by their exact names, including their values.
+
+        If no scope is given, a user-scoped secret takes precedence over a
+        workspace-scoped secret with the same name.
+
+        Args:
+            names: The names of the secrets.
+            workspace_id: The ID of the workspace of the secrets.
+            user_id: The ID of the user whose user-scoped secrets to get.
+            scope: The scope of the secrets. If not set, secrets in both
+                scopes are searched.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The secrets. Names for which no secret with values exists are not
+            included.
+        """
+
     @abstractmethod
     def list_secrets(
         self, secret_filter_model: SecretFilter, hydrate: bool = False
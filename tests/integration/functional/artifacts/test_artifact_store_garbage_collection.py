@@ -0,0 +1,176 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+import time
+from uuid import uuid4
+
+from typing_extensions import Annotated
+
+from zenml import pipeline, save_artifact, step
+from zenml.client import Client
+from zenml.constants import GARBAGE_COLLECTION_MIN_LOG_AGE_SECONDS
+from zenml.enums import StorageUsageGroup
+
+
+@step(enable_cache=False)
+def gc_producer_step() -> Annotated[str, "gc_output"]:
+    return "a" * 1000
+
+
+@pipeline(enable_step_logs=True)
+def gc_pipeline():
+    gc_producer_step()
+
+
+def _write_file(path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("orphaned")
+
+
+def _age_file(path: str) -> None:
+    modification_time = time.time() - GARBAGE_COLLECTION_MIN_LOG_AGE_SECONDS
+    os.utime(path, (modification_time, modification_time))
+
+
+def test_artifact_version_size_is_stored(clean_client: Client):
+    """Tests that the size of saved artifact versions is stored."""
+    gc_pipeline()
+
+    artifact_version = clean_client.get_artifact_version("gc_output")
+    assert artifact_version.size and artifact_version.size >= 1000
+
+
+def test_garbage_collection_finds_and_deletes_orphans(clean_client: Client):
+    """Tests that only unreferenced step files are orphaned."""
+    gc_pipeline()
+    gc_pipeline()
+    runs = clean_client.list_pipeline_runs(sort_by="asc:created").items
+    deleted_run, kept_run = runs
+    deleted_uri = deleted_run.steps["gc_producer_step"].output.uri
+    deleted_logs_uri = deleted_run.steps["gc_producer_step"].logs.uri
+    kept_uri = kept_run.steps["gc_producer_step"].output.uri
+
+    # Delete the run and its artifact version without removing the files
+    clean_client.delete_pipeline_run(deleted_run.id)
+    clean_client.prune_artifacts(delete_from_artifact_store=False)
+
+    path = clean_client.active_stack.artifact_store.path
+    unknown_step_run_uri = os.path.join(
+        path, "some_step", "output", str(uuid4()), "0123abcd"
+    )
+    unknown_logs_uri = os.path.join(path, "some_step", "logs", "x.log")
+    foreign_uri = os.path.join(path, "mlruns", "0", "meta.yaml")
+    for file_path in [
+        os.path.join(unknown_step_run_uri, "data.txt"),
+        unknown_logs_uri,
+        foreign_uri,
+    ]:
+        _write_file(file_path)
+    for logs_uri in [deleted_logs_uri, unknown_logs_uri]:
+        _age_file(logs_uri)
+
+    report = clean_client.garbage_collect_artifact_store()
+
+    assert report.dry_run
+    assert sorted(report.orphaned_files) == sorted(
+        [deleted_uri, deleted_logs_uri, unknown_step_run_uri, unknown_logs_uri]
+    )
+    assert report.orphaned_bytes and report.orphaned_bytes >= 1000
+    assert report.deleted_files == 0
+    assert os.path.exists(deleted_uri)
+
+    report = clean_client.garbage_collect_artifact_store(delete=True)
+
+    assert report.deleted_files == 4
+    assert not report.failed_files
+    for uri in report.orphaned_files:
+        assert not os.path.exists(uri)
+    assert os.path.exists(kept_uri)
+    assert os.path.exists(foreign_uri)
+    assert not clean_client.garbage_collect_artifact_store().orphaned_files
+
+
+def test_garbage_collection_keeps_recent_log_files(clean_client: Client):
+    """Tests that log files of steps which might still run are kept."""
+    path = clean_client.active_stack.artifact_store.path
+    logs_uri = os.path.join(path, "some_step", "logs", "x.log")
+    _write_file(logs_uri)
+
+    report = clean_client.garbage_collect_artifact_store(delete=True)
+
+    assert not report.orphaned_files
+    assert os.path.exists(logs_uri)
+
+    _age_file(logs_uri)
+    report = clean_client.garbage_collect_artifact_store(delete=True)
+
+    assert report.orphaned_files == [logs_uri]
+    assert not os.path.exists(logs_uri)
+
+
+def test_garbage_collection_stores_missing_sizes(clean_client: Client):
+    """Tests that garbage collection stores unknown artifact version sizes."""
+    artifact_version = save_artifact(
+        "a" * 1000, name="unsized", extract_metadata=False
+    )
+    assert artifact_version.size is None
+
+    report = clean_client.garbage_collect_artifact_store()
+
+    assert report.sized_artifact_versions == 1
+    size = clean_client.get_artifact_version("unsized").size
+    assert size and size >= 1000
+
+    report = clean_client.garbage_collect_artifact_store()
+    assert report.sized_artifact_versions == 0
+
+
+def test_artifact_storage_usage(clean_client: Client):
+    """Tests that the storage usage is aggregated by entity."""
+    gc_pipeline()
+    gc_pipeline()
+    save_artifact("a" * 1000, name="unsized", extract_metadata=False)
+    sizes = [
+        version.size
+        for version in clean_client.list_artifact_versions(
+            name="gc_output"
+        ).items
+    ]
+
+    by_artifact = {
+        usage.name: usage
+        for usage in clean_client.get_artifact_storage_usage()
+    }
+    assert by_artifact["gc_output"].size == sum(sizes)
+    assert by_artifact["gc_output"].artifact_versions == 2
+    assert by_artifact["gc_output"].unknown_size_artifact_versions == 0
+    assert by_artifact["unsized"].size == 0
+    assert by_artifact["unsized"].unknown_size_artifact_versions == 1
+
+    (by_pipeline,) = clean_client.get_artifact_storage_usage(
+        group_by=StorageUsageGroup.PIPELINE
+    )
+    assert by_pipeline.name == "gc_pipeline"
+    assert by_pipeline.size == sum(sizes)
+    assert by_pipeline.artifact_versions == 2
+
+    (by_workspace,) = clean_client.get_artifact_storage_usage(
+        group_by=StorageUsageGroup.WORKSPACE
+    )
+    assert by_workspace.id == clean_client.active_workspace.id
+    assert by_workspace.size == sum(sizes)
+    assert by_workspace.artifact_versions == 3
+    assert by_workspace.unknown_size_artifact_versions == 1
@@ -0,0 +1,184 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import UUID, uuid4
+
+import pytest
+from typing_extensions import Annotated
+
+from zenml import pipeline, step
+from zenml.artifacts.external_artifact import ExternalArtifact
+from zenml.client import Client
+from zenml.enums import LineageDirection
+from zenml.model.model import Model
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+
+@step(enable_cache=False)
+def dataset_producer_step() -> Annotated[int, "dataset"]:
+    return 1
+
+
+@step(enable_cache=False)
+def plus_one_step(a: int) -> int:
+    return a + 1
+
+
+@step(enable_cache=False)
+def sum_step(a: int, b: int) -> int:
+    return a + b
+
+
+@pipeline
+def producer_pipeline():
+    dataset_producer_step()
+
+
+@pipeline(model=Model(name="lineage_model"))
+def consumer_pipeline(dataset_id: UUID):
+    a = plus_one_step(a=ExternalArtifact(id=dataset_id), id="first")
+    plus_one_step(a, id="second")
+
+
+@pipeline
+def diamond_pipeline(dataset_id: UUID):
+    dataset = ExternalArtifact(id=dataset_id)
+    a = plus_one_step(a=dataset, id="left")
+    b = plus_one_step(a=dataset, id="right")
+    sum_step(a, b)
+
+
+@pytest.fixture
+def dataset_id(clean_client: Client) -> UUID:
+    """Runs a producer pipeline and two consumer pipelines of its dataset."""
+    producer_pipeline()
+    dataset_id = clean_client.get_artifact_version("dataset").id
+    consumer_pipeline(dataset_id)
+    consumer_pipeline(dataset_id)
+    return dataset_id
+
+
+def test_downstream_lineage_spans_runs(clean_client: Client, dataset_id):
+    """Tests that the downstream lineage contains the steps of all runs."""
+    lineage = clean_client.get_artifact_version_lineage("dataset")
+
+    assert lineage.total == 4
+    assert [(e.step_run_name, e.depth) for e in lineage.items] == [
+        ("first", 1),
+        ("first", 1),
+        ("second", 2),
+        ("second", 2),
+    ]
+    assert lineage.items[0].artifact_version_id == dataset_id
+
+    runs = consumer_pipeline.model.runs
+    assert {e.pipeline_run_id for e in lineage.items} == {r.id for r in runs}
+    for entry in lineage.items:
+        run = clean_client.get_pipeline_run(entry.pipeline_run_id)
+        assert entry.pipeline_run_name == run.name
+        assert entry.model_version_ids == [run.model_version.id]
+
+
+def test_upstream_lineage(clean_client: Client, dataset_id):
+    """Tests that the upstream lineage leads back to the producer step."""
+    output = consumer_pipeline.model.last_run.steps["second"].output
+
+    lineage = clean_client.get_artifact_version_lineage(
+        output.id, direction=LineageDirection.UPSTREAM
+    )
+
+    assert [(e.step_run_name, e.depth) for e in lineage.items] == [
+        ("second", 1),
+        ("first", 2),
+        ("dataset_producer_step", 3),
+    ]
+    assert lineage.items[0].artifact_version_id == output.id
+    assert lineage.items[-1].artifact_version_id == dataset_id
+    assert lineage.items[-1].model_version_ids == []
+
+
+def test_lineage_depth_and_pagination(clean_client: Client, dataset_id):
+    """Tests that the lineage is limited by depth and paginated."""
+    lineage = clean_client.get_artifact_version_lineage(
+        dataset_id, max_depth=1
+    )
+    assert lineage.total == 2
+    assert {e.depth for e in lineage.items} == {1}
+
+    first_page = clean_client.get_artifact_version_lineage(dataset_id, size=3)
+    second_page = clean_client.get_artifact_version_lineage(
+        dataset_id, page=2, size=3
+    )
+    assert first_page.total_pages == second_page.total_pages == 2
+    assert len(first_page.items) == 3
+    assert len(second_page.items) == 1
+    assert (
+        len({e.step_run_id for e in first_page.items + second_page.items}) == 4
+    )
+
+    with pytest.raises(ValueError):
+        clean_client.get_artifact_version_lineage(dataset_id, page=3, size=3)
+    with pytest.raises(ValueError):
+        clean_client.get_artifact_version_lineage(dataset_id, max_depth=0)
+
+
+def test_lineage_excludes_step_runs_of_unallowed_runs_before_paginating(
+    clean_client: Client, dataset_id
+):
+    """Tests that hidden pipeline runs are neither listed nor counted."""
+    zen_store = clean_client.zen_store
+    if not isinstance(zen_store, SqlZenStore):
+        pytest.skip("Filtering by allowed runs is only done by the server.")
+
+    allowed_run = clean_client.list_pipeline_runs(
+        pipeline_id=clean_client.get_pipeline("consumer_pipeline").id,
+        sort_by="asc:created",
+    ).items[0]
+    lineage = zen_store.get_artifact_version_lineage(
+        dataset_id, size=1, allowed_pipeline_run_ids={allowed_run.id}
+    )
+
+    assert lineage.total == lineage.total_pages == 2
+    assert len(lineage.items) == 1
+    assert lineage.items[0].pipeline_run_id == allowed_run.id
+
+
+def test_step_runs_with_several_lineage_inputs_are_listed_once(
+    clean_client: Client,
+):
+    """Tests that step runs consuming several lineage artifacts appear once."""
+    producer_pipeline()
+    dataset_id = clean_client.get_artifact_version("dataset").id
+    run = diamond_pipeline(dataset_id)
+    run = clean_client.get_pipeline_run(run.id)
+
+    lineage = clean_client.get_artifact_version_lineage(dataset_id)
+
+    assert lineage.total == 3
+    assert sorted((e.step_run_name, e.depth) for e in lineage.items) == [
+        ("left", 1),
+        ("right", 1),
+        ("sum_step", 2),
+    ]
+    sum_entry = lineage.items[-1]
+    assert sum_entry.artifact_version_id in {
+        run.steps["left"].output.id,
+        run.steps["right"].output.id,
+    }
+
+
+def test_lineage_of_unknown_artifact_version(clean_client: Client):
+    """Tests that getting the lineage of a missing artifact version fails."""
+    with pytest.raises(KeyError):
+        clean_client.get_artifact_version_lineage(uuid4())
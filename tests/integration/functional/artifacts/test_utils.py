@@ -286,6 +286,49 @@ def test_download_artifact_files_from_response(
     shutil.rmtree(tmp_path)
 
 
+def test_streaming_artifact_files_as_zip(tmp_path, mocker, clean_client):
+    """Test that artifact directories are streamed as zip archives."""
+    from zenml.artifacts import utils as artifact_utils
+
+    mocker.patch.object(artifact_utils, "ARTIFACT_DOWNLOAD_CHUNK_SIZE", 1000)
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "streaming_test")
+    files = {
+        "data.json": b"7",
+        "nested/large.bin": os.urandom(10_000),
+        "nested/deeper/empty.txt": b"",
+    }
+    for relative_path, content in files.items():
+        path = os.path.join(uri, relative_path)
+        artifact_store.makedirs(os.path.dirname(path))
+        with artifact_store.open(path, "wb") as f:
+            f.write(content)
+
+    for compression_level in [None, 0, 9]:
+        zipfile_path = os.path.join(tmp_path, f"{compression_level}.zip")
+        with open(zipfile_path, "wb") as f:
+            for chunk in artifact_utils.stream_artifact_files_as_zip(
+                artifact_store=artifact_store,
+                uri=uri,
+                compression_level=compression_level,
+                max_concurrent_reads=2,
+            ):
+                f.write(chunk)
+
+        with zipfile.ZipFile(zipfile_path, "r") as zip_ref:
+            # Each file is stored in a single entry
+            assert sorted(zip_ref.namelist()) == sorted(files)
+            for relative_path, content in files.items():
+                assert zip_ref.read(relative_path) == content
+
+    with pytest.raises(ValueError):
+        list(
+            artifact_utils.stream_artifact_files_as_zip(
+                artifact_store=artifact_store, uri=uri, compression_level=10
+            )
+        )
+
+
 def test_download_artifact_files_from_response_fails_if_exists(
     tmp_path, clean_client_with_run
 ):
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Test zenml artifact CLI commands."""
 
+import os
+
 from click.testing import CliRunner
 
 from zenml.cli.cli import cli
@@ -177,3 +179,30 @@ def test_artifact_prune(clean_client_with_run):
     assert len(existing_artifacts) == 0
     existing_artifact_versions = clean_client_with_run.list_artifact_versions()
     assert len(existing_artifact_versions) == 0
+
+
+def test_artifact_gc(clean_client_with_run):
+    """Test that `zenml artifact gc` deletes orphaned artifact files."""
+    run = clean_client_with_run.list_runs()[0]
+    uris = [step.output.uri for step in run.steps.values()]
+    clean_client_with_run.delete_pipeline_run(run.id)
+    clean_client_with_run.prune_artifacts()
+
+    runner = CliRunner()
+    gc_command = cli.commands["artifact"].commands["gc"]
+    result = runner.invoke(gc_command)
+    assert result.exit_code == 0
+    assert all(os.path.exists(uri) for uri in uris)
+
+    result = runner.invoke(gc_command, ["--delete", "-y"])
+    assert result.exit_code == 0
+    assert not any(os.path.exists(uri) for uri in uris)
+
+
+def test_artifact_usage(clean_client_with_run):
+    """Test that `zenml artifact usage` does not fail."""
+    runner = CliRunner()
+    usage_command = cli.commands["artifact"].commands["usage"]
+    for group_by in ["artifact", "pipeline", "workspace"]:
+        result = runner.invoke(usage_command, ["--group-by", group_by])
+        assert result.exit_code == 0
@@ -125,6 +125,30 @@ def test_pipeline_run_delete(clean_client_with_run):
     assert len(existing_runs) == 0
 
 
+def test_pipeline_run_prune(clean_client_with_run):
+    """Test that zenml pipeline runs prune deletes the selected runs."""
+    run = clean_client_with_run.list_pipeline_runs(hydrate=True)[0]
+    runner = CliRunner()
+    prune_command = cli.commands["pipeline"].commands["runs"].commands["prune"]
+
+    result = runner.invoke(prune_command, [])
+    assert result.exit_code != 0
+
+    result = runner.invoke(
+        prune_command,
+        ["--pipeline", run.pipeline.name, "--delete-files", "--dry-run"],
+    )
+    assert result.exit_code == 0
+    assert "Would delete 1 pipeline run(s)" in result.output
+    assert len(clean_client_with_run.list_pipeline_runs()) == 1
+
+    result = runner.invoke(
+        prune_command, ["--pipeline", run.pipeline.name, "--yes"]
+    )
+    assert result.exit_code == 0
+    assert len(clean_client_with_run.list_pipeline_runs()) == 0
+
+
 def test_pipeline_schedule_list(clean_client_with_scheduled_run):
     """Test that `zenml pipeline schedules list` does not fail."""
     runner = CliRunner()
@@ -0,0 +1,98 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing_extensions import Annotated
+
+from zenml import pipeline, step
+from zenml.constants import ENV_ZENML_STEP_PROFILING
+from zenml.enums import MetadataResourceTypes
+from zenml.utils import profiling_utils
+
+
+@step
+def _profiled_step(value: bytes) -> Annotated[bytes, "profiled_output"]:
+    return value * 2
+
+
+@pipeline(enable_cache=False)
+def _profiled_pipeline() -> None:
+    _profiled_step(_profiled_step(b"a" * 1000))
+
+
+def test_resource_usage_is_stored_as_run_metadata(clean_client, monkeypatch):
+    """Tests that the profiled resource usage is stored and aggregated."""
+    monkeypatch.setenv(ENV_ZENML_STEP_PROFILING, "true")
+
+    run = _profiled_pipeline.with_options(unlisted=True)()
+    run = clean_client.get_pipeline_run(run.id)
+
+    usages = [
+        step_run.run_metadata[
+            profiling_utils.RESOURCE_USAGE_METADATA_KEY
+        ].value
+        for step_run in run.steps.values()
+    ]
+    for usage in usages:
+        assert usage["artifact_store_bytes_written"] >= 2000
+    # The second step loads the output of the first one
+    assert max(usage["artifact_store_bytes_read"] for usage in usages) >= 2000
+
+    aggregate = run.run_metadata[
+        profiling_utils.RESOURCE_USAGE_METADATA_KEY
+    ].value
+    assert aggregate["steps"] == 2
+    assert aggregate["artifact_store_bytes_written"] == sum(
+        usage["artifact_store_bytes_written"] for usage in usages
+    )
+
+
+def test_resource_usage_is_not_stored_by_default(clean_client):
+    """Tests that step profiling is disabled by default."""
+    run = _profiled_pipeline.with_options(unlisted=True)()
+    run = clean_client.get_pipeline_run(run.id)
+
+    assert profiling_utils.RESOURCE_USAGE_METADATA_KEY not in run.run_metadata
+    for step_run in run.steps.values():
+        assert (
+            profiling_utils.RESOURCE_USAGE_METADATA_KEY
+            not in step_run.run_metadata
+        )
+
+
+def test_resource_usage_stored_after_the_run_finished_is_aggregated(
+    clean_client, monkeypatch
+):
+    """Tests that late step resource usage updates the run aggregate."""
+    monkeypatch.setenv(ENV_ZENML_STEP_PROFILING, "true")
+    run = _profiled_pipeline.with_options(unlisted=True)()
+    step_run = clean_client.get_pipeline_run(run.id).steps["_profiled_step"]
+
+    usage = dict(
+        step_run.run_metadata[
+            profiling_utils.RESOURCE_USAGE_METADATA_KEY
+        ].value
+    )
+    usage["peak_memory_bytes"] = 2**40
+    clean_client.create_run_metadata(
+        metadata={profiling_utils.RESOURCE_USAGE_METADATA_KEY: usage},
+        resource_id=step_run.id,
+        resource_type=MetadataResourceTypes.STEP_RUN,
+    )
+
+    aggregate = (
+        clean_client.get_pipeline_run(run.id)
+        .run_metadata[profiling_utils.RESOURCE_USAGE_METADATA_KEY]
+        .value
+    )
+    assert aggregate["peak_memory_bytes"] == 2**40
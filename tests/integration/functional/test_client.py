@@ -40,6 +40,7 @@ from zenml.config.pipeline_spec import PipelineSpec
 from zenml.config.source import Source
 from zenml.constants import PAGE_SIZE_DEFAULT
 from zenml.enums import (
+    ArtifactType,
     MetadataResourceTypes,
     ModelStages,
     SecretScope,
@@ -56,6 +57,7 @@ from zenml.io import fileio
 from zenml.metadata.metadata_types import MetadataTypeEnum
 from zenml.model.model import Model
 from zenml.models import (
+    ArtifactVersionRequest,
     ComponentResponse,
     ModelResponse,
     ModelVersionResponse,
@@ -988,6 +990,90 @@ def test_get_unlisted_runs(clean_client: Client, connected_two_step_pipeline):
     assert len(clean_client.list_pipeline_runs(unlisted=True)) == 1
 
 
+@step
+def bulk_deletion_producer_step() -> int:
+    return 1
+
+
+@step
+def bulk_deletion_consumer_step(a: int) -> int:
+    log_artifact_metadata(metadata={"key": "value"})
+    return a + 1
+
+
+@pipeline
+def bulk_deletion_pipeline():
+    bulk_deletion_consumer_step(bulk_deletion_producer_step())
+
+
+def test_delete_pipeline_runs(clean_client: Client):
+    """Test that runs matching a filter are deleted with their artifacts."""
+    bulk_deletion_pipeline.with_options(enable_cache=False)()
+    bulk_deletion_pipeline.with_options(enable_cache=False)()
+    runs = clean_client.list_pipeline_runs(hydrate=True).items
+    artifact_versions = [
+        step_.output for run in runs for step_ in run.steps.values()
+    ]
+
+    summary = clean_client.delete_pipeline_runs(
+        pipeline_name="bulk_deletion_pipeline",
+        delete_artifacts=True,
+        delete_from_artifact_store=True,
+        dry_run=True,
+    )
+    assert summary.dry_run
+    assert summary.pipeline_runs == 2
+    assert summary.step_runs == 4
+    assert summary.artifact_versions == 4
+    assert summary.file_bytes > 0
+    assert {file.uri for file in summary.files} >= {
+        artifact_version.uri for artifact_version in artifact_versions
+    }
+    assert len(clean_client.list_pipeline_runs()) == 2
+
+    summary = clean_client.delete_pipeline_runs(
+        pipeline_name="bulk_deletion_pipeline",
+        delete_artifacts=True,
+        delete_from_artifact_store=True,
+    )
+    assert not summary.dry_run
+    assert summary.pipeline_runs == 2
+    assert summary.artifact_versions == 4
+    assert summary.deleted_files == len(summary.files)
+    assert not summary.failed_files
+
+    assert len(clean_client.list_pipeline_runs()) == 0
+    assert len(clean_client.list_run_steps()) == 0
+    for artifact_version in artifact_versions:
+        with pytest.raises(KeyError):
+            clean_client.get_artifact_version(artifact_version.id)
+        assert not fileio.exists(artifact_version.uri)
+    for file in summary.files:
+        assert not fileio.exists(file.uri)
+
+
+def test_delete_pipeline_runs_keeps_used_artifacts(clean_client: Client):
+    """Test that artifact versions used by remaining runs are kept."""
+    bulk_deletion_pipeline()
+    first_run = bulk_deletion_pipeline.model.last_run
+    # All steps of the second run are cached and use the same artifacts
+    bulk_deletion_pipeline()
+    second_run = bulk_deletion_pipeline.model.last_run
+
+    summary = clean_client.delete_pipeline_runs(
+        id=first_run.id, delete_artifacts=True
+    )
+    assert summary.pipeline_runs == 1
+    assert summary.artifact_versions == 0
+
+    with pytest.raises(KeyError):
+        clean_client.get_pipeline_run(first_run.id)
+    second_run = clean_client.get_pipeline_run(second_run.id)
+    for step_ in second_run.steps.values():
+        assert step_.original_step_run_id is None
+        assert clean_client.get_artifact_version(step_.output.id)
+
+
 class ClientCrudTestConfig(BaseModel):
     entity_name: str
     create_args: Dict[str, Any] = {}
@@ -1211,6 +1297,35 @@ class TestArtifact:
             )
         assert not os.path.exists(artifact.uri)
 
+    def test_prune_skips_artifacts_without_artifact_store(
+        self, clean_client: "Client"
+    ):
+        """Test that artifacts without artifact store don't block pruning."""
+        artifact_id = ExternalArtifact(value="foo").upload_by_value()
+        artifact = clean_client.get_artifact_version(artifact_id)
+        storeless_artifact = clean_client.zen_store.create_artifact_version(
+            ArtifactVersionRequest(
+                artifact_id=artifact.artifact.id,
+                version="storeless",
+                data_type="module.class",
+                materializer="module.class",
+                type=ArtifactType.DATA,
+                uri="/storeless/artifact",
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+            )
+        )
+        assert storeless_artifact.artifact_store_id is None
+
+        clean_client.prune_artifacts(
+            only_versions=False, delete_from_artifact_store=True
+        )
+
+        for artifact_version_id in (artifact_id, storeless_artifact.id):
+            with pytest.raises(KeyError):
+                clean_client.get_artifact_version(artifact_version_id)
+        assert not os.path.exists(artifact.uri)
+
     def test_prune_data_and_version(self, clean_client: "Client"):
         """Test that artifact pruning works with delete_from_artifact_store flag."""
         artifact_id = ExternalArtifact(value="foo").upload_by_value()
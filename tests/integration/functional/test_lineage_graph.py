@@ -16,6 +16,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+import pytest
 from typing_extensions import Annotated
 
 from tests.integration.functional.zen_stores.utils import (
@@ -32,6 +33,7 @@ from zenml.lineage_graph.lineage_graph import (
 )
 from zenml.metadata.metadata_types import MetadataTypeEnum, Uri
 from zenml.models import PipelineRunResponse
+from zenml.zen_stores.sql_zen_store import SqlZenStore
 
 if TYPE_CHECKING:
     from zenml.client import Client
@@ -324,6 +326,68 @@ def test_manual_save_load_artifact(clean_client):
     assert saved_before_is_input
 
 
+@pytest.mark.parametrize(
+    "pipeline_instance",
+    [pipeline_with_direct_edge, saving_loading_pipeline],
+)
+def test_store_graph_matches_graph_of_hydrated_run(
+    clean_client: "Client", pipeline_instance
+):
+    """Tests that the graph built by the store matches the hydrated run."""
+    if not isinstance(clean_client.zen_store, SqlZenStore):
+        pytest.skip("Store graphs are only built by SQL zen stores.")
+
+    save_artifact(4, name="saved_before")
+    pipeline_instance()
+    run_ = pipeline_instance.model.last_run
+    clean_client.create_run_metadata(
+        metadata={"aria_loves_alex": True},
+        resource_id=run_.id,
+        resource_type=MetadataResourceTypes.PIPELINE_RUN,
+    )
+    run_ = clean_client.get_pipeline_run(run_.id)
+
+    expected_graph = LineageGraph()
+    expected_graph.generate_run_nodes_and_edges(run_)
+    graph = clean_client.zen_store.get_run_graph(run_.id)
+
+    assert graph.root_step_id == expected_graph.root_step_id
+    assert graph.run_metadata == expected_graph.run_metadata
+    assert {node.id: node for node in graph.nodes} == {
+        node.id: node for node in expected_graph.nodes
+    }
+    assert {edge.id for edge in graph.edges} == {
+        edge.id for edge in expected_graph.edges
+    }
+
+
+def test_store_graph_of_finished_run_is_cached(clean_client: "Client", mocker):
+    """Tests that graphs of finished runs are cached but metadata isn't."""
+    if not isinstance(clean_client.zen_store, SqlZenStore):
+        pytest.skip("Store graphs are only built by SQL zen stores.")
+
+    pipeline_with_direct_edge()
+    run_ = pipeline_with_direct_edge.model.last_run
+    get_lineage_step_runs = mocker.spy(SqlZenStore, "_get_lineage_step_runs")
+
+    graph = clean_client.zen_store.get_run_graph(run_.id)
+    step_id = graph.nodes[0].data.execution_id
+    clean_client.create_run_metadata(
+        metadata={"aria_loves_alex": True},
+        resource_id=UUID(step_id),
+        resource_type=MetadataResourceTypes.STEP_RUN,
+    )
+    cached_graph = clean_client.zen_store.get_run_graph(run_.id)
+
+    assert get_lineage_step_runs.call_count == 1
+    assert cached_graph.edges == graph.edges
+    assert cached_graph.nodes[0].data.metadata[-1] == (
+        "aria_loves_alex",
+        "True",
+        MetadataTypeEnum.BOOL,
+    )
+
+
 def _validate_graph(
     graph: LineageGraph, pipeline_run: PipelineRunResponse
 ) -> None:
@@ -0,0 +1,158 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Query count regression tests for the SQL zen store."""
+
+from contextlib import contextmanager
+from typing import Any, Generator, List
+
+import pytest
+from sqlalchemy import event
+
+from tests.integration.functional.utils import sample_name
+from zenml import pipeline, step
+from zenml.client import Client
+from zenml.enums import StoreType
+from zenml.models import (
+    ArtifactVersionFilter,
+    PipelineRunFilter,
+    StepRunFilter,
+)
+
+NUM_STEPS = 10
+
+
+@step
+def _query_count_source_step() -> int:
+    return 1
+
+
+@step
+def _query_count_step(value: int) -> int:
+    return value + 1
+
+
+@pipeline(enable_cache=False)
+def _query_count_pipeline() -> None:
+    value = _query_count_source_step()
+    for _ in range(NUM_STEPS - 1):
+        value = _query_count_step(value)
+
+
+class QueryCounter:
+    """Counts the SQL statements executed on an engine."""
+
+    def __init__(self) -> None:
+        """Initializes the counter."""
+        self.statements: List[str] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        """Callback for the `before_cursor_execute` engine event.
+
+        Args:
+            *args: The event positional arguments.
+            **kwargs: The event keyword arguments.
+        """
+        self.statements.append(args[2])
+
+    @property
+    def count(self) -> int:
+        """The number of executed statements.
+
+        Returns:
+            The number of executed statements.
+        """
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries() -> Generator[QueryCounter, None, None]:
+    """Counts the queries executed by the SQL zen store.
+
+    Yields:
+        The query counter.
+    """
+    engine = Client().zen_store.engine
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+@pytest.fixture(scope="module")
+def pipeline_run():
+    """Runs a pipeline with multiple steps and cleans it up afterwards."""
+    if Client().zen_store.type != StoreType.SQL:
+        pytest.skip("Query counts can only be measured on a SQL zen store.")
+
+    run_name = sample_name("query_count_run")
+    _query_count_pipeline.with_options(run_name=run_name)()
+    run = Client().get_pipeline_run(run_name)
+    yield run
+    Client().delete_pipeline_run(run.id)
+
+
+# Upper bounds for the number of queries issued by each store method. These
+# must not depend on the number of steps, artifacts or metadata entries.
+@pytest.mark.parametrize(
+    "method,max_queries",
+    [
+        ("get_run", 20),
+        ("list_runs", 10),
+        ("list_runs_hydrated", 20),
+        ("get_run_step", 20),
+        ("list_run_steps", 20),
+        ("list_run_steps_hydrated", 20),
+        ("get_artifact_version", 10),
+        ("list_artifact_versions", 10),
+        ("get_deployment", 5),
+    ],
+)
+def test_query_counts_are_bounded(pipeline_run, method, max_queries):
+    """Tests that fetching models does not issue a query per relationship."""
+    store = Client().zen_store
+    step_run = pipeline_run.steps[list(pipeline_run.steps)[-1]]
+    artifact_version = step_run.output
+
+    calls = {
+        "get_run": lambda: store.get_run(pipeline_run.id),
+        "list_runs": lambda: store.list_runs(
+            PipelineRunFilter(id=pipeline_run.id)
+        ),
+        "list_runs_hydrated": lambda: store.list_runs(
+            PipelineRunFilter(id=pipeline_run.id), hydrate=True
+        ),
+        "get_run_step": lambda: store.get_run_step(step_run.id),
+        "list_run_steps": lambda: store.list_run_steps(
+            StepRunFilter(pipeline_run_id=pipeline_run.id)
+        ),
+        "list_run_steps_hydrated": lambda: store.list_run_steps(
+            StepRunFilter(pipeline_run_id=pipeline_run.id), hydrate=True
+        ),
+        "get_artifact_version": lambda: store.get_artifact_version(
+            artifact_version.id
+        ),
+        "list_artifact_versions": lambda: store.list_artifact_versions(
+            ArtifactVersionFilter(artifact_id=artifact_version.artifact.id)
+        ),
+        "get_deployment": lambda: store.get_deployment(
+            pipeline_run.deployment_id
+        ),
+    }
+
+    with count_queries() as counter:
+        calls[method]()
+
+    assert counter.count <= max_queries, "\n\n".join(counter.statements)
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 
 import time
+import uuid
 from contextlib import ExitStack as does_not_raise
 from datetime import timedelta
 
@@ -28,6 +29,9 @@ from zenml.client import Client
 from zenml.enums import SecretScope, SecretsStoreType, StoreType
 from zenml.exceptions import EntityExistsError, IllegalOperationError
 from zenml.models import SecretFilter, SecretUpdate
+from zenml.zen_stores.secrets_stores.base_secrets_store import (
+    SecretValuesCache,
+)
 
 
 def _get_secrets_store_type() -> SecretsStoreType:
@@ -78,6 +82,114 @@ def test_list_secret_excludes_values():
         assert len(all_secrets[0].values) == 0
 
 
+def test_get_secrets_returns_values():
+    """Tests that `get_secrets` returns the values of multiple secrets."""
+    client = Client()
+    store = client.zen_store
+
+    with SecretContext(values=dict(aria="space cat")) as secret_1:
+        with SecretContext(values=dict(axl="space dog")) as secret_2:
+            secrets = store.get_secrets(
+                secret_ids=[secret_1.id, secret_2.id, uuid.uuid4()]
+            )
+
+            values = {secret.id: secret.secret_values for secret in secrets}
+            assert values == {
+                secret_1.id: dict(aria="space cat"),
+                secret_2.id: dict(axl="space dog"),
+            }
+
+            secrets_by_name = client.get_secrets_by_name(
+                [secret_1.name, secret_2.name, sample_name("missing")]
+            )
+            assert set(secrets_by_name) == {secret_1.name, secret_2.name}
+            assert secrets_by_name[secret_2.name].id == secret_2.id
+
+
+def test_get_secrets_by_name_prefers_user_scope():
+    """Tests that user-scoped secrets shadow workspace-scoped ones."""
+    client = Client()
+    name = sample_name("arias-secret")
+
+    with SecretContext(
+        secret_name=name, values=dict(aria="space cat")
+    ) as workspace_secret:
+        with SecretContext(
+            secret_name=name,
+            scope=SecretScope.USER,
+            values=dict(aria="space dog"),
+        ) as user_secret:
+            secrets = client.get_secrets_by_name([name])
+            assert secrets[name].id == user_secret.id
+            assert secrets[name].secret_values == dict(aria="space dog")
+
+            secrets = client.get_secrets_by_name(
+                [name], scope=SecretScope.WORKSPACE
+            )
+            assert secrets[name].id == workspace_secret.id
+
+
+def test_get_secret_returns_updated_values():
+    """Tests that cached secret values are refreshed on updates."""
+    client = Client()
+    store = client.zen_store
+
+    with SecretContext(values=dict(aria="space cat")) as secret:
+        assert store.get_secret(secret.id).secret_values == dict(
+            aria="space cat"
+        )
+
+        store.update_secret(
+            secret_id=secret.id,
+            secret_update=SecretUpdate(values=dict(aria="space dog")),
+        )
+
+        assert store.get_secret(secret.id).secret_values == dict(
+            aria="space dog"
+        )
+        assert store.get_secrets([secret.id])[0].secret_values == dict(
+            aria="space dog"
+        )
+
+
+def test_secret_values_read_during_updates_are_not_cached(mocker):
+    """Tests that values read while a secret is updated are not cached."""
+    client = Client()
+    store = client.zen_store
+    if store.type != StoreType.SQL:
+        pytest.skip("Only SQL Zen Stores cache secret values.")
+
+    mocker.patch.object(
+        store, "_secret_values_cache", SecretValuesCache(ttl_seconds=30)
+    )
+    secrets_store_class = type(store.secrets_store)
+    update_secret_values = secrets_store_class.update_secret_values
+
+    def _read_and_update(secrets_store, secret_id, secret_values):
+        # Simulates a concurrent request that reads the values while they
+        # are being updated
+        store.get_secret(secret_id)
+        update_secret_values(
+            secrets_store, secret_id=secret_id, secret_values=secret_values
+        )
+
+    with SecretContext(values=dict(aria="space cat")) as secret:
+        mocker.patch.object(
+            secrets_store_class,
+            "update_secret_values",
+            autospec=True,
+            side_effect=_read_and_update,
+        )
+        store.update_secret(
+            secret_id=secret.id,
+            secret_update=SecretUpdate(values=dict(aria="space dog")),
+        )
+
+        assert store.get_secret(secret.id).secret_values == dict(
+            aria="space dog"
+        )
+
+
 def test_secret_empty_values():
     """Tests that secrets can hold empty values."""
     client = Client()
@@ -2904,6 +2904,26 @@ def test_deleting_run_deletes_steps():
         assert store.list_run_steps(filter_model).total == 0
 
 
+def test_deployment_configurations_are_only_parsed_once():
+    """Tests that the parsed deployment configurations are cached."""
+    client = Client()
+    store = client.zen_store
+    if store.type != StoreType.SQL:
+        pytest.skip("Deployment configurations are parsed by the server.")
+
+    with PipelineRunContext(1) as runs:
+        deployment_id = runs[0].deployment_id
+        store.get_deployment(deployment_id)
+
+        with patch.object(Step, "parse_obj", side_effect=Step.parse_obj) as p:
+            deployment = store.get_deployment(deployment_id)
+            store.get_run(runs[0].id)
+            store.list_run_steps(StepRunFilter(pipeline_run_id=runs[0].id))
+
+        p.assert_not_called()
+        assert len(deployment.step_configurations) == 2
+
+
 # .--------------------.
 # | Pipeline run steps |
 # '--------------------'
@@ -0,0 +1,148 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+def _pod(phase: str, resource_version: str = "1") -> k8s_client.V1Pod:
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(resource_version=resource_version),
+        status=k8s_client.V1PodStatus(phase=phase),
+    )
+
+
+@pytest.fixture
+def core_api(mocker):
+    """Mocks the Kubernetes core API."""
+    core_api = MagicMock()
+    mocker.patch.object(
+        kube_utils.k8s_client, "CoreV1Api", return_value=core_api
+    )
+    return core_api
+
+
+@pytest.fixture
+def mock_watch(mocker):
+    """Mocks Kubernetes watches."""
+    watch = MagicMock()
+    mocker.patch.object(kube_utils.k8s_watch, "Watch", return_value=watch)
+    return watch
+
+
+def test_wait_pod_watches_for_changes(core_api, mock_watch, mocker):
+    """Tests that waiting for a pod uses watches instead of polling."""
+    core_api.read_namespaced_pod.side_effect = [
+        _pod("Pending"),
+        _pod("Running", "2"),
+        _pod("Succeeded", "3"),
+    ]
+    mock_watch.stream.side_effect = lambda *args, **kwargs: iter(
+        [{"type": "MODIFIED"}]
+    )
+    sleep = mocker.patch.object(kube_utils.time, "sleep")
+
+    pod = kube_utils.wait_pod(
+        kube_client_fn=MagicMock,
+        pod_name="pod",
+        namespace="ns",
+        exit_condition_lambda=kube_utils.pod_is_done,
+    )
+
+    assert pod.status.phase == "Succeeded"
+    sleep.assert_not_called()
+    resource_versions = [
+        call.kwargs["resource_version"]
+        for call in mock_watch.stream.call_args_list
+    ]
+    assert resource_versions == ["1", "2"]
+    assert all(
+        call.kwargs["field_selector"] == "metadata.name=pod"
+        for call in mock_watch.stream.call_args_list
+    )
+
+
+def test_wait_pod_follows_logs(core_api, mock_watch, mocker):
+    """Tests that the logs of a running pod are followed."""
+    core_api.read_namespaced_pod.side_effect = [
+        _pod("Running"),
+        _pod("Succeeded", "2"),
+    ]
+    mock_watch.stream.return_value = iter(["first line", "second line"])
+    log = mocker.patch.object(kube_utils.logger, "info")
+
+    kube_utils.wait_pod(
+        kube_client_fn=MagicMock,
+        pod_name="pod",
+        namespace="ns",
+        exit_condition_lambda=kube_utils.pod_is_done,
+        stream_logs=True,
+    )
+
+    assert mock_watch.stream.call_args.kwargs["follow"] is True
+    core_api.read_namespaced_pod_log.assert_not_called()
+    assert [call.args[0] for call in log.call_args_list] == [
+        "first line",
+        "second line",
+    ]
+
+
+def test_wait_pod_falls_back_to_polling(core_api, mock_watch, mocker):
+    """Tests that pods are polled if they can't be watched."""
+    core_api.read_namespaced_pod.side_effect = [
+        _pod("Pending"),
+        _pod("Pending"),
+        _pod("Succeeded"),
+    ]
+    mock_watch.stream.side_effect = ApiException(status=403)
+    sleep = mocker.patch.object(kube_utils.time, "sleep")
+
+    kube_utils.wait_pod(
+        kube_client_fn=MagicMock,
+        pod_name="pod",
+        namespace="ns",
+        exit_condition_lambda=kube_utils.pod_is_done,
+        exponential_backoff=True,
+    )
+
+    # The watch is only attempted once
+    assert mock_watch.stream.call_count == 1
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+
+
+def test_wait_pod_raises_if_pod_fails(core_api, mock_watch):
+    """Tests that waiting for a failed pod raises an error."""
+    core_api.read_namespaced_pod.return_value = _pod("Failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        kube_utils.wait_pod(
+            kube_client_fn=MagicMock,
+            pod_name="pod",
+            namespace="ns",
+            exit_condition_lambda=kube_utils.pod_is_done,
+        )
+
+
+def test_sanitize_label():
+    """Tests that label values are sanitized and shortened."""
+    assert kube_utils.sanitize_label("-my_run:1-") == "my_run-1"
+
+    label = kube_utils.sanitize_label("a" * 100)
+    assert len(label) <= 63
+    assert label != kube_utils.sanitize_label("a" * 99)
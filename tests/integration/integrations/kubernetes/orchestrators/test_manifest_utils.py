@@ -57,6 +57,26 @@ def test_build_pod_manifest_metadata():
     assert container.security_context.privileged is True
 
 
+def test_build_pod_manifest_additional_labels():
+    """Test that additional labels are added to the manifest."""
+    manifest: V1Pod = build_pod_manifest(
+        pod_name="test_name",
+        run_name="test_run",
+        pipeline_name="test_pipeline",
+        image_name="test_image",
+        command=["test", "command"],
+        args=["test", "args"],
+        privileged=False,
+        labels={"zenml-orchestrator-run-id": "test_id"},
+    )
+
+    assert manifest.metadata.labels == {
+        "run": "test_run",
+        "pipeline": "test_pipeline",
+        "zenml-orchestrator-run-id": "test_id",
+    }
+
+
 @pytest.fixture
 def kubernetes_pod_settings() -> KubernetesPodSettings:
     """build KubernetesPodSettings fixture."""
@@ -0,0 +1,389 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils, pod_watcher
+from zenml.integrations.kubernetes.orchestrators.pod_watcher import PodWatcher
+
+
+class _FakeCluster:
+    """Fake Kubernetes API which serves pods and their logs from memory."""
+
+    def __init__(self, watch_error: Optional[Exception] = None) -> None:
+        """Initializes the fake cluster.
+
+        Args:
+            watch_error: Error to raise when watching pods.
+        """
+        self.watch_error = watch_error
+        self.list_error: Optional[Exception] = None
+        self.read_error: Optional[Exception] = None
+        self.pods: Dict[str, k8s_client.V1Pod] = {}
+        self.logs: Dict[str, List[str]] = {}
+        self.events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.list_calls: List[Dict[str, Any]] = []
+        self.read_calls: List[Dict[str, Any]] = []
+        self.watch_calls: List[Dict[str, Any]] = []
+        self.log_calls: List[Dict[str, Any]] = []
+        self.resource_version = 0
+        self.lock = threading.Lock()
+
+    def set_phase(self, pod_name: str, phase: str) -> None:
+        """Creates or updates a pod.
+
+        Args:
+            pod_name: The name of the pod.
+            phase: The new phase of the pod.
+        """
+        with self.lock:
+            event_type = "MODIFIED" if pod_name in self.pods else "ADDED"
+            self.resource_version += 1
+            pod = k8s_client.V1Pod(
+                metadata=k8s_client.V1ObjectMeta(
+                    name=pod_name, resource_version=str(self.resource_version)
+                ),
+                status=k8s_client.V1PodStatus(phase=phase),
+            )
+            self.pods[pod_name] = pod
+        self.events.put({"type": event_type, "object": pod})
+
+    def delete(self, pod_name: str) -> None:
+        """Deletes a pod.
+
+        Args:
+            pod_name: The name of the pod.
+        """
+        with self.lock:
+            pod = self.pods.pop(pod_name)
+        self.events.put({"type": "DELETED", "object": pod})
+
+    def list_namespaced_pod(self, **kwargs: Any) -> k8s_client.V1PodList:
+        """Lists all pods.
+
+        Args:
+            **kwargs: The request arguments.
+
+        Returns:
+            The pods.
+
+        Raises:
+            Exception: If the cluster was configured to fail listing pods.
+        """
+        self.list_calls.append(kwargs)
+        if self.list_error:
+            raise self.list_error
+        with self.lock:
+            return k8s_client.V1PodList(
+                metadata=k8s_client.V1ListMeta(
+                    resource_version=str(self.resource_version)
+                ),
+                items=list(self.pods.values()),
+            )
+
+    def read_namespaced_pod(self, **kwargs: Any) -> k8s_client.V1Pod:
+        """Reads a single pod.
+
+        Args:
+            **kwargs: The request arguments.
+
+        Returns:
+            The pod.
+
+        Raises:
+            Exception: If the cluster was configured to fail reading pods.
+            ApiException: If the pod doesn't exist.
+        """
+        self.read_calls.append(kwargs)
+        if self.read_error:
+            raise self.read_error
+        with self.lock:
+            if kwargs["name"] not in self.pods:
+                raise ApiException(status=404)
+            return self.pods[kwargs["name"]]
+
+    def read_namespaced_pod_log(self, **kwargs: Any) -> None:
+        """Placeholder for the pod logs which are served by the watch."""
+
+    def watch(self) -> "_FakeWatch":
+        """Creates a watch for this cluster.
+
+        Returns:
+            The watch.
+        """
+        return _FakeWatch(self)
+
+
+class _FakeWatch:
+    """Fake Kubernetes watch which streams events of a fake cluster."""
+
+    def __init__(self, cluster: _FakeCluster) -> None:
+        """Initializes the watch.
+
+        Args:
+            cluster: The cluster to watch.
+        """
+        self.cluster = cluster
+        self.stopped = False
+
+    def stream(self, func: Any, **kwargs: Any) -> Iterator[Any]:
+        """Streams pod events or logs.
+
+        Args:
+            func: The API function to stream.
+            **kwargs: The request arguments.
+
+        Yields:
+            The events or log lines.
+
+        Raises:
+            Exception: If the cluster was configured to fail watches.
+        """
+        if func.__name__ == "read_namespaced_pod_log":
+            self.cluster.log_calls.append(kwargs)
+            # All lines have the same timestamp and the logs are always
+            # streamed from the start
+            for line in list(self.cluster.logs.get(kwargs["name"], [])):
+                yield f"2024-01-01T00:00:00.5Z {line}"
+            return
+
+        self.cluster.watch_calls.append(kwargs)
+        if self.cluster.watch_error:
+            raise self.cluster.watch_error
+        while not self.stopped:
+            try:
+                yield self.cluster.events.get(timeout=0.01)
+            except queue.Empty:
+                continue
+
+    def stop(self) -> None:
+        """Stops the watch."""
+        self.stopped = True
+
+
+@pytest.fixture
+def cluster(mocker):
+    """Fake cluster that is used by the pod watcher."""
+    cluster = _FakeCluster()
+    mocker.patch.object(
+        pod_watcher.k8s_client, "CoreV1Api", return_value=cluster
+    )
+    mocker.patch.object(pod_watcher.k8s_watch, "Watch", new=cluster.watch)
+    return cluster
+
+
+def _watcher(**kwargs: Any) -> PodWatcher:
+    return PodWatcher(
+        kube_client_fn=object,
+        namespace="ns",
+        label_selector="zenml-orchestrator-run-id=run",
+        **kwargs,
+    )
+
+
+def test_waiting_for_many_pods_uses_a_single_watch(cluster):
+    """Tests that all waiting threads share one label-selected watch."""
+    pod_names = [f"pod-{i}" for i in range(10)]
+
+    with _watcher() as watcher, ThreadPoolExecutor(len(pod_names)) as pool:
+        futures = [
+            pool.submit(
+                watcher.wait_for_pod,
+                pod_name=pod_name,
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=10,
+            )
+            for pod_name in pod_names
+        ]
+        for pod_name in pod_names:
+            cluster.set_phase(pod_name, "Pending")
+            cluster.set_phase(pod_name, "Running")
+        for pod_name in pod_names:
+            cluster.set_phase(pod_name, "Succeeded")
+
+        pods = [future.result(timeout=10) for future in futures]
+
+    assert [pod.metadata.name for pod in pods] == pod_names
+    assert all(pod.status.phase == "Succeeded" for pod in pods)
+    assert len(cluster.list_calls) == 1
+    assert len(cluster.watch_calls) == 1
+    assert all(
+        call["label_selector"] == "zenml-orchestrator-run-id=run"
+        for call in cluster.list_calls + cluster.watch_calls
+    )
+
+
+def test_waiting_for_an_existing_pod(cluster):
+    """Tests that pods which exist before the watch starts are found."""
+    cluster.set_phase("pod", "Succeeded")
+
+    with _watcher() as watcher:
+        pod = watcher.wait_for_pod(
+            "pod", exit_condition_lambda=kube_utils.pod_is_done, timeout_sec=10
+        )
+
+    assert pod.status.phase == "Succeeded"
+
+
+def test_waiting_for_a_failed_pod_raises(cluster):
+    """Tests that a failed pod raises an error for its waiting thread."""
+    with _watcher() as watcher:
+        cluster.set_phase("pod", "Running")
+        cluster.set_phase("pod", "Failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            watcher.wait_for_pod(
+                "pod",
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=10,
+            )
+
+
+def test_waiting_for_a_deleted_pod_raises(cluster):
+    """Tests that a deleted pod raises an error for its waiting thread."""
+    with _watcher() as watcher:
+        cluster.set_phase("pod", "Running")
+        cluster.delete("pod")
+
+        with pytest.raises(RuntimeError, match="deleted"):
+            watcher.wait_for_pod(
+                "pod",
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=10,
+            )
+
+
+def test_waiting_for_a_pod_times_out(cluster):
+    """Tests that waiting for a pod which never finishes times out."""
+    with _watcher() as watcher:
+        cluster.set_phase("pod", "Running")
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            watcher.wait_for_pod(
+                "pod",
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=1,
+            )
+
+
+def test_pod_logs_are_streamed(cluster, mocker):
+    """Tests that the logs of all pods are streamed before waiting returns."""
+    log = mocker.patch.object(pod_watcher.logger, "info")
+    cluster.logs = {
+        "pod-1": ["first line of pod 1", "second line of pod 1"],
+        "pod-2": ["first line of pod 2"],
+    }
+
+    with _watcher(stream_logs=True) as watcher:
+        for pod_name in cluster.logs:
+            cluster.set_phase(pod_name, "Running")
+            cluster.set_phase(pod_name, "Succeeded")
+
+        for pod_name in cluster.logs:
+            watcher.wait_for_pod(
+                pod_name,
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=10,
+            )
+
+    assert sorted(call.args[0] for call in log.call_args_list) == sorted(
+        line for lines in cluster.logs.values() for line in lines
+    )
+
+
+def test_pods_are_listed_if_they_cannot_be_watched(cluster, mocker):
+    """Tests that pods are listed periodically if watching isn't allowed."""
+    mocker.patch.object(pod_watcher, "POD_LIST_INTERVAL_SECONDS", 0.01)
+    cluster.watch_error = ApiException(status=403)
+
+    with _watcher() as watcher:
+        cluster.set_phase("pod", "Running")
+        cluster.set_phase("pod", "Succeeded")
+
+        pod = watcher.wait_for_pod(
+            "pod", exit_condition_lambda=kube_utils.pod_is_done, timeout_sec=10
+        )
+
+    assert pod.status.phase == "Succeeded"
+    # The watch is only attempted once
+    assert len(cluster.watch_calls) == 1
+    assert len(cluster.list_calls) > 1
+
+
+def test_pod_logs_are_resumed_while_the_pod_is_running(cluster, mocker):
+    """Tests that logs are followed again if the stream ends early."""
+    mocker.patch.object(pod_watcher, "POD_LIST_INTERVAL_SECONDS", 0.01)
+    log = mocker.patch.object(pod_watcher.logger, "info")
+    cluster.logs = {"pod": ["first line", "second line"]}
+
+    with _watcher(stream_logs=True) as watcher:
+        cluster.set_phase("pod", "Running")
+        # The log stream ends while the pod is still running
+        for _ in range(1000):
+            if len(cluster.log_calls) >= 2:
+                break
+            threading.Event().wait(0.01)
+
+        cluster.logs["pod"].append("third line")
+        cluster.set_phase("pod", "Succeeded")
+        watcher.wait_for_pod(
+            "pod", exit_condition_lambda=kube_utils.pod_is_done, timeout_sec=10
+        )
+
+    assert [call.args[0] for call in log.call_args_list] == [
+        "first line",
+        "second line",
+        "third line",
+    ]
+    assert "since_seconds" not in cluster.log_calls[0]
+    assert all(call["since_seconds"] > 0 for call in cluster.log_calls[1:])
+
+
+def test_pods_are_read_if_they_cannot_be_listed(cluster, mocker):
+    """Tests that pods are read individually if listing isn't allowed."""
+    mocker.patch.object(pod_watcher, "POD_LIST_INTERVAL_SECONDS", 0.01)
+    mocker.patch.object(pod_watcher, "MIN_RETRY_INTERVAL_SECONDS", 0.01)
+    cluster.list_error = ApiException(status=403)
+
+    with _watcher() as watcher:
+        cluster.set_phase("pod", "Running")
+        cluster.set_phase("pod", "Succeeded")
+
+        pod = watcher.wait_for_pod(
+            "pod", exit_condition_lambda=kube_utils.pod_is_done, timeout_sec=0
+        )
+
+    assert pod.status.phase == "Succeeded"
+    assert len(cluster.list_calls) == pod_watcher.MAX_FORBIDDEN_ATTEMPTS
+    assert cluster.read_calls[-1] == {"name": "pod", "namespace": "ns"}
+
+
+def test_waiting_fails_if_pods_cannot_be_read(cluster, mocker):
+    """Tests that waiting doesn't hang if pods can't be read at all."""
+    mocker.patch.object(pod_watcher, "MIN_RETRY_INTERVAL_SECONDS", 0.01)
+    cluster.list_error = ApiException(status=403)
+    cluster.read_error = ApiException(status=403)
+
+    with _watcher() as watcher:
+        with pytest.raises(RuntimeError, match="Unable to watch"):
+            watcher.wait_for_pod(
+                "pod", exit_condition_lambda=kube_utils.pod_is_done
+            )
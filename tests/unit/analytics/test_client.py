@@ -0,0 +1,184 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import importlib.util
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import pytest
+
+from zenml.analytics import request, source_context
+from zenml.analytics.client import Client
+from zenml.analytics.enums import AnalyticsEvent
+from zenml.enums import SourceContextTypes
+
+
+class _AnalyticsServer:
+    """Local stand-in for the analytics server."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Initializes the server.
+
+        Args:
+            delay: Seconds to wait before answering each request.
+        """
+        self.delay = delay
+        self.requests: List[Dict[str, Any]] = []
+        self.unblock = threading.Event()
+        self.unblock.set()
+
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                server.unblock.wait()
+                time.sleep(server.delay)
+                server.requests.append(
+                    {
+                        "path": self.path,
+                        "source": self.headers[source_context.name],
+                        "batch": json.loads(body),
+                    }
+                )
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, daemon=True
+        )
+        self.thread.start()
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """All messages received by the server.
+
+        Returns:
+            The messages.
+        """
+        return [msg for req in self.requests for msg in req["batch"]]
+
+    def stop(self) -> None:
+        """Stops the server."""
+        self.unblock.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def analytics_server(mocker):
+    """Local analytics server which receives all analytics requests."""
+    server = _AnalyticsServer()
+
+    # The test session replaces `post` with a mock, so we patch it with an
+    # unpatched copy which sends the requests to the local server instead
+    spec = importlib.util.find_spec(request.__name__)
+    unpatched_request = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(unpatched_request)
+    mocker.patch.object(unpatched_request, "ANALYTICS_SERVER_URL", server.url)
+    mocker.patch.object(request, "post", new=unpatched_request.post)
+
+    yield server
+    server.stop()
+
+
+def test_messages_are_uploaded_in_batches(analytics_server):
+    """Tests that queued messages are uploaded in batches."""
+    client = Client(upload_size=10, upload_interval=0.2)
+    user_id = uuid4()
+
+    for i in range(25):
+        success, _ = client.track(
+            user_id, AnalyticsEvent.RUN_PIPELINE, {"index": i}
+        )
+        assert success
+    client.flush()
+    client.shutdown()
+
+    assert all(req["path"] == "/batch" for req in analytics_server.requests)
+    assert len(analytics_server.requests) >= 3
+    assert all(len(req["batch"]) <= 10 for req in analytics_server.requests)
+    assert [
+        msg["properties"]["index"] for msg in analytics_server.messages
+    ] == list(range(25))
+
+
+def test_tracking_does_not_wait_for_the_server(analytics_server):
+    """Tests that tracking an event doesn't block on a slow server."""
+    analytics_server.delay = 0.5
+    client = Client(upload_interval=0.05)
+
+    start = time.monotonic()
+    for _ in range(5):
+        client.track(uuid4(), AnalyticsEvent.RUN_PIPELINE, None)
+    assert time.monotonic() - start < 0.25
+
+    client.shutdown()
+    assert len(analytics_server.messages) == 5
+
+
+def test_messages_are_dropped_if_the_queue_is_full(analytics_server):
+    """Tests that messages are dropped instead of blocking on overflow."""
+    analytics_server.unblock.clear()
+    client = Client(max_queue_size=2, upload_size=1, upload_interval=0.05)
+
+    results = []
+    for _ in range(10):
+        success, _ = client.track(uuid4(), AnalyticsEvent.RUN_PIPELINE, None)
+        results.append(success)
+    assert not all(results)
+
+    analytics_server.unblock.set()
+    client.shutdown()
+    assert len(analytics_server.messages) == results.count(True)
+
+
+def test_source_context_is_captured_when_queueing(analytics_server):
+    """Tests that messages are uploaded with their original source context."""
+    client = Client(upload_interval=0.2)
+
+    token = source_context.set(SourceContextTypes.API)
+    try:
+        client.track(uuid4(), AnalyticsEvent.RUN_PIPELINE, None)
+    finally:
+        source_context.reset(token)
+    client.track(uuid4(), AnalyticsEvent.RUN_PIPELINE, None)
+    client.shutdown()
+
+    assert {req["source"] for req in analytics_server.requests} == {
+        SourceContextTypes.API.value,
+        SourceContextTypes.PYTHON.value,
+    }
+
+
+def test_disabled_client_does_not_queue_messages(analytics_server):
+    """Tests that no consumer is started if sending is disabled."""
+    client = Client(send=False)
+
+    success, _ = client.track(uuid4(), AnalyticsEvent.RUN_PIPELINE, None)
+    client.shutdown()
+
+    assert success
+    assert client._consumer is None
+    assert not analytics_server.requests
@@ -11,25 +11,38 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import io
 import os
 import shutil
 import tempfile
+from datetime import datetime
 from uuid import uuid4
 
 import numpy as np
 import pytest
 
+from zenml.artifacts import utils as artifact_utils
 from zenml.artifacts.utils import (
+    _ArtifactStoreCache,
     _get_new_artifact_version,
+    _get_visualization_media_type,
     _load_artifact_from_uri,
+    _VisualizationCache,
     load_artifact_from_response,
+    load_artifact_visualization,
     load_model_from_metadata,
     save_model_metadata,
+    stream_artifact_visualization,
 )
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
+from zenml.enums import VisualizationType
 from zenml.materializers.numpy_materializer import NUMPY_FILENAME
-from zenml.models import ArtifactVersionResponse, Page
+from zenml.models import (
+    ArtifactVersionResponse,
+    ArtifactVisualizationResponse,
+    Page,
+)
 
 
 @pytest.fixture
@@ -206,3 +219,123 @@ def test__get_new_artifact_version(mocker, sample_artifact_version_model):
         _get_new_artifact_version(sample_artifact_version_model.name)
         == int(sample_artifact_version_model.version) + 1
     )
+
+
+def test_visualization_cache_is_bounded_by_size():
+    """Tests that the visualization cache is bounded by its size."""
+    cache = _VisualizationCache(max_bytes=10, max_entry_bytes=5)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.set(first, b"aaaa")
+    cache.set(second, b"bbbb")
+    assert cache.get(first) == b"aaaa"
+
+    cache.set(third, b"cccc")
+    assert cache.size == 8
+    assert cache.get(second) is None
+    assert cache.get(first) == b"aaaa"
+
+    # Contents larger than the maximum entry size are never cached
+    cache.set(second, b"bbbbbb")
+    assert cache.get(second) is None
+
+    cache.clear()
+    assert cache.size == 0
+    assert cache.get(first) is None
+
+
+def test_artifact_store_cache_invalidation(mocker):
+    """Tests that cached artifact stores are invalidated and expire."""
+    mock_time = mocker.patch.object(artifact_utils, "time")
+    mock_time.monotonic.return_value = 0
+    cache = _ArtifactStoreCache(max_entries=2, max_age=60)
+    artifact_store_id = uuid4()
+    artifact_store = mocker.Mock()
+    version = (datetime(2024, 1, 1), datetime(2024, 1, 1))
+
+    cache.set(artifact_store_id, artifact_store, version=version)
+    assert cache.get(artifact_store_id, version=version) is artifact_store
+    # Updating the service connector invalidates the cached instance
+    assert (
+        cache.get(
+            artifact_store_id,
+            version=(datetime(2024, 1, 1), datetime(2024, 1, 2)),
+        )
+        is None
+    )
+    assert cache.get(artifact_store_id, version=version) is None
+
+    cache.set(artifact_store_id, artifact_store, version=version)
+    assert (
+        cache.get(artifact_store_id, version=(datetime(2024, 1, 2), None))
+        is None
+    )
+
+    cache.set(artifact_store_id, artifact_store, version=version)
+    mock_time.monotonic.return_value = 61
+    assert cache.get(artifact_store_id, version=version) is None
+
+    for _ in range(3):
+        cache.set(uuid4(), artifact_store, version=version)
+    assert len(cache._entries) == 2
+
+
+@pytest.mark.parametrize(
+    "visualization_type,head,media_type",
+    [
+        (VisualizationType.HTML, b"<html>", "text/html; charset=utf-8"),
+        (VisualizationType.CSV, b"a,b", "text/csv; charset=utf-8"),
+        (VisualizationType.IMAGE, b"\x89PNG\r\n\x1a\n", "image/png"),
+        (VisualizationType.IMAGE, b"\xff\xd8\xff\xe0", "image/jpeg"),
+        (VisualizationType.IMAGE, b"RIFF\x00\x00\x00\x00WEBP", "image/webp"),
+        (VisualizationType.IMAGE, b"<?xml?><svg>", "image/svg+xml"),
+        (VisualizationType.IMAGE, b"unknown", "application/octet-stream"),
+    ],
+)
+def test_visualization_media_types(visualization_type, head, media_type):
+    """Tests detecting the media type of visualizations."""
+    assert (
+        _get_visualization_media_type(visualization_type, head) == media_type
+    )
+
+
+@pytest.fixture
+def visualized_artifact(mocker):
+    """Artifact with an HTML visualization in a mocked artifact store."""
+    artifact_utils._visualization_cache.clear()
+    visualization = mocker.Mock(
+        spec=ArtifactVisualizationResponse,
+        id=uuid4(),
+        type=VisualizationType.HTML,
+        uri="memory://visualization.html",
+    )
+    artifact = mocker.Mock(
+        spec=ArtifactVersionResponse,
+        id=uuid4(),
+        visualizations=[visualization],
+        artifact_store_id=uuid4(),
+    )
+    artifact_store = mocker.Mock()
+    artifact_store.open.side_effect = lambda *args, **kwargs: io.BytesIO(
+        b"<h1>Hello</h1>"
+    )
+    mocker.patch.object(
+        artifact_utils, "_load_artifact_store", return_value=artifact_store
+    )
+    yield artifact, artifact_store
+    artifact_utils._visualization_cache.clear()
+
+
+def test_streamed_visualizations_are_cached(visualized_artifact):
+    """Tests that visualizations are only read once."""
+    artifact, artifact_store = visualized_artifact
+
+    stream = stream_artifact_visualization(artifact=artifact)
+    assert stream.media_type == "text/html; charset=utf-8"
+    assert b"".join(stream.chunks) == b"<h1>Hello</h1>"
+
+    stream = stream_artifact_visualization(artifact=artifact)
+    assert b"".join(stream.chunks) == b"<h1>Hello</h1>"
+    loaded = load_artifact_visualization(artifact=artifact, use_cache=True)
+    assert loaded.value == "<h1>Hello</h1>"
+    assert artifact_store.open.call_count == 1
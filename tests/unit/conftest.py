@@ -725,6 +725,7 @@ status = {
     "state": ServiceState.ACTIVE,
     "last_state": ServiceState.INACTIVE,
     "last_error": "",
+    "last_status_update": None,
 }
 endpoint = None
 prediction_url = "http://example.com/predict"
@@ -12,8 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import os
+import tarfile
+import tempfile
+import time
 
 from zenml.image_builders import BuildContext
+from zenml.image_builders import build_context as build_context_module
 
 
 def test_adding_extra_files(tmp_path):
@@ -79,3 +83,64 @@ def test_build_context_includes_and_excludes(tmp_path):
         ".zen",
         os.path.join(".zen", "config.yaml"),
     }
+
+
+def test_build_context_checksum(tmp_path):
+    """Tests that the checksum only depends on the build context content."""
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "1").write_text("file 1")
+    (root / "2").write_text("file 2")
+    (root / ".dockerignore").write_text("/2")
+
+    checksum = BuildContext(root=str(root)).compute_checksum()
+    assert BuildContext(root=str(root)).compute_checksum() == checksum
+
+    # Changing an ignored file doesn't change the checksum
+    (root / "2").write_text("changed file 2")
+    assert BuildContext(root=str(root)).compute_checksum() == checksum
+
+    (root / "1").write_text("changed file 1")
+    assert BuildContext(root=str(root)).compute_checksum() != checksum
+
+    build_context = BuildContext(root=str(root))
+    build_context.add_file("content", destination="extra")
+    assert build_context.compute_checksum() != checksum
+
+
+def test_build_context_checksum_reuses_file_hashes(mocker, tmp_path):
+    """Tests that unchanged files are not hashed again."""
+    root = tmp_path / "root"
+    root.mkdir()
+    file_path = root / "file"
+    file_path.write_text("content")
+    # Make sure the file is old enough for its hash to be cached
+    os.utime(file_path, (time.time() - 60, time.time() - 60))
+
+    hash_file = mocker.spy(build_context_module, "_hash_file")
+    checksum = BuildContext(root=str(root)).compute_checksum()
+    assert BuildContext(root=str(root)).compute_checksum() == checksum
+    assert hash_file.call_count == 1
+
+    file_path.write_text("new content")
+    assert BuildContext(root=str(root)).compute_checksum() != checksum
+    assert hash_file.call_count == 2
+
+
+def test_writing_compressed_archive_in_chunks(mocker, tmp_path):
+    """Tests that archives compressed in chunks can be extracted."""
+    mocker.patch.object(build_context_module, "COMPRESSION_CHUNK_SIZE", 1024)
+    root = tmp_path / "root"
+    root.mkdir()
+    content = os.urandom(10 * 1024)
+    (root / "file").write_bytes(content)
+
+    build_context = BuildContext(root=str(root))
+    build_context.add_file("extra content", destination="extra")
+
+    with tempfile.TemporaryFile() as f:
+        build_context.write_archive(f, gzip=True)
+
+        with tarfile.open(fileobj=f, mode="r:gz") as archive:
+            assert archive.extractfile("file").read() == content
+            assert archive.extractfile("extra").read() == b"extra content"
@@ -0,0 +1,64 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pytest
+
+from zenml.integrations.integration import Integration
+from zenml.integrations.registry import IntegrationRegistry
+from zenml.utils import integration_utils
+
+
+@pytest.mark.parametrize(
+    "requirement, installed",
+    [
+        ("pytest", True),
+        ("pytest>=1.0", True),
+        ("pytest<1.0", False),
+        ("pytest; python_version < '3.0'", True),
+        ("zenml-package-that-does-not-exist", False),
+        ("pytest[extra-that-does-not-exist]", False),
+        ("invalid requirement[", False),
+    ],
+)
+def test_checking_a_requirement(requirement, installed):
+    """Tests checking whether a requirement is installed."""
+    assert Integration._check_requirement(requirement) is installed
+
+
+def test_installation_check_uses_cache(mocker, tmp_path):
+    """Tests that installation check results are cached."""
+    cache = integration_utils.IntegrationInstallationCache(
+        path=str(tmp_path / "cache.json")
+    )
+    mocker.patch("zenml.integrations.integration.installation_cache", cache)
+    mocker.patch.object(Integration, "REQUIREMENTS", ["pytest"])
+    check = mocker.spy(Integration, "_check_requirement")
+
+    assert Integration.check_installation() is True
+    assert Integration.check_installation() is True
+    assert check.call_count == 1
+
+
+def test_integrations_are_only_activated_once(mocker):
+    """Tests that the registry activates each integration once."""
+    registry = IntegrationRegistry()
+    integration = mocker.Mock()
+    integration.check_installation.return_value = True
+    registry.register_integration("mock", integration)
+
+    assert registry.activate_integration("mock") is True
+    registry.activate_integrations()
+
+    integration.activate.assert_called_once()
+    assert registry.activate_integration("not_registered") is False
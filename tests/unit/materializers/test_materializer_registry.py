@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 from contextlib import ExitStack as does_not_raise
 
+import pytest
+
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.steps import step
 
@@ -108,3 +110,77 @@ def test_materializer_with_conflicting_parameter_and_explicit_materializer():
 
     with does_not_raise():
         some_step().configure(output_materializers=MyFirstMaterializer)()
+
+
+def test_materializer_lookups_are_invalidated_on_registration():
+    """Tests that memoized materializer lookups are invalidated when a new
+    materializer gets registered."""
+    from zenml.materializers.cloudpickle_materializer import (
+        CloudpickleMaterializer,
+    )
+    from zenml.materializers.materializer_registry import MaterializerRegistry
+
+    class MyThirdType(MyFirstType):
+        pass
+
+    registry = MaterializerRegistry()
+    assert registry[MyThirdType] is CloudpickleMaterializer
+    assert not registry.is_registered(MyThirdType)
+
+    registry.register_materializer_type(MyFirstType, MyFirstMaterializer)
+    assert registry[MyThirdType] is MyFirstMaterializer
+    assert registry.is_registered(MyThirdType)
+
+    registry.register_and_overwrite_type(MyThirdType, MySecondMaterializer)
+    assert registry[MyThirdType] is MySecondMaterializer
+
+    # Modifications that don't use the registration methods
+    registry.materializer_types = {}
+    assert registry[MyThirdType] is CloudpickleMaterializer
+    assert not registry.is_registered(MyThirdType)
+
+
+def test_default_materializer_can_be_passed_per_lookup():
+    """Tests that the default materializer can be passed per lookup without
+    modifying the registry."""
+    from zenml.materializers.cloudpickle_materializer import (
+        CloudpickleMaterializer,
+    )
+    from zenml.materializers.materializer_registry import MaterializerRegistry
+
+    registry = MaterializerRegistry()
+    registry.register_materializer_type(MyFirstType, MyFirstMaterializer)
+
+    assert (
+        registry.get_materializer(
+            MySecondType, default_materializer=MySecondMaterializer
+        )
+        is MySecondMaterializer
+    )
+    assert (
+        registry.get_materializer(
+            MyConflictingType, default_materializer=MySecondMaterializer
+        )
+        is MyFirstMaterializer
+    )
+    assert registry.default_materializer is None
+    assert registry[MySecondType] is CloudpickleMaterializer
+
+
+def test_materializer_selection():
+    """Tests selecting a materializer from a list of candidates."""
+    from zenml.utils import materializer_utils
+
+    materializer_classes = [MySecondMaterializer, MyFirstMaterializer]
+    assert (
+        materializer_utils.select_materializer(
+            MyConflictingType, materializer_classes=materializer_classes
+        )
+        is MyFirstMaterializer
+    )
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            materializer_utils.select_materializer(
+                int, materializer_classes=materializer_classes
+            )
@@ -0,0 +1,216 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.services.test_service import TestService
+from zenml.enums import StackComponentType
+from zenml.model_deployers import base_model_deployer
+from zenml.model_deployers.base_model_deployer import (
+    BaseModelDeployer,
+    BaseModelDeployerConfig,
+)
+from zenml.services import ServiceState
+from zenml.services.service_status import ServiceStatus
+
+
+class _StubModelDeployer(BaseModelDeployer):
+    """Model deployer that can only find model servers."""
+
+    def perform_deploy_model(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def get_model_server_info(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def perform_stop_model(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def perform_start_model(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def perform_delete_model(self, *args, **kwargs):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def model_deployer():
+    """A stub model deployer."""
+    return _StubModelDeployer(
+        name="stub",
+        id=uuid4(),
+        config=BaseModelDeployerConfig(),
+        flavor="stub",
+        type=StackComponentType.MODEL_DEPLOYER,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+@pytest.fixture
+def mock_client(mocker):
+    """Mocks the client used by the model deployer."""
+    return mocker.patch.object(base_model_deployer, "Client").return_value
+
+
+def _get_service_response(service_response, last_status_update=None):
+    """Copies a service response with a new ID and status check time."""
+    status = ServiceStatus(
+        state=ServiceState.INACTIVE, last_status_update=last_status_update
+    )
+    response = service_response.copy(deep=True)
+    response.id = uuid4()
+    response.get_metadata().status = status.dict()
+    return response
+
+
+def test_statuses_are_refreshed_by_default(
+    model_deployer, mock_client, service_response, mocker
+):
+    """Tests that statuses are checked unless reusing them is requested."""
+    fresh = _get_service_response(
+        service_response, last_status_update=datetime.utcnow()
+    )
+    stale = _get_service_response(
+        service_response,
+        last_status_update=datetime.utcnow() - timedelta(hours=1),
+    )
+    mock_client.list_services.return_value.items = [fresh, stale]
+    check_status = mocker.patch.object(
+        TestService,
+        "check_status",
+        return_value=(ServiceState.ACTIVE, ""),
+        autospec=True,
+    )
+
+    services = model_deployer.find_model_server()
+    assert check_status.call_count == 2
+    assert [service.status.state for service in services] == [
+        ServiceState.ACTIVE,
+        ServiceState.ACTIVE,
+    ]
+
+    check_status.reset_mock()
+    model_deployer.find_model_server(refresh_status=False)
+    assert check_status.call_count == 0
+
+
+def test_only_stale_statuses_are_refreshed(
+    model_deployer, mock_client, service_response, mocker
+):
+    """Tests that recently checked statuses can be reused."""
+    fresh = _get_service_response(
+        service_response, last_status_update=datetime.utcnow()
+    )
+    stale = _get_service_response(
+        service_response,
+        last_status_update=datetime.utcnow() - timedelta(hours=1),
+    )
+    mock_client.list_services.return_value.items = [fresh, stale]
+    check_status = mocker.patch.object(
+        TestService,
+        "check_status",
+        return_value=(ServiceState.ACTIVE, ""),
+        autospec=True,
+    )
+
+    services = model_deployer.find_model_server(status_max_age=60)
+
+    assert [service.uuid for service in services] == [fresh.id, stale.id]
+    assert check_status.call_count == 1
+    assert services[0].status.state == ServiceState.INACTIVE
+    assert services[1].status.state == ServiceState.ACTIVE
+    mock_client.update_service.assert_called_once()
+    status = mock_client.update_service.call_args.kwargs["status"]
+    assert status["last_status_update"] > stale.status["last_status_update"]
+
+
+def test_unchanged_recent_statuses_are_not_stored(
+    model_deployer, mock_client, service_response, mocker
+):
+    """Tests that only the check time doesn't cause service updates."""
+    recent = _get_service_response(
+        service_response, last_status_update=datetime.utcnow()
+    )
+    old = _get_service_response(
+        service_response,
+        last_status_update=datetime.utcnow() - timedelta(hours=1),
+    )
+    mock_client.list_services.return_value.items = [recent, old]
+    mocker.patch.object(
+        TestService,
+        "check_status",
+        return_value=(ServiceState.INACTIVE, ""),
+        autospec=True,
+    )
+
+    model_deployer.find_model_server()
+
+    # Only the outdated check time of the second service is stored again
+    mock_client.update_service.assert_called_once()
+    assert mock_client.update_service.call_args.kwargs["id"] == old.id
+
+
+def test_statuses_are_refreshed_concurrently(
+    model_deployer, mock_client, service_response, mocker
+):
+    """Tests that slow status checks don't block other services."""
+    responses = [_get_service_response(service_response) for _ in range(4)]
+    mock_client.list_services.return_value.items = responses
+    mocker.patch.object(
+        base_model_deployer, "MODEL_SERVER_STATUS_REFRESH_TIMEOUT_SECONDS", 0.5
+    )
+
+    # All but the first check wait for each other, which only works if they
+    # run at the same time. The first check never finishes.
+    barrier = threading.Barrier(len(responses) - 1, timeout=5)
+    hanging = threading.Event()
+
+    abandoned_check_finished = threading.Event()
+
+    def _check_status(service):
+        if service.uuid == responses[0].id:
+            hanging.wait(10)
+            abandoned_check_finished.set()
+        else:
+            barrier.wait()
+        return ServiceState.ACTIVE, ""
+
+    mocker.patch.object(
+        TestService, "check_status", side_effect=_check_status, autospec=True
+    )
+
+    start = time.monotonic()
+    services = model_deployer.find_model_server()
+    first_service_status = services[0].status.copy()
+    hanging.set()
+
+    assert time.monotonic() - start < 3
+    assert [service.status.state for service in services] == [
+        ServiceState.INACTIVE,
+        ServiceState.ACTIVE,
+        ServiceState.ACTIVE,
+        ServiceState.ACTIVE,
+    ]
+    # The status check that timed out doesn't modify the returned service
+    # when it finishes later
+    abandoned_check_finished.wait(5)
+    assert services[0].status == first_service_status
@@ -12,12 +12,15 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import time
 from uuid import uuid4
 
 import pytest
 
+from zenml.constants import ENV_ZENML_WRITE_BEHIND_PUBLISHING
 from zenml.enums import ExecutionStatus
 from zenml.orchestrators import publish_utils
+from zenml.utils import publish_queue
 
 
 def test_publishing_a_successful_step_run(mocker):
@@ -131,3 +134,30 @@ def test_publish_step_run_metadata(mocker):
         step_run_metadata=step_run_metadata,
     )
     assert mock_create_run.call_count == 2  # once per run
+
+
+def test_step_run_is_published_after_queued_writes(mocker, monkeypatch):
+    """Tests that queued writes are stored before a step run is published."""
+    monkeypatch.setenv(ENV_ZENML_WRITE_BEHIND_PUBLISHING, "true")
+    mocker.patch.object(publish_queue, "_publish_queue", None)
+    calls = []
+    mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        side_effect=lambda *args: time.sleep(0.2) or calls.append("metadata"),
+    )
+    mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.update_run_step",
+        side_effect=lambda **kwargs: calls.append("step_run"),
+    )
+    step_run_id = uuid4()
+
+    publish_utils.publish_step_run_metadata(
+        step_run_id=step_run_id,
+        step_run_metadata={uuid4(): {"key": "value"}},
+    )
+    assert not calls
+
+    publish_utils.publish_successful_step_run(
+        step_run_id=step_run_id, output_artifact_ids={}
+    )
+    assert calls == ["metadata", "step_run"]
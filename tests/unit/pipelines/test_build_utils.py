@@ -575,3 +575,88 @@ def test_finding_existing_build(mocker, sample_deployment_response_model):
     )
 
     assert not build
+
+
+def test_build_checksum_includes_source_files(mocker):
+    """Tests that the build checksum includes files included in the image."""
+    mocker.patch.object(
+        BuildConfiguration,
+        "compute_settings_checksum",
+        return_value="settings_checksum",
+    )
+    mocker.patch(
+        "zenml.new.pipelines.build_utils.compute_source_files_checksum",
+        return_value="source_files_checksum",
+    )
+
+    build_config = BuildConfiguration(
+        key="key", settings=DockerSettings(source_files="include")
+    )
+    checksum = build_utils.compute_build_checksum(
+        items=[build_config], stack=Client().active_stack
+    )
+
+    mocker.patch(
+        "zenml.new.pipelines.build_utils.compute_source_files_checksum",
+        return_value="different_source_files_checksum",
+    )
+    assert checksum != build_utils.compute_build_checksum(
+        items=[build_config], stack=Client().active_stack
+    )
+
+    # Source files are ignored if they're downloaded instead of included
+    build_config = BuildConfiguration(
+        key="key", settings=DockerSettings(source_files="download")
+    )
+    checksum = build_utils.compute_build_checksum(
+        items=[build_config],
+        stack=Client().active_stack,
+        code_repository=StubCodeRepository(),
+    )
+    mocker.patch(
+        "zenml.new.pipelines.build_utils.compute_source_files_checksum",
+        return_value="source_files_checksum",
+    )
+    assert checksum == build_utils.compute_build_checksum(
+        items=[build_config],
+        stack=Client().active_stack,
+        code_repository=StubCodeRepository(),
+    )
+
+
+def test_finding_existing_build_that_includes_code(
+    mocker, sample_deployment_response_model
+):
+    """Tests finding an existing build that includes code."""
+    mock_list_builds = mocker.patch(
+        "zenml.client.Client.list_builds",
+        return_value=Page(
+            index=1,
+            max_size=1,
+            total_pages=1,
+            total=0,
+            items=[],
+        ),
+    )
+    mocker.patch(
+        "zenml.new.pipelines.build_utils.compute_build_checksum",
+        return_value="checksum",
+    )
+    mocker.patch.object(
+        Stack,
+        "get_docker_builds",
+        return_value=[
+            BuildConfiguration(
+                key="key", settings=DockerSettings(source_files="include")
+            )
+        ],
+    )
+
+    build_utils.find_existing_build(
+        deployment=sample_deployment_response_model
+    )
+
+    # The checksum includes the code, so builds that contain code can be
+    # reused
+    assert mock_list_builds.call_args.kwargs["contains_code"] is None
+    assert mock_list_builds.call_args.kwargs["checksum"] == "checksum"
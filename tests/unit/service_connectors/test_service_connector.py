@@ -0,0 +1,363 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, ClassVar, List, Optional
+from uuid import uuid4
+
+import pytest
+
+from zenml.exceptions import AuthorizationException
+from zenml.models import (
+    AuthenticationMethodModel,
+    ResourceTypeModel,
+    ServiceConnectorTypeModel,
+)
+from zenml.service_connectors.service_connector import (
+    AuthenticationConfig,
+    ServiceConnector,
+    ServiceConnectorCache,
+    verify_service_connectors,
+)
+from zenml.service_connectors.service_connector_registry import (
+    service_connector_registry,
+)
+
+
+class _Factory:
+    """Factory that counts how often it was called."""
+
+    def __init__(self, lifetime=None, delay=0.0):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            value = self.calls
+        time.sleep(self.delay)
+        expires_at = None
+        if self.lifetime is not None:
+            expires_at = datetime.now(timezone.utc) + self.lifetime
+        return value, expires_at
+
+
+def test_cache_reuses_values():
+    """Tests that values are only created once per key."""
+    cache = ServiceConnectorCache()
+    connector_id = uuid4()
+    factory = _Factory()
+
+    for _ in range(3):
+        value, expires_at = cache.get_or_create(
+            connector_id, ("client", "s3-bucket", "s3://a"), factory
+        )
+        assert value == 1
+        assert expires_at is None
+
+    cache.get_or_create(
+        connector_id, ("client", "s3-bucket", "s3://b"), factory
+    )
+    cache.get_or_create(uuid4(), ("client", "s3-bucket", "s3://a"), factory)
+
+    assert factory.calls == 3
+    stats = cache.stats()
+    assert stats.hits == 2
+    assert stats.misses == 3
+    assert stats.size == 3
+
+
+def test_cache_creates_values_once_for_concurrent_requests():
+    """Tests that concurrent requests for a missing value wait for it."""
+    cache = ServiceConnectorCache()
+    factory = _Factory(delay=0.1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(
+            executor.map(
+                lambda _: cache.get_or_create(None, "key", factory)[0],
+                range(8),
+            )
+        )
+
+    assert values == [1] * 8
+    assert factory.calls == 1
+
+
+def test_cache_discards_expired_values():
+    """Tests that values are re-created once they expire."""
+    cache = ServiceConnectorCache()
+    factory = _Factory(lifetime=timedelta(minutes=10))
+
+    assert cache.get_or_create(None, "key", factory, refresh_margin=0)[0] == 1
+    assert cache.get_or_create(None, "key", factory, refresh_margin=0)[0] == 1
+    # A skew tolerance larger than the lifetime expires values immediately
+    assert (
+        cache.get_or_create(
+            None, "other", factory, skew_tolerance=3600, refresh_margin=0
+        )[0]
+        == 2
+    )
+    assert (
+        cache.get_or_create(
+            None, "other", factory, skew_tolerance=3600, refresh_margin=0
+        )[0]
+        == 3
+    )
+    assert cache.stats().expirations == 1
+
+
+def test_cache_refreshes_values_proactively(mocker):
+    """Tests that values close to their expiration time are refreshed."""
+    cache = ServiceConnectorCache()
+    factory = _Factory(lifetime=timedelta(minutes=60))
+    cache.get_or_create(None, "key", factory, refresh_margin=10 * 60)
+
+    now = datetime.now(timezone.utc) + timedelta(minutes=55)
+    mock_datetime = mocker.patch(
+        "zenml.service_connectors.service_connector.datetime"
+    )
+    mock_datetime.now.return_value = now
+
+    assert cache.get_or_create(None, "key", factory)[0] == 2
+    assert cache.stats().refreshes == 1
+
+
+def test_cache_uses_valid_value_if_refresh_fails(mocker):
+    """Tests that a failing refresh falls back to the still valid value."""
+    cache = ServiceConnectorCache()
+    factory = _Factory(lifetime=timedelta(minutes=60))
+    cache.get_or_create(None, "key", factory, refresh_margin=10 * 60)
+
+    now = datetime.now(timezone.utc) + timedelta(minutes=55)
+    mock_datetime = mocker.patch(
+        "zenml.service_connectors.service_connector.datetime"
+    )
+    mock_datetime.now.return_value = now
+
+    def _failing_factory():
+        raise RuntimeError("Authentication failed.")
+
+    assert cache.get_or_create(None, "key", _failing_factory)[0] == 1
+    assert cache.stats().failed_refreshes == 1
+
+    # Once the value expired, the error is raised
+    mock_datetime.now.return_value = now + timedelta(minutes=10)
+    with pytest.raises(RuntimeError):
+        cache.get_or_create(None, "key", _failing_factory)
+
+
+def test_cache_evicts_least_recently_used_values():
+    """Tests that the cache size is limited."""
+    cache = ServiceConnectorCache(max_entries=2)
+    factory = _Factory()
+
+    cache.get_or_create(None, "a", factory)
+    cache.get_or_create(None, "b", factory)
+    cache.get_or_create(None, "a", factory)
+    cache.get_or_create(None, "c", factory)
+
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.size == 2
+    assert cache.get_or_create(None, "a", factory)[0] == 1
+    assert cache.get_or_create(None, "b", factory)[0] == 4
+
+
+def test_cache_invalidation():
+    """Tests that the values of a connector can be removed."""
+    cache = ServiceConnectorCache()
+    connector_id = uuid4()
+    factory = _Factory()
+
+    cache.get_or_create(connector_id, "a", factory)
+    cache.get_or_create(connector_id, "b", factory)
+    cache.get_or_create(None, "a", factory)
+
+    cache.invalidate(connector_id)
+    assert cache.stats().size == 1
+    assert cache.get_or_create(connector_id, "a", factory)[0] == 4
+
+    cache.invalidate()
+    assert cache.stats().size == 0
+
+
+FAKE_CONNECTOR_TYPE = "fake-test"
+FAKE_RESOURCE_TYPES = ["fake-bucket", "fake-registry", "fake-cluster"]
+
+
+class FakeConfiguration(AuthenticationConfig):
+    """Fake connector configuration."""
+
+    blocked: bool = False
+    authorized: bool = True
+
+
+@pytest.fixture
+def fake_connector_class():
+    """Registers a fake connector type that verifies in-process.
+
+    Verifications of individual resource types wait until the other resource
+    types are verified at the same time, so they only succeed if they run
+    concurrently. Verifications of blocked connectors wait until the
+    `release` event of the connector class is set.
+    """
+    barrier = threading.Barrier(len(FAKE_RESOURCE_TYPES), timeout=5)
+    release = threading.Event()
+
+    class FakeServiceConnector(ServiceConnector):
+        config: FakeConfiguration
+        release: ClassVar[threading.Event]
+
+        @classmethod
+        def _get_connector_type(cls) -> ServiceConnectorTypeModel:
+            return ServiceConnectorTypeModel(
+                name="Fake connector",
+                connector_type=FAKE_CONNECTOR_TYPE,
+                auth_methods=[
+                    AuthenticationMethodModel(
+                        name="Fake",
+                        auth_method="fake",
+                        config_class=FakeConfiguration,
+                    )
+                ],
+                resource_types=[
+                    ResourceTypeModel(
+                        name=resource_type,
+                        resource_type=resource_type,
+                        auth_methods=["fake"],
+                        supports_instances=True,
+                    )
+                    for resource_type in FAKE_RESOURCE_TYPES
+                ],
+            )
+
+        def _connect_to_resource(self, **kwargs: Any) -> Any:
+            return None
+
+        def _configure_local_client(self, **kwargs: Any) -> None:
+            pass
+
+        @classmethod
+        def _auto_configure(cls, **kwargs: Any) -> "FakeServiceConnector":
+            raise NotImplementedError()
+
+        def _verify(
+            self,
+            resource_type: Optional[str] = None,
+            resource_id: Optional[str] = None,
+        ) -> List[str]:
+            if self.config.blocked:
+                release.wait()
+            if not self.config.authorized:
+                raise AuthorizationException("Invalid credentials.")
+            if not resource_type:
+                return []
+            if not resource_id:
+                barrier.wait()
+            return [resource_id or f"{resource_type}-1"]
+
+    FakeServiceConnector.release = release
+    yield FakeServiceConnector
+
+    release.set()
+    service_connector_registry.service_connector_types.pop(FAKE_CONNECTOR_TYPE)
+
+
+def _get_connector_model(connector_class, workspace, name, **config):
+    """Creates a response model for a fake connector."""
+    connector = connector_class(
+        auth_method="fake", config=FakeConfiguration(**config)
+    )
+    return connector.to_response_model(
+        workspace=workspace, name=name, id=uuid4()
+    )
+
+
+def test_verify_checks_resource_types_concurrently(fake_connector_class):
+    """Tests that all resource types of a connector are verified at once."""
+    connector = fake_connector_class(
+        auth_method="fake", config=FakeConfiguration()
+    )
+
+    resources = connector.verify()
+
+    assert resources.error is None
+    assert {r.resource_type: r.resource_ids for r in resources.resources} == {
+        resource_type: [f"{resource_type}-1"]
+        for resource_type in FAKE_RESOURCE_TYPES
+    }
+
+
+def test_verify_stops_on_global_authorization_failure(fake_connector_class):
+    """Tests that resource types are not verified if authentication fails."""
+    connector = fake_connector_class(
+        auth_method="fake", config=FakeConfiguration(authorized=False)
+    )
+
+    resources = connector.verify()
+
+    assert "authorization failure" in resources.error
+    assert all(r.resource_ids is None for r in resources.resources)
+
+
+def test_verify_service_connectors_returns_partial_results(
+    fake_connector_class, sample_workspace_model
+):
+    """Tests that slow and failing connectors don't prevent listing."""
+    connectors = [
+        _get_connector_model(
+            fake_connector_class, sample_workspace_model, "fast"
+        ),
+        _get_connector_model(
+            fake_connector_class, sample_workspace_model, "slow", blocked=True
+        ),
+        _get_connector_model(
+            fake_connector_class,
+            sample_workspace_model,
+            "unauthorized",
+            authorized=False,
+        ),
+    ]
+
+    resource_list = verify_service_connectors(connectors, timeout=1)
+    fake_connector_class.release.set()
+
+    fast, slow, unauthorized = resource_list
+    assert fast.name == "fast"
+    assert fast.error is None
+    assert all(r.resource_ids for r in fast.resources)
+    assert "timed out" in slow.error
+    assert [r.resource_type for r in slow.resources] == FAKE_RESOURCE_TYPES
+    assert "authorization failure" in unauthorized.error
+
+
+def test_verify_service_connectors_raises_unexpected_errors(
+    fake_connector_class, sample_workspace_model, mocker
+):
+    """Tests that only configuration and authorization errors are ignored."""
+    connector = _get_connector_model(
+        fake_connector_class, sample_workspace_model, "broken"
+    )
+    mocker.patch.object(
+        fake_connector_class, "verify", side_effect=RuntimeError("bug")
+    )
+
+    with pytest.raises(RuntimeError, match="bug"):
+        verify_service_connectors([connector])
@@ -11,6 +11,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import time
+from datetime import datetime, timedelta
 from typing import Generator, Optional, Tuple
 from uuid import UUID
 
@@ -110,3 +112,31 @@ def test_service_config_init_with_name():
     config = ServiceConfig(name="test-service")
     assert config.name == "test-service"
     assert config.service_name == f"{ZENM_ENDPOINT_PREFIX}test-service"
+
+
+def test_update_status_records_the_check_time(base_service):
+    """Test that the time of the last status check is stored."""
+    assert base_service.status.last_status_update is None
+
+    base_service.update_status()
+
+    last_status_update = base_service.status.last_status_update
+    assert last_status_update is not None
+    assert datetime.utcnow() - last_status_update < timedelta(minutes=1)
+
+
+def test_poll_service_status_detects_ready_services_quickly(
+    base_service, monkeypatch
+):
+    """Test that polling doesn't wait a full second between checks."""
+    ready_at = time.monotonic() + 0.3
+
+    def mock_check_status(self):
+        if time.monotonic() < ready_at:
+            return ServiceState.PENDING_STARTUP, ""
+        return ServiceState.ACTIVE, ""
+
+    monkeypatch.setattr(TestService, "check_status", mock_check_status)
+
+    assert base_service.poll_service_status(timeout=10)
+    assert time.monotonic() - ready_at < 0.5
@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 from contextlib import ExitStack as does_not_raise
+from datetime import datetime
 from typing import Dict, Generator, List, Mapping, Sequence, Type
 from uuid import uuid4
 
@@ -277,3 +278,44 @@ def test_stack_component_config_converts_json_strings():
     assert config.sequence_ == ["item"]
     assert config.dict_ == {"key": 1}
     assert config.mapping_ == {"key": 1}
+
+
+def test_connector_clients_are_recreated_after_connector_updates(
+    stub_component, mocker
+):
+    """Tests that cached connector clients are not used after an update."""
+    from zenml.models import ServiceConnectorRequirements
+    from zenml.service_connectors.service_connector import (
+        service_connector_cache,
+    )
+
+    stub_component.connector = uuid4()
+    stub_component.connector_requirements = ServiceConnectorRequirements(
+        resource_type="s3-bucket"
+    )
+    clients = [
+        mocker.MagicMock(valid_until=None),
+        mocker.MagicMock(valid_until=None),
+    ]
+    mocker.patch(
+        "zenml.client.Client.get_service_connector_client",
+        side_effect=clients,
+    )
+    connector = mocker.MagicMock(updated=datetime(2024, 1, 1))
+    mocker.patch.object(
+        type(Client().zen_store),
+        "get_service_connector",
+        return_value=connector,
+    )
+
+    try:
+        assert stub_component.get_connector() is clients[0]
+        stub_component._connector_instance = None
+        assert stub_component.get_connector() is clients[0]
+
+        # The connector was updated, e.g. by another process
+        connector.updated = datetime(2024, 1, 2)
+        stub_component._connector_instance = None
+        assert stub_component.get_connector() is clients[1]
+    finally:
+        service_connector_cache.invalidate(stub_component.connector)
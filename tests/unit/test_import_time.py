@@ -0,0 +1,101 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import importlib
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Upper bound for the cumulative import time of the CLI entrypoint. This is
+# deliberately generous to account for slow CI machines, the check for heavy
+# modules below catches most regressions.
+CLI_IMPORT_TIME_BUDGET_SECONDS = 10.0
+
+# Modules that are slow to import and must only be imported by the CLI
+# commands that actually need them.
+DEFERRED_MODULES = [
+    "docker",
+    "distutils",
+    "pkg_resources",
+    "zenml.integrations.registry",
+    "zenml.services.container.container_service",
+    "zenml.zen_server.deploy",
+    "zenml.zen_stores.rest_zen_store",
+    "zenml.zen_stores.sql_zen_store",
+]
+
+
+def _get_import_times(statement: str) -> Dict[str, float]:
+    """Gets the cumulative import times of all modules imported by a statement.
+
+    Args:
+        statement: The import statement to run in a new interpreter.
+
+    Returns:
+        Mapping of module names to their cumulative import time in seconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        try:
+            import_times[module.strip()] = int(cumulative) / 1e6
+        except ValueError:
+            # Header line
+            continue
+    return import_times
+
+
+def test_cli_import_time_is_within_budget():
+    """Tests that importing the CLI entrypoint is fast."""
+    import_times = _get_import_times("import zenml.cli.cli")
+
+    imported_heavy_modules = [
+        module for module in DEFERRED_MODULES if module in import_times
+    ]
+    assert not imported_heavy_modules
+    assert import_times["zenml.cli.cli"] < CLI_IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_lazy_cli_subcommands_match_registered_commands():
+    """Tests that all CLI commands are registered lazily."""
+    from zenml.cli.cli import cli
+
+    for modules in cli.lazy_subcommands.values():
+        for module in modules:
+            importlib.import_module(module)
+
+    assert set(cli.commands) == set(cli.lazy_subcommands)
+
+
+@pytest.mark.parametrize("command", ["stack", "model-deployer", "version"])
+def test_getting_a_lazy_cli_subcommand(command):
+    """Tests that lazily registered CLI commands can be retrieved."""
+    from click import Context
+
+    from zenml.cli.cli import cli
+
+    subcommand = cli.get_command(Context(cli), command)
+    assert subcommand is not None
+    assert subcommand.name == command
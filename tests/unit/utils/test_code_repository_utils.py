@@ -12,12 +12,24 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
 import pathlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+from git import Actor, Repo
 
 from tests.unit.pipelines.test_build_utils import (
     StubCodeRepository,
     StubLocalRepositoryContext,
 )
+from zenml.code_repositories import BaseCodeRepository
+from zenml.code_repositories.base_code_repository import (
+    normalize_repository_sub_directory,
+)
+from zenml.constants import ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY
 from zenml.models import Page
 from zenml.utils import code_repository_utils
 
@@ -109,3 +121,251 @@ def test_setting_a_custom_active_code_repo(mocker):
 
     # Cleanup
     code_repository_utils._CODE_REPOSITORY_CACHE = {}
+
+
+class LocalGitCodeRepository(BaseCodeRepository):
+    """Code repository that serves the files of a local git repository.
+
+    Stands in for a code repository hosted by a git hosting service.
+    """
+
+    def login(self) -> None:
+        pass
+
+    def get_local_context(self, path):
+        return None
+
+    def _download_file(self, git_repo, commit, path):
+        if path in self._config.get("failing_paths", []):
+            raise ConnectionError("Rate limit exceeded.")
+        return git_repo.git.show(f"{commit}:{path}", stdout_as_string=False)
+
+    def download_files(self, commit, directory, repo_sub_directory):
+        git_repo = Repo(self._config["path"])
+        if self._config.get("individual_files"):
+            paths = git_repo.git.ls_tree(
+                "-r", "--name-only", commit
+            ).splitlines()
+            prefix = normalize_repository_sub_directory(repo_sub_directory)
+            self._download_files_concurrently(
+                paths=[
+                    path
+                    for path in paths
+                    if not prefix or path.startswith(prefix + "/")
+                ],
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+                download_file=lambda path: self._download_file(
+                    git_repo, commit, path
+                ),
+            )
+            return
+
+        with tempfile.TemporaryFile() as f:
+            git_repo.archive(
+                f, treeish=commit, prefix=f"repo-{commit}/", format="tar.gz"
+            )
+            f.seek(0)
+            self._extract_archive(
+                archive=f,
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+            )
+
+
+@pytest.fixture
+def local_git_repo(tmp_path):
+    """Creates a local git repository with a single commit."""
+    path = tmp_path / "repo"
+    (path / "src" / "pipelines").mkdir(parents=True)
+    (path / "README.md").write_text("readme")
+    (path / "src" / "run.py").write_text("print('run')")
+    (path / "src" / "pipelines" / "pipeline.py").write_text("pipeline")
+
+    git_repo = Repo.init(path)
+    git_repo.index.add(
+        ["README.md", "src/run.py", "src/pipelines/pipeline.py"]
+    )
+    actor = Actor("zenml", "zenml@zenml.io")
+    commit = git_repo.index.commit("Initial", author=actor, committer=actor)
+    return str(path), commit.hexsha
+
+
+def _read_files(directory):
+    files = {}
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            files[os.path.relpath(path, directory)] = pathlib.Path(
+                path
+            ).read_text()
+    return files
+
+
+@pytest.mark.parametrize("individual_files", [False, True])
+def test_downloading_code_from_repository(
+    tmp_path, local_git_repo, individual_files
+):
+    """Tests downloading the files of a commit and subdirectory."""
+    path, commit = local_git_repo
+    repo = LocalGitCodeRepository(
+        id=uuid4(),
+        config={"path": path, "individual_files": individual_files},
+    )
+
+    repo.download_files(
+        commit=commit,
+        directory=str(tmp_path / "root"),
+        repo_sub_directory=".",
+    )
+    assert _read_files(tmp_path / "root") == {
+        "README.md": "readme",
+        os.path.join("src", "run.py"): "print('run')",
+        os.path.join("src", "pipelines", "pipeline.py"): "pipeline",
+    }
+
+    repo.download_files(
+        commit=commit,
+        directory=str(tmp_path / "src"),
+        repo_sub_directory="src",
+    )
+    assert _read_files(tmp_path / "src") == {
+        "run.py": "print('run')",
+        os.path.join("pipelines", "pipeline.py"): "pipeline",
+    }
+
+
+def test_downloading_invalid_repository_sub_directory(
+    tmp_path, local_git_repo
+):
+    """Tests that downloading a missing subdirectory fails."""
+    path, commit = local_git_repo
+    repo = LocalGitCodeRepository(id=uuid4(), config={"path": path})
+
+    with pytest.raises(RuntimeError):
+        repo.download_files(
+            commit=commit,
+            directory=str(tmp_path / "download"),
+            repo_sub_directory="does_not_exist",
+        )
+
+
+def test_code_downloads_are_cached(
+    mocker, monkeypatch, tmp_path, local_git_repo
+):
+    """Tests that concurrent code downloads of a commit share the files."""
+    monkeypatch.setenv(
+        ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY, str(tmp_path / "cache")
+    )
+    path, commit = local_git_repo
+    repo = LocalGitCodeRepository(id=uuid4(), config={"path": path})
+    download_files = mocker.spy(repo, "download_files")
+
+    def _download(index: int) -> None:
+        code_repository_utils.download_code_from_repository(
+            repo=repo,
+            commit=commit,
+            directory=str(tmp_path / f"code_{index}"),
+            repo_sub_directory="src",
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_download, range(4)))
+
+    assert download_files.call_count == 1
+    for index in range(4):
+        assert _read_files(tmp_path / f"code_{index}") == {
+            "run.py": "print('run')",
+            os.path.join("pipelines", "pipeline.py"): "pipeline",
+        }
+
+    # Other subdirectories are downloaded separately
+    code_repository_utils.download_code_from_repository(
+        repo=repo,
+        commit=commit,
+        directory=str(tmp_path / "root"),
+        repo_sub_directory=".",
+    )
+    assert download_files.call_count == 2
+
+
+def test_partial_code_downloads_are_not_cached(
+    monkeypatch, tmp_path, local_git_repo
+):
+    """Tests that a download with failed files is never cached."""
+    monkeypatch.setenv(
+        ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY, str(tmp_path / "cache")
+    )
+    path, commit = local_git_repo
+    repo = LocalGitCodeRepository(
+        id=uuid4(),
+        config={
+            "path": path,
+            "individual_files": True,
+            "failing_paths": ["src/run.py"],
+        },
+    )
+
+    with pytest.raises(RuntimeError, match="src/run.py"):
+        code_repository_utils.download_code_from_repository(
+            repo=repo,
+            commit=commit,
+            directory=str(tmp_path / "code"),
+            repo_sub_directory="src",
+        )
+
+    cache_directory = tmp_path / "cache" / str(repo.id) / commit
+    assert not [p for p in cache_directory.iterdir() if p.is_dir()]
+
+    # Lock files of failed downloads are cleaned up with the cache
+    code_repository_utils._evict_code_downloads(max_entries=1)
+    assert not list(cache_directory.iterdir())
+
+    repo._config["failing_paths"] = []
+    code_repository_utils.download_code_from_repository(
+        repo=repo,
+        commit=commit,
+        directory=str(tmp_path / "code"),
+        repo_sub_directory="src",
+    )
+    assert _read_files(tmp_path / "code") == {
+        "run.py": "print('run')",
+        os.path.join("pipelines", "pipeline.py"): "pipeline",
+    }
+
+
+def test_least_recently_used_code_downloads_are_evicted(
+    monkeypatch, tmp_path, local_git_repo
+):
+    """Tests that the code download cache is limited in size."""
+    monkeypatch.setenv(
+        ENV_ZENML_CODE_DOWNLOAD_CACHE_DIRECTORY, str(tmp_path / "cache")
+    )
+    monkeypatch.setattr(
+        code_repository_utils, "CODE_DOWNLOAD_CACHE_MAX_ENTRIES", 2
+    )
+    path, commit = local_git_repo
+    repo = LocalGitCodeRepository(id=uuid4(), config={"path": path})
+    cache_directory = tmp_path / "cache" / str(repo.id) / commit
+
+    def _cached_entries():
+        return {p.name for p in cache_directory.iterdir() if p.is_dir()}
+
+    entries = []
+    for index, sub_directory in enumerate(["src", ".", "src/pipelines"]):
+        code_repository_utils.download_code_from_repository(
+            repo=repo,
+            commit=commit,
+            directory=str(tmp_path / f"code_{index}"),
+            repo_sub_directory=sub_directory,
+        )
+        (new_entry,) = _cached_entries() - set(entries)
+        entries.append(new_entry)
+        # Make sure the access times of the entries differ
+        os.utime(cache_directory / new_entry, (index, index))
+
+    assert _cached_entries() == set(entries[1:])
+    # Lock files are removed together with their entries
+    assert {p.name for p in cache_directory.iterdir() if p.is_file()} == {
+        f"{entry}.lock" for entry in entries[1:]
+    }
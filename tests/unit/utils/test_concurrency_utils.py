@@ -0,0 +1,85 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+
+from zenml.utils.concurrency_utils import run_concurrently
+
+
+def test_run_concurrently_reports_results_in_order():
+    """Tests that task results and errors are returned in order."""
+
+    def _fail():
+        raise ValueError()
+
+    results = run_concurrently(
+        [lambda: 1, _fail, lambda: 3], max_workers=2, timeout=5
+    )
+
+    assert [r.value for r in results] == [1, None, 3]
+    assert isinstance(results[1].error, ValueError)
+    assert not any(r.timed_out for r in results)
+
+
+def test_run_concurrently_abandons_tasks_that_time_out():
+    """Tests that slow tasks don't block the remaining tasks."""
+    event = threading.Event()
+
+    start = time.monotonic()
+    results = run_concurrently(
+        [event.wait, lambda: 2, lambda: 3], max_workers=1, timeout=0.2
+    )
+    event.set()
+
+    assert time.monotonic() - start < 2
+    assert results[0].timed_out
+    assert [r.value for r in results[1:]] == [2, 3]
+
+
+def test_run_concurrently_workers_of_abandoned_tasks_exit():
+    """Tests that abandoned tasks don't increase the concurrency."""
+    release = threading.Event()
+    abandoned_task_finished = threading.Event()
+    task_threads = []
+
+    def _abandoned_task() -> None:
+        task_threads.append(threading.current_thread())
+        release.wait()
+        abandoned_task_finished.set()
+
+    def _task() -> None:
+        task_threads.append(threading.current_thread())
+        release.set()
+        abandoned_task_finished.wait(timeout=5)
+
+    results = run_concurrently(
+        [_abandoned_task] + [_task] * 5, max_workers=1, timeout=0.2
+    )
+
+    assert results[0].timed_out
+    assert not any(r.timed_out for r in results[1:])
+    # All remaining tasks ran one after another in the replacement worker
+    assert task_threads[0] not in task_threads[1:]
+    assert len(set(task_threads[1:])) == 1
+
+
+def test_run_concurrently_limits_abandoned_tasks():
+    """Tests that workers are not replaced forever if all tasks hang."""
+    event = threading.Event()
+
+    results = run_concurrently([event.wait] * 5, max_workers=1, timeout=0.05)
+    event.set()
+
+    assert all(r.timed_out for r in results)
@@ -12,6 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from zenml.constants import ENV_ZENML_DISABLE_INTEGRATION_INSTALLATION_CACHE
+from zenml.utils import integration_utils
 from zenml.utils.integration_utils import parse_requirement
 
 
@@ -80,3 +82,50 @@ def test_parse_requirement():
     requirement = " package "
     expected_output = (None, None)
     assert parse_requirement(requirement) == expected_output
+
+
+def test_installation_cache_persists_entries(tmp_path):
+    """Tests that the installation cache persists entries to disk."""
+    path = str(tmp_path / "cache.json")
+    cache = integration_utils.IntegrationInstallationCache(path=path)
+
+    assert cache.get("sklearn", ["scikit-learn"]) is None
+    cache.set("sklearn", ["scikit-learn"], True)
+    cache.save()
+
+    cache = integration_utils.IntegrationInstallationCache(path=path)
+    assert cache.get("sklearn", ["scikit-learn"]) is True
+    # Changed requirements invalidate the entry
+    assert cache.get("sklearn", ["scikit-learn>2"]) is None
+
+
+def test_installation_cache_is_invalidated_by_package_changes(
+    mocker, tmp_path
+):
+    """Tests that the cache is discarded if the installed packages change."""
+    path = str(tmp_path / "cache.json")
+    mocker.patch.object(
+        integration_utils, "get_site_packages_fingerprint", return_value="a"
+    )
+    cache = integration_utils.IntegrationInstallationCache(path=path)
+    cache.set("sklearn", ["scikit-learn"], False)
+    cache.save()
+
+    mocker.patch.object(
+        integration_utils, "get_site_packages_fingerprint", return_value="b"
+    )
+    cache = integration_utils.IntegrationInstallationCache(path=path)
+    assert cache.get("sklearn", ["scikit-learn"]) is None
+
+
+def test_installation_cache_can_be_disabled(tmp_path, monkeypatch):
+    """Tests that the installation cache can be disabled."""
+    monkeypatch.setenv(
+        ENV_ZENML_DISABLE_INTEGRATION_INSTALLATION_CACHE, "true"
+    )
+    cache = integration_utils.IntegrationInstallationCache(
+        path=str(tmp_path / "cache.json")
+    )
+
+    cache.set("sklearn", ["scikit-learn"], True)
+    assert cache.get("sklearn", ["scikit-learn"]) is None
@@ -0,0 +1,125 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import io
+import os
+import pickle
+import time
+from uuid import uuid4
+
+from zenml.utils import profiling_utils
+
+
+def _busy_wait(seconds: float) -> None:
+    """Uses the CPU for some time.
+
+    Args:
+        seconds: The number of seconds.
+    """
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_profiler_records_resource_usage():
+    """Tests that the profiler records CPU and memory usage."""
+    profiler = profiling_utils.StepProfiler("step_name", interval=0.02)
+    profiler.start()
+    _busy_wait(0.2)
+    profiler.stop()
+
+    usage = profiler.get_metadata()[
+        profiling_utils.RESOURCE_USAGE_METADATA_KEY
+    ]
+    assert usage["duration_seconds"] >= 0.2
+    assert usage["cpu_seconds"] > 0
+    assert 0 < usage["cpu_utilization"]
+    assert usage["peak_cpu_utilization"] > 0
+    assert usage["artifact_store_bytes_read"] == 0
+    assert usage["artifact_store_bytes_written"] == 0
+    if os.path.exists("/proc/self/statm"):
+        assert usage["peak_memory_bytes"] > 0
+
+
+def test_artifact_store_io_is_only_counted_while_profiling():
+    """Tests that file objects are only wrapped while a step is profiled."""
+    open_function = profiling_utils.count_artifact_store_io(
+        lambda data: io.BytesIO(data)
+    )
+    file = open_function(b"")
+    assert isinstance(file, io.BytesIO)
+
+    profiler = profiling_utils.StepProfiler("step_name")
+    profiler.start()
+    with open_function(b"0123456789") as file:
+        assert file.read(4) == b"0123"
+        assert list(file) == [b"456789"]
+        file.write(b"abc")
+        file.writelines([b"de", b"f"])
+    profiler.stop()
+
+    assert profiler.artifact_store_io == (10, 6)
+    assert not profiling_utils._artifact_store_io.active_profilers
+
+
+def test_artifact_store_io_wrapper_can_be_pickled():
+    """Tests that artifact stores with a wrapped `open` can be pickled."""
+    open_function = pickle.loads(
+        pickle.dumps(profiling_utils.count_artifact_store_io(io.BytesIO))
+    )
+    with open_function(b"data") as file:
+        assert file.read() == b"data"
+
+
+def test_aggregate_resource_usage():
+    """Tests that the resource usage of steps is aggregated."""
+    aggregate = profiling_utils.aggregate_resource_usage(
+        [
+            {
+                "duration_seconds": 1.0,
+                "cpu_seconds": 0.5,
+                "cpu_utilization": 0.5,
+                "peak_cpu_utilization": 0.8,
+                "peak_memory_bytes": 100,
+                "artifact_store_bytes_written": 10,
+            },
+            {
+                "duration_seconds": 3.0,
+                "cpu_seconds": 3.5,
+                "cpu_utilization": 1.167,
+                "peak_cpu_utilization": 1.5,
+                "peak_memory_bytes": 50,
+                "artifact_store_bytes_written": 5,
+                "artifact_store_bytes_read": 10,
+            },
+        ]
+    )
+
+    assert aggregate == {
+        "steps": 2,
+        "duration_seconds": 4.0,
+        "cpu_seconds": 4.0,
+        "cpu_utilization": 1.0,
+        "peak_cpu_utilization": 1.5,
+        "peak_memory_bytes": 100,
+        "artifact_store_bytes_written": 15,
+        "artifact_store_bytes_read": 10,
+    }
+
+
+def test_profiling_is_disabled_by_default():
+    """Tests that steps are only profiled if profiling is enabled."""
+    with profiling_utils.profile_step("step_name", uuid4()) as profiler:
+        assert profiler is None
+        assert not profiling_utils._artifact_store_io.active_profilers
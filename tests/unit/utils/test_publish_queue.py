@@ -0,0 +1,146 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from zenml.constants import ENV_ZENML_WRITE_BEHIND_PUBLISHING
+from zenml.enums import MetadataResourceTypes
+from zenml.utils import publish_queue
+from zenml.utils.publish_queue import PublishQueue
+
+
+@pytest.fixture
+def write_behind_publishing(mocker, monkeypatch):
+    """Enables write-behind publishing with a fresh queue."""
+    monkeypatch.setenv(ENV_ZENML_WRITE_BEHIND_PUBLISHING, "true")
+    mocker.patch.object(publish_queue, "_publish_queue", None)
+
+
+def test_writes_are_performed_immediately_if_disabled(monkeypatch):
+    """Tests that writes are not queued by default."""
+    monkeypatch.delenv(ENV_ZENML_WRITE_BEHIND_PUBLISHING, raising=False)
+    write = MagicMock()
+
+    publish_queue.publish(write, "arg", key="value")
+
+    assert publish_queue.get_publish_queue() is None
+    write.assert_called_once_with("arg", key="value")
+
+
+def test_writes_are_queued_until_flushed(write_behind_publishing):
+    """Tests that queued writes don't block and are stored on flush."""
+    unblock = threading.Event()
+    written = []
+
+    def _write(value: int) -> None:
+        unblock.wait()
+        written.append(value)
+
+    start = time.monotonic()
+    for i in range(5):
+        publish_queue.publish(_write, i)
+    assert time.monotonic() - start < 0.5
+    assert not written
+
+    unblock.set()
+    publish_queue.flush()
+    assert sorted(written) == list(range(5))
+
+
+def test_run_metadata_is_merged_per_resource(mocker):
+    """Tests that run metadata of the same resource is sent in one request."""
+    create_run_metadata = mocker.patch(
+        "zenml.client.Client.create_run_metadata"
+    )
+    queue = PublishQueue(batch_interval=1)
+    step_run_id = uuid4()
+    component_id = uuid4()
+
+    queue.submit_run_metadata(
+        {"a": 1}, step_run_id, MetadataResourceTypes.STEP_RUN
+    )
+    queue.submit_run_metadata(
+        {"b": 2}, step_run_id, MetadataResourceTypes.STEP_RUN
+    )
+    queue.submit_run_metadata(
+        {"c": 3},
+        step_run_id,
+        MetadataResourceTypes.STEP_RUN,
+        stack_component_id=component_id,
+    )
+    queue.flush()
+
+    requests = {
+        call.kwargs["stack_component_id"]: call.kwargs["metadata"]
+        for call in create_run_metadata.call_args_list
+    }
+    assert create_run_metadata.call_count == 2
+    assert requests == {None: {"a": 1, "b": 2}, component_id: {"c": 3}}
+
+
+def test_flushing_raises_failed_writes():
+    """Tests that errors of queued writes are raised when flushing."""
+    queue = PublishQueue(batch_interval=0)
+    succeeded = MagicMock()
+
+    queue.submit(MagicMock(side_effect=RuntimeError("write failed")))
+    queue.submit(succeeded)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        queue.flush()
+    succeeded.assert_called_once()
+
+    # Errors are only raised once
+    queue.flush()
+
+
+def test_flushing_can_log_failed_writes(mocker):
+    """Tests that errors of queued writes can be logged instead of raised."""
+    warning = mocker.patch.object(publish_queue.logger, "warning")
+    queue = PublishQueue(batch_interval=0)
+
+    queue.submit(MagicMock(side_effect=RuntimeError("write failed")))
+    queue.flush(raise_on_error=False)
+
+    assert "write failed" in warning.call_args.args[0]
+
+
+def test_flushing_only_waits_for_writes_of_the_calling_thread():
+    """Tests that a flush ignores the writes queued by other threads."""
+    queue = PublishQueue(batch_interval=0)
+    unblock = threading.Event()
+    own_write = MagicMock()
+    queue.submit(own_write)
+
+    def _queue_other_writes() -> None:
+        queue.submit(MagicMock(side_effect=RuntimeError("other step")))
+        queue.submit(unblock.wait)
+
+    thread = threading.Thread(target=_queue_other_writes)
+    thread.start()
+    thread.join()
+
+    # Neither blocked by nor failing because of the other thread's writes
+    queue.flush()
+    own_write.assert_called_once()
+    assert not unblock.is_set()
+
+    unblock.set()
+    with pytest.raises(RuntimeError, match="other step"):
+        queue.flush(all_producers=True)
@@ -345,3 +345,96 @@ def test_package_utility_functions():
         source_utils._get_package_version(package_name="non_existent_package")
         is None
     )
+
+
+def test_package_lookups_are_cached():
+    """Tests that the installed distributions are only inspected once."""
+    source_utils.clear_caches()
+
+    for _ in range(3):
+        assert source_utils._get_package_for_module("pytest") == "pytest"
+        assert (
+            source_utils._get_package_version("pytest") == pytest.__version__
+        )
+
+    assert source_utils._get_packages_distributions.cache_info().misses == 1
+    assert source_utils._get_package_version.cache_info().misses == 1
+
+
+def test_resolved_sources_are_cached(mocker):
+    """Tests that sources are only resolved once per object."""
+    source_utils.clear_caches()
+    spy = mocker.spy(source_utils, "get_source_type")
+
+    source = source_utils.resolve(pytest.fixture)
+    assert source_utils.resolve(pytest.fixture) == source
+    assert spy.call_count == 1
+
+    # Returned sources are copies that can be modified
+    source.attribute = "something_else"
+    assert source_utils.resolve(pytest.fixture).attribute == "fixture"
+
+
+def test_user_sources_are_cached_per_source_root(mocker, tmp_path):
+    """Tests that user sources are resolved again if the source root
+    changes."""
+    source_utils.clear_caches()
+    spy = mocker.spy(source_utils, "_resolve_module")
+
+    source_utils.set_custom_source_root(CURRENT_MODULE_PARENT_DIR)
+    try:
+        source = source_utils.resolve(EmptyClass)
+        assert source.type == SourceType.USER
+        assert source.module == __name__.split(".")[-1]
+        assert source_utils.resolve(EmptyClass) == source
+        assert spy.call_count == 1
+
+        parent_dir = str(pathlib.Path(CURRENT_MODULE_PARENT_DIR).parent)
+        source_utils.set_custom_source_root(parent_dir)
+        source = source_utils.resolve(EmptyClass)
+        assert source.module == ".".join(__name__.split(".")[-2:])
+        assert spy.call_count == 2
+    finally:
+        source_utils.set_custom_source_root(None)
+
+
+def test_loaded_modules_are_cached(mocker):
+    """Tests that loading sources doesn't import their modules again."""
+    source_utils.clear_caches()
+    spy = mocker.spy(source_utils, "_load_module")
+
+    from zenml import client
+
+    client_source = Source(
+        module="zenml.client", attribute="Client", type=SourceType.INTERNAL
+    )
+    assert source_utils.load(client_source) is client.Client
+    assert source_utils.load(client_source) is client.Client
+    assert spy.call_count == 1
+
+    # Attributes that get replaced after the first load are respected
+    mocker.patch.object(client, "Client", EmptyClass)
+    assert source_utils.load(client_source) is EmptyClass
+
+
+def test_resolving_and_loading_10k_objects(mocker):
+    """Tests that repeatedly resolving and loading objects hits the caches."""
+    from zenml.materializers import BuiltInMaterializer
+
+    source_utils.clear_caches()
+    mocker.patch.object(
+        source_utils,
+        "get_source_root",
+        return_value=str(pathlib.Path(__file__).resolve().parents[3]),
+    )
+    objects = [int, BuiltInMaterializer, pytest.fixture, EmptyClass]
+    source_type_spy = mocker.spy(source_utils, "get_source_type")
+    load_module_spy = mocker.spy(source_utils, "_load_source_module")
+
+    for i in range(10_000):
+        obj = objects[i % len(objects)]
+        assert source_utils.load(source_utils.resolve(obj)) is obj
+
+    # Only the first resolution and load of each object misses the caches
+    assert source_type_spy.call_count == len(objects)
+    assert load_module_spy.call_count == len(objects)
@@ -0,0 +1,204 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import time
+from typing import List
+
+import pytest
+
+from zenml import pipeline, step
+from zenml.constants import ENV_ZENML_STEP_TRACING
+from zenml.enums import StepExecutionPhase
+from zenml.utils import tracing_utils
+
+
+class _RecordingHook(tracing_utils.BaseTracingHook):
+    """Tracing hook that records all spans."""
+
+    def __init__(self) -> None:
+        """Initializes the hook."""
+        self.started: List[tracing_utils.Span] = []
+        self.ended: List[tracing_utils.Span] = []
+
+    def on_span_start(self, span: tracing_utils.Span) -> None:
+        """Records a started span.
+
+        Args:
+            span: The span.
+        """
+        self.started.append(span)
+
+    def on_span_end(self, span: tracing_utils.Span) -> None:
+        """Records an ended span.
+
+        Args:
+            span: The span.
+        """
+        self.ended.append(span)
+
+
+@pytest.fixture
+def recording_hook():
+    """Registers a recording tracing hook."""
+    hook = _RecordingHook()
+    tracing_utils.register_tracing_hook(hook)
+    yield hook
+    tracing_utils.unregister_tracing_hook(hook)
+
+
+def test_spans_are_noops_without_trace_or_hooks():
+    """Tests that spans don't record anything if nobody is listening."""
+    with tracing_utils.span(StepExecutionPhase.USER_FUNCTION):
+        pass
+
+    assert tracing_utils.get_active_trace() is None
+
+
+def test_trace_step_is_a_noop_if_tracing_is_disabled():
+    """Tests that no trace is created if nobody is listening."""
+    with tracing_utils.trace_step("step_name") as trace:
+        assert trace is None
+        assert tracing_utils.get_active_trace() is None
+
+
+def test_trace_records_exclusive_phase_durations(monkeypatch, recording_hook):
+    """Tests that nested spans are not counted towards their parents."""
+    monkeypatch.setenv(ENV_ZENML_STEP_TRACING, "true")
+    with tracing_utils.trace_step("step_name") as trace:
+        with tracing_utils.span(StepExecutionPhase.USER_FUNCTION):
+            time.sleep(0.02)
+            with tracing_utils.span(StepExecutionPhase.OUTPUT_MATERIALIZATION):
+                time.sleep(0.05)
+
+    spans = {span.phase: span for span in recording_hook.ended}
+    parent = spans[StepExecutionPhase.USER_FUNCTION]
+    child = spans[StepExecutionPhase.OUTPUT_MATERIALIZATION]
+    durations = trace.phase_durations
+    assert durations[StepExecutionPhase.OUTPUT_MATERIALIZATION] >= 0.05
+    assert durations[StepExecutionPhase.USER_FUNCTION] >= 0.02
+    assert durations[StepExecutionPhase.USER_FUNCTION] == pytest.approx(
+        parent.duration - child.duration, abs=1e-6
+    )
+    assert durations[StepExecutionPhase.USER_FUNCTION] < parent.duration
+    assert StepExecutionPhase.OTHER in durations
+
+    metadata = trace.get_metadata()
+    assert set(metadata[tracing_utils.PHASE_DURATIONS_METADATA_KEY]) == {
+        "user_function",
+        "output_materialization",
+        "other",
+    }
+
+
+def test_nested_traces_use_the_outer_trace(monkeypatch):
+    """Tests that only the outermost trace collects spans."""
+    monkeypatch.setenv(ENV_ZENML_STEP_TRACING, "true")
+    with tracing_utils.trace_step("outer") as outer:
+        with tracing_utils.trace_step("inner") as inner:
+            assert inner is None
+            with tracing_utils.span(StepExecutionPhase.INPUT_LOADING):
+                pass
+
+    assert StepExecutionPhase.INPUT_LOADING in outer.phase_durations
+
+
+def test_hooks_receive_spans(recording_hook):
+    """Tests that hooks receive spans including their parents and errors."""
+    with pytest.raises(RuntimeError):
+        with tracing_utils.span(
+            StepExecutionPhase.USER_FUNCTION, name="outer"
+        ):
+            with tracing_utils.span(
+                StepExecutionPhase.INPUT_LOADING, input_name="a"
+            ):
+                raise RuntimeError()
+
+    assert [span.name for span in recording_hook.started] == [
+        "outer",
+        "input_loading",
+    ]
+    inner, outer = recording_hook.ended
+    assert inner.parent_id == outer.id
+    assert inner.attributes == {"input_name": "a"}
+    assert inner.failed and outer.failed
+    assert outer.duration >= inner.duration
+
+
+def test_failing_hooks_dont_interrupt_the_step():
+    """Tests that exceptions raised by hooks are ignored."""
+
+    class _FailingHook(tracing_utils.BaseTracingHook):
+        def on_span_start(self, span: tracing_utils.Span) -> None:
+            raise RuntimeError()
+
+    hook = _FailingHook()
+    tracing_utils.register_tracing_hook(hook)
+    try:
+        with tracing_utils.span(StepExecutionPhase.USER_FUNCTION):
+            pass
+    finally:
+        tracing_utils.unregister_tracing_hook(hook)
+
+
+@step
+def _traced_step(value: int) -> int:
+    return value + 1
+
+
+@pipeline(enable_cache=False)
+def _traced_pipeline() -> None:
+    _traced_step(_traced_step(1))
+
+
+def test_phase_durations_are_stored_as_step_run_metadata(
+    clean_client, monkeypatch
+):
+    """Tests that step phase durations are stored if tracing is enabled."""
+    monkeypatch.setenv(ENV_ZENML_STEP_TRACING, "true")
+
+    run = _traced_pipeline.with_options(unlisted=True)()
+
+    step_run = run.steps["_traced_step_2"]
+    durations = step_run.run_metadata[
+        tracing_utils.PHASE_DURATIONS_METADATA_KEY
+    ].value
+    for phase in [
+        StepExecutionPhase.RUN_CREATION,
+        StepExecutionPhase.INPUT_RESOLUTION,
+        StepExecutionPhase.CACHE_LOOKUP,
+        StepExecutionPhase.INPUT_LOADING,
+        StepExecutionPhase.USER_FUNCTION,
+        StepExecutionPhase.OUTPUT_MATERIALIZATION,
+        StepExecutionPhase.VISUALIZATION,
+        StepExecutionPhase.METADATA_EXTRACTION,
+        StepExecutionPhase.PUBLISHING,
+    ]:
+        assert phase.value in durations
+
+    # The step runner runs in the same process and uses the launcher trace
+    assert (
+        tracing_utils.STEP_OPERATOR_PHASE_DURATIONS_METADATA_KEY
+        not in step_run.run_metadata
+    )
+
+
+def test_phase_durations_are_not_stored_by_default(clean_client):
+    """Tests that step tracing is disabled by default."""
+    run = _traced_pipeline.with_options(unlisted=True)()
+
+    for step_run in run.steps.values():
+        assert (
+            tracing_utils.PHASE_DURATIONS_METADATA_KEY
+            not in step_run.run_metadata
+        )
@@ -0,0 +1,125 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from zenml.zen_server import metrics
+from zenml.zen_server.metrics import (
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    instrument_zen_store,
+)
+
+
+@pytest.fixture
+def enable_metrics(mocker):
+    """Enables metrics collection."""
+    mocker.patch.object(metrics, "metrics_enabled", return_value=True)
+
+
+def test_histogram_rendering():
+    """Tests that histograms are rendered with cumulative buckets."""
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("test_duration", "Test.", ["method"], buckets=(0.1, 1.0))
+    )
+
+    histogram.observe(0.05, method="get")
+    histogram.observe(0.5, method="get")
+    histogram.observe(5, method="get")
+
+    assert histogram.get_count(method="get") == 3
+    lines = registry.render().splitlines()
+    assert "# TYPE test_duration histogram" in lines
+    assert 'test_duration_bucket{method="get",le="0.1"} 1.0' in lines
+    assert 'test_duration_bucket{method="get",le="1.0"} 2.0' in lines
+    assert 'test_duration_bucket{method="get",le="+Inf"} 3.0' in lines
+    assert 'test_duration_count{method="get"} 3.0' in lines
+    assert 'test_duration_sum{method="get"} 5.55' in lines
+
+
+def test_metric_label_validation():
+    """Tests that observations with wrong labels are rejected."""
+    histogram = Histogram("test_duration", "Test.", ["method"])
+
+    with pytest.raises(ValueError):
+        histogram.observe(1, router="runs")
+
+
+def test_gauge_reads_value_from_callback():
+    """Tests that gauges collect their value when rendered."""
+    gauge = Gauge("test_connections", "Test.", ["state"])
+    gauge.set_function(lambda: 3, state="checked_out")
+
+    assert 'test_connections{state="checked_out"} 3.0' in gauge.render()
+
+
+def test_histogram_timer_respects_enabled_setting(mocker):
+    """Tests that the histogram timer only records if metrics are enabled."""
+    histogram = Histogram("test_duration", "Test.")
+
+    mocker.patch.object(metrics, "metrics_enabled", return_value=False)
+    with histogram.time():
+        pass
+    assert histogram.get_count() == 0
+
+    mocker.patch.object(metrics, "metrics_enabled", return_value=True)
+    with histogram.time():
+        pass
+    assert histogram.get_count() == 1
+
+
+def test_store_instrumentation_attributes_queries(enable_metrics, tmp_path):
+    """Tests that store calls and their SQL queries are recorded."""
+
+    class _Store:
+        def __init__(self) -> None:
+            self.engine = create_engine(
+                f"sqlite:///{tmp_path / 'zenml.db'}", poolclass=QueuePool
+            )
+
+        def list_runs(self) -> int:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            return 42
+
+    store = _Store()
+    instrument_zen_store(store)
+    # Instrumenting twice must not record the calls twice
+    instrument_zen_store(store)
+
+    assert store.list_runs() == 42
+    assert metrics.STORE_CALL_DURATION.get_count(method="list_runs") == 1
+    assert metrics.SQL_QUERY_DURATION.get_count(store_method="list_runs") == 2
+    assert 'zenml_db_pool_connections{state="checked_out"}' in (
+        metrics.REGISTRY.render()
+    )
+
+
+def test_failed_queries_dont_leave_stale_start_times(enable_metrics, tmp_path):
+    """Tests that the start times of failed queries are discarded."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'zenml.db'}")
+    metrics._instrument_engine(engine)
+
+    with engine.connect() as connection:
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing_table"))
+        assert not connection.info["zenml_query_start"]
+
+        connection.execute(text("SELECT 1"))
+        assert not connection.info["zenml_query_start"]
@@ -0,0 +1,81 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml.zen_stores.secrets_stores import base_secrets_store
+from zenml.zen_stores.secrets_stores.base_secrets_store import (
+    SecretValuesCache,
+)
+
+
+def test_secret_values_cache_stores_encrypted_values():
+    """Tests that cached secret values are not kept in plain text."""
+    cache = SecretValuesCache(ttl_seconds=30)
+    secret_id = uuid4()
+
+    cache.set(secret_id, {"password": "space cat"})
+
+    assert cache.enabled
+    assert cache.get(secret_id) == {"password": "space cat"}
+    _, encrypted_values = cache._entries[secret_id]
+    assert "space cat" not in encrypted_values
+
+
+def test_secret_values_cache_expiry(mocker):
+    """Tests that cached secret values expire after the TTL."""
+    mock_time = mocker.patch.object(base_secrets_store, "time")
+    mock_time.monotonic.return_value = 100.0
+    cache = SecretValuesCache(ttl_seconds=30)
+    secret_id = uuid4()
+
+    cache.set(secret_id, {"password": "space cat"})
+
+    mock_time.monotonic.return_value = 129.0
+    assert cache.get(secret_id) == {"password": "space cat"}
+
+    mock_time.monotonic.return_value = 130.0
+    assert cache.get(secret_id) is None
+    assert secret_id not in cache._entries
+
+
+def test_secret_values_cache_invalidation_and_eviction():
+    """Tests that cached secret values can be invalidated and are evicted."""
+    cache = SecretValuesCache(ttl_seconds=30, max_entries=2)
+    secret_ids = [uuid4() for _ in range(3)]
+
+    for secret_id in secret_ids:
+        cache.set(secret_id, {"key": str(secret_id)})
+
+    # The least recently cached secret is evicted
+    assert cache.get(secret_ids[0]) is None
+    assert cache.get(secret_ids[1]) == {"key": str(secret_ids[1])}
+
+    cache.invalidate(secret_ids[1])
+    assert cache.get(secret_ids[1]) is None
+    assert cache.get(secret_ids[2]) is not None
+
+    cache.invalidate()
+    assert cache.get(secret_ids[2]) is None
+
+
+def test_disabled_secret_values_cache():
+    """Tests that nothing is cached if the TTL is not positive."""
+    cache = SecretValuesCache(ttl_seconds=0)
+    secret_id = uuid4()
+
+    cache.set(secret_id, {"password": "space cat"})
+
+    assert not cache.enabled
+    assert cache.get(secret_id) is None